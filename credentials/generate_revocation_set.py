@@ -22,12 +22,19 @@
 #     python ./credentials/generate-revocation-set.py --help
 
 import base64
+import concurrent.futures
 import dataclasses
+import datetime
+import hashlib
+import http.server
+import io
 import json
 import logging
 import os
 import subprocess
 import sys
+import tempfile
+import threading
 import unittest
 from enum import Enum
 from typing import Optional
@@ -36,7 +43,7 @@ import click
 import requests
 from click_option_group import AllOptionGroup, RequiredMutuallyExclusiveOptionGroup, optgroup
 from cryptography import x509
-from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import ec
 from cryptography.x509.extensions import ExtensionNotFound
 from cryptography.x509.oid import NameOID
@@ -89,11 +96,110 @@ class RevocationSet:
     revoked_serial_numbers: [str]
     crl_signer_cert: str
     crl_signer_delegator: str = None
+    # Version of the CRL the entry was generated from, see get_crl_version()
+    crl_number: Optional[str] = None
+    crl_this_update: Optional[str] = None
 
     def asDict(self):
         return dataclasses.asdict(self)
 
 
+@dataclasses.dataclass
+class RevocationSetDelta:
+    type: str
+    issuer_subject_key_id: str
+    issuer_name: str
+    added_serial_numbers: [str]
+    removed_serial_numbers: [str]
+
+    def asDict(self):
+        return dataclasses.asdict(self)
+
+
+class RevocationSetIndex:
+    '''
+    Index of the entries of a revocation set, to check if a serial number is revoked in constant time.
+    '''
+
+    def __init__(self, revocation_set: list[RevocationSet]):
+        '''
+        Index the entries of a revocation set.
+
+        Parameters
+        ----------
+        revocation_set: list[RevocationSet]
+            Entries of the revocation set.
+        '''
+        self.revocation_set = revocation_set
+        # Revoked serial numbers keyed by (issuer_subject_key_id, issuer_name), as several CRL signers may revoke
+        # certificates of the same issuer
+        self.revoked_serial_numbers = {}
+        # Entries keyed by (issuer_subject_key_id, crl_signer_cert, crl_signer_delegator)
+        self.entries_by_crl_signer = {}
+        for entry in revocation_set:
+            issuer_key = (entry.issuer_subject_key_id, entry.issuer_name)
+            self.revoked_serial_numbers.setdefault(issuer_key, set()).update(entry.revoked_serial_numbers)
+            self.entries_by_crl_signer[(entry.issuer_subject_key_id, entry.crl_signer_cert, entry.crl_signer_delegator)] = entry
+
+    @classmethod
+    def load(cls, path: str) -> 'RevocationSetIndex':
+        '''
+        Index a revocation set JSON file, as written by the from-dcl command.
+        '''
+        with open(path, 'r') as f:
+            return cls([RevocationSet(**entry) for entry in json.load(f)])
+
+    def is_revoked(self, issuer_subject_key_id: str, issuer_name: str, serial_number: str) -> bool:
+        '''
+        Check if a certificate is revoked.
+
+        Parameters
+        ----------
+        issuer_subject_key_id: str
+            AKID of the certificate, in uppercase hex.
+        issuer_name: str
+            Issuer name of the certificate, base64 encoded.
+        serial_number: str
+            Serial number of the certificate, in uppercase hex of an even length.
+
+        Returns
+        -------
+        bool
+            True if the serial number is revoked by the issuer.
+        '''
+        return serial_number in self.revoked_serial_numbers.get((issuer_subject_key_id, issuer_name), ())
+
+    def get_entry_for_crl_signer(self, issuer_subject_key_id: str, crl_signer_cert: str,
+                                 crl_signer_delegator: Optional[str]) -> Optional[RevocationSet]:
+        '''
+        Get the entry generated from the CRL of a CRL signer, given as base64 DER certificates.
+        '''
+        return self.entries_by_crl_signer.get((issuer_subject_key_id, crl_signer_cert, crl_signer_delegator))
+
+
+def get_revocation_set_delta(previous_set: RevocationSetIndex, revocation_set: RevocationSetIndex) -> list[RevocationSetDelta]:
+    '''
+    Get the serial numbers added to and removed from the revocation set of each issuer, since the previous revocation set.
+    '''
+    issuer_keys = list(revocation_set.revoked_serial_numbers)
+    issuer_keys += [key for key in previous_set.revoked_serial_numbers if key not in revocation_set.revoked_serial_numbers]
+
+    delta = []
+    for issuer_key in issuer_keys:
+        previous_serial_numbers = previous_set.revoked_serial_numbers.get(issuer_key, set())
+        serial_numbers = revocation_set.revoked_serial_numbers.get(issuer_key, set())
+        if previous_serial_numbers == serial_numbers:
+            continue
+        delta.append(RevocationSetDelta(
+            type='revocation_set_delta',
+            issuer_subject_key_id=issuer_key[0],
+            issuer_name=issuer_key[1],
+            added_serial_numbers=sorted(serial_numbers - previous_serial_numbers),
+            removed_serial_numbers=sorted(previous_serial_numbers - serial_numbers),
+        ))
+    return delta
+
+
 OID_VENDOR_ID = x509.ObjectIdentifier("1.3.6.1.4.1.37244.2.1")
 OID_PRODUCT_ID = x509.ObjectIdentifier("1.3.6.1.4.1.37244.2.2")
 
@@ -101,6 +207,10 @@ PRODUCTION_NODE_URL = "https://on.dcl.csa-iot.org:26657"
 PRODUCTION_NODE_URL_REST = "https://on.dcl.csa-iot.org"
 TEST_NODE_URL_REST = "https://on.test-net.dcl.csa-iot.org"
 
+# Number of revocation points processed, and of HTTP requests sent, at the same time
+DEFAULT_FETCH_JOBS = 16
+CRL_FETCH_TIMEOUT = 5
+
 
 def extract_single_integer_attribute(subject, oid):
     attribute_list = subject.get_attributes_for_oid(oid)
@@ -266,6 +376,7 @@ def generate_revocation_set_from_crl(crl_file: x509.CertificateRevocationList,
             - revoked_serial_numbers: List of revoked serial numbers
             - crl_signer_cert: CRL signer certificate (base64 DER)
             - crl_signer_delegator: Optional delegator certificate (base64 DER)
+            - crl_number, crl_this_update: Version of the CRL, see get_crl_version()
     """
     serialnumber_list = []
 
@@ -294,12 +405,12 @@ def generate_revocation_set_from_crl(crl_file: x509.CertificateRevocationList,
         issuer_subject_key_id=certificate_akid_hex,
         issuer_name=get_b64_name(certificate_authority_name),
         revoked_serial_numbers=serialnumber_list,
-        crl_signer_cert=base64.b64encode(crl_signer_certificate.public_bytes(serialization.Encoding.DER)).decode('utf-8'),
+        crl_signer_cert=get_b64_cert(crl_signer_certificate),
     )
+    entry.crl_number, entry.crl_this_update = get_crl_version(crl_file)
 
     if crl_signer_delegator_cert:
-        entry.crl_signer_delegator = base64.b64encode(
-            crl_signer_delegator_cert.public_bytes(serialization.Encoding.DER)).decode('utf-8')
+        entry.crl_signer_delegator = get_b64_cert(crl_signer_delegator_cert)
 
     return entry
 
@@ -348,6 +459,24 @@ def get_b64_name(name: x509.name.Name) -> str:
     return base64.b64encode(name.public_bytes()).decode('utf-8')
 
 
+def get_b64_cert(cert: x509.Certificate) -> str:
+    '''
+    Get base64 encoded DER certificate
+    '''
+    return base64.b64encode(cert.public_bytes(serialization.Encoding.DER)).decode('utf-8')
+
+
+def get_crl_version(crl: x509.CertificateRevocationList) -> tuple[Optional[str], str]:
+    '''
+    Get the CRL number, in uppercase hex, and the ISO 8601 thisUpdate of a CRL, which change whenever the CRL is reissued.
+    '''
+    try:
+        crl_number = '{:02X}'.format(crl.extensions.get_extension_for_class(x509.CRLNumber).value.crl_number)
+    except ExtensionNotFound:
+        crl_number = None
+    return crl_number, crl.last_update_utc.isoformat()
+
+
 def fetch_crl_from_url(url: str, timeout: int) -> x509.CertificateRevocationList:
     logging.debug(f"Fetching CRL from {url}")
 
@@ -359,17 +488,132 @@ def fetch_crl_from_url(url: str, timeout: int) -> x509.CertificateRevocationList
         logging.error('Failed to fetch a valid CRL', e)
 
 
+class HttpCache:
+    '''
+    An on-disk cache of HTTP responses, revalidated with ETag and Last-Modified.
+    '''
+
+    def __init__(self, cache_dir: str):
+        '''
+        Initialize the cache.
+
+        Parameters
+        ----------
+        cache_dir: str
+            Directory where the responses are stored. Created if it does not exist.
+        '''
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def get_path(self, url: str) -> str:
+        return os.path.join(self.cache_dir, hashlib.sha256(url.encode('utf-8')).hexdigest())
+
+    def load(self, url: str) -> tuple[Optional[dict], Optional[bytes]]:
+        '''
+        Get the validators and the content of the cached response to url, or (None, None) if there is none.
+        '''
+        path = self.get_path(url)
+        try:
+            with open(path + '.json', 'r') as f:
+                validators = json.load(f)
+            with open(path, 'rb') as f:
+                return validators, f.read()
+        except (OSError, ValueError):
+            return None, None
+
+    def store(self, url: str, response: requests.Response):
+        '''
+        Store a response if it has an ETag or a Last-Modified header to revalidate it with.
+        '''
+        validators = {header: response.headers[header] for header in ('ETag', 'Last-Modified') if header in response.headers}
+        if not validators:
+            return
+        path = self.get_path(url)
+        # Written to temporary files first, so that concurrent or interrupted runs never see a partial response
+        for suffix, mode, data in (('', 'wb', response.content), ('.json', 'w', json.dumps(validators))):
+            with tempfile.NamedTemporaryFile(mode, dir=self.cache_dir, delete=False) as f:
+                f.write(data)
+            os.replace(f.name, path + suffix)
+
+    def get(self, session: requests.Session, url: str, timeout: Optional[float] = None) -> bytes:
+        '''
+        Get the content at url, sending a conditional request if the response is cached.
+        '''
+        validators, content = self.load(url)
+        headers = {}
+        if validators:
+            if 'ETag' in validators:
+                headers['If-None-Match'] = validators['ETag']
+            if 'Last-Modified' in validators:
+                headers['If-Modified-Since'] = validators['Last-Modified']
+        r = session.get(url, headers=headers, timeout=timeout)
+        if r.status_code == requests.codes.not_modified and content is not None:
+            logging.debug(f"Using cached response for {url}")
+            return content
+        r.raise_for_status()
+        self.store(url, r)
+        return r.content
+
+
 class DclClientInterface:
     '''
     An interface for interacting with DCLD.
     '''
 
-    def send_get_request(self, url: str) -> dict:
+    def __init__(self, cache_dir: Optional[str] = None, max_connections: int = DEFAULT_FETCH_JOBS):
+        '''
+        Initialize the client.
+
+        Parameters
+        ----------
+        cache_dir: str
+            Directory of the on-disk cache of CRLs and certificates, or None to not cache them.
+        max_connections: int
+            Number of connections kept open to each host by the HTTP session shared by all requests.
+        '''
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=max_connections)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.http_cache = HttpCache(cache_dir) if cache_dir else None
+        self.memo = {}
+        self.memo_lock = threading.Lock()
+
+    def memoize(self, table: str, key, fetch):
+        '''
+        Get the result of fetch() for key, calling fetch only the first time key is looked up in table.
+
+        Concurrent lookups of the same key wait for the first one instead of fetching again.
+        '''
+        with self.memo_lock:
+            future = self.memo.setdefault(table, {}).get(key)
+            is_first_lookup = future is None
+            if is_first_lookup:
+                future = concurrent.futures.Future()
+                self.memo[table][key] = future
+        if is_first_lookup:
+            try:
+                future.set_result(fetch())
+            except Exception as e:
+                future.set_exception(e)
+        return future.result()
+
+    def fetch(self, url: str, timeout: Optional[float] = None, cached: bool = False) -> bytes:
+        '''
+        Get the content at url with the shared HTTP session, from the on-disk cache if cached is set and it is still valid.
+        '''
+        if cached and self.http_cache:
+            return self.http_cache.get(self.session, url, timeout)
+        r = self.session.get(url, timeout=timeout)
+        r.raise_for_status()
+        return r.content
+
+    def send_get_request(self, url: str, cached: bool = False) -> dict:
         '''
         Send a GET request for a json object.
         '''
         try:
-            return requests.get(url).json()
+            return json.loads(self.fetch(url, cached=cached))
         except Exception as e:
             logging.error(f"Failed to fetch {url}: {e}")
             return None
@@ -431,7 +675,9 @@ class DclClientInterface:
         paa_certificate = None
         while not paa_certificate:
             try:
-                is_root, issuer_certificate = self.get_approved_certificate(issuer_name, akid)
+                # Most of the revocation points share a few PAAs, and PAIs with their delegators
+                is_root, issuer_certificate = self.memoize('approved_certificate', (issuer_name.public_bytes(), akid),
+                                                           lambda: self.get_approved_certificate(issuer_name, akid))
                 if is_root:
                     paa_certificate = issuer_certificate
                     break
@@ -455,9 +701,9 @@ class DclClientInterface:
                      crl_signer_certificate: x509.Certificate) -> x509.CertificateRevocationList:
         """Obtain the CRL."""
         try:
-            r = requests.get(revocation_point.dataURL, timeout=5)
-            logging.debug(f"Fetched CRL: {r.content}")
-            return x509.load_der_x509_crl(r.content)
+            content = self.fetch(revocation_point.dataURL, timeout=CRL_FETCH_TIMEOUT, cached=True)
+            logging.debug(f"Fetched CRL: {content}")
+            return x509.load_der_x509_crl(content)
         except Exception:
             logging.warning(f"Failed to fetch a valid CRL for': {crl_signer_certificate.subject.rfc4514_string()}")
 
@@ -470,7 +716,7 @@ class NodeDclClient(DclClientInterface):
     A client for interacting with DCLD using command line interface (CLI).
     '''
 
-    def __init__(self, dcld_exe: str, use_test_net: bool):
+    def __init__(self, dcld_exe: str, use_test_net: bool, **kwargs):
         '''
         Initialize the client.
 
@@ -478,8 +724,11 @@ class NodeDclClient(DclClientInterface):
             Path to `dcld` executable.
          use_test_net: bool
             Indicates if the client should use TestNet or MainNet URL with dcld executable.
+        kwargs:
+            Arguments of DclClientInterface.
         '''
 
+        super().__init__(**kwargs)
         self.dcld_exe = dcld_exe
         self.use_test_net = use_test_net
 
@@ -584,13 +833,16 @@ class RestDclClient(DclClientInterface):
     A client for interacting with DCLD using the REST API.
     '''
 
-    def __init__(self, use_test_net: bool):
+    def __init__(self, use_test_net: bool, **kwargs):
         '''
         Initialize the client.
 
         use_test_net: bool
             Indicates if the client should use TestNet or MainNet REST API URL.
+        kwargs:
+            Arguments of DclClientInterface.
         '''
+        super().__init__(**kwargs)
         self.rest_node_url = TEST_NODE_URL_REST if use_test_net else PRODUCTION_NODE_URL_REST
 
     def get_revocation_points(self) -> list[RevocationPoint]:
@@ -643,7 +895,8 @@ class RestDclClient(DclClientInterface):
         logging.debug(
             f"Fetching issuer from:{self.rest_node_url}/dcl/pki/certificates/{get_b64_name(subject_name)}/{self.get_formatted_hex_skid(skid_hex)}")
         response = self.send_get_request(
-            f"{self.rest_node_url}/dcl/pki/certificates/{get_b64_name(subject_name)}/{self.get_formatted_hex_skid(skid_hex)}")
+            f"{self.rest_node_url}/dcl/pki/certificates/{get_b64_name(subject_name)}/{self.get_formatted_hex_skid(skid_hex)}",
+            cached=True)
         logging.debug(f"Response certificate: {response}")
         return self.get_only_approved_certificate(response, skid_hex)
 
@@ -653,7 +906,7 @@ class LocalFilesDclClient(DclClientInterface):
     A client for interacting with local DLCD response data.
     '''
 
-    def __init__(self, crls: [], dcl_certificates: [], revocation_points_response_file: str):
+    def __init__(self, crls: [], dcl_certificates: [], revocation_points_response_file: str, **kwargs):
         '''
         Initialize the client.
 
@@ -665,8 +918,12 @@ class LocalFilesDclClient(DclClientInterface):
             List of certificate files.
         revocation_points_response_file: str
             Path to the get-revocation-points response json file.
+        kwargs:
+            Arguments of DclClientInterface.
         '''
 
+        super().__init__(**kwargs)
+
         logging.debug(f"Loading certificates from {dcl_certificates}")
         logging.debug(f"Loading crls from {crls}")
         logging.debug(f"Loading revocation points response from {revocation_points_response_file}")
@@ -824,15 +1081,15 @@ class LocalFilesDclClient(DclClientInterface):
         return False, None
 
     def get_crl_file(self,
-                     unused_revocation_point: RevocationPoint,
+                     revocation_point: RevocationPoint,
                      crl_signer_certificate: x509.Certificate) -> x509.CertificateRevocationList:
         '''
         Obtain the CRL.
 
         Parameters
         ----------
-        unused_revocation_point: RevocationPoint
-            Revocation point. Not used.
+        revocation_point: RevocationPoint
+            Revocation point. Its dataURL is only used when none of the local CRLs is signed by the CRL signer.
 
         crl_signer_certificate: x509.Certificate
             Crl signer certificate.
@@ -846,8 +1103,150 @@ class LocalFilesDclClient(DclClientInterface):
             if crl.issuer.public_bytes() == crl_signer_certificate.subject.public_bytes():
                 logging.debug(f"Found CRL for issuer: {crl.issuer.rfc4514_string()}")
                 return crl
+        if revocation_point.dataURL:
+            return super().get_crl_file(revocation_point, crl_signer_certificate)
+        return None
+
+
+def process_revocation_point(dcld_client: DclClientInterface, revocation_point: RevocationPoint,
+                             previous_set: Optional[RevocationSetIndex] = None) -> Optional[RevocationSet]:
+    """Generate the revocation set entry of a revocation point, or None if the revocation point is not valid.
+
+    If previous_set is given, the entry of previous_set generated from the same CRL signer is returned as is when
+    the CRL has the same number and thisUpdate as the one recorded in that entry, or when the CRL cannot be fetched.
+    """
+    # 1. Validate Revocation Type
+    if revocation_point.revocationType != RevocationType.CRL.value:
+        logging.warning("Revocation Type is not CRL, continue...")
         return None
 
+    # 2. Parse the certificate
+    try:
+        crl_signer_certificate = x509.load_pem_x509_certificate(bytes(revocation_point.crlSignerCertificate, 'utf-8'))
+    except Exception:
+        logging.warning("CRL Signer Certificate is not valid, continue...")
+        return None
+
+    # Parse the crl signer delegator
+    crl_signer_delegator_cert = None
+    if revocation_point.crlSignerDelegator:
+        crl_signer_delegator_cert_pem = revocation_point.crlSignerDelegator
+        logging.debug(f"CRLSignerDelegator: {crl_signer_delegator_cert_pem}")
+        try:
+            crl_signer_delegator_cert = x509.load_pem_x509_certificate(bytes(crl_signer_delegator_cert_pem, 'utf-8'))
+        except Exception:
+            logging.warning("CRL Signer Delegator Certificate not found...")
+
+    crl_file = None
+    if previous_set is not None:
+        previous_entry = previous_set.get_entry_for_crl_signer(
+            revocation_point.issuerSubjectKeyID, get_b64_cert(crl_signer_certificate),
+            get_b64_cert(crl_signer_delegator_cert) if crl_signer_delegator_cert else None)
+        if previous_entry is not None:
+            crl_file = dcld_client.get_crl_file(revocation_point, crl_signer_certificate)
+            if crl_file is None:
+                # Dropping the entry would list all the serial numbers of the issuer as removed from the set
+                logging.warning(f"CRL of {revocation_point.dataURL} could not be fetched, keeping previous entry")
+                return previous_entry
+            # Entries of a revocation set generated before CRL versions were recorded have no crl_this_update
+            if (previous_entry.crl_number, previous_entry.crl_this_update) == get_crl_version(crl_file):
+                logging.debug(f"CRL of {revocation_point.dataURL} did not change, keeping previous entry")
+                return previous_entry
+
+    # 3. and 4. Validate VID/PID
+    if not validate_vid_pid(revocation_point, crl_signer_certificate, crl_signer_delegator_cert):
+        logging.warning("Failed to validate VID/PID, continue...")
+        return None
+
+    # 5. Validate the certification path containing CRLSignerCertificate.
+    paa_certificate_object = dcld_client.get_paa_cert(crl_signer_certificate)
+    if paa_certificate_object is None:
+        logging.warning("PAA Certificate not found, continue...")
+        return None
+
+    if validate_cert_chain(crl_signer_certificate, crl_signer_delegator_cert, paa_certificate_object) is False:
+        logging.warning("Failed to validate CRL Signer Certificate chain, continue...")
+        return None
+
+    # 6. Obtain the CRL
+    if crl_file is None:
+        crl_file = dcld_client.get_crl_file(revocation_point, crl_signer_certificate)
+    if crl_file is None:
+        logging.warning("CRL file not found for revocation point, continue...")
+        return None
+
+    # 7. Perform CRL File Validation
+    # a.
+    try:
+        crl_signer_skid = get_skid(crl_signer_certificate)
+    except ExtensionNotFound:
+        logging.warning("CRL Signer SKID not found, continue...")
+        return None
+    try:
+        crl_akid = get_akid(crl_file)
+    except ExtensionNotFound:
+        logging.warning("CRL AKID is not found, continue...")
+        return None
+    if crl_akid != crl_signer_skid:
+        logging.warning("CRL AKID is not CRL Signer SKID, continue...")
+        return None
+
+    # b.
+    same_issuer_points = dcld_client.memoize('revocation_points_by_skid', crl_akid,
+                                             lambda: dcld_client.get_revocation_points_by_skid(crl_akid))
+    count_with_matching_vid_issuer_skid = sum(item.vid == revocation_point.vid for item in same_issuer_points)
+
+    if count_with_matching_vid_issuer_skid > 1:
+        try:
+            issuing_distribution_point = crl_file.extensions.get_extension_for_oid(
+                x509.oid.ExtensionOID.ISSUING_DISTRIBUTION_POINT).value
+        except Exception:
+            logging.warning("CRL Issuing Distribution Point not found, continue...")
+            return None
+
+        uri_list = issuing_distribution_point.full_name
+        if len(uri_list) == 1 and isinstance(uri_list[0], x509.UniformResourceIdentifier):
+            if uri_list[0].value != revocation_point.dataURL:
+                logging.warning("CRL Issuing Distribution Point URI is not CRL URL, continue...")
+                return None
+        else:
+            logging.warning("CRL Issuing Distribution Point URI is not CRL URL, continue...")
+            return None
+
+    # TODO: 8. Validate CRL as per Section 6.3 of RFC 5280
+
+    # 9. Decide on certificate authority name and AKID
+    certificate_authority_name, certificate_akid_hex = get_certificate_authority_details(
+        crl_signer_certificate, crl_signer_delegator_cert, paa_certificate_object, revocation_point.isPAA)
+
+    # validate issuer skid matchces with the one in revocation points
+    logging.debug(f"revocation_point.issuerSubjectKeyID: {revocation_point.issuerSubjectKeyID}")
+
+    if revocation_point.issuerSubjectKeyID != certificate_akid_hex:
+        logging.warning("CRL Issuer Subject Key ID is not CRL Signer Subject Key ID, continue...")
+        return None
+
+    # 10. Iterate through the Revoked Certificates List
+    entry = generate_revocation_set_from_crl(crl_file, crl_signer_certificate,
+                                             certificate_authority_name, certificate_akid_hex, crl_signer_delegator_cert)
+    logging.debug(f"Entry to append: {entry}")
+    return entry
+
+
+def generate_revocation_set(dcld_client: DclClientInterface, jobs: int = DEFAULT_FETCH_JOBS,
+                            previous_set: Optional[RevocationSetIndex] = None) -> list[RevocationSet]:
+    """Generate the revocation set of all the revocation points of the DCL.
+
+    The revocation points are processed by a pool of `jobs` threads, so that the certificates and CRLs
+    of the revocation points are fetched concurrently. The entries are in the order of the revocation points.
+    If previous_set is given, only the revocation points whose CRL changed since previous_set are processed again.
+    """
+    revocation_point_list = dcld_client.get_revocation_points()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as executor:
+        entries = executor.map(lambda revocation_point: process_revocation_point(dcld_client, revocation_point, previous_set),
+                               revocation_point_list)
+        return [entry for entry in entries if entry is not None]
+
 
 @click.group()
 def cli():
@@ -866,13 +1265,23 @@ def cli():
 @optgroup.option('--certificates', type=click.File('rb'), multiple=True, help='Paths to PEM formated certificates (i.e. PAA) in DCL but missing from the revocation-points-response file.')
 @optgroup.option('--crls', type=click.File('rb'), multiple=True, help='Paths to the crl der files')
 @optgroup.option('--revocation-points-response', type=click.File('rb'), help='Path to the get-revocation-points response json file.')
+@optgroup.group('Optional fetch arguments')
+@optgroup.option('--jobs', default=DEFAULT_FETCH_JOBS, show_default=True, type=click.IntRange(1),
+                 help='Number of revocation points whose certificates and CRLs are fetched at the same time')
+@optgroup.option('--cache-dir', type=click.Path(file_okay=False), metavar='PATH',
+                 help='Directory where the fetched CRLs and certificates are cached, and revalidated with ETag/Last-Modified on the next run')
+@optgroup.group('Optional incremental update arguments')
+@optgroup.option('--previous-output', type=click.Path(exists=True, dir_okay=False), metavar='FILEPATH',
+                 help='Revocation set generated by a previous run. Only the revocation points whose CRL changed since are processed again')
+@optgroup.option('--delta-output', type=str, metavar='FILEPATH',
+                 help='Output filename of the serial numbers added and removed per issuer since --previous-output')
 @optgroup.group('Optional output arguments')
 @optgroup.option('--output', default='sample_revocation_set_list.json', type=str, metavar='FILEPATH',
                  help="Output filename (default: sample_revocation_set_list.json)")
 @optgroup.option('--log-level', default='INFO', show_default=True, type=click.Choice(__LOG_LEVELS__.keys(),
                                                                                      case_sensitive=False), callback=lambda c, p, v: __LOG_LEVELS__[v],
                  help='Determines the verbosity of script output')
-def from_dcl(use_main_net_dcld: str, use_test_net_dcld: str, use_main_net_http: bool, use_test_net_http: bool, use_local_data: bool, revocation_points_response: str, crls: [], certificates: [], output: str, log_level: str):
+def from_dcl(use_main_net_dcld: str, use_test_net_dcld: str, use_main_net_http: bool, use_test_net_http: bool, use_local_data: bool, revocation_points_response: str, crls: [], certificates: [], jobs: int, cache_dir: str, previous_output: str, delta_output: str, output: str, log_level: str):
     """Generate revocation set from DCL using generation algorithm from Matter Spec section 6.2.4.1."""
     logging.basicConfig(
         level=log_level,
@@ -880,118 +1289,28 @@ def from_dcl(use_main_net_dcld: str, use_test_net_dcld: str, use_main_net_http:
         datefmt='%Y-%m-%d %H:%M:%S'
     )
 
+    if delta_output and not previous_output:
+        raise click.UsageError('--delta-output requires --previous-output')
+
+    client_args = {'cache_dir': cache_dir, 'max_connections': jobs}
     if use_local_data:
-        dcld_client = LocalFilesDclClient(crls, certificates, revocation_points_response)
+        dcld_client = LocalFilesDclClient(crls, certificates, revocation_points_response, **client_args)
     elif use_main_net_http or use_test_net_http:
-        dcld_client = RestDclClient(bool(use_test_net_http))
+        dcld_client = RestDclClient(bool(use_test_net_http), **client_args)
     else:
-        dcld_client = NodeDclClient(use_main_net_dcld or use_test_net_dcld, bool(use_test_net_dcld))
+        dcld_client = NodeDclClient(use_main_net_dcld or use_test_net_dcld, bool(use_test_net_dcld), **client_args)
 
-    revocation_point_list = dcld_client.get_revocation_points()
-    revocation_set = []
-    for revocation_point in revocation_point_list:
-        # 1. Validate Revocation Type
-        if revocation_point.revocationType != RevocationType.CRL.value:
-            logging.warning("Revocation Type is not CRL, continue...")
-            continue
-
-        # 2. Parse the certificate
-        try:
-            crl_signer_certificate = x509.load_pem_x509_certificate(bytes(revocation_point.crlSignerCertificate, 'utf-8'))
-        except Exception:
-            logging.warning("CRL Signer Certificate is not valid, continue...")
-            continue
-
-        # Parse the crl signer delegator
-        crl_signer_delegator_cert = None
-        if revocation_point.crlSignerDelegator:
-            crl_signer_delegator_cert_pem = revocation_point.crlSignerDelegator
-            logging.debug(f"CRLSignerDelegator: {crl_signer_delegator_cert_pem}")
-            try:
-                crl_signer_delegator_cert = x509.load_pem_x509_certificate(bytes(crl_signer_delegator_cert_pem, 'utf-8'))
-            except Exception:
-                logging.warning("CRL Signer Delegator Certificate not found...")
-
-        # 3. and 4. Validate VID/PID
-        if not validate_vid_pid(revocation_point, crl_signer_certificate, crl_signer_delegator_cert):
-            logging.warning("Failed to validate VID/PID, continue...")
-            continue
-
-        # 5. Validate the certification path containing CRLSignerCertificate.
-        paa_certificate_object = dcld_client.get_paa_cert(crl_signer_certificate)
-        if paa_certificate_object is None:
-            logging.warning("PAA Certificate not found, continue...")
-            continue
-
-        if validate_cert_chain(crl_signer_certificate, crl_signer_delegator_cert, paa_certificate_object) is False:
-            logging.warning("Failed to validate CRL Signer Certificate chain, continue...")
-            continue
-
-        # 6. Obtain the CRL
-        crl_file = dcld_client.get_crl_file(revocation_point, crl_signer_certificate)
-        if crl_file is None:
-            logging.warning("CRL file not found for revocation point, continue...")
-            continue
-
-        # 7. Perform CRL File Validation
-        # a.
-        try:
-            crl_signer_skid = get_skid(crl_signer_certificate)
-        except ExtensionNotFound:
-            logging.warning("CRL Signer SKID not found, continue...")
-            continue
-        try:
-            crl_akid = get_akid(crl_file)
-        except ExtensionNotFound:
-            logging.warning("CRL AKID is not found, continue...")
-            continue
-        if crl_akid != crl_signer_skid:
-            logging.warning("CRL AKID is not CRL Signer SKID, continue...")
-            continue
-
-        # b.
-        same_issuer_points = dcld_client.get_revocation_points_by_skid(crl_akid)
-        count_with_matching_vid_issuer_skid = sum(item.vid == revocation_point.vid for item in same_issuer_points)
-
-        if count_with_matching_vid_issuer_skid > 1:
-            try:
-                issuing_distribution_point = crl_file.extensions.get_extension_for_oid(
-                    x509.oid.ExtensionOID.ISSUING_DISTRIBUTION_POINT).value
-            except Exception:
-                logging.warning("CRL Issuing Distribution Point not found, continue...")
-                continue
-
-            uri_list = issuing_distribution_point.full_name
-            if len(uri_list) == 1 and isinstance(uri_list[0], x509.UniformResourceIdentifier):
-                if uri_list[0].value != revocation_point.dataURL:
-                    logging.warning("CRL Issuing Distribution Point URI is not CRL URL, continue...")
-                    continue
-            else:
-                logging.warning("CRL Issuing Distribution Point URI is not CRL URL, continue...")
-                continue
-
-        # TODO: 8. Validate CRL as per Section 6.3 of RFC 5280
-
-        # 9. Decide on certificate authority name and AKID
-        certificate_authority_name, certificate_akid_hex = get_certificate_authority_details(
-            crl_signer_certificate, crl_signer_delegator_cert, paa_certificate_object, revocation_point.isPAA)
-
-        # validate issuer skid matchces with the one in revocation points
-        logging.debug(f"revocation_point.issuerSubjectKeyID: {revocation_point.issuerSubjectKeyID}")
-
-        if revocation_point.issuerSubjectKeyID != certificate_akid_hex:
-            logging.warning("CRL Issuer Subject Key ID is not CRL Signer Subject Key ID, continue...")
-            continue
-
-        # 10. Iterate through the Revoked Certificates List
-        entry = generate_revocation_set_from_crl(crl_file, crl_signer_certificate,
-                                                 certificate_authority_name, certificate_akid_hex, crl_signer_delegator_cert)
-        logging.debug(f"Entry to append: {entry}")
-        revocation_set.append(entry)
+    previous_set = RevocationSetIndex.load(previous_output) if previous_output else None
+    revocation_set = generate_revocation_set(dcld_client, jobs, previous_set)
 
     with open(output, 'w+') as outfile:
         json.dump([revocation.asDict() for revocation in revocation_set], outfile, indent=4)
 
+    if delta_output:
+        delta = get_revocation_set_delta(previous_set, RevocationSetIndex(revocation_set))
+        with open(delta_output, 'w+') as outfile:
+            json.dump([issuer_delta.asDict() for issuer_delta in delta], outfile, indent=4)
+
 
 class TestRevocationSetGeneration(unittest.TestCase):
     """Test class for revocation set generation"""
@@ -1067,6 +1386,172 @@ class TestRevocationSetGeneration(unittest.TestCase):
         self.compare_revocation_sets(revocation_set, self.get_expected_revocation_set(2))
 
 
+class CrlRequestHandler(http.server.BaseHTTPRequestHandler):
+    """Serves the CRLs of the test server, with an ETag per CRL."""
+
+    def do_GET(self):
+        self.server.requests.append((self.path, self.headers.get('If-None-Match')))
+        if self.path not in self.server.crls:
+            self.send_error(404)
+            return
+        etag = f'"{hashlib.sha256(self.server.crls[self.path]).hexdigest()}"'
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('ETag', etag)
+        self.send_header('Content-Length', str(len(self.server.crls[self.path])))
+        self.end_headers()
+        self.wfile.write(self.server.crls[self.path])
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestRevocationSetFetching(unittest.TestCase):
+    """Test generation of revocation set from revocation points whose CRLs are served over HTTP"""
+
+    def setUp(self):
+        self.test_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test/revoked-attestation-certificates')
+        self.server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), CrlRequestHandler)
+        self.server.requests = []
+        self.server.crls = {}
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.cache_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.cache_dir.cleanup()
+
+    def read_test_file(self, filename):
+        with open(os.path.join(self.test_dir, filename), 'rb') as f:
+            return f.read()
+
+    def get_revocation_point(self, name, is_paa):
+        cert_pem = self.read_test_file(f'{name}-Cert.pem')
+        self.server.crls[f'/{name}.crl'] = self.read_test_file(f'{name}-CRL.der')
+        return {
+            'vid': 0xFFF1,
+            'label': name,
+            'issuerSubjectKeyID': get_skid(x509.load_pem_x509_certificate(cert_pem)),
+            'pid': 0,
+            'isPAA': is_paa,
+            'crlSignerCertificate': cert_pem.decode('utf-8'),
+            'dataURL': f'http://127.0.0.1:{self.server.server_port}/{name}.crl',
+            'dataFileSize': '',
+            'dataDigest': '',
+            'dataDigestType': 0,
+            'revocationType': RevocationType.CRL.value,
+            'schemaVersion': 0,
+            'crlSignerDelegator': '',
+        }
+
+    def generate(self, revocation_points, previous_set=None):
+        response = io.StringIO(json.dumps({'PkiRevocationDistributionPoint': revocation_points}))
+        certificates = [io.BytesIO(self.read_test_file('Chip-Test-PAA-FFF1-Cert.pem'))]
+        dcld_client = LocalFilesDclClient([], certificates, response, cache_dir=self.cache_dir.name, max_connections=4)
+        return generate_revocation_set(dcld_client, jobs=4, previous_set=previous_set)
+
+    def reissue_crl(self, name, revoked_serial_numbers):
+        crl = x509.load_der_x509_crl(self.server.crls[f'/{name}.crl'])
+        crl_signer = x509.load_pem_x509_certificate(self.read_test_file(f'{name}-Cert.pem'))
+        key = serialization.load_pem_private_key(self.read_test_file(f'{name}-Key.pem'), None)
+        builder = x509.CertificateRevocationListBuilder().issuer_name(crl.issuer) \
+            .last_update(crl.last_update_utc + datetime.timedelta(days=1)) \
+            .next_update(crl.last_update_utc + datetime.timedelta(days=31)) \
+            .add_extension(x509.AuthorityKeyIdentifier(bytes.fromhex(get_skid(crl_signer)), None, None), False)
+        for serial_number in revoked_serial_numbers:
+            builder = builder.add_revoked_certificate(x509.RevokedCertificateBuilder().serial_number(serial_number)
+                                                      .revocation_date(crl.last_update_utc).build())
+        self.server.crls[f'/{name}.crl'] = builder.sign(key, hashes.SHA256()).public_bytes(serialization.Encoding.DER)
+
+    def test_fetch_and_revalidate_crls(self):
+        revocation_points = [self.get_revocation_point('Chip-Test-PAA-FFF1', True),
+                             self.get_revocation_point('Matter-Development-PAI-FFF1-noPID', False)]
+        with open(os.path.join(self.test_dir, 'revocation-sets/revocation-set.json'), 'r') as f:
+            expected = [RevocationSet(**entry) for entry in json.load(f)[:2]]
+
+        for _ in range(2):
+            revocation_set = self.generate(revocation_points)
+            self.assertEqual([entry.issuer_subject_key_id for entry in revocation_set],
+                             [entry.issuer_subject_key_id for entry in expected])
+            for generated_set, expected_set in zip(revocation_set, expected):
+                self.assertEqual(set(generated_set.revoked_serial_numbers), set(expected_set.revoked_serial_numbers))
+                self.assertEqual(generated_set.issuer_name, expected_set.issuer_name)
+                self.assertEqual(generated_set.crl_signer_cert, expected_set.crl_signer_cert)
+
+        # The second run revalidates the cached CRLs instead of downloading them again
+        self.assertEqual(len(self.server.requests), 4)
+        self.assertEqual(sorted(etag is not None for _, etag in self.server.requests), [False, False, True, True])
+
+    def test_incremental_update(self):
+        revocation_points = [self.get_revocation_point('Chip-Test-PAA-FFF1', True),
+                             self.get_revocation_point('Matter-Development-PAI-FFF1-noPID', False)]
+        previous_set = RevocationSetIndex(self.generate(revocation_points))
+        pai_entry = previous_set.revocation_set[1]
+        kept_serial_numbers = pai_entry.revoked_serial_numbers[1:]
+
+        # The PAI no longer revokes its first certificate, and revokes a new one
+        self.reissue_crl('Matter-Development-PAI-FFF1-noPID', [int(serial, 16) for serial in kept_serial_numbers] + [0x0A0B0C0D])
+        revocation_set = self.generate(revocation_points, previous_set)
+
+        self.assertIs(revocation_set[0], previous_set.revocation_set[0])
+        self.assertEqual(set(revocation_set[1].revoked_serial_numbers), set(kept_serial_numbers + ['0A0B0C0D']))
+
+        delta = get_revocation_set_delta(previous_set, RevocationSetIndex(revocation_set))
+        self.assertEqual([issuer_delta.asDict() for issuer_delta in delta], [{
+            'type': 'revocation_set_delta',
+            'issuer_subject_key_id': pai_entry.issuer_subject_key_id,
+            'issuer_name': pai_entry.issuer_name,
+            'added_serial_numbers': ['0A0B0C0D'],
+            'removed_serial_numbers': [pai_entry.revoked_serial_numbers[0]],
+        }])
+
+        index = RevocationSetIndex(revocation_set)
+        self.assertTrue(index.is_revoked(pai_entry.issuer_subject_key_id, pai_entry.issuer_name, '0A0B0C0D'))
+        self.assertFalse(index.is_revoked(pai_entry.issuer_subject_key_id, pai_entry.issuer_name,
+                                          pai_entry.revoked_serial_numbers[0]))
+        self.assertEqual(get_revocation_set_delta(index, index), [])
+
+    def test_crl_version_of_previous_output(self):
+        revocation_points = [self.get_revocation_point('Chip-Test-PAA-FFF1', True),
+                             self.get_revocation_point('Matter-Development-PAI-FFF1-noPID', False)]
+        # Loaded from JSON, as --previous-output is
+        previous_set = RevocationSetIndex([RevocationSet(**json.loads(json.dumps(entry.asDict())))
+                                           for entry in self.generate(revocation_points)])
+        pai_entry = previous_set.revocation_set[1]
+        self.assertIsNotNone(pai_entry.crl_this_update)
+
+        # The cache is updated with the reissued CRL by a run that did not write the previous output
+        self.reissue_crl('Matter-Development-PAI-FFF1-noPID', [0x0A0B0C0D])
+        self.generate(revocation_points)
+        revocation_set = self.generate(revocation_points, previous_set)
+
+        self.assertEqual(revocation_set[0], previous_set.revocation_set[0])
+        self.assertEqual(revocation_set[1].revoked_serial_numbers, ['0A0B0C0D'])
+        self.assertNotEqual(revocation_set[1].crl_this_update, pai_entry.crl_this_update)
+
+    def test_unreachable_crl_keeps_previous_entry(self):
+        revocation_points = [self.get_revocation_point('Chip-Test-PAA-FFF1', True),
+                             self.get_revocation_point('Matter-Development-PAI-FFF1-noPID', False)]
+        previous_set = RevocationSetIndex(self.generate(revocation_points))
+        del self.server.crls['/Chip-Test-PAA-FFF1.crl']
+
+        revocation_set = self.generate(revocation_points, previous_set)
+        self.assertIs(revocation_set[0], previous_set.revocation_set[0])
+        self.assertEqual(get_revocation_set_delta(previous_set, RevocationSetIndex(revocation_set)), [])
+
+    def test_unreachable_crl(self):
+        revocation_points = [self.get_revocation_point('Chip-Test-PAA-FFF1', True),
+                             self.get_revocation_point('Matter-Development-PAI-FFF1-noPID', False)]
+        del self.server.crls['/Chip-Test-PAA-FFF1.crl']
+
+        revocation_set = self.generate(revocation_points)
+        self.assertEqual([entry.issuer_subject_key_id for entry in revocation_set], [revocation_points[1]['issuerSubjectKeyID']])
+
+
 if __name__ == "__main__":
     if len(sys.argv) > 1 and sys.argv[1] == 'test':
         # Remove the 'test' argument and run tests
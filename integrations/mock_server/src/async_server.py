@@ -0,0 +1,194 @@
+# Copyright (c) 2026 Project CHIP Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import contextlib
+import http
+import logging
+import ssl
+import urllib.parse
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from handler import NOT_FOUND_BODY, NOT_FOUND_HEADERS, compile_responses
+from route_configuration import Configuration, Route, load_configurations
+from router import CompiledRouter
+from server import validate_server_paths
+
+SUPPORTED_METHODS = {"GET", "POST", "PUT", "DELETE"}
+
+# Seconds a kept-alive connection may stay idle before being closed
+KEEP_ALIVE_TIMEOUT = 5.0
+
+# Maximum size of the request line and headers
+MAX_HEADER_SIZE = 64 * 1024
+
+
+def encode_response_head(status: int, headers: Dict[str, str], content_length: int) -> bytes:
+    """ Encodes the status line and headers of a response, without the Connection header and final empty line. """
+    try:
+        reason = http.HTTPStatus(status).phrase
+    except ValueError:
+        reason = ""
+    lines = [f"HTTP/1.1 {status} {reason}"]
+    lines += [f"{key}: {value}" for key, value in headers.items()]
+    lines.append(f"Content-Length: {content_length}")
+    return ("\r\n".join(lines) + "\r\n").encode("latin-1")
+
+
+class AsyncMockServer:
+    """
+    Serves the routes of a configuration with asyncio, keeping connections alive between requests.
+
+    Unlike the ThreadingHTTPServer of run_server, which handles each connection in its own thread and
+    closes it after every response, all the connections are served by a single event loop, and
+    clients can send any number of HTTP/1.1 requests on the same TLS connection.
+    """
+
+    def __init__(self, config: Configuration):
+        self.router = CompiledRouter(config.routing)
+        # Responses are static, their head and body are encoded once, by id of the route
+        bodies = compile_responses(config)
+        self.responses: Dict[int, Tuple[bytes, bytes]] = {
+            id(route): (encode_response_head(route.response.status, route.response.headers, len(bodies[id(route)])),
+                        bodies[id(route)])
+            for route in config.routing
+        }
+        self.not_found = (encode_response_head(404, NOT_FOUND_HEADERS, len(NOT_FOUND_BODY)), NOT_FOUND_BODY)
+        self.not_implemented = (encode_response_head(501, {}, 0), b"")
+
+    async def start(self, host: Optional[str], port: int, context: Optional[ssl.SSLContext]) -> asyncio.Server:
+        return await asyncio.start_server(self.handle_connection, host, port, ssl=context, limit=MAX_HEADER_SIZE)
+
+    def respond(self, method: str, target: str) -> Tuple[int, Tuple[bytes, bytes]]:
+        """ Returns the status and the encoded head and body of the response to a request. """
+        if method not in SUPPORTED_METHODS:
+            return 501, self.not_implemented
+
+        parsed_target = urllib.parse.urlsplit(target)
+        route: Optional[Route] = self.router.match(method, parsed_target.path, parsed_target.query)
+        if not route:
+            return 404, self.not_found
+        return route.response.status, self.responses[id(route)]
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), KEEP_ALIVE_TIMEOUT)
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError):
+                    # The client closed the connection, or kept it idle for too long
+                    break
+                except asyncio.LimitOverrunError:
+                    await self._send_error(writer, 431)
+                    break
+
+                lines = head.decode("latin-1").split("\r\n")
+                try:
+                    method, target, version = lines[0].split(" ")
+                except ValueError:
+                    await self._send_error(writer, 400)
+                    break
+
+                headers: Dict[str, str] = {}
+                for line in lines[1:]:
+                    key, separator, value = line.partition(":")
+                    if separator:
+                        headers[key.strip().lower()] = value.strip()
+
+                # The request body is not used to match routes, but it must be read to get to the next request
+                try:
+                    await self._read_body(reader, headers)
+                except asyncio.IncompleteReadError:
+                    break
+                except (ValueError, asyncio.LimitOverrunError):
+                    await self._send_error(writer, 400)
+                    break
+
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+
+                status, (response_head, response_body) = self.respond(method, target)
+                writer.write(response_head)
+                writer.write(b"Connection: keep-alive\r\n\r\n" if keep_alive else b"Connection: close\r\n\r\n")
+                writer.write(response_body)
+                await writer.drain()
+                logging.debug('"%s %s %s" %d', method, target, version, status)
+
+                if not keep_alive:
+                    break
+        except (ConnectionError, ssl.SSLError) as e:
+            logging.debug("Connection error: %s", e)
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError, ssl.SSLError):
+                await writer.wait_closed()
+
+    @staticmethod
+    async def _read_body(reader: asyncio.StreamReader, headers: Dict[str, str]) -> None:
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            while True:
+                size = int((await reader.readuntil(b"\r\n")).split(b";", 1)[0], 16)
+                # Each chunk, and the last empty one, is followed by CRLF
+                await reader.readexactly(size + 2)
+                if size == 0:
+                    return
+        elif "content-length" in headers:
+            await reader.readexactly(int(headers["content-length"]))
+
+    @staticmethod
+    async def _send_error(writer: asyncio.StreamWriter, status: int) -> None:
+        writer.write(encode_response_head(status, {}, 0) + b"Connection: close\r\n\r\n")
+        await writer.drain()
+
+
+def run_async_server(port: int, config_path: Path, routing_config_dir: Path, cert_path: Path, key_path: Path) -> None:
+    """
+    Starts a secure HTTPS server with mock endpoints defined by configuration files, served by asyncio.
+
+    Serves the same routes and responses as run_server, on a single thread. Connections are kept alive
+    between requests, which avoids a TLS handshake per request when clients send many requests.
+
+    Args:
+        port (int): Port number on which the server will listen
+        config_path (Path): Path to the main configuration file
+        routing_config_dir (Path): Directory containing additional routing configuration files
+        cert_path (Path): Path to the SSL/TLS certificate file
+        key_path (Path): Path to the SSL/TLS private key file
+
+    Raises:
+        ssl.SSLError: If there are issues with the SSL/TLS certificate or key
+        OSError: If the port is already in use or permission is denied
+        ValueError: If configuration files are invalid or missing
+    """
+
+    logging.basicConfig(level=logging.DEBUG, format="[%(levelname)s] %(message)s")
+
+    validate_server_paths(config_path, routing_config_dir, cert_path, key_path)
+
+    config: Configuration = load_configurations(config_path, routing_config_dir)
+    context: ssl.SSLContext = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(certfile=cert_path, keyfile=key_path)
+
+    async def serve() -> None:
+        server = await AsyncMockServer(config).start(None, port, context)
+        logging.info("Server started on port %s", port)
+        logging.info("HTTPS enabled with cert: %s and key: %s", cert_path, key_path)
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        logging.info("Server is shutting down due to keyboard interrupt.")
@@ -0,0 +1,164 @@
+# Copyright (c) 2026 Project CHIP Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import concurrent.futures
+import http.client
+import socket
+import ssl
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+from pathlib import Path
+from typing import List, Tuple
+
+from route_configuration import Route, load_configurations
+from router import CompiledRouter, match_route
+
+"""
+Benchmark of the mock server
+
+Measures the requests per second served by the threading server and by the asyncio server
+(--asyncio) for the same route configuration, with concurrent clients sending requests to
+the paths of the configured routes. Each client reuses its connection when the server keeps
+it alive. The matching of the routes is also measured alone, with match_route and with
+CompiledRouter.
+
+Usage:
+    python benchmark.py [--config CONFIG_FILE] [--routing-config-dir ROUTE_DIR]
+                        [--clients CLIENTS] [--requests REQUESTS]
+"""
+
+SRC_DIR = Path(__file__).resolve().parent
+CONFIGURATIONS_DIR = SRC_DIR.parent / "configurations"
+
+
+def request_paths(routing: List[Route]) -> List[Tuple[str, str]]:
+    """ Returns a request for each route, and one that does not match any route. """
+    paths = []
+    for route in routing:
+        path = route.path[:-1] + "benchmark" if route.path.endswith("*") else route.path
+        if route.query:
+            path += "?" + "&".join(f"{param}=1" for param in route.query.params)
+        paths.append((route.method, path))
+    paths.append(("GET", "/benchmark/not/found"))
+    return paths
+
+
+def benchmark_router(routing: List[Route], iterations: int) -> None:
+    paths = request_paths(routing)
+    router = CompiledRouter(routing)
+
+    def run_match_route():
+        for method, path in paths:
+            path, _, query = path.partition("?")
+            match_route(routing, method, path, query)
+
+    def run_compiled_router():
+        for method, path in paths:
+            path, _, query = path.partition("?")
+            router.match(method, path, query)
+
+    for name, run in (("match_route", run_match_route), ("CompiledRouter", run_compiled_router)):
+        elapsed = timeit.timeit(run, number=iterations)
+        print(f"{name:>16}: {iterations * len(paths) / elapsed:12.0f} matches/s ({len(routing)} routes)")
+
+
+def run_client(port: int, paths: List[Tuple[str, str]], requests: int) -> List[float]:
+    """ Sends requests to the server, returning their latencies. """
+    context = ssl.create_default_context()
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+
+    connection = http.client.HTTPSConnection("localhost", port, context=context)
+    latencies = []
+    for i in range(requests):
+        method, path = paths[i % len(paths)]
+        start = time.perf_counter()
+        connection.request(method, path)
+        response = connection.getresponse()
+        response.read()
+        latencies.append(time.perf_counter() - start)
+        # The threading server closes the connection after each response
+        if response.will_close:
+            connection.close()
+    connection.close()
+    return latencies
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def wait_for_server(port: int, server: subprocess.Popen) -> None:
+    deadline = time.monotonic() + 10
+    while True:
+        try:
+            socket.create_connection(("localhost", port), timeout=1).close()
+            return
+        except OSError:
+            if server.poll() is not None or time.monotonic() > deadline:
+                raise RuntimeError("The mock server did not start")
+            time.sleep(0.1)
+
+
+def benchmark_server(name: str, server_args: List[str], paths: List[Tuple[str, str]], clients: int, requests: int) -> None:
+    port = free_port()
+    server = subprocess.Popen([sys.executable, str(SRC_DIR / "main.py"), "--port", str(port)] + server_args,
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wait_for_server(port, server)
+
+        # Clients run in their own processes, for the client side not to be the bottleneck
+        with concurrent.futures.ProcessPoolExecutor(clients) as executor:
+            start = time.perf_counter()
+            futures = [executor.submit(run_client, port, paths, requests) for _ in range(clients)]
+            latencies = sorted(latency for future in futures for latency in future.result())
+            elapsed = time.perf_counter() - start
+    finally:
+        server.terminate()
+        server.wait()
+
+    print(f"{name:>16}: {len(latencies) / elapsed:12.0f} requests/s, "
+          f"p50 {latencies[len(latencies) // 2] * 1000:.2f}ms, p99 {latencies[int(len(latencies) * 0.99)] * 1000:.2f}ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark of the mock server")
+    parser.add_argument("--config", type=str, default=str(CONFIGURATIONS_DIR / "server_config.json"),
+                        help="Path to the common config file")
+    parser.add_argument("--routing-config-dir", type=str, default=str(CONFIGURATIONS_DIR / "fake_distributed_compliance_ledger"),
+                        help="Directory of the routing configuration files")
+    parser.add_argument("--clients", type=int, default=8, help="Number of concurrent clients")
+    parser.add_argument("--requests", type=int, default=500, help="Number of requests sent by each client")
+    parser.add_argument("--router-iterations", type=int, default=10000, help="Number of times all the routes are matched")
+    args = parser.parse_args()
+
+    config = load_configurations(Path(args.config), Path(args.routing_config_dir))
+    benchmark_router(config.routing, args.router_iterations)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cert, key = Path(tmp) / "server.crt", Path(tmp) / "server.key"
+        subprocess.run(["openssl", "req", "-x509", "-newkey", "rsa:2048", "-keyout", str(key), "-out", str(cert),
+                        "-days", "1", "-nodes", "-subj", "/CN=localhost"], check=True, capture_output=True)
+
+        server_args = ["--config", args.config, "--routing-config-dir", args.routing_config_dir,
+                       "--cert", str(cert), "--key", str(key)]
+        paths = request_paths(config.routing)
+        benchmark_server("threading", server_args, paths, args.clients, args.requests)
+        benchmark_server("asyncio", server_args + ["--asyncio"], paths, args.clients, args.requests)
@@ -15,10 +15,28 @@
 import http.server
 import json
 import urllib.parse
-from typing import List, Optional, Type
+from typing import Dict, Optional, Type
 
 from route_configuration import Configuration, Route
-from router import match_route
+from router import CompiledRouter
+
+NOT_FOUND_HEADERS: Dict[str, str] = {"Content-Type": "application/json"}
+NOT_FOUND_BODY: bytes = json.dumps({}).encode("utf-8")
+
+
+def encode_response_body(route: Route) -> bytes:
+    """
+    Encodes the static response body of a route, as JSON if its Content-Type is
+    application/json and as text otherwise.
+    """
+    if route.response.headers.get("Content-Type") == "application/json":
+        return json.dumps(route.response.body).encode("utf-8")
+    return str(route.response.body).encode("utf-8")
+
+
+def compile_responses(config: Configuration) -> Dict[int, bytes]:
+    """ Encodes the response bodies of all the routes once, by id of the route. """
+    return {id(route): encode_response_body(route) for route in config.routing}
 
 
 def createMockServerHandler(config: Configuration) -> Type[http.server.BaseHTTPRequestHandler]:
@@ -65,8 +83,12 @@ def createMockServerHandler(config: Configuration) -> Type[http.server.BaseHTTPR
         - JSON responses are automatically encoded to UTF-8
         - Non-JSON responses are converted to strings before encoding
         - All responses include standard HTTP headers and status codes
+        - Routes are compiled and response bodies encoded once, when the handler is created
     """
 
+    router = CompiledRouter(config.routing)
+    response_bodies = compile_responses(config)
+
     class MockServerHandler(http.server.BaseHTTPRequestHandler):
         def _set_headers(self, status_code=200, headers=None) -> None:
             self.send_response(status_code)
@@ -89,24 +111,18 @@ def createMockServerHandler(config: Configuration) -> Type[http.server.BaseHTTPR
 
         def handle_request(self) -> None:
             parsed_path: urllib.parse.ParseResult = urllib.parse.urlparse(self.path)
-            path: str = parsed_path.path
-            query_params: dict[str, list[str]] = urllib.parse.parse_qs(parsed_path.query)
 
-            # Find the matching route from the configuration
-            routes: List[Route] = config.routing
-            route: Optional[Route] = match_route(routes, self.command, path, query_params)
+            # Find the matching route from the configuration, the query is only parsed if needed
+            route: Optional[Route] = router.match(self.command, parsed_path.path, parsed_path.query)
 
             if not route:
                 # No matching route found; return a 404 error response
-                self._set_headers(404, {"Content-Type": "application/json"})
-                self.wfile.write(json.dumps({}).encode("utf-8"))
+                self._set_headers(404, NOT_FOUND_HEADERS)
+                self.wfile.write(NOT_FOUND_BODY)
                 return
 
             # Use the static response defined in the configuration
             self._set_headers(route.response.status, route.response.headers)
-            if route.response.headers.get("Content-Type") == "application/json":
-                self.wfile.write(json.dumps(route.response.body).encode("utf-8"))
-            else:
-                self.wfile.write(str(route.response.body).encode("utf-8"))
+            self.wfile.write(response_bodies[id(route)])
 
     return MockServerHandler
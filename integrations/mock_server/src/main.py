@@ -15,6 +15,7 @@
 import argparse
 from pathlib import Path
 
+from async_server import run_async_server
 from server import run_server
 
 """
@@ -30,11 +31,12 @@ The server supports:
 - Configurable port binding
 - Multiple concurrent connections
 - Dynamic response configuration
+- An asyncio server keeping connections alive, for high request rates
 
 Usage:
     python main.py [--port PORT] [--config CONFIG_FILE]
                    [--routing-config-dir ROUTE_DIR]
-                   [--cert CERT_FILE] [--key KEY_FILE]
+                   [--cert CERT_FILE] [--key KEY_FILE] [--asyncio]
 
 Arguments:
     --port PORT                 Port number to listen on (default: 8443)
@@ -43,6 +45,8 @@ Arguments:
                                (default: config.json)
     --cert CERT_FILE           Path to SSL certificate file (default: server.crt)
     --key KEY_FILE             Path to SSL private key file (default: server.key)
+    --asyncio                  Serve with asyncio and HTTP/1.1 keep-alive instead of a thread
+                               per connection
 
 Example:
     python main.py --port 8443 --config ./config/main.json
@@ -67,7 +71,7 @@ Notes:
     - Server runs until interrupted (Ctrl+C)
     - All endpoints return JSON by default
     - Logs to stdout with DEBUG level
-    - Supports concurrent requests via threading
+    - Supports concurrent requests via threading, or via asyncio with --asyncio
 """
 
 
@@ -78,6 +82,8 @@ if __name__ == "__main__":
     parser.add_argument("--routing-config-dir", type=str, default="config.json", help="Path to the common config file")
     parser.add_argument("--cert", type=str, default="server.crt", help="SSL Certificate file")
     parser.add_argument("--key", type=str, default="server.key", help="SSL Private Key file")
+    parser.add_argument("--asyncio", action="store_true", help="Serve with asyncio, keeping connections alive")
 
     args = parser.parse_args()
-    run_server(args.port, Path(args.config), Path(args.routing_config_dir), Path(args.cert), Path(args.key))
+    serve = run_async_server if args.asyncio else run_server
+    serve(args.port, Path(args.config), Path(args.routing_config_dir), Path(args.cert), Path(args.key))
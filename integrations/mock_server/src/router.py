@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import parse_qs
 
 from route_configuration import Route
@@ -85,14 +85,7 @@ def match_route(routing: List[Route], method: str, path: str, query: Optional[Di
         return None
 
     # Parse query parameters if present
-    query_params = {}
-    if query:
-        if isinstance(query, str):
-            # parse_qs returns values as lists, we'll take the first value for each parameter
-            parsed = parse_qs(query)
-            query_params = {k: v[0] if v else "" for k, v in parsed.items()}
-        else:
-            query_params = query
+    query_params = _parse_query(query)
 
     # Find the first route that matches the path and query parameters
     for route in path_routes:
@@ -104,3 +97,86 @@ def match_route(routing: List[Route], method: str, path: str, query: Optional[Di
             return route
 
     return None
+
+
+class CompiledRouter:
+    """
+    Matches requests like match_route, against routes compiled once into lookup tables.
+
+    Routes with an exact path are indexed by (method, path), and wildcard routes by method in
+    a trie of their path prefixes, so that matching a request does not go through the whole
+    route list. The query string is only parsed when a candidate route requires parameters.
+
+    Examples:
+        router = CompiledRouter(config.routing)
+        route = router.match("GET", "/api/device/123", "type=sensor")
+    """
+
+    def __init__(self, routing: List[Route]):
+        # Routes are stored along with their position in the configuration, which is their priority
+        self._exact: Dict[Tuple[str, str], List[Tuple[int, Route]]] = {}
+        self._wildcards: Dict[str, _PrefixTrie] = {}
+
+        for index, route in enumerate(routing):
+            if route.path.endswith("*"):
+                self._wildcards.setdefault(route.method, _PrefixTrie()).insert(route.path[:-1], (index, route))
+            else:
+                self._exact.setdefault((route.method, route.path), []).append((index, route))
+
+    def match(self, method: str, path: str, query: Optional[Dict[str, Any] | str] = None) -> Optional[Route]:
+        """
+        Finds the best matching route, with the same arguments and result as match_route.
+        """
+        candidates = self._exact.get((method, path), [])
+        trie = self._wildcards.get(method)
+        if trie:
+            wildcard_candidates = trie.find_prefixes_of(path)
+            if wildcard_candidates:
+                candidates = sorted(candidates + wildcard_candidates, key=lambda candidate: candidate[0])
+
+        query_params: Optional[Dict[str, Any]] = None
+        for _, route in candidates:
+            if not route.query:
+                return route
+
+            if query_params is None:
+                query_params = _parse_query(query)
+            if all(param in query_params for param in route.query.params):
+                return route
+
+        return None
+
+
+class _PrefixTrie:
+    """ Character trie of the path prefixes of the wildcard routes. """
+
+    def __init__(self):
+        self.children: Dict[str, _PrefixTrie] = {}
+        self.routes: List[Tuple[int, Route]] = []
+
+    def insert(self, prefix: str, route: Tuple[int, Route]) -> None:
+        node = self
+        for char in prefix:
+            node = node.children.setdefault(char, _PrefixTrie())
+        node.routes.append(route)
+
+    def find_prefixes_of(self, path: str) -> List[Tuple[int, Route]]:
+        """ Returns the routes of all the prefixes of path. """
+        found = list(self.routes)
+        node = self
+        for char in path:
+            node = node.children.get(char)  # type: ignore
+            if node is None:
+                break
+            found.extend(node.routes)
+        return found
+
+
+def _parse_query(query: Optional[Dict[str, Any] | str]) -> Dict[str, Any]:
+    if not query:
+        return {}
+    if isinstance(query, str):
+        # parse_qs returns values as lists, we'll take the first value for each parameter
+        parsed = parse_qs(query)
+        return {k: v[0] if v else "" for k, v in parsed.items()}
+    return query
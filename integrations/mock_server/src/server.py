@@ -22,6 +22,26 @@ from handler import createMockServerHandler
 from route_configuration import Configuration, load_configurations
 
 
+def validate_server_paths(config_path: Path, routing_config_dir: Path, cert_path: Path, key_path: Path) -> None:
+    """
+    Checks that the configuration, certificate and key files given to a server exist.
+
+    Raises:
+        ValueError: If a file or directory is missing
+    """
+    if not config_path.is_file():
+        raise ValueError(f"'{config_path}' is not a file")
+
+    if not routing_config_dir.is_dir():
+        raise ValueError(f"'{routing_config_dir}' is not a directory")
+
+    if not cert_path.is_file():
+        raise ValueError(f"'{cert_path}' is not a file")
+
+    if not key_path.is_file():
+        raise ValueError(f"'{key_path}' is not a file")
+
+
 def run_server(port: int, config_path: Path, routing_config_dir: Path, cert_path: Path, key_path: Path) -> None:
     """
     Starts a secure HTTPS server with mock endpoints defined by configuration files.
@@ -66,17 +86,7 @@ def run_server(port: int, config_path: Path, routing_config_dir: Path, cert_path
 
     logging.basicConfig(level=logging.DEBUG, format="[%(levelname)s] %(message)s")
 
-    if not config_path.is_file():
-        raise ValueError(f"'{config_path}' is not a file")
-
-    if not routing_config_dir.is_dir():
-        raise ValueError(f"'{routing_config_dir}' is not a directory")
-
-    if not cert_path.is_file():
-        raise ValueError(f"'{cert_path}' is not a file")
-
-    if not key_path.is_file():
-        raise ValueError(f"'{key_path}' is not a file")
+    validate_server_paths(config_path, routing_config_dir, cert_path, key_path)
 
     config: Configuration = load_configurations(config_path, routing_config_dir)
     server_address: socketserver._AfInetAddress = ("", port)
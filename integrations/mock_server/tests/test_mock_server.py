@@ -12,15 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import json
 import shutil
 import tempfile
 import unittest
 from pathlib import Path
-from typing import List
+from typing import Callable, Dict, List, Optional
 
-from route_configuration import QueryConfig, Route, RouteResponse, load_configurations
-from router import match_route
+from async_server import AsyncMockServer
+from route_configuration import Configuration, QueryConfig, Route, RouteResponse, load_configurations
+from router import CompiledRouter, match_route
 
 
 class TestConfigLoader(unittest.TestCase):
@@ -93,6 +95,13 @@ class TestConfigLoader(unittest.TestCase):
         self.assertEqual(query_route.response.body["version"], "1.0")  # type: ignore
 
 
+# Implementations of the route matching, all checked by TestRouter
+ROUTERS: Dict[str, Callable[[List[Route]], Callable[..., Optional[Route]]]] = {
+    "match_route": lambda routes: lambda method, path, query: match_route(routes, method, path, query),
+    "CompiledRouter": lambda routes: CompiledRouter(routes).match,
+}
+
+
 class TestRouter(unittest.TestCase):
     routes: List[Route] = []
 
@@ -122,29 +131,90 @@ class TestRouter(unittest.TestCase):
             ),
         ]
 
+    def assertMatch(self, method: str, path: str, query, body: Optional[dict]):
+        """ Checks the route matched by each implementation of ROUTERS, in a subtest of its own. """
+        for name, make_router in ROUTERS.items():
+            with self.subTest(router=name, method=method, path=path, query=query):
+                route = make_router(self.routes)(method, path, query)
+                if body is None:
+                    self.assertIsNone(route)
+                else:
+                    self.assertIsNotNone(route)
+                    self.assertEqual(route.response.body, body)  # type: ignore
+
     def test_exact_route_match(self):
-        route = match_route(self.routes, "GET", "/api/data", {})
-        self.assertIsNotNone(route)
-        self.assertEqual(route.response.body, {"message": "Hello, World!"})  # type: ignore
+        self.assertMatch("GET", "/api/data", {}, {"message": "Hello, World!"})
 
     def test_wildcard_route_match(self):
-        route = match_route(self.routes, "GET", "/api/anything", {})
-        self.assertIsNotNone(route)
-        self.assertEqual(route.response.body, {"message": "Wildcard matched"})  # type: ignore
+        self.assertMatch("GET", "/api/anything", {}, {"message": "Wildcard matched"})
 
     def test_query_parameter_matching(self):
-        route = match_route(self.routes, "GET", "/api/query", {"key": ["value"]})
-        self.assertIsNotNone(route)
-        self.assertEqual(route.response.body, {"message": "Query matched"})  # type: ignore
+        self.assertMatch("GET", "/api/query", {"key": ["value"]}, {"message": "Query matched"})
+        self.assertMatch("GET", "/api/query", "key=value", {"message": "Query matched"})
+        # Without the parameter, the query route is skipped for the wildcard route
+        self.assertMatch("GET", "/api/query", "other=value", {"message": "Wildcard matched"})
 
     def test_body_regex_match(self):
-        route = match_route(self.routes, "POST", "/api/echo", "This is a hello message")
-        self.assertIsNotNone(route)
-        self.assertEqual(route.response.body, {"message": "Echo"})  # type: ignore
+        self.assertMatch("POST", "/api/echo", "This is a hello message", {"message": "Echo"})
 
     def test_no_match(self):
-        route = match_route(self.routes, "DELETE", "/nonexistent", {})
-        self.assertIsNone(route)
+        self.assertMatch("DELETE", "/nonexistent", {}, None)
+        self.assertMatch("GET", "/other", {}, None)
+
+    def test_same_matches_as_match_route(self):
+        routes = [
+            Route(method="GET", path="/a/*", response=RouteResponse(status=200, headers={}, body={"n": 1})),
+            Route(method="GET", path="/a/b", response=RouteResponse(status=200, headers={}, body={"n": 2})),
+            Route(method="GET", path="/a/b*", query=QueryConfig(params={"q": 1}),
+                  response=RouteResponse(status=200, headers={}, body={"n": 3})),
+            Route(method="GET", path="*", response=RouteResponse(status=200, headers={}, body={"n": 4})),
+            Route(method="POST", path="/a/b", response=RouteResponse(status=200, headers={}, body={"n": 5})),
+            Route(method="POST", path="/a/b", response=RouteResponse(status=200, headers={}, body={"n": 6})),
+        ]
+        router = CompiledRouter(routes)
+        for method in ("GET", "POST", "PUT"):
+            for path in ("/a/b", "/a/bc", "/a/", "/a", "/", ""):
+                for query in (None, "", "q=1", "r=1", {"q": ["1"]}):
+                    self.assertIs(router.match(method, path, query), match_route(routes, method, path, query),
+                                  (method, path, query))
+
+
+class TestAsyncMockServer(unittest.TestCase):
+    def setUp(self):
+        self.config = Configuration(routing=[
+            Route(method="GET", path="/api/data",
+                  response=RouteResponse(status=200, headers={"Content-Type": "application/json"}, body={"message": "ok"})),
+            Route(method="POST", path="/api/*",
+                  response=RouteResponse(status=201, headers={"Content-Type": "text/plain"}, body="created")),
+        ])
+
+    async def send_requests(self, requests: bytes) -> bytes:
+        server = await AsyncMockServer(self.config).start("127.0.0.1", 0, None)
+        async with server:
+            reader, writer = await asyncio.open_connection(*server.sockets[0].getsockname())
+            writer.write(requests)
+            response = await reader.read()
+            writer.close()
+        return response
+
+    def test_keep_alive(self):
+        # Both requests are answered on the same connection, which is closed after the last one
+        response = asyncio.run(self.send_requests(
+            b"GET /api/data?x=1 HTTP/1.1\r\nHost: localhost\r\n\r\n"
+            b"POST /api/items HTTP/1.1\r\nHost: localhost\r\nContent-Length: 5\r\nConnection: close\r\n\r\nhello"))
+
+        first, second = response.split(b"HTTP/1.1 ")[1:]
+        self.assertTrue(first.startswith(b"200 OK\r\n"))
+        self.assertIn(b"Connection: keep-alive\r\n", first)
+        self.assertTrue(first.endswith(b'\r\n\r\n{"message": "ok"}'))
+        self.assertTrue(second.startswith(b"201 Created\r\n"))
+        self.assertIn(b"Connection: close\r\n", second)
+        self.assertTrue(second.endswith(b"\r\n\r\ncreated"))
+
+    def test_not_found(self):
+        response = asyncio.run(self.send_requests(b"GET /other HTTP/1.0\r\n\r\n"))
+        self.assertTrue(response.startswith(b"HTTP/1.1 404 Not Found\r\n"))
+        self.assertTrue(response.endswith(b"\r\n\r\n{}"))
 
 
 if __name__ == "__main__":
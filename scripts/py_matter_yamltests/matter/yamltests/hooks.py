@@ -138,6 +138,19 @@ class TestRunnerHooks():
         """
         pass
 
+    def test_latencies(self, percentiles: dict[int, float]):
+        """
+        This method is called when the runner has run all the steps of a particular test file,
+        right before test_stop.
+
+        Parameters
+        ----------
+        percentiles: dict[int, float]
+            A mapping of percentile (e.g. 50, 90, 99) to the step duration, in milliseconds.
+            It is empty if no step has been executed.
+        """
+        pass
+
     def step_skipped(self, name: str, expression: str):
         """
         This method is called when running a step is skipped.
@@ -940,6 +940,22 @@ class TestStep:
         """Gets a runtime variable from the test context, or None if missing."""
         return self._runtime_config_variable_storage.get(name)
 
+    @property
+    def saves_runtime_variables(self) -> bool:
+        """Whether post processing the response of this step may update the runtime variables."""
+        if self._test.save_response_as or self.is_event:
+            return True
+
+        responses = self.responses or []
+        if not isinstance(responses, list):
+            responses = [responses]
+
+        for response in responses:
+            for value in response.get('values', []):
+                if 'saveAs' in value or 'saveDataVersionAs' in value:
+                    return True
+        return False
+
     def post_process_response(self, received_responses):
         result = PostProcessResponseResult()
 
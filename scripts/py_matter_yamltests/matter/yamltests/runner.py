@@ -15,6 +15,7 @@
 
 import ast
 import asyncio
+import math
 import time
 from abc import ABC, abstractmethod
 from asyncio import CancelledError
@@ -48,11 +49,16 @@ class TestRunnerOptions:
 
     delay_in_ms:  If set to any value that is not zero the runner will
                   wait for the given time between steps.
+
+    pipelined: If set to True the runner will encode the next step while
+               the current one is in flight, as long as the current step
+               does not save any runtime variable the next one may use.
     """
     stop_on_error: bool = True
     stop_on_warning: bool = False
     stop_at_number: int = -1
     delay_in_ms: int = 0
+    pipelined: bool = False
 
 
 @dataclass
@@ -82,6 +88,43 @@ class TestRunnerConfig:
     auto_start_stop: bool = True
 
 
+def _compute_latency_percentiles(durations: list[float], percentiles=(50, 90, 99)) -> dict[int, float]:
+    """Returns the nearest-rank percentiles of the given step durations."""
+    if not durations:
+        return {}
+
+    ordered = sorted(durations)
+    return {p: ordered[max(math.ceil(p / 100 * len(ordered)), 1) - 1] for p in percentiles}
+
+
+class _LookaheadSteps:
+    """
+    Iterator over the steps of a test that allows peeking at the next step.
+
+    Peeking builds the next TestStep, which resolves its placeholders against the
+    runtime variables known at that time. Callers should only peek when the current
+    step can not update those variables.
+    """
+
+    def __init__(self, steps):
+        self._steps = steps
+        self._next = None
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._next is not None:
+            step, self._next = self._next, None
+            return step
+        return next(self._steps)
+
+    def peek(self):
+        if self._next is None:
+            self._next = next(self._steps, None)
+        return self._next
+
+
 class TestRunnerBase(ABC):
     """
     TestRunnerBase is an abstract interface that defines the set of methods a runner
@@ -181,6 +224,34 @@ class TestRunner(TestRunnerBase):
                 return item.get('value')
         return None
 
+    async def _execute_and_prefetch(self, encoded_request, steps: _LookaheadSteps, config: TestRunnerConfig):
+        """
+        Executes the given request and encodes the next step while waiting for the response.
+
+        Returns a tuple with the encoded response and, if the next step could be encoded
+        ahead of time, a (request, encoded_request) tuple for it.
+        """
+        task = asyncio.ensure_future(self.execute(encoded_request))
+        # Let the request go out before spending any time on the next step.
+        await asyncio.sleep(0)
+
+        prefetched = None
+        next_request = steps.peek()
+        if next_request is not None and self._can_prefetch(next_request, config):
+            try:
+                prefetched = (next_request, config.adapter.encode(next_request))
+            except Exception:
+                # The step will be encoded again when it runs, so any error is reported
+                # against the right step.
+                prefetched = None
+
+        return await task, prefetched
+
+    def _can_prefetch(self, request, config: TestRunnerConfig) -> bool:
+        if not request.is_pics_enabled:
+            return False
+        return not (config.pseudo_clusters.supports(request) or config.pseudo_clusters.is_manual_step(request))
+
     async def _run(self, parser: TestParser, config: TestRunnerConfig):
         status = True
         try:
@@ -188,7 +259,10 @@ class TestRunner(TestRunnerBase):
             hooks.test_start(parser.filename, parser.name, parser.tests.count)
 
             test_duration = 0
-            for idx, request in enumerate(parser.tests):
+            step_durations = []
+            steps = _LookaheadSteps(parser.tests)
+            prefetched = None
+            for idx, request in enumerate(steps):
                 # Handle skipping tests where PICS do not apply.
                 if not request.is_pics_enabled:
                     hooks.step_skipped(request.label, request.pics)
@@ -236,11 +310,20 @@ class TestRunner(TestRunnerBase):
                     else:
                         responses, logs = await config.pseudo_clusters.execute(request, parser.definitions)
                 else:
-                    encoded_request = config.adapter.encode(request)
-                    encoded_response = await self.execute(encoded_request)
+                    if prefetched and prefetched[0] is request:
+                        encoded_request = prefetched[1]
+                    else:
+                        encoded_request = config.adapter.encode(request)
+                    prefetched = None
+
+                    if config.options.pipelined and not request.saves_runtime_variables:
+                        encoded_response, prefetched = await self._execute_and_prefetch(encoded_request, steps, config)
+                    else:
+                        encoded_response = await self.execute(encoded_request)
                     responses, logs = config.adapter.decode(encoded_response)
                 duration = round((time.time() - start) * 1000, 2)
                 test_duration += duration
+                step_durations.append(duration)
 
                 logger = request.post_process_response(responses)
 
@@ -264,6 +347,7 @@ class TestRunner(TestRunnerBase):
                 if config.options.delay_in_ms:
                     await asyncio.sleep(config.options.delay_in_ms / 1000)
 
+            hooks.test_latencies(_compute_latency_percentiles(step_durations))
             hooks.test_stop(round(test_duration))
 
         except Exception as exception:
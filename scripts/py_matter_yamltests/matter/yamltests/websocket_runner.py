@@ -16,7 +16,6 @@
 import asyncio
 import logging
 import re
-import select
 import subprocess
 import time
 from dataclasses import dataclass
@@ -81,7 +80,10 @@ class WebSocketRunner(TestRunner):
         return None
 
     async def _start_client(self, url, max_retries=_CONNECT_MAX_RETRIES_DEFAULT, interval_between_retries=1):
-        if max_retries:
+        # When the server has been started by the runner it has already signaled that it is
+        # ready, so the first attempt is expected to succeed. Servers started by other means
+        # may take longer, so each retry waits one second longer than the previous one.
+        for _ in range(max_retries):
             start = time.time()
             try:
                 self._hooks.connecting(url)
@@ -94,7 +96,7 @@ class WebSocketRunner(TestRunner):
                 self._hooks.failure(duration)
                 self._hooks.retry(interval_between_retries)
                 await asyncio.sleep(interval_between_retries)
-                return await self._start_client(url, max_retries - 1, interval_between_retries + 1)
+                interval_between_retries += 1
 
         self._hooks.abort(url)
         raise Exception(f'Connecting to {url} failed.')
@@ -106,8 +108,6 @@ class WebSocketRunner(TestRunner):
     async def _start_server(self, command, url):
         instance = None
         if command:
-            start_time = time.time()
-
             instance = subprocess.Popen(    # noqa: ASYNC220
                 command,
                 bufsize=0,                  # unbuffered
@@ -116,30 +116,40 @@ class WebSocketRunner(TestRunner):
                 stderr=subprocess.STDOUT,
             )
 
-            # Loop to read the subprocess output with a timeout
             lines = []
-            while True:
-                if time.time() - start_time > _WEBSOCKET_SERVER_MESSAGE_TIMEOUT:
-                    for line in lines:
-                        print(line.decode('utf-8', errors='replace'), end='')
-                    self._hooks.abort(url)
-                    await self._stop_server(instance)
-                    raise Exception(
-                        f'Connecting to {url} failed. WebSocket startup has not been detected.')
-
-                ready, _, _ = select.select([instance.stdout], [], [], 1)
-                if ready:
-                    line = instance.stdout.readline()
-                    if line:
-                        lines.append(line)
-                        if re.search(_WEBSOCKET_SERVER_MESSAGE, line.decode('utf-8', errors='replace')):
-                            break  # Exit the loop if the pattern is found
-                else:
-                    continue
+            ready = await self._wait_for_server_ready(instance, lines)
+            if not ready:
+                for line in lines:
+                    print(line.decode('utf-8', errors='replace'), end='')
+                self._hooks.abort(url)
+                await self._stop_server(instance)
+                raise Exception(
+                    f'Connecting to {url} failed. WebSocket startup has not been detected.')
             instance.stdout.close()
 
         return instance
 
+    async def _wait_for_server_ready(self, instance, lines: list) -> bool:
+        """
+        Waits for the server to signal that it is ready to accept connections.
+
+        The server output is read on a worker thread so the event loop is not blocked, and
+        the wait returns as soon as the ready message is printed or the server exits.
+        """
+        def read_until_ready():
+            for line in iter(instance.stdout.readline, b''):
+                lines.append(line)
+                if re.search(_WEBSOCKET_SERVER_MESSAGE, line.decode('utf-8', errors='replace')):
+                    return True
+            return False
+
+        loop = asyncio.get_running_loop()
+        try:
+            return await asyncio.wait_for(loop.run_in_executor(None, read_until_ready), _WEBSOCKET_SERVER_MESSAGE_TIMEOUT)
+        except asyncio.TimeoutError:
+            # The reader thread returns once the server is stopped and its output is closed.
+            return False
+
     async def _stop_server(self, instance):
         if instance:
             instance.terminate()  # sends SIGTERM
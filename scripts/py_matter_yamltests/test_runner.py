@@ -0,0 +1,143 @@
+#!/usr/bin/env -S python3 -B
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the 'License');
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an 'AS IS' BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import asyncio
+import unittest
+from unittest.mock import mock_open, patch
+
+from matter.yamltests.adapter import TestAdapter
+from matter.yamltests.hooks import TestRunnerHooks
+from matter.yamltests.parser_builder import TestParserBuilderConfig
+from matter.yamltests.runner import TestRunner, TestRunnerConfig, TestRunnerOptions, _compute_latency_percentiles
+
+simple_test_yaml = '''
+name: Test Pipelining
+
+config:
+    myValue: 1
+
+tests:
+    - label: "Step 1"
+      cluster: "OnOff"
+      command: "Toggle"
+
+    - label: "Step 2"
+      cluster: "OnOff"
+      command: "readAttribute"
+      attribute: "OnTime"
+      response:
+          saveAs: myValue
+
+    - label: "Step 3"
+      cluster: "OnOff"
+      command: "writeAttribute"
+      attribute: "OnTime"
+      arguments:
+          value: myValue
+
+    - label: "Step 4"
+      cluster: "OnOff"
+      command: "Toggle"
+'''
+
+
+def mock_open_with_parameter_content(content):
+    file_object = mock_open(read_data=content).return_value
+    file_object.__iter__.return_value = content.splitlines(True)
+    return file_object
+
+
+class FakeAdapter(TestAdapter):
+    def __init__(self, events):
+        self._events = events
+
+    def encode(self, request):
+        self._events.append(('encode', request.label))
+        return request.label
+
+    def decode(self, response):
+        return {'value': 2}, []
+
+
+class FakeRunner(TestRunner):
+    def __init__(self, events):
+        self._events = events
+
+    async def execute(self, request):
+        self._events.append(('send', request))
+        await asyncio.sleep(0.01)
+        self._events.append(('receive', request))
+        return request
+
+
+class FakeHooks(TestRunnerHooks):
+    def __init__(self):
+        self.successes = 0
+        self.percentiles = None
+
+    def test_latencies(self, percentiles):
+        self.percentiles = percentiles
+
+    def test_stop(self, duration):
+        pass
+
+    def step_success(self, logger, logs, duration, request):
+        self.successes += 1
+
+
+@patch('builtins.open', new=mock_open_with_parameter_content)
+class TestRunnerPipelining(unittest.TestCase):
+    def _run(self, pipelined: bool):
+        events = []
+        hooks = FakeHooks()
+        options = TestRunnerOptions(pipelined=pipelined)
+        runner_config = TestRunnerConfig(FakeAdapter(events), options=options, hooks=hooks)
+        parser_builder_config = TestParserBuilderConfig([simple_test_yaml])
+        asyncio.run(FakeRunner(events).run(parser_builder_config, runner_config))
+        return events, hooks
+
+    def test_sequential(self):
+        events, hooks = self._run(pipelined=False)
+        self.assertEqual(events[:4], [('encode', 'Step 1'), ('send', 'Step 1'),
+                         ('receive', 'Step 1'), ('encode', 'Step 2')])
+        self.assertEqual(hooks.successes, 4)
+
+    def test_pipelined(self):
+        events, hooks = self._run(pipelined=True)
+        self.assertEqual(hooks.successes, 4)
+
+        # Step 2 is encoded while step 1 is in flight.
+        self.assertLess(events.index(('encode', 'Step 2')), events.index(('receive', 'Step 1')))
+        # Step 3 depends on a value saved by step 2, so it is only encoded once step 2 is done.
+        self.assertGreater(events.index(('encode', 'Step 3')), events.index(('receive', 'Step 2')))
+        # Step 4 is encoded while step 3 is in flight.
+        self.assertLess(events.index(('encode', 'Step 4')), events.index(('receive', 'Step 3')))
+        # Each step is encoded exactly once.
+        self.assertEqual(len([event for event in events if event[0] == 'encode']), 4)
+
+    def test_latencies(self):
+        _, hooks = self._run(pipelined=True)
+        self.assertEqual(list(hooks.percentiles.keys()), [50, 90, 99])
+
+    def test_compute_latency_percentiles(self):
+        self.assertEqual(_compute_latency_percentiles([]), {})
+        self.assertEqual(_compute_latency_percentiles([3.0]), {50: 3.0, 90: 3.0, 99: 3.0})
+        durations = [float(value) for value in range(100, 0, -1)]
+        self.assertEqual(_compute_latency_percentiles(durations), {50: 50.0, 90: 90.0, 99: 99.0})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
 import logging
 import os
 import pathlib
@@ -26,7 +27,28 @@ from typing import Literal
 
 log = logging.getLogger(__name__)
 
-log = logging.getLogger(__name__)
+
+# Number of output lines kept in memory by a LogPipe. Older lines are dropped, or
+# appended to the spill file if the pipe has one.
+_MAX_CAPTURED_LINES = 100000
+
+
+class _PatternWaiter:
+    """Patterns a thread is waiting for, matched against each new line as it is read."""
+
+    def __init__(self, patterns: typing.Iterable[str]):
+        self.pending = set(patterns)
+        self.last_index = -1
+
+    def feed(self, line: str, index: int):
+        found = [pattern for pattern in self.pending if pattern in line]
+        if found:
+            self.pending.difference_update(found)
+            self.last_index = max(self.last_index, index)
+
+    @property
+    def done(self) -> bool:
+        return not self.pending
 
 
 class LogPipe(threading.Thread):
@@ -37,9 +59,14 @@ class LogPipe(threading.Thread):
     enable IO buffering in the spawned process. In order to trick such process
     to flush its streams immediately, we are going to create a PIPE based on
     pseudoterminal (PTY).
+
+    Captured lines are kept in a ring buffer of max_lines entries and are indexed
+    by their absolute position in the output. Threads waiting for some output
+    register the patterns they are interested in, so each new line is tested once
+    against the pending patterns and waiters are woken up as soon as they match.
     """
 
-    def __init__(self, level, capture_delegate=None, name=None):
+    def __init__(self, level, capture_delegate=None, name=None, max_lines=_MAX_CAPTURED_LINES, spill_path=None):
         """
         Setup the object with a logger and a loglevel and start the thread.
         """
@@ -49,24 +76,71 @@ class LogPipe(threading.Thread):
         self.level = level
         self.fd_read, self.fd_write = pty.openpty()
         self.reader = open(self.fd_read, encoding='utf-8', errors='ignore')  # noqa: SIM115
-        self.captured_logs = []
+        self.captured_logs = collections.deque(maxlen=max_lines)
         self.capture_delegate = capture_delegate
         self.name = name
+        self.is_closed = False
+
+        # Absolute index of the next line to be read.
+        self.__line_count = 0
+        self.__spill = open(spill_path, 'w', encoding='utf-8') if spill_path else None  # noqa: SIM115
+        self.__cv = threading.Condition()
+        self.__waiters = []
+        # Last match of each pattern given to FindLastMatchingLine, kept up to date as lines are read.
+        self.__last_matches = {}
 
         self.start()
 
+    def __first_index(self) -> int:
+        return self.__line_count - len(self.captured_logs)
+
+    def __lines_from(self, index: int):
+        """Yield (index, line) for the captured lines starting at the given absolute index."""
+        first = self.__first_index()
+        for i in range(max(index, first), self.__line_count):
+            yield i, self.captured_logs[i - first]
+
     def CapturedLogContains(self, txt: str, index=0):
-        for i, line in enumerate(self.captured_logs[index:]):
-            if txt in line:
-                return True, index + i
-        return False, len(self.captured_logs)
+        with self.__cv:
+            for i, line in self.__lines_from(index):
+                if txt in line:
+                    return True, i
+            return False, self.__line_count
+
+    def WaitForPatterns(self, patterns: typing.Iterable[str], index=0, timeout=None) -> typing.Optional[int]:
+        """
+        Block until every pattern has been seen in a line at or after the given index.
+
+        Returns the index of the last line that completed a pattern, or None if the
+        timeout elapsed or the pipe was closed before all patterns were seen.
+        """
+        waiter = _PatternWaiter(patterns)
+        with self.__cv:
+            for i, line in self.__lines_from(index):
+                waiter.feed(line, i)
+                if waiter.done:
+                    return waiter.last_index
+
+            self.__waiters.append(waiter)
+            try:
+                self.__cv.wait_for(lambda: waiter.done or self.is_closed, timeout)
+            finally:
+                self.__waiters.remove(waiter)
+            return waiter.last_index if waiter.done else None
 
     def FindLastMatchingLine(self, matcher):
-        for line in reversed(self.captured_logs):
-            match = re.match(matcher, line)
-            if match:
-                return match
-        return None
+        with self.__cv:
+            if matcher in self.__last_matches:
+                return self.__last_matches[matcher][1]
+
+            pattern = re.compile(matcher)
+            match = None
+            for line in reversed(self.captured_logs):
+                match = pattern.match(line)
+                if match:
+                    break
+            self.__last_matches[matcher] = (pattern, match)
+            return match
 
     def fileno(self):
         """Return the write file descriptor of the pipe."""
@@ -84,11 +158,38 @@ class LogPipe(threading.Thread):
             except OSError:
                 break
             log.log(self.level, line.strip())
-            self.captured_logs.append(line)
+            self.__append(line)
             if self.capture_delegate:
                 self.capture_delegate.Log(self.name, line)
         self.reader.close()
 
+        with self.__cv:
+            self.is_closed = True
+            if self.__spill:
+                self.__spill.close()
+            self.__cv.notify_all()
+
+    def __append(self, line: str):
+        with self.__cv:
+            if self.__spill and len(self.captured_logs) == self.captured_logs.maxlen:
+                self.__spill.write(self.captured_logs[0])
+
+            index = self.__line_count
+            self.captured_logs.append(line)
+            self.__line_count += 1
+
+            for matcher, (pattern, _) in self.__last_matches.items():
+                match = pattern.match(line)
+                if match:
+                    self.__last_matches[matcher] = (pattern, match)
+
+            notify = False
+            for waiter in self.__waiters:
+                waiter.feed(line, index)
+                notify = notify or waiter.done
+            if notify:
+                self.__cv.notify_all()
+
     def close(self):
         """Close the write end of the pipe."""
         os.close(self.fd_write)
@@ -152,9 +253,18 @@ class Executor:
 
 
 class Runner:
-    def __init__(self, executor: Executor, capture_delegate=None):
+    def __init__(self, executor: Executor, capture_delegate=None, log_spill_dir: typing.Optional[str] = None):
         self.executor = executor
         self.capture_delegate = capture_delegate
+        # If set, output lines that do not fit in the LogPipe buffers are written to files in this directory.
+        self.log_spill_dir = log_spill_dir
+        self.spill_count = 0
+
+    def __spill_path(self, name: str) -> typing.Optional[str]:
+        if not self.log_spill_dir:
+            return None
+        self.spill_count += 1
+        return os.path.join(self.log_spill_dir, '%04d-%s.log' % (self.spill_count, name.replace(' ', '_')))
 
     def RunSubprocess(self, subproc: SubprocessInfo, name: str, wait=True, dependencies=[], timeout_seconds: typing.Optional[int] = None, stdin=None):
         log.info('RunSubprocess starting application %s' % subproc)
@@ -162,10 +272,10 @@ class Runner:
 
         outpipe = LogPipe(
             logging.DEBUG, capture_delegate=self.capture_delegate,
-            name=name + ' OUT')
+            name=name + ' OUT', spill_path=self.__spill_path(name + ' OUT'))
         errpipe = LogPipe(
             logging.INFO, capture_delegate=self.capture_delegate,
-            name=name + ' ERR')
+            name=name + ' ERR', spill_path=self.__spill_path(name + ' ERR'))
 
         if self.capture_delegate:
             self.capture_delegate.Log(name, 'EXECUTING %r' % cmd)
@@ -13,6 +13,7 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import contextlib
 import logging
 import os
 import shlex
@@ -28,6 +29,7 @@ from datetime import datetime
 from enum import Enum, auto
 
 from .runner import SubprocessInfo
+from .warm_app import WarmAppCache
 
 log = logging.getLogger(__name__)
 
@@ -157,29 +159,17 @@ class App:
         """
         logging.debug('Waiting for all patterns %r', patterns)
 
-        start_time = time.monotonic()
-
-        def allPatternsFound() -> int | None:
-            lastLogIndex = self.lastLogIndex
-            for p in patterns:
-                found, index = self.outpipe.CapturedLogContains(p, self.lastLogIndex)
-                if not found:
-                    return None
-                lastLogIndex = max(lastLogIndex, index)
-
-            return lastLogIndex
-
-        lastLogIndex = allPatternsFound()
-        while lastLogIndex is None:
+        lastLogIndex = self.outpipe.WaitForPatterns(patterns, self.lastLogIndex, timeoutInSeconds)
+        if lastLogIndex is None:
+            if self.outpipe.is_closed:
+                # The output is closed when the process exits, give it a moment to be reaped.
+                with contextlib.suppress(subprocess.TimeoutExpired):
+                    self.process.wait(1)
             if self.process.poll() is not None:
                 died_str = f'Server died while waiting for {patterns!r}, returncode {self.process.returncode}'
                 logging.error(died_str)
                 raise Exception(died_str)
-            if time.monotonic() - start_time > timeoutInSeconds:
-                raise Exception(f'Timeout while waiting for {patterns!r}')
-            time.sleep(0.1)
-
-            lastLogIndex = allPatternsFound()
+            raise Exception(f'Timeout while waiting for {patterns!r}')
 
         self.lastLogIndex = lastLogIndex + 1
         logging.debug('Success waiting for: %r', patterns)
@@ -380,14 +370,27 @@ class TestDefinition:
             timeout_seconds: typing.Optional[int], dry_run=False,
             test_runtime: TestRunTime = TestRunTime.CHIP_TOOL_PYTHON,
             ble_controller_app: typing.Optional[int] = None,
-            ble_controller_tool: typing.Optional[int] = None):
+            ble_controller_tool: typing.Optional[int] = None,
+            warm_app: typing.Optional[WarmAppCache] = None):
         """
         Executes the given test case using the provided runner for execution.
+
+        If warm_app is provided, the commissioned state of the target app is reused
+        from a previous test with the same target and controller setup instead of
+        commissioning the app again.
         """
         runner.capture_delegate = ExecutionCapture()
 
         tool_storage_dir = None
 
+        # Warm apps are only supported by the chip-tool based runners, since the matter-repl
+        # tester commissions the app itself.
+        use_warm_app = warm_app is not None and not dry_run and test_runtime != TestRunTime.MATTER_REPL_PYTHON
+        warm_app_key = (self.target, test_runtime, ble_controller_app, ble_controller_tool)
+        reuse_warm_app = use_warm_app and warm_app.matches(warm_app_key)
+        if warm_app is not None:
+            warm_app.last_saved_seconds = 0.0
+
         loggedCapturedLogs = False
 
         try:
@@ -468,7 +471,26 @@ class TestDefinition:
                 setupCode = '${SETUP_PAYLOAD}'
             else:
                 app = apps_register.get('default')
-                app.start()
+                if reuse_warm_app:
+                    try:
+                        warm_app.restore(warm_app_key, app, tool_storage_dir)
+                        app.start()
+                        warm_app.record_reuse()
+                    except Exception:
+                        log.exception("%s - Failed to start the warm app, falling back to a full restart", self.name)
+                        warm_app.clear(warm_app_key)
+                        warm_app.last_saved_seconds = 0.0
+                        reuse_warm_app = False
+
+                        app.kill()
+                        app = App(runner, app.subproc)
+                        apps_register.add('default', app)
+                        app.factoryReset()
+                        shutil.rmtree(tool_storage_dir, ignore_errors=True)
+                        os.makedirs(tool_storage_dir)
+                        app.start()
+                else:
+                    app.start()
                 setupCode = app.setupCode
 
             if test_runtime == TestRunTime.MATTER_REPL_PYTHON:
@@ -511,8 +533,19 @@ class TestDefinition:
                     log.info(shlex.join(pairing_cmd))
                     log.info(shlex.join(test_cmd))
                 else:
-                    runner.RunSubprocess(pairing_cmd,
-                                         name='PAIR', dependencies=[apps_register])
+                    if reuse_warm_app:
+                        log.info("%s - Reusing warm app, skipping commissioning", self.name)
+                    else:
+                        pairing_start = time.monotonic()
+                        runner.RunSubprocess(pairing_cmd,
+                                             name='PAIR', dependencies=[apps_register])
+                        if use_warm_app:
+                            # Snapshot the KVS while the app is stopped, then restart it from that
+                            # storage, as the following warm tests will.
+                            pairing_seconds = time.monotonic() - pairing_start
+                            app.stop()
+                            warm_app.save(warm_app_key, app, tool_storage_dir, pairing_seconds)
+                            app.start()
                     runner.RunSubprocess(
                         test_cmd,
                         name='TEST', dependencies=[apps_register],
@@ -522,6 +555,9 @@ class TestDefinition:
             log.error("!!!!!!!!!!!!!!!!!!!! ERROR !!!!!!!!!!!!!!!!!!!!!!")
             runner.capture_delegate.LogContents()
             loggedCapturedLogs = True
+            # Do not trust the commissioned state anymore, the next test will do a full restart.
+            if use_warm_app:
+                warm_app.clear(warm_app_key)
             raise
         finally:
             ok = apps_register.killAll()
@@ -534,4 +570,6 @@ class TestDefinition:
             if not ok and not loggedCapturedLogs:
                 log.error("!!!!!!!!!!!!!!!!!!!! ERROR !!!!!!!!!!!!!!!!!!!!!!")
                 runner.capture_delegate.LogContents()
+                if use_warm_app:
+                    warm_app.clear(warm_app_key)
                 raise Exception('Subprocess terminated abnormally')
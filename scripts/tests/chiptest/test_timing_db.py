@@ -0,0 +1,92 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import os
+import tempfile
+import unittest
+
+from chiptest.timing_db import EstimateDuration, ShardLongestFirst, TimingDatabase
+
+
+class TestTimingDatabase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db = TimingDatabase(os.path.join(self.tmp.name, 'timings', 'tests.sqlite'))
+
+    def tearDown(self):
+        self.db.Close()
+        self.tmp.cleanup()
+
+    def record_run(self, results):
+        self.db.StartRun('CHIP_TOOL_PYTHON')
+        for test_name, attempt, duration, passed in results:
+            self.db.Record(test_name, attempt, duration, passed)
+        return self.db.Flush()
+
+    def test_flush(self):
+        self.db.StartRun('CHIP_TOOL_PYTHON')
+        self.assertIsNone(self.db.Flush())
+
+        first = self.record_run([('A', 1, 10.0, True)])
+        second = self.record_run([('A', 1, 12.0, True)])
+        self.assertEqual(self.db.RunIds(), [first, second])
+
+        # Results only reach the database when flushed
+        self.db.StartRun('CHIP_TOOL_PYTHON')
+        self.db.Record('A', 1, 1.0, True)
+        self.assertEqual(self.db.RunIds(), [first, second])
+
+    def test_expected_durations(self):
+        for duration in (10.0, 20.0, 30.0):
+            self.record_run([('A', 1, duration, True), ('B', 1, 100.0, False)])
+
+        durations = self.db.ExpectedDurations()
+        self.assertEqual(durations, {'A': 20.0})
+
+    def test_flaky_tests(self):
+        self.record_run([('A', 1, 1.0, True), ('B', 1, 1.0, True)])
+        self.record_run([('A', 1, 1.0, False), ('A', 2, 1.0, True), ('B', 1, 1.0, True)])
+        self.assertEqual(self.db.FlakyTests(), {'A'})
+
+    def test_compare_runs(self):
+        baseline = self.record_run([('A', 1, 10.0, True), ('B', 1, 10.0, True), ('C', 1, 5.0, True)])
+        current = self.record_run([('A', 1, 11.0, True), ('B', 1, 30.0, False), ('B', 2, 20.0, True), ('D', 1, 1.0, True)])
+
+        changes = self.db.CompareRuns(baseline, current)
+        self.assertEqual([(c.test_name, c.baseline, c.current) for c in changes], [('B', 10.0, 20.0), ('A', 10.0, 11.0)])
+        self.assertEqual(changes[0].ratio, 2.0)
+
+
+class TestSharding(unittest.TestCase):
+
+    def test_estimate_duration(self):
+        self.assertEqual(EstimateDuration({}, 'A'), 0.0)
+        self.assertEqual(EstimateDuration({'A': 3.0, 'B': 5.0, 'C': 7.0}, 'A'), 3.0)
+        self.assertEqual(EstimateDuration({'A': 3.0, 'B': 5.0, 'C': 7.0}, 'Unknown'), 5.0)
+
+    def test_shard_longest_first(self):
+        durations = {'A': 10.0, 'B': 8.0, 'C': 5.0, 'D': 3.0, 'E': 2.0}
+        shards = ShardLongestFirst(list(durations), durations, 2)
+        self.assertEqual(shards, [['A', 'D', 'E'], ['B', 'C']])
+
+    def test_shard_without_history(self):
+        shards = ShardLongestFirst(['A', 'B', 'C', 'D', 'E'], {}, 2)
+        self.assertEqual([len(shard) for shard in shards], [3, 2])
+        self.assertEqual(sorted(sum(shards, [])), ['A', 'B', 'C', 'D', 'E'])
+
+
+if __name__ == '__main__':
+    unittest.main()
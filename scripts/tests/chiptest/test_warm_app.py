@@ -0,0 +1,98 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import os
+import tempfile
+import unittest
+
+from chiptest.warm_app import WarmAppCache
+
+
+class FakeApp:
+    def __init__(self, kvs_paths):
+        self.process = None
+        self.kvsPathSet = set(kvs_paths)
+
+
+class TestWarmAppCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.kvs = os.path.join(self.tmp.name, 'chip_kvs')
+        self.tool_storage = os.path.join(self.tmp.name, 'tool_storage')
+        os.makedirs(self.tool_storage)
+        self.cache = WarmAppCache()
+
+    def tearDown(self):
+        self.cache.clear()
+        self.tmp.cleanup()
+
+    def write(self, path, content):
+        with open(path, 'w') as f:
+            f.write(content)
+
+    def read(self, path):
+        with open(path) as f:
+            return f.read()
+
+    def test_snapshot_and_restore(self):
+        app = FakeApp([self.kvs, os.path.join(self.tmp.name, 'missing_kvs')])
+        self.write(self.kvs, 'commissioned')
+        self.write(os.path.join(self.tool_storage, 'chip_tool_config.ini'), 'fabric')
+
+        self.assertFalse(self.cache.matches('key'))
+        self.cache.save('key', app, self.tool_storage, commissioning_seconds=5.0)
+        self.assertTrue(self.cache.matches('key'))
+
+        # The test modifies the storage, then the app is factory reset for the next one
+        self.write(self.kvs, 'modified')
+        os.unlink(self.kvs)
+        restored_tool_storage = os.path.join(self.tmp.name, 'restored_tool_storage')
+        os.makedirs(restored_tool_storage)
+
+        restored_app = FakeApp([])
+        self.cache.restore('key', restored_app, restored_tool_storage)
+        self.assertEqual(self.read(self.kvs), 'commissioned')
+        self.assertEqual(restored_app.kvsPathSet, {self.kvs})
+        self.assertEqual(self.read(os.path.join(restored_tool_storage, 'chip_tool_config.ini')), 'fabric')
+        self.assertFalse(os.path.exists(self.kvs + '.tmp'))
+        self.assertGreater(self.cache.last_saved_seconds, 0)
+
+        self.cache.record_reuse()
+        self.assertEqual(self.cache.reused_tests, 1)
+
+    def test_snapshot_requires_stopped_app(self):
+        app = FakeApp([self.kvs])
+        app.process = object()
+        self.write(self.kvs, 'commissioned')
+        with self.assertRaises(ValueError):
+            self.cache.save('key', app, self.tool_storage, commissioning_seconds=1.0)
+        self.assertFalse(self.cache.matches('key'))
+
+    def test_clear(self):
+        app = FakeApp([self.kvs])
+        self.write(self.kvs, 'commissioned')
+        self.cache.save('a', app, self.tool_storage, commissioning_seconds=1.0)
+        self.cache.save('b', app, self.tool_storage, commissioning_seconds=1.0)
+
+        self.cache.clear('a')
+        self.assertFalse(self.cache.matches('a'))
+        self.assertTrue(self.cache.matches('b'))
+        self.cache.clear()
+        self.assertFalse(self.cache.matches('b'))
+
+
+if __name__ == '__main__':
+    unittest.main()
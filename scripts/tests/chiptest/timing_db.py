@@ -0,0 +1,195 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import logging
+import os
+import sqlite3
+import statistics
+import typing
+from dataclasses import dataclass
+from datetime import datetime
+
+log = logging.getLogger(__name__)
+
+# Number of most recent results of a test used to compute its expected duration.
+_DURATION_HISTORY = 5
+
+# Number of most recent results of a test used to decide whether it is flaky.
+_FLAKY_HISTORY = 20
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at TEXT NOT NULL,
+    runtime TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    test_name TEXT NOT NULL,
+    attempt INTEGER NOT NULL,
+    duration REAL NOT NULL,
+    passed INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_by_test ON results (test_name, run_id);
+"""
+
+
+@dataclass
+class TestRunResult:
+    test_name: str
+    attempt: int
+    duration: float
+    passed: bool
+
+
+@dataclass
+class DurationChange:
+    test_name: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float('inf')
+
+
+class TimingDatabase:
+    """
+    Local SQLite database of the duration and outcome of every test run.
+
+    Results of the current run are kept in memory and written to the database in a
+    single transaction by Flush(), so an interrupted run does not leave partial data.
+    """
+
+    def __init__(self, path: str):
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(_SCHEMA)
+        self.pending: typing.List[TestRunResult] = []
+        self.runtime = None
+        self.started_at = None
+
+    def Close(self):
+        self.connection.close()
+
+    def StartRun(self, runtime: str):
+        self.pending = []
+        self.runtime = runtime
+        self.started_at = datetime.now().isoformat(timespec='seconds')
+
+    def Record(self, test_name: str, attempt: int, duration: float, passed: bool):
+        self.pending.append(TestRunResult(test_name, attempt, duration, passed))
+
+    def Flush(self) -> typing.Optional[int]:
+        """Write the results recorded since StartRun() as a new run, and return its id."""
+        if not self.pending:
+            return None
+
+        with self.connection:
+            cursor = self.connection.execute(
+                'INSERT INTO runs (started_at, runtime) VALUES (?, ?)', (self.started_at, self.runtime))
+            run_id = cursor.lastrowid
+            self.connection.executemany(
+                'INSERT INTO results (run_id, test_name, attempt, duration, passed) VALUES (?, ?, ?, ?, ?)',
+                [(run_id, r.test_name, r.attempt, r.duration, int(r.passed)) for r in self.pending])
+
+        log.info("Recorded %d test results as run %d in %s", len(self.pending), run_id, self.path)
+        self.pending = []
+        return run_id
+
+    def __RecentResults(self, limit: int) -> typing.Dict[str, typing.List[typing.Tuple[float, bool]]]:
+        rows = self.connection.execute(
+            '''
+            SELECT test_name, duration, passed FROM (
+                SELECT test_name, duration, passed,
+                       ROW_NUMBER() OVER (PARTITION BY test_name ORDER BY run_id DESC, attempt DESC) AS position
+                FROM results
+            ) WHERE position <= ?
+            ''', (limit,))
+
+        results = {}
+        for test_name, duration, passed in rows:
+            results.setdefault(test_name, []).append((duration, bool(passed)))
+        return results
+
+    def ExpectedDurations(self) -> typing.Dict[str, float]:
+        """Median duration of the most recent passing runs of every known test."""
+        durations = {}
+        for test_name, results in self.__RecentResults(_DURATION_HISTORY).items():
+            passing = [duration for duration, passed in results if passed]
+            if passing:
+                durations[test_name] = statistics.median(passing)
+        return durations
+
+    def FlakyTests(self) -> typing.Set[str]:
+        """Tests that both passed and failed within their most recent results."""
+        flaky = set()
+        for test_name, results in self.__RecentResults(_FLAKY_HISTORY).items():
+            outcomes = {passed for _, passed in results}
+            if len(outcomes) > 1:
+                flaky.add(test_name)
+        return flaky
+
+    def RunIds(self) -> typing.List[int]:
+        return [run_id for (run_id,) in self.connection.execute('SELECT id FROM runs ORDER BY id')]
+
+    def RunDurations(self, run_id: int) -> typing.Dict[str, float]:
+        """Duration of the last passing attempt of every test in the given run."""
+        rows = self.connection.execute(
+            'SELECT test_name, duration FROM results WHERE run_id = ? AND passed = 1 ORDER BY attempt', (run_id,))
+        # Later attempts come last and overwrite the earlier ones
+        return dict(rows)
+
+    def CompareRuns(self, baseline_run_id: int, run_id: int) -> typing.List[DurationChange]:
+        """Duration changes of the tests that passed in both runs, largest slowdown first."""
+        baseline = self.RunDurations(baseline_run_id)
+        current = self.RunDurations(run_id)
+
+        changes = [DurationChange(name, baseline[name], current[name]) for name in current if name in baseline]
+        changes.sort(key=lambda change: change.current - change.baseline, reverse=True)
+        return changes
+
+
+def EstimateDuration(durations: typing.Dict[str, float], test_name: str) -> float:
+    """Expected duration of a test, using the median of all known tests if it has no history."""
+    if test_name in durations:
+        return durations[test_name]
+    if durations:
+        return statistics.median(durations.values())
+    return 0.0
+
+
+def ShardLongestFirst(test_names: typing.List[str], durations: typing.Dict[str, float],
+                      shard_count: int) -> typing.List[typing.List[str]]:
+    """
+    Split tests into shards of similar total duration.
+
+    Tests are assigned longest first to the currently shortest shard, and each shard
+    keeps that longest-first order so the slowest tests do not end up last.
+    """
+    shards = [[] for _ in range(shard_count)]
+    totals = [0.0] * shard_count
+
+    ordered = sorted(test_names, key=lambda name: (-EstimateDuration(durations, name), name))
+    for name in ordered:
+        # Without any history all estimates are equal, so fall back to balancing the test count.
+        index = min(range(shard_count), key=lambda i: (totals[i], len(shards[i])))
+        shards[index].append(name)
+        totals[index] += EstimateDuration(durations, name)
+
+    return shards
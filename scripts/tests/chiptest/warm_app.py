@@ -0,0 +1,119 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import logging
+import os
+import shutil
+import tempfile
+import time
+import typing
+from dataclasses import dataclass
+
+log = logging.getLogger(__name__)
+
+
+def _copy_atomically(src: str, dst: str):
+    """Copy src next to dst and rename it, so that dst is never seen partially written."""
+    tmp = f'{dst}.tmp'
+    shutil.copy2(src, tmp)
+    os.replace(tmp, dst)
+
+
+@dataclass
+class _Snapshot:
+    directory: str
+    kvs_snapshots: typing.Dict[str, str]
+    tool_storage_snapshot: str
+    commissioning_seconds: float
+
+
+class WarmAppCache:
+    """
+    Keeps snapshots of the storage of freshly commissioned target apps, and of the
+    chip-tool storage used to commission them, so that following tests with the same
+    preconditions (target app and controller setup) can skip commissioning.
+
+    The app process is still restarted for every test, so no in-memory state (i.e. the
+    value of any non-persisted attribute) leaks from one test to the next: restoring a
+    snapshot simply takes the place of the factory reset plus commissioning.
+    """
+
+    def __init__(self):
+        self.reused_tests = 0
+        self.saved_seconds = 0.0
+        # Seconds saved by the last test run, 0 if it did not use a warm app.
+        self.last_saved_seconds = 0.0
+
+        self.__snapshots: typing.Dict[typing.Hashable, _Snapshot] = {}
+
+    def matches(self, key: typing.Hashable) -> bool:
+        return key in self.__snapshots
+
+    def save(self, key: typing.Hashable, app, tool_storage_dir: str, commissioning_seconds: float):
+        """
+        Snapshot the storage of a just commissioned app and of chip-tool.
+
+        The app must be stopped, so that its KVS files are not being written while they
+        are copied.
+        """
+        if app.process is not None:
+            raise ValueError("The app must be stopped before its storage is snapshotted")
+
+        self.clear(key)
+
+        directory = tempfile.mkdtemp(prefix='chip_warm_app_')
+        kvs_snapshots = {}
+        for index, kvs in enumerate(sorted(app.kvsPathSet)):
+            if os.path.exists(kvs):
+                snapshot = os.path.join(directory, f'kvs_{index}')
+                _copy_atomically(kvs, snapshot)
+                kvs_snapshots[kvs] = snapshot
+
+        tool_storage_snapshot = os.path.join(directory, 'tool_storage')
+        shutil.copytree(tool_storage_dir, tool_storage_snapshot)
+
+        self.__snapshots[key] = _Snapshot(directory, kvs_snapshots, tool_storage_snapshot, commissioning_seconds)
+        log.debug("Saved warm app snapshot for %r (commissioning took %0.2f seconds)", key, commissioning_seconds)
+
+    def restore(self, key: typing.Hashable, app, tool_storage_dir: str):
+        """
+        Restore the snapshot in place of the (already factory reset) storage of the given
+        app, and into the given chip-tool storage directory.
+        """
+        start = time.monotonic()
+
+        snapshot = self.__snapshots[key]
+        for kvs, kvs_snapshot in snapshot.kvs_snapshots.items():
+            _copy_atomically(kvs_snapshot, kvs)
+            app.kvsPathSet.add(kvs)
+        shutil.copytree(snapshot.tool_storage_snapshot, tool_storage_dir, dirs_exist_ok=True)
+
+        restore_seconds = time.monotonic() - start
+        self.last_saved_seconds = max(snapshot.commissioning_seconds - restore_seconds, 0.0)
+
+    def record_reuse(self):
+        self.reused_tests += 1
+        self.saved_seconds += self.last_saved_seconds
+
+    def clear(self, key: typing.Optional[typing.Hashable] = None):
+        """
+        Forget the snapshot for the given key, or all of them if no key is given, so
+        that the next matching test commissions the app again.
+        """
+        keys = list(self.__snapshots) if key is None else [key]
+        for k in keys:
+            snapshot = self.__snapshots.pop(k, None)
+            if snapshot is not None:
+                shutil.rmtree(snapshot.directory, ignore_errors=True)
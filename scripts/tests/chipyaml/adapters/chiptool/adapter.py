@@ -16,12 +16,14 @@ from matter.yamltests.adapter import TestAdapter
 
 from .decoder import Decoder
 from .encoder import Encoder
+from .translation import TranslationTable
 
 
 class Adapter(TestAdapter):
     def __init__(self, specifications):
-        self.encoder = Encoder(specifications)
-        self.decoder = Decoder(specifications)
+        translations = TranslationTable(specifications)
+        self.encoder = Encoder(specifications, translations)
+        self.decoder = Decoder(specifications, translations)
 
     def encode(self, request):
         return self.encoder.encode(request)
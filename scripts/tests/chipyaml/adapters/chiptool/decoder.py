@@ -14,7 +14,8 @@
 
 import base64
 import json
-import re
+
+from .translation import TranslationTable
 
 # These constants represent the vocabulary used for the incoming JSON.
 _CLUSTER_ID = 'clusterId'
@@ -54,9 +55,9 @@ class Decoder:
     matter_yamltests format.
     """
 
-    def __init__(self, specifications):
-        self.__specs = specifications
-        self.__converter = Converter(specifications)
+    def __init__(self, specifications, translations: TranslationTable = None):
+        self.__translations = translations or TranslationTable(specifications)
+        self.__converter = Converter(specifications, self.__translations)
 
     def decode(self, payload):
         payload, logs = self.__get_payload_content(payload)
@@ -71,27 +72,27 @@ class Decoder:
 
     def __translate_names(self, payloads):
         translated_payloads = []
-        specs = self.__specs
+        translations = self.__translations
 
         for payload in payloads:
             translated_payload = {}
             for key, value in payload.items():
                 if key == _CLUSTER_ID:
                     key = _CLUSTER
-                    value = specs.get_cluster_name(value)
+                    value = translations.get_cluster_name(value)
                 elif key == _ENDPOINT_ID:
                     key = _ENDPOINT
                 elif key == _RESPONSE_ID:
                     key = _RESPONSE
-                    value = specs.get_response_name(
+                    value = translations.get_response_name(
                         payload[_CLUSTER_ID], value)
                 elif key == _ATTRIBUTE_ID:
                     key = _ATTRIBUTE
-                    value = specs.get_attribute_name(
+                    value = translations.get_attribute_name(
                         payload[_CLUSTER_ID], value)
                 elif key == _EVENT_ID:
                     key = _EVENT
-                    value = specs.get_event_name(payload[_CLUSTER_ID], value)
+                    value = translations.get_event_name(payload[_CLUSTER_ID], value)
                 elif key in (_VALUE, _ERROR, _CLUSTER_ERROR, _DATA_VERSION, _EVENT_NUMBER):
                     pass
                 else:
@@ -151,8 +152,8 @@ class Converter():
     meantime the conversion is done here.
     """
 
-    def __init__(self, specifications):
-        self.__specs = specifications
+    def __init__(self, specifications, translations: TranslationTable = None):
+        self.__translations = translations or TranslationTable(specifications)
         self.__converters = [
             DarwinAnyFormatConverter(),
             StructFieldsNameConverter(),
@@ -180,68 +181,59 @@ class Converter():
         return rv
 
     def __convert_command(self, rv):
-        specs = self.__specs
         cluster_name = rv[_CLUSTER]
         response_name = rv[_RESPONSE]
         value = rv[_VALUE]
 
-        response = specs.get_response_by_name(cluster_name, response_name)
-        if not response:
+        response_type = self.__translations.get_response_type(cluster_name, response_name)
+        if not response_type:
             raise KeyError(f'Error: response "{response_name}" not found.')
 
-        typename = response.name
-        array = False
+        typename, array = response_type
         return self.__run(value, cluster_name, typename, array)
 
     def __convert_attribute(self, rv):
-        specs = self.__specs
         cluster_name = rv[_CLUSTER]
         attribute_name = rv[_ATTRIBUTE]
         value = rv[_VALUE]
 
-        attribute = specs.get_attribute_by_name(cluster_name, attribute_name)
-        if not attribute:
+        attribute_type = self.__translations.get_attribute_type(cluster_name, attribute_name)
+        if not attribute_type:
             raise KeyError(f'Error: attribute "{attribute_name}" not found.')
 
-        typename = attribute.definition.data_type.name
-        array = attribute.definition.is_list
+        typename, array = attribute_type
         return self.__run(value, cluster_name, typename, array)
 
     def __convert_event(self, rv):
-        specs = self.__specs
         cluster_name = rv[_CLUSTER]
         event_name = rv[_EVENT]
         value = rv[_VALUE]
 
-        event = specs.get_event_by_name(cluster_name, event_name)
-        if not event:
+        event_type = self.__translations.get_event_type(cluster_name, event_name)
+        if not event_type:
             raise KeyError(f'Error: event "{event_name}" not found.')
 
-        typename = event.name
-        array = False
+        typename, array = event_type
         return self.__run(value, cluster_name, typename, array)
 
     def __run(self, value, cluster_name: str, typename: str, array: bool):
         for converter in self.__converters:
-            value = converter.run(self.__specs, value,
+            value = converter.run(self.__translations, value,
                                   cluster_name, typename, array)
         return value
 
 
 class BaseConverter:
-    def run(self, specs, value, cluster_name: str, typename: str, array: bool):
+    def run(self, translations, value, cluster_name: str, typename: str, array: bool):
         if isinstance(value, dict) and not array:
-            struct = specs.get_struct_by_name(
-                cluster_name, typename) or specs.get_event_by_name(cluster_name, typename)
+            struct = translations.get_struct(cluster_name, typename)
             for field in struct.fields:
                 field_name = field.name
-                field_type = field.data_type.name
-                field_array = field.is_list
                 if field_name in value:
                     value[field_name] = self.run(
-                        specs, value[field_name], cluster_name, field_type, field_array)
+                        translations, value[field_name], cluster_name, field.type_name, field.is_list)
         elif isinstance(value, list) and array:
-            value = [self.run(specs, v, cluster_name, typename, False)
+            value = [self.run(translations, v, cluster_name, typename, False)
                      for v in value]
         elif value is not None:
             value = self.maybe_convert(typename.lower(), value)
@@ -258,7 +250,7 @@ class DarwinAnyFormatConverter(BaseConverter):
     format used for other commands.
     """
 
-    def run(self, specs, value, cluster_name: str, typename: str, array: bool):
+    def run(self, translations, value, cluster_name: str, typename: str, array: bool):
         if isinstance(value, list) and len(value) >= 1 and isinstance(value[0], dict) and value[0].get('data') is not None:
             value = [self.__convert(item_value) for item_value in value]
         return value
@@ -319,65 +311,48 @@ class StructFieldsNameConverter():
     Converts fields identifiers to the field names specified in the cluster definition.
     """
 
-    def run(self, specs, value, cluster_name: str, typename: str, array: bool):
+    def run(self, translations, value, cluster_name: str, typename: str, array: bool):
         if isinstance(value, dict) and not array:
-            struct = specs.get_struct_by_name(
-                cluster_name, typename) or specs.get_event_by_name(cluster_name, typename)
+            struct = translations.get_struct(cluster_name, typename)
             for field in struct.fields:
-                field_code = field.code
                 field_name = field.name
-                field_type = field.data_type.name
-                field_array = field.is_list
-
-                provided_field_name = field_name
 
-                if str(field_code) in value:
+                if field.code in value:
                     # chip-tool returns the field code as an integer but the test suite expects
                     # a field name.
                     # To not confuse the test suite, the field code is replaced by its field name
                     # equivalent and then removed.
-                    provided_field_name = str(field_code)
+                    provided_field_name = field.code
+                elif field_name == 'Description' and 'descriptionString' in value:
+                    # "Description" is returned as "descriptionString" since 'description' is a reserved keyword
+                    # and can not be exposed in an objc struct.
+                    provided_field_name = 'descriptionString'
                 else:
                     # darwin-framework-tool returns the field name but with a different casing than
                     # what the test suite expects.
                     # To not confuse the test suite, the field name is replaced by its field name
                     # equivalent from the spec and then removed.
-
-                    if field_name == 'Description' and 'descriptionString' in value:
-                        # "Description" is returned as "descriptionString" since 'description' is a reserved keyword
-                        # and can not be exposed in an objc struct.
-                        provided_field_name = 'descriptionString'
-
-                    # If field_name starts with a sequence of capital letters lowercase all but the last one.
-                    provided_field_name = re.sub(
-                        '^([A-Z]+)([A-Z])',
-                        lambda m: m.group(1).lower() + m.group(2),
-                        provided_field_name
-                    )
-
-                    # All field names in darwin-framework-tool start with a lowercase letter.
-                    provided_field_name = provided_field_name[0].lower(
-                    ) + provided_field_name[1:]
+                    provided_field_name = field.darwin_name
 
                 if provided_field_name in value:
                     value[field_name] = self.run(
-                        specs,
+                        translations,
                         value[provided_field_name],
                         cluster_name,
-                        field_type,
-                        field_array
+                        field.type_name,
+                        field.is_list
                     )
                     if provided_field_name != field_name:
                         del value[provided_field_name]
 
-            if specs.is_fabric_scoped(struct):
+            if struct.is_fabric_scoped:
                 if _FABRIC_INDEX_FIELD_CODE in value:
                     key_name = _FABRIC_INDEX_FIELD_CODE
                 elif _FABRIC_INDEX_FIELD_NAME_DARWIN in value:
                     key_name = _FABRIC_INDEX_FIELD_NAME_DARWIN
 
                 value[_FABRIC_INDEX_FIELD_NAME] = self.run(
-                    specs,
+                    translations,
                     value[key_name],
                     cluster_name,
                     _FABRIC_INDEX_FIELD_TYPE,
@@ -392,7 +367,7 @@ class StructFieldsNameConverter():
             # darwin-framework-tool any read-by-id 29 0 0x12344321 65535
             # returns value such as:
             # [[{'DeviceType': 17, 'Revision': 1}, {'DeviceType': 22, 'Revision': 1}], ...]
-            value = [self.run(specs, v, cluster_name, typename, isinstance(v, list))
+            value = [self.run(translations, v, cluster_name, typename, isinstance(v, list))
                      for v in value]
 
         return value
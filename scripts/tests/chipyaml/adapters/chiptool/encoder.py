@@ -15,9 +15,10 @@
 import base64
 import json
 import os
-import re
 import sys
 
+from .translation import TranslationTable
+
 _ANY_COMMANDS_LIST = [
     'ReadById',
     'WriteById',
@@ -239,8 +240,8 @@ class Encoder:
     This class converts the names from the YAML tests to the chip-tool equivalent.
     """
 
-    def __init__(self, specifications):
-        self.__specs = specifications
+    def __init__(self, specifications, translations: TranslationTable = None):
+        self.__translations = translations or TranslationTable(specifications)
 
         # This is not the best way to toggle this flag. But for now it prevents having
         # to build a new adapter for the very small differences that exists...
@@ -278,7 +279,7 @@ class Encoder:
             # chip-tool exposes writable attribute under the "write" command, but for non-writable
             # attributes, those appear under the "force-write" command.
             if command_name == 'write':
-                attribute = self.__specs.get_attribute_by_name(
+                attribute = self.__translations.get_attribute(
                     request.cluster, request.attribute)
                 if attribute and not attribute.is_writable:
                     command_name = 'force-write'
@@ -489,16 +490,13 @@ class Encoder:
         return value
 
     def __to_lower_camel_case(self, name):
-        return name[:1].lower() + name[1:]
+        return self.__translations.to_member_name(name)
 
     def __format_cluster_name(self, name):
-        return name.lower().replace(' ', '').replace('/', '').replace('.', '').lower()
+        return self.__translations.to_cluster_name(name)
 
     def __format_command_name(self, name):
-        if name is None:
-            return name
-
-        return re.sub(r'([a-z])([A-Z])', r'\1-\2', name).replace(' ', '-').replace(':', '-').replace('/', '').replace('_', '-').lower()
+        return self.__translations.to_command_name(name)
 
     def __get_alias(self, cluster_name: str, command_name: str = None, argument_name: str = None):
         if argument_name is None and command_name in _GLOBAL_ALIASES:
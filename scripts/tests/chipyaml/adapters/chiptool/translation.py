@@ -0,0 +1,177 @@
+# Copyright (c) 2026 Project CHIP Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+_COMMAND_NAME_PATTERN = re.compile(r'([a-z])([A-Z])')
+_DARWIN_FIELD_NAME_PATTERN = re.compile('^([A-Z]+)([A-Z])')
+
+# Marker for entries that have not been computed yet, since None is a valid (cached)
+# result for names that do not exist in the definitions.
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class StructField:
+    code: str
+    name: str
+    darwin_name: str
+    type_name: str
+    is_list: bool
+
+
+@dataclass(frozen=True)
+class StructDefinition:
+    fields: tuple[StructField, ...]
+    is_fabric_scoped: bool
+
+
+class TranslationTable:
+    """
+    This class maps the names used by the YAML tests to the names used by chip-tool and back.
+
+    Every entry is computed from the cluster definitions the first time it is needed and
+    then served from a dictionary, so encoding and decoding a step does not need to do any
+    string case conversion or SpecDefinitions lookup for names that have already been seen.
+    """
+
+    def __init__(self, specifications):
+        self.__specs = specifications
+
+        self.__cluster_names = {}
+        self.__command_names = {}
+        self.__member_names = {}
+        self.__attributes = {}
+
+        self.__cluster_names_by_id = {}
+        self.__response_names_by_id = {}
+        self.__attribute_names_by_id = {}
+        self.__event_names_by_id = {}
+
+        self.__response_types = {}
+        self.__attribute_types = {}
+        self.__event_types = {}
+        self.__structs = {}
+
+    #
+    # YAML names to chip-tool names.
+    #
+    def to_cluster_name(self, name: str) -> str:
+        value = self.__cluster_names.get(name)
+        if value is None:
+            value = name.lower().replace(' ', '').replace('/', '').replace('.', '')
+            self.__cluster_names[name] = value
+        return value
+
+    def to_command_name(self, name: str) -> str:
+        if name is None:
+            return name
+
+        value = self.__command_names.get(name)
+        if value is None:
+            value = _COMMAND_NAME_PATTERN.sub(r'\1-\2', name).replace(' ', '-').replace(':', '-').replace(
+                '/', '').replace('_', '-').lower()
+            self.__command_names[name] = value
+        return value
+
+    def to_member_name(self, name: str) -> str:
+        value = self.__member_names.get(name)
+        if value is None:
+            value = name[:1].lower() + name[1:]
+            self.__member_names[name] = value
+        return value
+
+    def get_attribute(self, cluster_name: str, attribute_name: str):
+        return self.__get_or_compute(self.__attributes, (cluster_name, attribute_name),
+                                     lambda: self.__specs.get_attribute_by_name(cluster_name, attribute_name))
+
+    #
+    # chip-tool ids to YAML names.
+    #
+    def get_cluster_name(self, cluster_id: int) -> Optional[str]:
+        return self.__get_or_compute(self.__cluster_names_by_id, cluster_id,
+                                     lambda: self.__specs.get_cluster_name(cluster_id))
+
+    def get_response_name(self, cluster_id: int, response_id: int) -> Optional[str]:
+        return self.__get_or_compute(self.__response_names_by_id, (cluster_id, response_id),
+                                     lambda: self.__specs.get_response_name(cluster_id, response_id))
+
+    def get_attribute_name(self, cluster_id: int, attribute_id: int) -> Optional[str]:
+        return self.__get_or_compute(self.__attribute_names_by_id, (cluster_id, attribute_id),
+                                     lambda: self.__specs.get_attribute_name(cluster_id, attribute_id))
+
+    def get_event_name(self, cluster_id: int, event_id: int) -> Optional[str]:
+        return self.__get_or_compute(self.__event_names_by_id, (cluster_id, event_id),
+                                     lambda: self.__specs.get_event_name(cluster_id, event_id))
+
+    #
+    # Types of the values returned by chip-tool.
+    #
+    def get_response_type(self, cluster_name: str, response_name: str) -> Optional[tuple[str, bool]]:
+        def compute():
+            response = self.__specs.get_response_by_name(cluster_name, response_name)
+            return (response.name, False) if response else None
+
+        return self.__get_or_compute(self.__response_types, (cluster_name, response_name), compute)
+
+    def get_attribute_type(self, cluster_name: str, attribute_name: str) -> Optional[tuple[str, bool]]:
+        def compute():
+            attribute = self.get_attribute(cluster_name, attribute_name)
+            return (attribute.definition.data_type.name, attribute.definition.is_list) if attribute else None
+
+        return self.__get_or_compute(self.__attribute_types, (cluster_name, attribute_name), compute)
+
+    def get_event_type(self, cluster_name: str, event_name: str) -> Optional[tuple[str, bool]]:
+        def compute():
+            event = self.__specs.get_event_by_name(cluster_name, event_name)
+            return (event.name, False) if event else None
+
+        return self.__get_or_compute(self.__event_types, (cluster_name, event_name), compute)
+
+    def get_struct(self, cluster_name: str, typename: str) -> Optional[StructDefinition]:
+        """
+        Returns the fields of the given struct or event, with both the name chip-tool uses
+        (the field code) and the name darwin-framework-tool uses for each of them.
+        """
+        def compute():
+            specs = self.__specs
+            struct = specs.get_struct_by_name(cluster_name, typename) or specs.get_event_by_name(cluster_name, typename)
+            if struct is None:
+                return None
+
+            fields = tuple(StructField(
+                code=str(field.code),
+                name=field.name,
+                darwin_name=self.__to_darwin_field_name(field.name),
+                type_name=field.data_type.name,
+                is_list=field.is_list,
+            ) for field in struct.fields)
+            return StructDefinition(fields, specs.is_fabric_scoped(struct))
+
+        return self.__get_or_compute(self.__structs, (cluster_name, typename), compute)
+
+    def __to_darwin_field_name(self, name: str) -> str:
+        # If field_name starts with a sequence of capital letters lowercase all but the last one.
+        name = _DARWIN_FIELD_NAME_PATTERN.sub(lambda m: m.group(1).lower() + m.group(2), name)
+        # All field names in darwin-framework-tool start with a lowercase letter.
+        return name[0].lower() + name[1:]
+
+    def __get_or_compute(self, cache: dict, key, compute):
+        value = cache.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            cache[key] = value
+        return value
@@ -120,6 +120,8 @@ class RunnerStrings:
     stop = 'Run finished in {duration}ms with {runned} steps runned and {skipped} steps skipped.'
     test_start = 'Running: "{name}" with {count} steps.'
     test_stop = '{state} Test finished in {duration}ms with {successes} success, {errors} errors and {warnings} warnings'
+    test_latencies = click.style('\t\tStep latencies: {percentiles}', fg='white')
+    test_latency = 'p{percentile} {duration}ms'
     step_skipped = click.style('\t\t{index}. ' + _strikethrough('Running ') + '{name}', fg='white')
     step_start = click.style('\t\t{index}. Running ', fg='white') + '{name}'
     step_unknown = ''
@@ -185,6 +187,14 @@ class TestRunnerLogger(TestRunnerHooks):
         warnings = click.style(self.__warnings, bold=True)
         print(self.__strings.test_stop.format(state=state, successes=successes, errors=errors, warnings=warnings, duration=duration))
 
+    def test_latencies(self, percentiles: dict[int, float]):
+        if not percentiles:
+            return
+
+        entries = [self.__strings.test_latency.format(percentile=percentile, duration=duration)
+                   for percentile, duration in percentiles.items()]
+        print(self.__strings.test_latencies.format(percentiles=', '.join(entries)))
+
     def step_skipped(self, name: str, expression: str):
         print(self.__strings.step_skipped.format(index=self.__index, name=_strikethrough(name)))
 
@@ -39,7 +39,7 @@ import tabulate
 import yaml
 
 try:
-    from matter.testing.metadata import extract_runs_args  # May fail if python environment not built yet
+    from matter.testing.metadata import MetadataIndex, extract_runs_args  # May fail if python environment not built yet
 except ImportError:
     # Fallback to manual import from source tree
     _MATTER_TESTING_PATH = os.path.join(os.path.dirname(
@@ -47,19 +47,22 @@ except ImportError:
     if _MATTER_TESTING_PATH not in sys.path:
         sys.path.insert(0, _MATTER_TESTING_PATH)
     try:
-        from matter.testing.metadata import extract_runs_args
+        from matter.testing.metadata import MetadataIndex, extract_runs_args
     except ImportError:
         extract_runs_args = None  # filtering by app (--app-filter) will not work.
+        MetadataIndex = None
 
 log = logging.getLogger(__name__)
 
+_METADATA_INDEX_PATH = "out/python_testing_metadata_index.json"
 
-def _get_apps_from_script(path: str) -> List[str]:
+
+def _get_apps_from_script(path: str, metadata_index=None) -> List[str]:
     """
     Parses a python script and returns the apps it is for.
     """
     try:
-        runs_args = extract_runs_args(path)
+        runs_args = metadata_index.runs_args(path) if metadata_index else extract_runs_args(path)
         apps = set()
         for run_config in runs_args.values():
             if run_config and 'app' in run_config:
@@ -920,13 +923,19 @@ def python_tests(
     test_scripts.append("src/controller/python/tests/scripts/mobile-device-test.py")
     test_scripts.sort()  # order consistent
 
+    metadata_index = None
+    if app_filter_list and MetadataIndex:
+        # Read the run arguments of all the scripts at once, only parsing the ones that changed since last time
+        metadata_index = MetadataIndex(_METADATA_INDEX_PATH)
+        metadata_index.update(test_scripts, prune=True)
+
     execution_times = []
     failed_tests = []
     try:
         to_run = []
         for script in [t for t in test_scripts if test_filter.any_matches(t)]:
             if app_filter_list:
-                required_apps = _get_apps_from_script(script)
+                required_apps = _get_apps_from_script(script, metadata_index)
                 if not any(app_filter_list.any_matches(app) for app in required_apps):
                     log.info("Skipping '%s' due to app filter (requires %r)", script, required_apps)
                     continue
@@ -1,10 +1,10 @@
 #! /usr/bin/env -S python3 -B
 
+import contextlib
 import io
 import json
 import logging
-import time
-from subprocess import PIPE
+from subprocess import PIPE, TimeoutExpired
 
 import click
 from chiptest.accessories import AppsRegister
@@ -43,20 +43,19 @@ class DarwinToolRunner:
     def waitForMessage(self, message):
         log.debug("Waiting for '%s'", message)
 
-        start_time = time.monotonic()
-        ready, self.lastLogIndex = self.outpipe.CapturedLogContains(
-            message, self.lastLogIndex)
-        while not ready:
+        index = self.outpipe.WaitForPatterns([message], self.lastLogIndex, 10)
+        if index is None:
+            if self.outpipe.is_closed:
+                # The output is closed when the process exits, give it a moment to be reaped.
+                with contextlib.suppress(TimeoutExpired):
+                    self.process.wait(1)
             if self.process.poll() is not None:
                 died_str = ('Process died while waiting for %s, returncode %d' %
                             (message, self.process.returncode))
                 log.error(died_str)
                 raise Exception(died_str)
-            if time.monotonic() - start_time > 10:
-                raise Exception('Timeout while waiting for %s' % message)
-            time.sleep(0.1)
-            ready, self.lastLogIndex = self.outpipe.CapturedLogContains(
-                message, self.lastLogIndex)
+            raise Exception('Timeout while waiting for %s' % message)
+        self.lastLogIndex = index
 
         log.debug("Success waiting for: '%s'", message)
 
@@ -29,6 +29,8 @@ from chiptest.accessories import AppsRegister
 from chiptest.glob_matcher import GlobMatcher
 from chiptest.runner import Executor, SubprocessInfo
 from chiptest.test_definition import TestRunTime, TestTag
+from chiptest.timing_db import EstimateDuration, ShardLongestFirst, TimingDatabase
+from chiptest.warm_app import WarmAppCache
 from chipyaml.paths_finder import PathsFinder
 
 log = logging.getLogger(__name__)
@@ -70,6 +72,14 @@ class RunContext:
     # If not empty, exclude tests tagged with these tags
     exclude_tags: set(TestTag) = field(default_factory={})
 
+    # Database of historical test durations and outcomes, if enabled
+    timing_db: typing.Optional[TimingDatabase] = None
+
+    def is_selected(self, test: chiptest.TestDefinition) -> bool:
+        if self.include_tags and not (test.tags & self.include_tags):
+            return False
+        return not (self.exclude_tags and test.tags & self.exclude_tags)
+
 
 @click.group(chain=True)
 @click.option(
@@ -134,9 +144,28 @@ class RunContext:
 @click.option(
     '--chip-tool',
     help='Binary path of chip tool app to use to run the test')
+@click.option(
+    '--timing-db',
+    'timing_db_path',
+    type=click.Path(dir_okay=False),
+    default=None,
+    help='SQLite database where test durations and outcomes are recorded, and used for sharding, ETA and flaky retries.')
+@click.option(
+    '--shard-count',
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help='Split the selected tests into this many shards of similar expected duration.')
+@click.option(
+    '--shard-index',
+    type=click.IntRange(min=0),
+    default=0,
+    show_default=True,
+    help='Zero-based index of the shard to run when --shard-count is more than 1.')
 @click.pass_context
 def main(context, dry_run, log_level, target, target_glob, target_skip_glob,
-         no_log_timestamps, root, internal_inside_unshare, include_tags, exclude_tags, runner, chip_tool):
+         no_log_timestamps, root, internal_inside_unshare, include_tags, exclude_tags, runner, chip_tool,
+         timing_db_path, shard_count, shard_index):
     # Ensures somewhat pretty logging of what is going on
     log_fmt = '%(asctime)s.%(msecs)03d %(levelname)-7s %(message)s'
     if no_log_timestamps:
@@ -217,12 +246,28 @@ def main(context, dry_run, log_level, target, target_glob, target_skip_glob,
 
     tests.sort(key=lambda x: x.name)
 
+    if shard_index >= shard_count:
+        raise click.BadOptionUsage("shard-index", f"--shard-index must be smaller than --shard-count ({shard_count})")
+
+    timing_db: typing.Optional[TimingDatabase] = TimingDatabase(timing_db_path) if timing_db_path else None
+
     context.obj = RunContext(root=root, tests=tests,
                              in_unshare=internal_inside_unshare,
                              chip_tool=chip_tool, dry_run=dry_run,
                              runtime=runtime,
                              include_tags=include_tags,
-                             exclude_tags=exclude_tags)
+                             exclude_tags=exclude_tags,
+                             timing_db=timing_db)
+
+    if shard_count > 1:
+        # Only tests that will actually run are sharded, so that every shard gets its
+        # share of the expected duration. Each shard runs its longest tests first.
+        durations = timing_db.ExpectedDurations() if timing_db else {}
+        selected = {test.name: test for test in tests if context.obj.is_selected(test)}
+        shard = ShardLongestFirst(list(selected), durations, shard_count)[shard_index]
+        context.obj.tests = [selected[name] for name in shard]
+        log.info("Shard %d/%d: %d of %d tests, expected to take %0.2f seconds", shard_index + 1, shard_count,
+                 len(shard), len(selected), sum(EstimateDuration(durations, name) for name in shard))
 
 
 @main.command(
@@ -320,15 +365,37 @@ def cmd_list(context):
     default=False,
     show_default=True,
     help='Use Bluetooth and WiFi mock servers to perform BLE-WiFi commissioning. This option is available on Linux platform only.')
+@click.option(
+    '--warm-app',
+    is_flag=True,
+    default=False,
+    show_default=True,
+    help='Commission the target app once and restore its commissioned storage for following tests with the same target, instead of commissioning it for every test. Falls back to a full restart on failure.')
+@click.option(
+    '--log-spill-dir',
+    type=click.Path(file_okay=False, writable=True),
+    default=None,
+    help='Directory where process output lines that no longer fit in the in-memory capture buffers are written.')
+@click.option(
+    '--retry-flaky',
+    type=click.IntRange(min=0),
+    default=0,
+    show_default=True,
+    help='Number of times to retry a failing test whose recent history in --timing-db has both passes and failures.')
 @click.pass_context
 def cmd_run(context, iterations, all_clusters_app, lock_app, ota_provider_app, ota_requestor_app,
             fabric_bridge_app, tv_app, bridge_app, lit_icd_app, microwave_oven_app, rvc_app, network_manager_app,
             energy_gateway_app, energy_management_app, closure_app, matter_repl_yaml_tester,
-            chip_tool_with_python, pics_file, keep_going, test_timeout_seconds, expected_failures, ble_wifi):
+            chip_tool_with_python, pics_file, keep_going, test_timeout_seconds, expected_failures, ble_wifi, warm_app,
+            log_spill_dir, retry_flaky):
     if expected_failures != 0 and not keep_going:
         log.error("--expected-failures '%s' used without '--keep-going'", expected_failures)
         sys.exit(2)
 
+    timing_db = context.obj.timing_db
+    if retry_flaky and timing_db is None:
+        raise click.BadOptionUsage("retry-flaky", "Option --retry-flaky requires --timing-db")
+
     paths_finder = PathsFinder()
 
     def build_app(arg_value, kind: str, key: str):
@@ -414,15 +481,30 @@ def cmd_run(context, iterations, all_clusters_app, lock_app, ota_provider_app, o
         log.warning("No platform-specific executor for '%s'", sys.platform)
         executor = Executor()
 
-    runner = chiptest.runner.Runner(executor=executor)
+    if log_spill_dir:
+        os.makedirs(log_spill_dir, exist_ok=True)
+
+    runner = chiptest.runner.Runner(executor=executor, log_spill_dir=log_spill_dir)
 
     log.info("Each test will be executed %d times", iterations)
 
     apps_register = AppsRegister()
     apps_register.init()
 
+    warm_app_cache = WarmAppCache() if warm_app else None
+
+    expected_durations = timing_db.ExpectedDurations() if timing_db else {}
+    flaky_tests = timing_db.FlakyTests() if retry_flaky else set()
+    if flaky_tests:
+        log.info("Tests marked as flaky by their history will be retried up to %d times: %s",
+                 retry_flaky, ", ".join(sorted(flaky_tests)))
+
     def cleanup():
+        if timing_db is not None and not context.obj.dry_run:
+            timing_db.Flush()
         apps_register.uninit()
+        if warm_app_cache is not None:
+            warm_app_cache.clear()
         if sys.platform == 'linux':
             if ble_wifi:
                 wifi.terminate()
@@ -433,39 +515,69 @@ def cmd_run(context, iterations, all_clusters_app, lock_app, ota_provider_app, o
     for i in range(iterations):
         log.info("Starting iteration %d", i+1)
         observed_failures = 0
+
+        selected_tests = [test for test in context.obj.tests if context.obj.is_selected(test)]
+        remaining_seconds = sum(EstimateDuration(expected_durations, test.name) for test in selected_tests)
+        if timing_db is not None:
+            timing_db.StartRun(context.obj.runtime.name)
+            log.info("Iteration %d: %d tests expected to take %0.2f seconds", i+1, len(selected_tests), remaining_seconds)
+
         for test in context.obj.tests:
-            if context.obj.include_tags:
-                if not (test.tags & context.obj.include_tags):
-                    log.debug("Test '%s' not included", test.name)
-                    continue
-
-            if context.obj.exclude_tags:
-                if test.tags & context.obj.exclude_tags:
-                    log.debug("Test '%s' excluded", test.name)
-                    continue
-
-            test_start = time.monotonic()
-            try:
-                if context.obj.dry_run:
-                    log.info("Would run test: '%s'", test.name)
-                else:
-                    log.info("%-20s - Starting test", test.name)
-                test.Run(
-                    runner, apps_register, paths, pics_file, test_timeout_seconds, context.obj.dry_run,
-                    test_runtime=context.obj.runtime,
-                    ble_controller_app=ble_controller_app,
-                    ble_controller_tool=ble_controller_tool,
-                )
-                if not context.obj.dry_run:
+            if not context.obj.is_selected(test):
+                log.debug("Test '%s' not selected by tags", test.name)
+                continue
+
+            max_attempts = 1 + (retry_flaky if test.name in flaky_tests else 0)
+            for attempt in range(1, max_attempts + 1):
+                test_start = time.monotonic()
+                try:
+                    if context.obj.dry_run:
+                        log.info("Would run test: '%s'", test.name)
+                    else:
+                        log.info("%-20s - Starting test", test.name)
+                    test.Run(
+                        runner, apps_register, paths, pics_file, test_timeout_seconds, context.obj.dry_run,
+                        test_runtime=context.obj.runtime,
+                        ble_controller_app=ble_controller_app,
+                        ble_controller_tool=ble_controller_tool,
+                        warm_app=warm_app_cache,
+                    )
+                    if not context.obj.dry_run:
+                        test_end = time.monotonic()
+                        if timing_db is not None:
+                            timing_db.Record(test.name, attempt, test_end - test_start, passed=True)
+                        if warm_app_cache is not None and warm_app_cache.last_saved_seconds:
+                            log.info("%-30s - Completed in %0.2f seconds (%0.2f seconds saved by warm app)",
+                                     test.name, test_end - test_start, warm_app_cache.last_saved_seconds)
+                        else:
+                            log.info("%-30s - Completed in %0.2f seconds", test.name, test_end - test_start)
+                    break
+                except Exception:
                     test_end = time.monotonic()
-                    log.info("%-30s - Completed in %0.2f seconds", test.name, test_end - test_start)
-            except Exception:
-                test_end = time.monotonic()
-                log.exception("%-30s - FAILED in %0.2f seconds", test.name, test_end - test_start)
-                observed_failures += 1
-                if not keep_going:
-                    cleanup()
-                    sys.exit(2)
+                    if timing_db is not None:
+                        timing_db.Record(test.name, attempt, test_end - test_start, passed=False)
+                    if attempt < max_attempts:
+                        log.exception("%-30s - FAILED in %0.2f seconds, retrying flaky test (attempt %d of %d)",
+                                      test.name, test_end - test_start, attempt + 1, max_attempts)
+                        continue
+                    log.exception("%-30s - FAILED in %0.2f seconds", test.name, test_end - test_start)
+                    observed_failures += 1
+                    if not keep_going:
+                        cleanup()
+                        sys.exit(2)
+
+            if timing_db is not None and not context.obj.dry_run:
+                remaining_seconds = max(remaining_seconds - EstimateDuration(expected_durations, test.name), 0.0)
+                log.info("Estimated time remaining for iteration %d: %0.2f seconds", i+1, remaining_seconds)
+
+        if timing_db is not None and not context.obj.dry_run:
+            timing_db.Flush()
+
+        if warm_app_cache is not None:
+            log.info("Iteration %d: warm app reused by %d tests, saving %0.2f seconds",
+                     i+1, warm_app_cache.reused_tests, warm_app_cache.saved_seconds)
+            warm_app_cache.reused_tests = 0
+            warm_app_cache.saved_seconds = 0.0
 
         if observed_failures != expected_failures:
             log.error("Iteration %d: expected failure count %d, but got %d", i, expected_failures, observed_failures)
@@ -475,6 +587,65 @@ def cmd_run(context, iterations, all_clusters_app, lock_app, ota_provider_app, o
     cleanup()
 
 
+@main.command(
+    'report', help='Show per-test duration regressions between two runs recorded in --timing-db')
+@click.option(
+    '--baseline-run',
+    type=int,
+    default=None,
+    help='Id of the run to compare against. Defaults to the run before --run.')
+@click.option(
+    '--run',
+    'run_id',
+    type=int,
+    default=None,
+    help='Id of the run to check for regressions. Defaults to the last recorded run.')
+@click.option(
+    '--threshold-percent',
+    type=float,
+    default=20.0,
+    show_default=True,
+    help='Report tests that got slower than the baseline by more than this percentage.')
+@click.option(
+    '--min-seconds',
+    type=float,
+    default=1.0,
+    show_default=True,
+    help='Ignore tests that got slower by less than this many seconds.')
+@click.pass_context
+def cmd_report(context, baseline_run, run_id, threshold_percent, min_seconds):
+    timing_db = context.obj.timing_db
+    if timing_db is None:
+        raise click.UsageError("The report command requires --timing-db")
+
+    run_ids = timing_db.RunIds()
+    if run_id is None:
+        if not run_ids:
+            log.error("No runs recorded in %s", timing_db.path)
+            sys.exit(1)
+        run_id = run_ids[-1]
+
+    if baseline_run is None:
+        earlier = [i for i in run_ids if i < run_id]
+        if not earlier:
+            log.error("No run recorded before run %d to compare against", run_id)
+            sys.exit(1)
+        baseline_run = earlier[-1]
+
+    changes = timing_db.CompareRuns(baseline_run, run_id)
+    regressions = [change for change in changes
+                   if change.current - change.baseline >= min_seconds
+                   and change.ratio > 1 + threshold_percent / 100]
+
+    print("Comparing run %d against baseline run %d (%d tests in both)" % (run_id, baseline_run, len(changes)))
+    for change in regressions:
+        print("%-50s %8.2fs -> %8.2fs (%+.1f%%)" % (change.test_name, change.baseline, change.current,
+                                                    (change.ratio - 1) * 100))
+
+    if not regressions:
+        print("No duration regressions found")
+
+
 # On linux, allow an execution shell to be prepared
 if sys.platform == 'linux':
     @main.command(
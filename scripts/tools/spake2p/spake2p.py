@@ -19,11 +19,25 @@
 
 import argparse
 import base64
+import csv
 import hashlib
+import itertools
+import multiprocessing
+import os
+import secrets
 import struct
+import sys
+import time
+from typing import IO, Iterable, Iterator, Optional, Tuple
 
 from ecdsa.curves import NIST256p
 
+try:
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
+except ImportError:
+    ec = None
+
 # Forbidden passcodes as listed in the "5.1.7.1. Invalid Passcodes" section of the Matter spec
 INVALID_PASSCODES = [
     00000000,
@@ -43,14 +57,106 @@ INVALID_PASSCODES = [
 # Length of `w0s` and `w1s` elements
 WS_LENGTH = NIST256p.baselen + 8
 
+# Columns of the CSV files read and written by gen-verifiers-bulk, same as the C++ spake2p tool
+CSV_HEADER = ['Index', 'PIN Code', 'Iteration Count', 'Salt', 'Verifier']
+
+# Number of entries handed over to a worker process at once
+BULK_CHUNK_SIZE = 64
+
+# (passcode, salt, verifier)
+VerifierEntry = Tuple[int, bytes, bytes]
+
+
+def _point_L(w1: int) -> bytes:
+    # The point multiplication is much faster with OpenSSL than with the pure-Python ecdsa package
+    if ec is not None:
+        return ec.derive_private_key(w1, ec.SECP256R1()).public_key().public_bytes(
+            Encoding.X962, PublicFormat.UncompressedPoint)
+    return (NIST256p.generator * w1).to_bytes('uncompressed')
+
 
 def generate_verifier(passcode: int, salt: bytes, iterations: int) -> bytes:
     ws = hashlib.pbkdf2_hmac('sha256', struct.pack('<I', passcode), salt, iterations, WS_LENGTH * 2)
     w0 = int.from_bytes(ws[:WS_LENGTH], byteorder='big') % NIST256p.order
     w1 = int.from_bytes(ws[WS_LENGTH:], byteorder='big') % NIST256p.order
-    L = NIST256p.generator * w1
 
-    return w0.to_bytes(NIST256p.baselen, byteorder='big') + L.to_bytes('uncompressed')
+    return w0.to_bytes(NIST256p.baselen, byteorder='big') + _point_L(w1)
+
+
+def generate_passcode() -> int:
+    while True:
+        passcode = secrets.randbelow(99999999)
+        if passcode not in INVALID_PASSCODES:
+            return passcode
+
+
+def random_entries(count: int, salt_len: int = 32) -> Iterator[Tuple[int, bytes]]:
+    ''' Yields `count` random (passcode, salt) pairs. '''
+    for _ in range(count):
+        yield generate_passcode(), os.urandom(salt_len)
+
+
+def read_entries(csv_file: IO[str], salt_len: int = 32) -> Iterator[Tuple[int, bytes]]:
+    ''' Yields the (passcode, salt) pairs of a CSV file with "PIN Code" and "Salt" columns.
+
+        Salts are encoded in Base64. A random salt is used for rows with an empty or missing salt.
+    '''
+    for line, row in enumerate(csv.DictReader(csv_file), start=2):
+        passcode = int(row['PIN Code'])
+        if not 0 <= passcode <= 99999999 or passcode in INVALID_PASSCODES:
+            raise ValueError(f'line {line}: invalid passcode {passcode}')
+
+        salt = base64.b64decode(row['Salt']) if row.get('Salt') else os.urandom(salt_len)
+        if not 16 <= len(salt) <= 32:
+            raise ValueError(f'line {line}: invalid salt length')
+
+        yield passcode, salt
+
+
+def _generate_entry(entry: Tuple[int, bytes, int]) -> VerifierEntry:
+    passcode, salt, iterations = entry
+    return passcode, salt, generate_verifier(passcode, salt, iterations)
+
+
+def generate_verifiers_bulk(entries: Iterable[Tuple[int, bytes]], iterations: int,
+                            jobs: Optional[int] = None) -> Iterator[VerifierEntry]:
+    ''' Generates the verifiers of (passcode, salt) pairs across `jobs` processes (all the CPUs by default).
+
+        Entries are consumed and results are yielded in order, a batch at a time, so that any number
+        of verifiers can be streamed without holding them all in memory.
+    '''
+    jobs = jobs or os.cpu_count() or 1
+    entries = ((passcode, salt, iterations) for passcode, salt in entries)
+
+    if jobs == 1:
+        yield from map(_generate_entry, entries)
+        return
+
+    batch_size = BULK_CHUNK_SIZE * jobs * 4
+    with multiprocessing.Pool(jobs) as pool:
+        while batch := list(itertools.islice(entries, batch_size)):
+            yield from pool.imap(_generate_entry, batch, BULK_CHUNK_SIZE)
+
+
+def write_verifiers_csv(out: IO[str], verifiers: Iterable[VerifierEntry], iterations: int) -> int:
+    ''' Writes the verifiers in the CSV format of the C++ spake2p tool and returns how many were written. '''
+    writer = csv.writer(out, lineterminator='\n')
+    writer.writerow(CSV_HEADER)
+    count = 0
+    for index, (passcode, salt, verifier) in enumerate(verifiers):
+        writer.writerow([index, passcode, iterations, base64.b64encode(salt).decode('ascii'),
+                         base64.b64encode(verifier).decode('ascii')])
+        count += 1
+    return count
+
+
+def benchmark(count: int, iterations: int, jobs: Optional[int] = None) -> float:
+    ''' Returns the throughput of generate_verifiers_bulk(), in verifiers per second. '''
+    entries = list(random_entries(count))
+    start = time.perf_counter()
+    for _ in generate_verifiers_bulk(entries, iterations, jobs):
+        pass
+    return count / (time.perf_counter() - start)
 
 
 def main():
@@ -92,11 +198,48 @@ def main():
     gen_verifier.add_argument('-i', '--iteration-count', type=iterations_arg,
                               metavar='count', required=True, help='Iteration count between 1000 and 100000')
 
+    gen_verifiers_bulk = commands.add_parser('gen-verifiers-bulk', help='Generate SPAKE2+ Verifiers in bulk')
+    source = gen_verifiers_bulk.add_mutually_exclusive_group(required=True)
+    source.add_argument('--in', dest='input', type=argparse.FileType('r'), metavar='file',
+                        help='CSV file with "PIN Code" and "Salt" (Base64, random if empty) columns')
+    source.add_argument('-n', '--count', type=int, help='Number of random passcodes to generate')
+    gen_verifiers_bulk.add_argument('-i', '--iteration-count', type=iterations_arg,
+                                    metavar='count', required=True, help='Iteration count between 1000 and 100000')
+    gen_verifiers_bulk.add_argument('--salt-len', type=int, choices=range(16, 33), default=32, metavar='length',
+                                    help='Length of the random salts, between 16 and 32 octets (default: 32)')
+    gen_verifiers_bulk.add_argument('-j', '--jobs', type=int, help='Number of worker processes (default: number of CPUs)')
+    gen_verifiers_bulk.add_argument('-o', '--out', type=argparse.FileType('w'), default='-', metavar='file',
+                                    help='Output CSV file (default: stdout)')
+
+    bench = commands.add_parser('benchmark', help='Measure SPAKE2+ Verifier generation throughput')
+    bench.add_argument('-n', '--count', type=int, default=1000, help='Number of verifiers to generate (default: 1000)')
+    bench.add_argument('-i', '--iteration-count', type=iterations_arg,
+                       metavar='count', default=1000, help='Iteration count between 1000 and 100000 (default: 1000)')
+    bench.add_argument('-j', '--jobs', type=int, help='Number of worker processes (default: number of CPUs)')
+
     args = parser.parse_args()
 
     if args.command == 'gen-verifier':
         verifier = generate_verifier(args.passcode, args.salt, args.iteration_count)
         print(base64.b64encode(verifier).decode('ascii'))
+    elif args.command == 'gen-verifiers-bulk':
+        if args.input:
+            entries = read_entries(args.input, args.salt_len)
+        else:
+            entries = random_entries(args.count, args.salt_len)
+        start = time.perf_counter()
+        try:
+            count = write_verifiers_csv(args.out, generate_verifiers_bulk(entries, args.iteration_count, args.jobs),
+                                        args.iteration_count)
+        except ValueError as e:
+            parser.error(str(e))
+        elapsed = time.perf_counter() - start
+        print(f'Generated {count} verifiers in {elapsed:.2f} s ({count / elapsed:.0f} verifiers/s)', file=sys.stderr)
+    elif args.command == 'benchmark':
+        backend = 'cryptography' if ec is not None else 'ecdsa'
+        for jobs in sorted({1, args.jobs or os.cpu_count() or 1}):
+            rate = benchmark(args.count, args.iteration_count, jobs)
+            print(f'{backend}, {jobs} job(s): {rate:.0f} verifiers/s')
 
 
 if __name__ == '__main__':
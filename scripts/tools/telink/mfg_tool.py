@@ -19,12 +19,18 @@ import argparse
 import base64
 import binascii
 import csv
+import datetime
+import functools
+import hashlib
 import json
 import logging
+import multiprocessing
 import os
 import random
+import secrets
 import shlex
 import shutil
+import struct
 import subprocess
 import sys
 
@@ -32,6 +38,9 @@ import cbor2 as cbor
 import cryptography.hazmat.backends
 import cryptography.x509
 import pyqrcode
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
 from intelhex import IntelHex
 
 TOOLS = {
@@ -55,9 +64,24 @@ QRCODE_LEN = 22
 ROTATING_DEVICE_ID_UNIQUE_ID_LEN = 16
 HEX_PREFIX = "hex:"
 DEV_SN_CSV_HDR = "Serial Number,\n"
+PIN_DISC_CSV_HDR = "Index,PIN Code,Iteration Count,Salt,Verifier,Discriminator\n"
+
+# SPAKE2+ parameters, as used by scripts/tools/spake2p/spake2p.py
+SPAKE2P_SALT_LEN = 32
+SPAKE2P_WS_LENGTH = 32 + 8
+P256_ORDER = 0xFFFFFFFF00000000FFFFFFFFFFFFFFFFBCE6FAADA7179E84F3B9CAC2FC632551
+
+# Matter DN attributes of the attestation certificates
+MATTER_OID_VID = cryptography.x509.ObjectIdentifier('1.3.6.1.4.1.37244.2.1')
+MATTER_OID_PID = cryptography.x509.ObjectIdentifier('1.3.6.1.4.1.37244.2.2')
+# Certificate lifetime (in days) that chip-cert treats as "no well-defined expiration date"
+CERT_NO_WELL_DEFINED_EXPIRATION = 4294967295
 
 NVS_MEMORY = {}
 
+# Per-process state of the pipeline workers, set by init_pipeline_worker()
+PIPELINE = {}
+
 
 def nvs_memory_append(key, value):
     if isinstance(value, str):
@@ -74,17 +98,19 @@ def nvs_memory_update(key, value):
 
 
 def check_tools_exists(args):
-    if args.spake2_path:
-        TOOLS['spake2p'] = shutil.which(args.spake2_path)
-    else:
-        TOOLS['spake2p'] = shutil.which('spake2p')
+    # The pipeline mode computes the SPAKE2+ verifiers and the DACs in-process
+    if not args.jobs:
+        if args.spake2_path:
+            TOOLS['spake2p'] = shutil.which(args.spake2_path)
+        else:
+            TOOLS['spake2p'] = shutil.which('spake2p')
 
-    if TOOLS['spake2p'] is None:
-        log.error("spake2p not found, please specify --spake2-path argument")
-        sys.exit(1)
+        if TOOLS['spake2p'] is None:
+            log.error("spake2p not found, please specify --spake2-path argument")
+            sys.exit(1)
     # if the certs and keys are not in the generated partitions or the specific dac cert and key are used,
     # the chip-cert is not needed.
-    if args.paa or (args.pai and (args.dac_cert is None and args.dac_key is None)):
+    if args.paa or (args.pai and (args.dac_cert is None and args.dac_key is None) and not args.jobs):
         if args.chip_cert_path:
             TOOLS['chip-cert'] = shutil.which(args.chip_cert_path)
         else:
@@ -226,6 +252,36 @@ def generate_discriminator(args, out_dirs):
     os.remove(os.sep.join([out_dirs['output'], 'pin.csv']))
 
 
+def generate_random_passcode():
+    while True:
+        passcode = secrets.randbelow(0x5F5E0FE) + 1
+        if passcode not in INVALID_PASSCODES:
+            return passcode
+
+
+# Same math as generate_verifier() of scripts/tools/spake2p/spake2p.py, the L point is computed with cryptography
+def generate_spake2p_verifier(passcode, salt, iterations):
+    ws = hashlib.pbkdf2_hmac('sha256', struct.pack('<I', passcode), salt, iterations, SPAKE2P_WS_LENGTH * 2)
+    w0 = int.from_bytes(ws[:SPAKE2P_WS_LENGTH], byteorder='big') % P256_ORDER
+    w1 = int.from_bytes(ws[SPAKE2P_WS_LENGTH:], byteorder='big') % P256_ORDER
+    L = ec.derive_private_key(w1, ec.SECP256R1()).public_key().public_bytes(
+        serialization.Encoding.X962, serialization.PublicFormat.UncompressedPoint)
+    return w0.to_bytes(32, byteorder='big') + L
+
+
+# In-process equivalent of generate_passcode() followed by generate_discriminator()
+def generate_pin_disc(index, args, out_dirs):
+    passcode = args.passcode if args.passcode else generate_random_passcode()
+    disc = args.discriminator if args.discriminator else random.randint(0x0000, 0x0FFF)
+    salt = os.urandom(SPAKE2P_SALT_LEN)
+    verifier = generate_spake2p_verifier(passcode, salt, args.spake2_it)
+
+    row = [str(index), str(passcode), str(args.spake2_it), base64.b64encode(salt).decode('utf-8'),
+           base64.b64encode(verifier).decode('utf-8'), str(disc)]
+    with open(os.sep.join([out_dirs['output'], 'pin_disc.csv']), 'w') as fd:
+        fd.write(PIN_DISC_CSV_HDR + ','.join(row) + '\n')
+
+
 def generate_pai_certs(args, ca_key, ca_cert, out_key, out_cert):
     cmd = [
         TOOLS['chip-cert'], 'gen-att-cert',
@@ -341,6 +397,81 @@ def generate_dac_cert(iteration, args, out_dirs, discriminator, passcode, ca_key
     return out_cert_der, out_private_key_bin, out_public_key_bin
 
 
+# The CA key and certificate are only loaded once per process
+@functools.lru_cache(maxsize=None)
+def load_ca(ca_key, ca_cert):
+    with open(ca_key, 'rb') as f:
+        key = serialization.load_pem_private_key(f.read(), None)
+    with open(ca_cert, 'rb') as f:
+        cert = cryptography.x509.load_pem_x509_certificate(f.read())
+    return key, cert
+
+
+def get_validity_period(args):
+    if args.valid_from:
+        valid_from = datetime.datetime.fromisoformat(args.valid_from)
+    else:
+        valid_from = datetime.datetime.now(datetime.timezone.utc).replace(microsecond=0)
+    valid_from = valid_from.replace(tzinfo=datetime.timezone.utc)
+
+    if args.lifetime == CERT_NO_WELL_DEFINED_EXPIRATION:
+        valid_to = datetime.datetime(9999, 12, 31, 23, 59, 59, tzinfo=datetime.timezone.utc)
+    else:
+        valid_to = valid_from + datetime.timedelta(days=args.lifetime)
+    return valid_from, valid_to
+
+
+# In-process equivalent of generate_dac_cert(), signs the DAC with the given PAI like chip-cert gen-att-cert --type d
+def generate_dac_cert_in_process(iteration, args, out_dirs, discriminator, passcode, ca_key, ca_cert):
+    out_key_pem = os.sep.join([out_dirs['internal'], 'DAC_key.pem'])
+    out_cert_pem = out_key_pem.replace('key.pem', 'cert.pem')
+    out_cert_der = out_key_pem.replace('key.pem', 'cert.der')
+    out_private_key_bin = out_key_pem.replace('key.pem', 'private_key.bin')
+    out_public_key_bin = out_key_pem.replace('key.pem', 'public_key.bin')
+
+    pai_key, pai_cert = load_ca(ca_key, ca_cert)
+    dac_key = ec.generate_private_key(ec.SECP256R1())
+    valid_from, valid_to = get_validity_period(args)
+
+    subject = cryptography.x509.Name([
+        cryptography.x509.NameAttribute(NameOID.COMMON_NAME, '{} DAC {}'.format(args.cn_prefix, iteration)),
+        cryptography.x509.NameAttribute(MATTER_OID_VID, '{:04X}'.format(args.vendor_id)),
+        cryptography.x509.NameAttribute(MATTER_OID_PID, '{:04X}'.format(args.product_id)),
+    ])
+    cert = (cryptography.x509.CertificateBuilder()
+            .subject_name(subject)
+            .issuer_name(pai_cert.subject)
+            .public_key(dac_key.public_key())
+            .serial_number(cryptography.x509.random_serial_number())
+            .not_valid_before(valid_from)
+            .not_valid_after(valid_to)
+            .add_extension(cryptography.x509.BasicConstraints(ca=False, path_length=None), critical=True)
+            .add_extension(cryptography.x509.KeyUsage(digital_signature=True, content_commitment=False,
+                                                      key_encipherment=False, data_encipherment=False,
+                                                      key_agreement=False, key_cert_sign=False, crl_sign=False,
+                                                      encipher_only=False, decipher_only=False), critical=True)
+            .add_extension(cryptography.x509.SubjectKeyIdentifier.from_public_key(dac_key.public_key()), critical=False)
+            .add_extension(cryptography.x509.AuthorityKeyIdentifier.from_issuer_public_key(pai_key.public_key()),
+                           critical=False)
+            .sign(pai_key, hashes.SHA256()))
+
+    with open(out_key_pem, 'wb') as f:
+        f.write(dac_key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.TraditionalOpenSSL,
+                                      serialization.NoEncryption()))
+    with open(out_cert_pem, 'wb') as f:
+        f.write(cert.public_bytes(serialization.Encoding.PEM))
+    with open(out_cert_der, 'wb') as f:
+        f.write(cert.public_bytes(serialization.Encoding.DER))
+    with open(out_private_key_bin, 'wb') as f:
+        f.write(dac_key.private_numbers().private_value.to_bytes(32, byteorder='big'))
+    with open(out_public_key_bin, 'wb') as f:
+        f.write(dac_key.public_key().public_bytes(serialization.Encoding.X962,
+                                                  serialization.PublicFormat.UncompressedPoint))
+    log.info("Generated DAC certificate: '%s'", out_cert_der)
+
+    return out_cert_der, out_private_key_bin, out_public_key_bin
+
+
 def use_dac_cert_from_args(args, out_dirs):
     log.info("Using DAC from command line arguments...")
     log.info("DAC Certificate: '%s'", args.dac_cert)
@@ -439,7 +570,7 @@ def generate_onboarding_data(args, out_dirs, discriminator, passcode):
 
 # This function generates the DACs, picks the commissionable data from the already present csv file,
 # and generates the onboarding payloads, and writes everything to the master csv
-def write_device_unique_data(args, out_dirs, pai_cert):
+def write_device_unique_data(args, out_dirs, pai_cert, dac_generator=generate_dac_cert):
     with open(os.sep.join([out_dirs['output'], 'pin_disc.csv']), 'r') as csvf:
         pin_disc_dict = csv.DictReader(csvf)
         row = pin_disc_dict.__next__()
@@ -454,8 +585,8 @@ def write_device_unique_data(args, out_dirs, pai_cert):
             if args.dac_key is not None and args.dac_cert is not None:
                 dacs = use_dac_cert_from_args(args, out_dirs)
             else:
-                dacs = generate_dac_cert(int(row['Index']), args, out_dirs, int(row['Discriminator']),
-                                         int(row['PIN Code']), pai_cert['key_pem'], pai_cert['cert_pem'])
+                dacs = dac_generator(int(row['Index']), args, out_dirs, int(row['Discriminator']),
+                                     int(row['PIN Code']), pai_cert['key_pem'], pai_cert['cert_pem'])
 
             nvs_memory_append('dac_cert', read_der_file(dacs[0]))
             nvs_memory_append('dac_key', read_key_bin_file(dacs[1]))
@@ -523,6 +654,8 @@ def generate_json_summary(args, out_dirs, pai_certs, dacs_cert, serial_num: str)
     with open(os.sep.join([out_dirs['output'], 'summary.json']), 'w') as json_file:
         json.dump(json_dict, json_file, indent=4)
 
+    return json_dict
+
 
 def add_additional_kv(args, serial_num):
     # Device instance information
@@ -560,6 +693,100 @@ def add_additional_kv(args, serial_num):
         nvs_memory_append('part_number', args.part_number)
 
 
+def init_pipeline_worker(args, out_dir_top, serial_num_int, pai_cert):
+    PIPELINE['args'] = args
+    PIPELINE['out_dir_top'] = out_dir_top
+    PIPELINE['serial_num_int'] = serial_num_int
+    PIPELINE['pai_cert'] = pai_cert
+    if pai_cert and args.dac_cert is None:
+        load_ca(pai_cert['key_pem'], pai_cert['cert_pem'])
+
+
+# Generates the factory data of the device with the given index in a pipeline worker,
+# and returns its summary as the row of the manifest
+def generate_pipeline_device(index):
+    args = PIPELINE['args']
+    serial_num_str = format(PIPELINE['serial_num_int'] + index, 'x')
+    out_dirs = setup_out_dir(PIPELINE['out_dir_top'], args, serial_num_str)
+
+    NVS_MEMORY.clear()
+    add_additional_kv(args, serial_num_str)
+    generate_pin_disc(index, args, out_dirs)
+    dacs_cert = write_device_unique_data(args, out_dirs, PIPELINE['pai_cert'], generate_dac_cert_in_process)
+    generate_partition(args, out_dirs)
+    summary = generate_json_summary(args, out_dirs, PIPELINE['pai_cert'], dacs_cert, serial_num_str)
+    return dict(index=index, output=out_dirs['output'], **summary)
+
+
+def read_pipeline_checkpoint(path):
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def write_pipeline_checkpoint(path, checkpoint):
+    with open(path + '.tmp', 'w') as f:
+        json.dump(checkpoint, f)
+    os.replace(path + '.tmp', path)
+
+
+# Generates the devices across a pool of worker processes. The summary of each device is streamed
+# to a single CSV or JSONL manifest, in device order, and a checkpoint records how much of the
+# manifest is complete so that an interrupted run can be resumed with --resume.
+def run_pipeline(args, out_dir_top, serial_num_int):
+    manifest_path = os.path.realpath(args.manifest) if args.manifest else os.sep.join([out_dir_top, 'manifest.jsonl'])
+    checkpoint_path = manifest_path + '.checkpoint'
+    use_csv = manifest_path.endswith('.csv')
+
+    checkpoint = read_pipeline_checkpoint(checkpoint_path) if args.resume else None
+    if checkpoint is None:
+        checkpoint = {'serial_num': serial_num_int, 'next_index': 0, 'manifest_size': 0, 'fields': None}
+    else:
+        log.info("Resuming from device %d of %d", checkpoint['next_index'], args.count)
+
+    # Drop anything written to the manifest after the last checkpoint
+    with open(manifest_path, 'a') as f:
+        f.truncate(checkpoint['manifest_size'])
+
+    # The PAI is generated once and shared by all the devices
+    pai_cert = {}
+    if args.paa:
+        internal_dir = os.sep.join([out_dir_top, 'internal'])
+        os.makedirs(internal_dir, exist_ok=True)
+        if not os.path.exists(os.sep.join([internal_dir, 'pai_cert.der'])):
+            pai_cert = setup_root_certificates(args, {'internal': internal_dir})
+        else:
+            pai_cert = {
+                'cert_pem': os.sep.join([internal_dir, 'pai_cert.pem']),
+                'cert_der': os.sep.join([internal_dir, 'pai_cert.der']),
+                'key_pem': os.sep.join([internal_dir, 'pai_key.pem']),
+            }
+    elif args.pai:
+        pai_cert = setup_root_certificates(args, {'internal': out_dir_top})
+
+    init_args = (args, out_dir_top, checkpoint['serial_num'], pai_cert)
+    with multiprocessing.Pool(args.jobs, initializer=init_pipeline_worker, initargs=init_args) as pool, \
+            open(manifest_path, 'a', newline='') as manifest:
+        for row in pool.imap(generate_pipeline_device, range(checkpoint['next_index'], args.count)):
+            if use_csv:
+                if checkpoint['fields'] is None:
+                    checkpoint['fields'] = list(row)
+                    csv.writer(manifest).writerow(checkpoint['fields'])
+                csv.DictWriter(manifest, checkpoint['fields'], restval='', extrasaction='ignore').writerow(row)
+            else:
+                manifest.write(json.dumps(row) + '\n')
+            manifest.flush()
+
+            checkpoint['next_index'] = row['index'] + 1
+            checkpoint['manifest_size'] = manifest.tell()
+            write_pipeline_checkpoint(checkpoint_path, checkpoint)
+            log.info("Generated '%s' (%d/%d)", row['serial_num'], checkpoint['next_index'], args.count)
+
+    log.info("Manifest: '%s'", manifest_path)
+
+
 def get_and_validate_args():
     def allow_any_int(i): return int(i, 0)
     def base64_str(s): return base64.b64decode(s)
@@ -586,6 +813,17 @@ def get_and_validate_args():
     general_args.add_argument("--enable-key", type=str,
                               help="[hex string] [128-bit hex-encoded] The Enable Key is a 128-bit value that triggers manufacturer-specific action while invoking the TestEventTrigger Command."
                               "This value is used during Certification Tests, and should not be present on production devices.")
+
+    # Pipeline options
+    pipeline_args = parser.add_argument_group('Pipeline options')
+    pipeline_args.add_argument('-j', '--jobs', type=allow_any_int,
+                               help='Generate the devices in a pool of JOBS worker processes. The SPAKE2+ verifiers and DACs are '
+                               'computed in-process, so spake2p and chip-cert (with --pai) are not needed.')
+    pipeline_args.add_argument('--manifest', type=str,
+                               help='[string] Manifest of the devices generated with --jobs, in CSV format if the path ends '
+                               'with .csv and in JSON Lines format otherwise. Default is <output>/manifest.jsonl.')
+    pipeline_args.add_argument('--resume', action='store_true', default=False,
+                               help='Resume an interrupted --jobs run from the checkpoint stored next to its manifest.')
     # Commissioning options
     commissioning_args = parser.add_argument_group('Commisioning options')
     commissioning_args.add_argument('--passcode', type=allow_any_int,
@@ -653,6 +891,12 @@ def get_and_validate_args():
         log.error("Option --in-tree can not be use together with --count > 1")
         sys.exit(1)
 
+    # Validate pipeline parameters
+    check_int_range(args.jobs, 1, 1024, 'Jobs')
+    if (args.manifest or args.resume) and not args.jobs:
+        log.error("Options --manifest and --resume can only be used together with --jobs")
+        sys.exit(1)
+
     # Validate discriminator and passcode
     check_int_range(args.discriminator, 0x0000, 0x0FFF, 'Discriminator')
     if args.passcode is not None:
@@ -710,7 +954,7 @@ def main():
     args = get_and_validate_args()
     check_tools_exists(args)
 
-    if os.path.exists(args.output):
+    if os.path.exists(args.output) and not args.resume:
         if args.overwrite:
             log.info("Output directory already exists. All data will be overwritten.")
             shutil.rmtree(args.output)
@@ -728,6 +972,10 @@ def main():
     out_dir_top = os.path.realpath(args.output)
     os.makedirs(out_dir_top, exist_ok=True)
 
+    if args.jobs:
+        run_pipeline(args, out_dir_top, serial_num_int)
+        return
+
     with open(os.sep.join([out_dir_top, "device_sn.csv"]), "w") as f:
         f.write(DEV_SN_CSV_HDR)
 
@@ -27,13 +27,19 @@ Creating OTA image file:
 
 Showing OTA image file info:
 ./ota_image_tool.py show my-firmware.ota
+
+Creating many OTA image files in parallel, as listed in a JSON manifest:
+./ota_image_tool.py create-many -j 8 manifest.json
 """
 
 import argparse
 import hashlib
+import json
 import os
+import shutil
 import struct
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from enum import IntEnum
 
 sys.path.insert(0, os.path.join(
@@ -61,9 +67,9 @@ DIGEST_ALGORITHM_ID = {
 DIGEST_ALL_ALGORITHMS = hashlib.algorithms_available.intersection(
     DIGEST_ALGORITHM_ID.keys())
 
-# Buffer size used for file reads to ensure large files do not need to be loaded
-# into memory fully before processing.
-PAYLOAD_BUFFER_SIZE = 16 * 1024
+# Buffer size used by the streaming image builder, which reads each payload chunk once
+# into a reusable buffer to both hash it and write it to the image file.
+STREAM_BUFFER_SIZE = 1024 * 1024
 
 
 class HeaderTag(IntEnum):
@@ -119,27 +125,35 @@ def validate_header_attributes(args: object):
             warn('Release notes URL does not start with "https://"')
 
 
-def generate_payload_summary(args: object):
+def stream_payload(input_files: list, out_file, digest_algorithms: list):
     """
-    Calculate total size and hash of all concatenated input payload files
+    Read all concatenated input payload files once, computing their total size and their digest
+    for each of the algorithms, and copy them to out_file unless it is None.
+
+    Chunks are read into a reusable buffer. With several algorithms, the digests of a chunk are
+    computed in parallel threads, as hashlib releases the GIL while hashing large buffers.
     """
 
+    digests = {algorithm: hashlib.new(algorithm) for algorithm in digest_algorithms}
+    buffer = bytearray(STREAM_BUFFER_SIZE)
+    view = memoryview(buffer)
     total_size = 0
-    digest = hashlib.new(args.digest_algorithm)
-
-    if digest.digest_size < (256 // 8):
-        warn('Using digest length below 256 bits is not recommended')
 
-    for path in args.input_files:
-        with open(path, 'rb') as file:
-            while True:
-                chunk = file.read(PAYLOAD_BUFFER_SIZE)
-                if not chunk:
-                    break
-                total_size += len(chunk)
-                digest.update(chunk)
+    with ThreadPoolExecutor(max_workers=len(digests)) as executor:
+        for path in input_files:
+            with open(path, 'rb', buffering=0) as file:
+                while size := file.readinto(buffer):
+                    chunk = view[:size]
+                    total_size += size
+                    if len(digests) > 1:
+                        list(executor.map(lambda digest: digest.update(chunk), digests.values()))
+                    else:
+                        for digest in digests.values():
+                            digest.update(chunk)
+                    if out_file is not None:
+                        out_file.write(chunk)
 
-    return total_size, digest.digest()
+    return total_size, {algorithm: digest.digest() for algorithm, digest in digests.items()}
 
 
 def generate_header_tlv(args: object, payload_size: int, payload_digest: bytes):
@@ -186,69 +200,123 @@ def generate_header(header_tlv: bytes, payload_size: int):
     return fixed_header + header_tlv
 
 
-def write_image(args: object, header: bytes):
+def generate_image(args: object) -> dict:
     """
-    Write OTA image file consisting of header and concatenated payload files
+    Generate OTA image header and write it along with payload files to the OTA image file
+
+    The payload files are read only once: the header is first written with a placeholder digest of
+    the same length, and rewritten once the payload has been copied and hashed. Returns the payload
+    digests, for the header digest algorithm and any algorithm listed in args.extra_digest_algorithms.
     """
+    digest_size = hashlib.new(args.digest_algorithm).digest_size
+    if digest_size < (256 // 8):
+        warn('Using digest length below 256 bits is not recommended')
+
+    digest_algorithms = [args.digest_algorithm]
+    for algorithm in getattr(args, 'extra_digest_algorithms', None) or []:
+        if algorithm not in digest_algorithms:
+            digest_algorithms.append(algorithm)
+
+    payload_size = sum(os.path.getsize(path) for path in args.input_files)
+    header = generate_header(generate_header_tlv(args, payload_size, bytes(digest_size)), payload_size)
 
     with open(args.output_file, 'wb') as out_file:
         out_file.write(header)
+        streamed_size, digests = stream_payload(args.input_files, out_file, digest_algorithms)
+
+        if streamed_size != payload_size:
+            error('Input payload files changed while creating the image')
+
+        out_file.seek(0)
+        out_file.write(generate_header(generate_header_tlv(args, payload_size, digests[args.digest_algorithm]), payload_size))
+
+    return digests
 
-        for path in args.input_files:
-            with open(path, 'rb') as file:
-                while True:
-                    chunk = file.read(PAYLOAD_BUFFER_SIZE)
-                    if not chunk:
-                        break
-                    out_file.write(chunk)
 
+def print_digests(digests: dict):
+    for algorithm, digest in digests.items():
+        print(f'{algorithm}: {digest.hex()}')
 
-def generate_image(args: object):
+
+def manifest_image_args(entry: dict) -> argparse.Namespace:
     """
-    Generate OTA image header and write it along with payload files to the OTA image file
+    Convert an image entry of a create-many manifest into the arguments of the create subcommand
     """
-    payload_size, payload_digest = generate_payload_summary(args)
-    header_tlv = generate_header_tlv(args, payload_size, payload_digest)
-    header = generate_header(header_tlv, payload_size)
-    write_image(args, header)
 
+    def optional_int(value):
+        return int(value, 0) if isinstance(value, str) else value
 
-def parse_header(args: object):
+    try:
+        return argparse.Namespace(
+            vendor_id=optional_int(entry['vendor_id']),
+            product_id=optional_int(entry['product_id']),
+            version=optional_int(entry['version']),
+            version_str=entry['version_str'],
+            digest_algorithm=entry['digest_algorithm'],
+            min_version=optional_int(entry.get('min_version')),
+            max_version=optional_int(entry.get('max_version')),
+            release_notes=entry.get('release_notes'),
+            extra_digest_algorithms=entry.get('extra_digest_algorithms', []),
+            input_files=entry['input_files'],
+            output_file=entry['output_file'],
+        )
+    except KeyError as e:
+        error(f'Manifest entry {entry} is missing {e}')
+
+
+def generate_manifest_image(args: argparse.Namespace):
+    return args.output_file, generate_image(args)
+
+
+def generate_images(args: object):
     """
-    Parse OTA image header
+    Generate all OTA images listed in a JSON manifest, in parallel processes
     """
 
-    with open(args.image_file, 'rb') as file:
-        fixed_header = file.read(struct.calcsize(FIXED_HEADER_FORMAT))
-        magic, total_size, header_size = struct.unpack(
-            FIXED_HEADER_FORMAT, fixed_header)
-        header_tlv = TLVReader(file.read(header_size)).get()['Any']
+    with open(args.manifest) as file:
+        images = [manifest_image_args(entry) for entry in json.load(file)]
+
+    for image in images:
+        for algorithm in [image.digest_algorithm] + image.extra_digest_algorithms:
+            if algorithm not in DIGEST_ALL_ALGORITHMS:
+                error(f'{image.output_file}: unsupported digest algorithm {algorithm}')
+        validate_header_attributes(image)
 
-        return magic, total_size, header_size, header_tlv
+    with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        for output_file, digests in executor.map(generate_manifest_image, images):
+            print(output_file)
+            print_digests(digests)
 
 
-def full_header_size(args: object) -> int:
+def read_header(file):
     """
-    Returns the size of the fixed header + header
+    Parse OTA image header from a file object, leaving it positioned at the start of the payload
     """
-    _magic, _total_size, header_size, _header_tlv = parse_header(args)
-    return struct.calcsize(FIXED_HEADER_FORMAT) + header_size
 
+    fixed_header = file.read(struct.calcsize(FIXED_HEADER_FORMAT))
+    magic, total_size, header_size = struct.unpack(
+        FIXED_HEADER_FORMAT, fixed_header)
+    header_tlv = TLVReader(file.read(header_size)).get()['Any']
 
-def read_chunk(file, size=1024):
-    while data := file.read(size):
-        yield data
+    return magic, total_size, header_size, header_tlv
+
+
+def parse_header(args: object):
+    """
+    Parse OTA image header
+    """
+
+    with open(args.image_file, 'rb') as file:
+        return read_header(file)
 
 
 def remove_header(args: object) -> None:
     """
     Removes the header from args.image_file and writes to args.output_file
     """
-    image_start = full_header_size(args)
     with open(args.image_file, 'rb') as file, open(args.output_file, 'wb') as outfile:
-        file.seek(image_start)
-        for chunk in read_chunk(file):
-            outfile.write(chunk)
+        read_header(file)
+        shutil.copyfileobj(file, outfile, STREAM_BUFFER_SIZE)
 
 
 def show_header(args: object):
@@ -282,7 +350,9 @@ def update_header_args(args: object) -> None:
     New header values can be specified in args, otherwise the values from args.image_file are used.
     The new file is written out to args.output_file.
     """
-    _magic, _total_size, _header_size, header_tlv = parse_header(args)
+    with open(args.image_file, 'rb') as infile:
+        _magic, _total_size, _header_size, header_tlv = read_header(infile)
+        payload_start = infile.tell()
 
     payload_size = header_tlv[HeaderTag.PAYLOAD_SIZE]
     payload_digest = header_tlv[HeaderTag.DIGEST]
@@ -310,9 +380,8 @@ def update_header_args(args: object) -> None:
 
     with open(args.image_file, 'rb') as infile, open(args.output_file, 'wb') as outfile:
         outfile.write(header)
-        infile.seek(full_header_size(args))
-        for chunk in read_chunk(infile):
-            outfile.write(chunk)
+        infile.seek(payload_start)
+        shutil.copyfileobj(infile, outfile, STREAM_BUFFER_SIZE)
 
 
 def main():
@@ -340,10 +409,21 @@ def main():
                                help='Maximum software version that can be updated to this image')
     create_parser.add_argument(
         '-rn', '--release-notes', help='Release note URL')
+    create_parser.add_argument('-xd', '--extra-digest-algorithm', dest='extra_digest_algorithms', action='append',
+                               choices=DIGEST_ALL_ALGORITHMS,
+                               help='Additional payload digest to compute and print, e.g. for publishing the image (repeatable)')
     create_parser.add_argument('input_files', nargs='+',
                                help='Path to input image payload file')
     create_parser.add_argument('output_file', help='Path to output image file')
 
+    create_many_parser = subcommands.add_parser(
+        'create-many', help='Create OTA images listed in a JSON manifest in parallel')
+    create_many_parser.add_argument('-j', '--jobs', type=int,
+                                    help='Number of images created in parallel (default: number of CPUs)')
+    create_many_parser.add_argument('manifest',
+                                    help='Path to JSON list of images, each an object with the create arguments as keys '
+                                    '(e.g. "vendor_id", "version_str", "input_files", "output_file")')
+
     show_parser = subcommands.add_parser('show', help='Show OTA image info')
     show_parser.add_argument('image_file', help='Path to OTA image file')
 
@@ -376,7 +456,11 @@ def main():
 
     if args.subcommand == 'create':
         validate_header_attributes(args)
-        generate_image(args)
+        digests = generate_image(args)
+        if args.extra_digest_algorithms:
+            print_digests(digests)
+    elif args.subcommand == 'create-many':
+        generate_images(args)
     elif args.subcommand == 'show':
         show_header(args)
     elif args.subcommand == 'extract':
@@ -38,6 +38,7 @@ import json
 import logging
 import secrets
 import threading
+import time
 import typing
 from ctypes import (CDLL, CFUNCTYPE, POINTER, Structure, byref, c_bool, c_char, c_char_p, c_int, c_int32, c_size_t, c_uint8,
                     c_uint16, c_uint32, c_uint64, c_void_p, cast, create_string_buffer, pointer, py_object, string_at)
@@ -56,6 +57,7 @@ from .clusters.CHIPClusters import ChipClusters
 from .crypto import p256keypair
 from .interaction_model import SessionParameters, SessionParametersStruct
 from .native import PyChipError
+from .storage.attribute_store import AttributeStore
 
 __all__ = ["ChipDeviceController", "CommissioningParameters",
            "AttributeReadRequest", "AttributeReadRequestList", "SubscriptionTargetList"]
@@ -137,6 +139,22 @@ class NOCChain:
     adminSubject: int
 
 
+@dataclass
+class NodeReadResult:
+    ''' Outcome of the read or subscription of a single node in ReadMany and SubscribeMany. '''
+    nodeId: int
+    # AsyncReadTransaction.ReadResponse for reads, ClusterAttribute.SubscriptionTransaction for subscriptions.
+    # None if the interaction failed.
+    result: typing.Any = None
+    error: typing.Optional[Exception] = None
+    # Time from the start of the interaction with the node (once a concurrency slot was available) to its completion
+    latencySec: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
 @dataclass
 class ICDRegistrationParameters:
     symmetricKey: typing.Optional[bytes]
@@ -492,6 +510,7 @@ class ChipDeviceControllerBase():
         self._open_window_context: CallbackContext = CallbackContext(asyncio.Lock())
         self._unpair_device_context: CallbackContext = CallbackContext(asyncio.Lock())
         self._pase_establishment_context: CallbackContext = CallbackContext(self._commissioning_lock)
+        self._attributeStore: typing.Optional[AttributeStore] = None
 
     def _set_dev_ctrl(self, devCtrl, pairingDelegate):
         def HandleCommissioningComplete(nodeId: int, err: PyChipError):
@@ -1989,6 +2008,8 @@ class ChipDeviceControllerBase():
         raise ValueError("Unsupported Attribute Path")
 
     def _parseDataVersionFilterTuple(self, pathTuple: typing.List[typing.Tuple[int, typing.Type[ClusterObjects.Cluster], int]]):
+        if isinstance(pathTuple, ClusterAttribute.DataVersionFilter):
+            return pathTuple
         endpoint = None
         cluster = None
 
@@ -2111,7 +2132,7 @@ class ChipDeviceControllerBase():
 
             An AttributePath can also be specified directly by [matter.cluster.Attribute.AttributePath(...)]
 
-        dataVersionFilters: A list of tuples of (endpoint, cluster, data version).
+        dataVersionFilters: A list of tuples of (endpoint, cluster, data version), or of ClusterAttribute.DataVersionFilter.
 
         events: A list of tuples of varying types depending on the type of read being requested:
             (endpoint, Clusters.ClusterA.EventA, urgent):       Endpoint = specific,
@@ -2342,6 +2363,179 @@ class ChipDeviceControllerBase():
             return res
         return res.events
 
+    def SetAttributeStore(self, store: typing.Optional[AttributeStore]):
+        '''
+        Sets the store used by IncrementalRead to persist the attributes read from nodes.
+
+        store: An AttributeStore, e.g. AttributeStore('/path/to/attributes.sqlite'). None to use a store in memory.
+        '''
+        self._attributeStore = store
+
+    async def IncrementalRead(
+        self,
+        nodeId: int,
+        attributes: typing.Optional[typing.List[typing.Any]] = None,
+        returnClusterObject: bool = False,
+        payloadCapability: int = TransportPayloadCapability.MRP_PAYLOAD
+    ):
+        '''
+        Read a list of attributes from a target node, only transferring the clusters that changed since they were last read.
+
+        The attributes read are saved in the attribute store of the controller (see SetAttributeStore). The next reads
+        of these attributes send DataVersion filters for the stored clusters, so that the node only reports the clusters
+        whose DataVersion changed. The clusters that did not change are then taken from the store.
+
+        nodeId: Target's Node ID
+        attributes: The attribute paths to read, see ReadAttribute(). Defaults to a wildcard read of all attributes.
+        returnClusterObject: This returns the data as consolidated cluster objects, see ReadAttribute().
+
+        Returns:
+            - The attributes, in the same format as ReadAttribute() returns for a read request.
+
+        Raises:
+            - InteractionModelError (matter.interaction_model) on error
+        '''
+        self.CheckIsActive()
+        if self._attributeStore is None:
+            self._attributeStore = AttributeStore(':memory:')
+        store = self._attributeStore
+
+        paths = [self._parseAttributePathTuple(v) for v in attributes] if attributes else [ClusterAttribute.AttributePath()]
+        fabric = self.GetCompressedFabricId()
+        stored = store.GetNodeClusters(fabric, nodeId)
+        filters = AttributeStore.GetDataVersionFilters(stored, paths)
+
+        res = await self.Read(nodeId, attributes=paths, dataVersionFilters=filters, payloadCapability=payloadCapability)
+
+        merged, removed = AttributeStore.Merge(stored, res.tlvAttributes, res.dataVersions, paths)
+        changed = {(endpoint, cluster) for endpoint, clusters in res.tlvAttributes.items() for cluster in clusters}
+        store.UpdateNodeClusters(fabric, nodeId, {key: merged[key] for key in changed if key in merged}, removed)
+        LOGGER.debug("Incremental read of node 0x%016X: %d clusters filtered, %d clusters reported",
+                     nodeId, len(filters), len(changed))
+
+        return AttributeStore.BuildCache(merged, paths, res.tlvAttributes, res.dataVersions,
+                                         returnClusterObject).GetUpdatedAttributeCache()
+
+    async def ReadManyAsCompleted(
+        self,
+        nodeIds: typing.Iterable[int],
+        attributes: typing.Optional[typing.List[typing.Any]] = None,
+        events: typing.Optional[typing.List[typing.Any]] = None,
+        concurrency: int = 16,
+        perNodeTimeoutSec: typing.Optional[float] = 30.0,
+        **kwargs
+    ) -> typing.AsyncIterator[NodeReadResult]:
+        '''
+        Read (or subscribe to) the same attributes and/or events on many nodes, yielding the result of each node as soon as
+        it completes.
+
+        nodeIds: Target Node IDs. Duplicates are only read once.
+        attributes, events: The paths to read, see Read() for the supported formats.
+        concurrency: Maximum number of nodes read at once. This bounds the number of CASE sessions being established
+            concurrently. Sessions that already exist are reused. A read that outlives the deadline of its node keeps
+            its slot until it completes.
+        perNodeTimeoutSec: Deadline for each node, including session establishment. None to wait indefinitely.
+        kwargs: Any other argument of Read(), e.g. reportInterval to establish subscriptions, or fabricFiltered.
+
+        Yields:
+            - NodeReadResult for every node, in completion order. Errors and timeouts of a node are reported in its result
+              instead of being raised, so the other nodes are not affected.
+              A subscription that completes after the deadline of its node is shut down.
+        '''
+        self.CheckIsActive()
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        def shutdownLateSubscription(task: asyncio.Task):
+            if task.cancelled() or task.exception() is not None:
+                return
+            if isinstance(task.result(), ClusterAttribute.SubscriptionTransaction):
+                task.result().Shutdown()
+
+        async def readNode(nodeId: int) -> NodeReadResult:
+            await semaphore.acquire()
+            start = time.monotonic()
+            readTask = asyncio.ensure_future(self.Read(nodeId, attributes=attributes, events=events, **kwargs))
+            # The slot is freed when the read itself is over, not when its deadline expires, so that a read outliving
+            # its deadline still counts against the concurrency bound.
+            readTask.add_done_callback(lambda _: semaphore.release())
+            try:
+                # The read is shielded so that a late subscription can still be shut down once established.
+                result = await asyncio.wait_for(asyncio.shield(readTask), timeout=perNodeTimeoutSec)
+                return NodeReadResult(nodeId=nodeId, result=result, latencySec=time.monotonic() - start)
+            except asyncio.TimeoutError:
+                readTask.add_done_callback(shutdownLateSubscription)
+                return NodeReadResult(nodeId=nodeId, error=TimeoutError(
+                    f"Node 0x{nodeId:016X} did not respond within {perNodeTimeoutSec} seconds"), latencySec=time.monotonic() - start)
+            except asyncio.CancelledError:
+                readTask.add_done_callback(shutdownLateSubscription)
+                raise
+            except Exception as ex:
+                return NodeReadResult(nodeId=nodeId, error=ex, latencySec=time.monotonic() - start)
+
+        tasks = [asyncio.ensure_future(readNode(nodeId)) for nodeId in dict.fromkeys(nodeIds)]
+        try:
+            for completed in asyncio.as_completed(tasks):
+                result = await completed
+                if result.ok:
+                    LOGGER.debug("Read of node 0x%016X completed in %.3f seconds", result.nodeId, result.latencySec)
+                else:
+                    LOGGER.warning("Read of node 0x%016X failed after %.3f seconds: %s",
+                                   result.nodeId, result.latencySec, result.error)
+                yield result
+        finally:
+            # The caller stopped iterating early, do not leave reads running in the background.
+            for task in tasks:
+                task.cancel()
+
+    async def ReadMany(
+        self,
+        nodeIds: typing.Iterable[int],
+        attributes: typing.Optional[typing.List[typing.Any]] = None,
+        events: typing.Optional[typing.List[typing.Any]] = None,
+        concurrency: int = 16,
+        perNodeTimeoutSec: typing.Optional[float] = 30.0,
+        **kwargs
+    ) -> typing.Dict[int, NodeReadResult]:
+        '''
+        Read the same attributes and/or events on many nodes. Please see ReadManyAsCompleted for the description of the
+        parameters, and to process the results while the other nodes are still being read.
+
+        Returns:
+            - A dict mapping every node ID to its NodeReadResult. The read response of a node is in the `result` field
+              of its NodeReadResult, and its error (e.g. a TimeoutError) in the `error` field.
+        '''
+        return {result.nodeId: result async for result in self.ReadManyAsCompleted(
+            nodeIds, attributes=attributes, events=events, concurrency=concurrency, perNodeTimeoutSec=perNodeTimeoutSec,
+            **kwargs)}
+
+    async def SubscribeMany(
+        self,
+        nodeIds: typing.Iterable[int],
+        attributes: typing.Optional[typing.List[typing.Any]] = None,
+        events: typing.Optional[typing.List[typing.Any]] = None,
+        reportInterval: typing.Tuple[int, int] = (0, 30),
+        concurrency: int = 16,
+        perNodeTimeoutSec: typing.Optional[float] = 30.0,
+        keepSubscriptions: bool = True,
+        **kwargs
+    ) -> typing.Dict[int, NodeReadResult]:
+        '''
+        Subscribe to the same attributes and/or events on many nodes. Please see ReadManyAsCompleted for the description
+        of the parameters.
+
+        keepSubscriptions: Keep the existing subscriptions with each node. Unlike Read(), this defaults to True.
+
+        Returns:
+            - A dict mapping every node ID to its NodeReadResult. The ClusterAttribute.SubscriptionTransaction of a node is in
+              the `result` field of its NodeReadResult, and its error (e.g. a TimeoutError) in the `error` field.
+        '''
+        return await self.ReadMany(nodeIds, attributes=attributes, events=events, concurrency=concurrency,
+                                   perNodeTimeoutSec=perNodeTimeoutSec, reportInterval=reportInterval,
+                                   keepSubscriptions=keepSubscriptions, **kwargs)
+
     def SetIpk(self, ipk: bytes):
         '''
         Sets the Identity Protection Key (IPK) for the device controller.
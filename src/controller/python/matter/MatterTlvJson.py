@@ -15,15 +15,17 @@
 #    limitations under the License.
 #
 
+import base64
 import builtins
 import ctypes
 import json
+import math
 import typing
 from ctypes import CDLL, POINTER, c_char_p, c_size_t, c_ubyte
 
 from .clusters import ClusterObjects as ClusterObjects
-from .clusters.Attribute import AttributeCache, AttributePath, ValueDecodeFailure
-from .tlv import TLVReader
+from .clusters.Attribute import AttributeCache, AttributePath, ValueDecodeFailure, _EnsureIndexesBuilt
+from .tlv import TLVReader, float32, uint
 
 
 class TLVJsonConverter():
@@ -82,3 +84,102 @@ class TLVJsonConverter():
                     cache.UpdateTLV(path=path, dataVersion=0, data=tlvData)
                     cache.GetUpdatedAttributeCache()
         return cache
+
+
+def _parse_json_name(json_name: str) -> typing.Tuple[typing.Any, str, str]:
+    ''' Splits a MatterJsonTlv name of the form [field_name:]field_id:element_type[-sub_element_type] into the
+        tag used by TLVReader for the element, its element type and its array sub-element type.
+    '''
+    parts = json_name.split(':')
+    if len(parts) not in (2, 3):
+        raise ValueError(f"Invalid MatterJsonTlv name {json_name}")
+    tag_number = int(parts[-2])
+    element_type, _, sub_element_type = parts[-1].partition('-')
+
+    # Mirrors the tag encoding of the JSON to TLV converter: standard tags that fit in 8 bits are
+    # context tags, larger ones are implicit profile tags and manufacturer tags are fully qualified.
+    vendor_id = tag_number >> 16
+    tag_id = tag_number & 0xFFFF
+    if vendor_id != 0:
+        tag = (vendor_id << 16, tag_id)
+    elif tag_id <= 0xFF:
+        tag = tag_number
+    else:
+        tag = (None, tag_number)
+    return tag, element_type, sub_element_type
+
+
+def _json_to_tlv_value(element_type: str, sub_element_type: str, value: typing.Any) -> typing.Any:
+    ''' Converts a MatterJsonTlv value into the python value TLVReader returns for the equivalent TLV. '''
+    if element_type == "UINT":
+        result = int(value)
+        if result < 0:
+            raise ValueError(f"Negative value {value} for an unsigned integer")
+        return uint(result)
+    if element_type == "INT":
+        return int(value)
+    if element_type in ("FLOAT", "DOUBLE"):
+        if isinstance(value, str):
+            if value not in ("Infinity", "-Infinity"):
+                raise ValueError(f"Invalid floating point value {value}")
+            result = math.inf if value == "Infinity" else -math.inf
+        else:
+            result = float(value)
+        return float32(result) if element_type == "FLOAT" else result
+    if element_type == "BOOL":
+        if not isinstance(value, bool):
+            raise ValueError(f"Invalid boolean value {value}")
+        return value
+    if element_type == "BYTES":
+        return base64.b64decode(value, validate=True)
+    if element_type == "STRING":
+        if not isinstance(value, str):
+            raise ValueError(f"Invalid string value {value}")
+        return value
+    if element_type == "NULL":
+        if value is not None:
+            raise ValueError(f"Invalid null value {value}")
+        return None
+    if element_type == "STRUCT":
+        result = {}
+        for json_name, field_value in value.items():
+            tag, field_type, field_sub_type = _parse_json_name(json_name)
+            result[tag] = _json_to_tlv_value(field_type, field_sub_type, field_value)
+        return result
+    if element_type == "ARRAY":
+        if sub_element_type == "?":
+            if value:
+                raise ValueError("Array with unknown element type is not empty")
+            return []
+        if sub_element_type == "ARRAY":
+            raise ValueError("Arrays of arrays are not supported")
+        return [_json_to_tlv_value(sub_element_type, "", item) for item in value]
+    raise ValueError(f"Unsupported element type {element_type}")
+
+
+def convert_dump_to_cache_without_stack(json_tlv: typing.Any) -> AttributeCache:
+    ''' Converts a json object containing the MatterJsonTlv dump of an entire device into an AttributeCache object,
+        like TLVJsonConverter.convert_dump_to_cache, but in python so that it does not need a running CHIP stack.
+
+        Attributes that cannot be converted are stored as a ValueDecodeFailure, as the TLVJsonConverter does.
+    '''
+    _EnsureIndexesBuilt()
+    cache = AttributeCache()
+    for endpoint_id_str, endpoint in json_tlv.items():
+        endpoint_id = int(endpoint_id_str, 0)
+        for cluster_id_and_type_str, cluster in endpoint.items():
+            cluster_id_str, _ = cluster_id_and_type_str.split(':', 2)
+            cluster_id = int(cluster_id_str)
+            for attribute_id_and_type_str, attribute in cluster.items():
+                attribute_id_str, _ = attribute_id_and_type_str.split(':', 2)
+                attribute_id = int(attribute_id_str)
+                path = AttributePath(EndpointId=endpoint_id, ClusterId=cluster_id, AttributeId=attribute_id)
+                try:
+                    _, element_type, sub_element_type = _parse_json_name(attribute_id_and_type_str)
+                    tlvData = _json_to_tlv_value(element_type, sub_element_type, attribute)
+                except (ValueError, TypeError, AttributeError):
+                    tlvData = ValueDecodeFailure()
+                cache.UpdateTLV(path=path, dataVersion=0, data=tlvData)
+    # Converting the TLV into cluster objects is the expensive part, so only do it once for the whole dump
+    cache.GetUpdatedAttributeCache()
+    return cache
@@ -18,6 +18,7 @@
 # Needed to use types in type hints before they are fully defined.
 from __future__ import annotations
 
+import asyncio
 import builtins
 import ctypes
 import inspect
@@ -281,6 +282,16 @@ def _BuildClusterIndex():
             _ClusterIndex[obj.id] = obj
 
 
+def _EnsureIndexesBuilt():
+    ''' Builds the attribute and cluster indexes if Init() has not done so, for code that decodes
+        attribute data without initializing the CHIP stack.
+    '''
+    if not _AttributeIndex:
+        _BuildAttributeIndex()
+    if not _ClusterIndex:
+        _BuildClusterIndex()
+
+
 @dataclass
 class SubscriptionParameters:
     MinReportIntervalFloorSeconds: int
@@ -457,6 +468,11 @@ class SubscriptionTransaction:
         '''
         return self._readTransaction._cache.GetUpdatedAttributeCache()
 
+    def GetAttributeTLVCache(self) -> Dict[int, Dict[int, Dict[int, Any]]]:
+        ''' Returns the raw TLV values received so far, by endpoint, cluster and attribute ID.
+        '''
+        return self._readTransaction._cache.attributeTLVCache
+
     def GetAttribute(self, path: TypedAttributePath) -> Any:
         ''' Returns a specific attribute given a TypedAttributePath.
         '''
@@ -659,6 +675,191 @@ def DefaultReportEndCallback(transaction: SubscriptionTransaction):
     pass
 
 
+def _PathCovers(path: AttributePath, other: AttributePath) -> bool:
+    ''' Returns True if every attribute matched by `other` is also matched by `path`. '''
+    return all(value is None or value == otherValue for value, otherValue in (
+        (path.EndpointId, other.EndpointId), (path.ClusterId, other.ClusterId), (path.AttributeId, other.AttributeId)))
+
+
+def _PathSortKey(path: AttributePath) -> Tuple[int, int, int]:
+    return tuple(-1 if value is None else value for value in (path.EndpointId, path.ClusterId, path.AttributeId))
+
+
+def MinimalPathSet(paths: List[AttributePath]) -> List[AttributePath]:
+    ''' Returns the paths that are not covered by any other path of the list, without duplicates, in a stable order. '''
+    unique = sorted(set(paths), key=_PathSortKey)
+    return [path for path in unique if not any(other != path and _PathCovers(other, path) for other in unique)]
+
+
+@dataclass(eq=False)
+class SubscriptionListener:
+    ''' A local listener of a SubscriptionMultiplexer, notified of the reports of the attributes matched by its paths. '''
+    paths: List[AttributePath]
+    callback: Callable[[TypedAttributePath, SubscriptionTransaction], None]
+
+    def Matches(self, path: AttributePath) -> bool:
+        return any(_PathCovers(listenerPath, path) for listenerPath in self.paths)
+
+
+class SubscriptionMultiplexer:
+    ''' Shares device subscriptions to a node between local listeners with overlapping paths.
+
+        The paths of all the listeners are merged into a minimal set of paths, and subscribed to with as few
+        subscriptions as possible (at most maxPathsPerSubscription paths each), so that overlapping listeners
+        do not use additional subscription slots on the node, nor receive the same reports several times.
+        Attribute reports are fanned out to every listener whose paths match them, using the same callback
+        signature as SubscriptionTransaction.SetAttributeUpdateCallback.
+
+        The subscriptions are re-planned whenever a listener with new paths is added, or when removing a
+        listener allows subscribing to fewer paths. New subscriptions are established before the ones they
+        replace are shut down, so no report is missed by the listeners in the meantime.
+
+        e.g.
+            multiplexer = SubscriptionMultiplexer(devCtrl, nodeId, reportInterval=(0, 30))
+            listener = await multiplexer.AddListener([AttributePath.from_cluster(1, Clusters.OnOff)], callback)
+            ...
+            await multiplexer.RemoveListener(listener)
+    '''
+
+    def __init__(self, devCtrl, nodeId: int, reportInterval: Tuple[int, int] = (0, 30), fabricFiltered: bool = True,
+                 maxPathsPerSubscription: Optional[int] = None):
+        self._devCtrl = devCtrl
+        self._nodeId = nodeId
+        self._reportInterval = reportInterval
+        self._fabricFiltered = fabricFiltered
+        self._maxPathsPerSubscription = maxPathsPerSubscription
+        self._listeners: List[SubscriptionListener] = []
+        # Device subscriptions, by the paths they subscribe to
+        self._subscriptions: Dict[Tuple[AttributePath, ...], SubscriptionTransaction] = {}
+        self._lock = asyncio.Lock()
+
+    @property
+    def subscriptions(self) -> List[SubscriptionTransaction]:
+        return list(self._subscriptions.values())
+
+    @property
+    def listeners(self) -> List[SubscriptionListener]:
+        return list(self._listeners)
+
+    def _Plan(self) -> List[Tuple[AttributePath, ...]]:
+        paths = MinimalPathSet([path for listener in self._listeners for path in listener.paths])
+        chunkSize = self._maxPathsPerSubscription or max(len(paths), 1)
+        return [tuple(paths[i:i + chunkSize]) for i in range(0, len(paths), chunkSize)]
+
+    def _OnAttributeChange(self, path: TypedAttributePath, transaction: SubscriptionTransaction):
+        # A replaced subscription may still deliver reports until it is shut down. The listeners were already notified
+        # of the values that changed from the subscriptions that replaced it.
+        if not any(transaction is subscription for subscription in self._subscriptions.values()):
+            return
+        for listener in list(self._listeners):
+            if listener.Matches(path.Path):
+                self._Notify(listener, path.Path, transaction)
+
+    @staticmethod
+    def _Notify(listener: SubscriptionListener, path: AttributePath, transaction: SubscriptionTransaction):
+        try:
+            listener.callback(TypedAttributePath(Path=path), transaction)
+        except (KeyError, ValueError) as err:
+            # path could not be resolved into a TypedAttributePath
+            LOGGER.exception(err)
+        except Exception as ex:
+            # A failing listener must not prevent the other listeners from getting the report
+            LOGGER.exception(ex)
+
+    @staticmethod
+    def _CachedValues(transaction: SubscriptionTransaction) -> Dict[AttributePath, Any]:
+        return {AttributePath(EndpointId=endpoint, ClusterId=cluster, AttributeId=attribute): value
+                for endpoint, clusters in transaction.GetAttributeTLVCache().items()
+                for cluster, attributes in clusters.items()
+                for attribute, value in attributes.items()}
+
+    async def _Replan(self, newListeners: List[SubscriptionListener]):
+        plan = self._Plan()
+        previous = self._subscriptions
+        established: Dict[Tuple[AttributePath, ...], SubscriptionTransaction] = {}
+        try:
+            for paths in plan:
+                if paths in previous:
+                    established[paths] = previous[paths]
+                    continue
+                LOGGER.info("Subscribing to %s on node 0x%016X", [str(p) for p in paths], self._nodeId)
+                subscription = await self._devCtrl.ReadAttribute(
+                    self._nodeId, attributes=list(paths), reportInterval=self._reportInterval,
+                    fabricFiltered=self._fabricFiltered, keepSubscriptions=True)
+                established[paths] = subscription
+        except Exception:
+            for paths, subscription in established.items():
+                if paths not in previous:
+                    subscription.Shutdown()
+            raise
+
+        previousValues: Dict[AttributePath, Any] = {}
+        for subscription in previous.values():
+            previousValues.update(self._CachedValues(subscription))
+
+        # From now on, the reports of the subscriptions being replaced are ignored
+        self._subscriptions = established
+        for paths, subscription in established.items():
+            if paths in previous:
+                continue
+            subscription.SetAttributeUpdateCallback(self._OnAttributeChange)
+            # The priming reports of the new subscriptions are not reported to the listeners, so notify them of the
+            # values that changed while the subscriptions were swapped, and new listeners of all the current values.
+            for path, value in self._CachedValues(subscription).items():
+                changed = path not in previousValues or previousValues[path] != value
+                for listener in list(self._listeners):
+                    if listener.Matches(path) and (changed or listener in newListeners):
+                        self._Notify(listener, path, subscription)
+
+        for paths, subscription in previous.items():
+            if paths not in established:
+                LOGGER.info("Shutting down subscription to %s on node 0x%016X", [str(p) for p in paths], self._nodeId)
+                subscription.Shutdown()
+
+        # New listeners whose paths were already subscribed to get the current values from the existing subscriptions
+        for listener in newListeners:
+            for paths, subscription in established.items():
+                if paths not in previous:
+                    continue
+                for path in self._CachedValues(subscription):
+                    if listener.Matches(path):
+                        self._Notify(listener, path, subscription)
+
+    async def AddListener(self, paths: List[AttributePath],
+                          callback: Callable[[TypedAttributePath, SubscriptionTransaction], None]) -> SubscriptionListener:
+        ''' Adds a listener of the given paths, subscribing to the paths that are not subscribed to yet.
+
+            paths: The attribute paths to listen to, e.g. AttributePath.from_cluster(1, Clusters.OnOff).
+            callback: Called with the path and the subscription of every report matched by the paths, starting with
+                      the current values of the attributes.
+
+            Returns the listener, to be passed to RemoveListener.
+        '''
+        listener = SubscriptionListener(paths=list(paths), callback=callback)
+        async with self._lock:
+            self._listeners.append(listener)
+            try:
+                await self._Replan([listener])
+            except Exception:
+                self._listeners.remove(listener)
+                raise
+        return listener
+
+    async def RemoveListener(self, listener: SubscriptionListener):
+        ''' Removes a listener, shutting down or narrowing the subscriptions that are not needed anymore. '''
+        async with self._lock:
+            self._listeners.remove(listener)
+            await self._Replan([])
+
+    async def Shutdown(self):
+        ''' Removes all the listeners and shuts down all the subscriptions. '''
+        async with self._lock:
+            self._listeners.clear()
+            for subscription in self._subscriptions.values():
+                subscription.Shutdown()
+            self._subscriptions = {}
+
+
 def _BuildEventIndex():
     ''' Build internal event index for locating the corresponding cluster object by path in the future.
     We do this because this operation will take a long time when there are lots of events, it takes about 300ms for a single query.
@@ -688,6 +889,8 @@ class AsyncReadTransaction:
         attributes: dict[Any, Any]
         events: list[ClusterEvent]
         tlvAttributes: dict[int, Any]
+        # DataVersion of every cluster in tlvAttributes, as dataVersions[endpoint][cluster]
+        dataVersions: dict[int, dict[int, int]] = field(default_factory=dict)
 
     def __init__(self, future: Future, eventLoop, devCtrl, returnClusterObject: bool):
         self._event_loop = eventLoop
@@ -711,7 +914,8 @@ class AsyncReadTransaction:
         return self.ReadResponse(
             attributes=self._cache.GetUpdatedAttributeCache(),
             events=self._events,
-            tlvAttributes=self._cache.attributeTLVCache
+            tlvAttributes=self._cache.attributeTLVCache,
+            dataVersions=self._cache.versionList
         )
 
     def GetSubscriptionHandler(self) -> SubscriptionTransaction | None:
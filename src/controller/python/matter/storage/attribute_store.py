@@ -0,0 +1,234 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import logging
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from ..clusters.Attribute import AttributeCache, AttributePath, DataVersionFilter, ValueDecodeFailure
+from ..tlv import TLVReader, TLVWriter
+
+LOGGER = logging.getLogger(__name__)
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS clusters (
+    fabric INTEGER NOT NULL,
+    node INTEGER NOT NULL,
+    endpoint INTEGER NOT NULL,
+    cluster INTEGER NOT NULL,
+    data_version INTEGER NOT NULL,
+    complete INTEGER NOT NULL,
+    PRIMARY KEY (fabric, node, endpoint, cluster)
+);
+CREATE TABLE IF NOT EXISTS attributes (
+    fabric INTEGER NOT NULL,
+    node INTEGER NOT NULL,
+    endpoint INTEGER NOT NULL,
+    cluster INTEGER NOT NULL,
+    attribute INTEGER NOT NULL,
+    tlv BLOB NOT NULL,
+    PRIMARY KEY (fabric, node, endpoint, cluster, attribute)
+);
+'''
+
+_DESCRIPTOR_CLUSTER_ID = 0x001D
+_SERVER_LIST_ATTRIBUTE_ID = 0x0001
+_PARTS_LIST_ATTRIBUTE_ID = 0x0003
+_ROOT_ENDPOINT_ID = 0
+
+
+@dataclass
+class StoredCluster:
+    ''' Attributes of a cluster instance of a node, as last read at the given data version. '''
+    dataVersion: int
+    # True if the cluster was read with a wildcard attribute path, i.e. it holds every attribute of the cluster.
+    complete: bool
+    attributes: Dict[int, Any] = field(default_factory=dict)
+
+
+# Stored clusters of a node, keyed by (endpoint, cluster).
+NodeClusters = Dict[Tuple[int, int], StoredCluster]
+
+
+def _pathMatchesCluster(path: AttributePath, endpointId: int, clusterId: int) -> bool:
+    return path.EndpointId in (None, endpointId) and path.ClusterId in (None, clusterId)
+
+
+def _requiredAttributes(paths: Iterable[AttributePath], endpointId: int, clusterId: int) -> Optional[Set[int]]:
+    ''' Returns the attribute IDs of the cluster the paths request, or None if they request all its attributes. '''
+    attributeIds: Set[int] = set()
+    for path in paths:
+        if not _pathMatchesCluster(path, endpointId, clusterId):
+            continue
+        if path.AttributeId is None:
+            return None
+        attributeIds.add(path.AttributeId)
+    return attributeIds
+
+
+def _encode(value: Any) -> bytes:
+    writer = TLVWriter()
+    writer.put(None, value)
+    return bytes(writer.encoding)
+
+
+def _decode(tlv: bytes) -> Any:
+    return TLVReader(tlv).get()["Any"]
+
+
+class AttributeStore:
+    ''' A persistent store of the attributes read from nodes, used by DeviceController.IncrementalRead().
+
+        Each cluster instance of a node is stored with the DataVersion it was read at, so that later reads
+        of the same paths can send DataVersion filters and only receive the clusters that changed since.
+        Attribute values are stored as TLV, as they are received from the node.
+
+        The store is an SQLite database. Use ':memory:' as path for a store that is not persisted.
+        Nodes are identified by their fabric (e.g. the compressed fabric ID) and their node ID.
+    '''
+
+    def __init__(self, path: str):
+        self._path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.executescript(_SCHEMA)
+        self._db.commit()
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def GetNodeClusters(self, fabric: int, nodeId: int) -> NodeClusters:
+        ''' Returns all the stored clusters of the node. '''
+        with self._lock:
+            clusters = {(endpoint, cluster): StoredCluster(dataVersion=dataVersion, complete=bool(complete))
+                        for endpoint, cluster, dataVersion, complete in self._db.execute(
+                            'SELECT endpoint, cluster, data_version, complete FROM clusters WHERE fabric=? AND node=?',
+                            (fabric, nodeId))}
+            for endpoint, cluster, attribute, tlv in self._db.execute(
+                    'SELECT endpoint, cluster, attribute, tlv FROM attributes WHERE fabric=? AND node=?', (fabric, nodeId)):
+                if (endpoint, cluster) in clusters:
+                    clusters[(endpoint, cluster)].attributes[attribute] = _decode(tlv)
+        return clusters
+
+    def UpdateNodeClusters(self, fabric: int, nodeId: int, updated: NodeClusters, removed: Iterable[Tuple[int, int]] = ()):
+        ''' Replaces the given clusters of the node, and removes the `removed` ones, in a single transaction. '''
+        with self._lock, self._db:
+            for endpoint, cluster in list(updated) + list(removed):
+                self._db.execute('DELETE FROM clusters WHERE fabric=? AND node=? AND endpoint=? AND cluster=?',
+                                 (fabric, nodeId, endpoint, cluster))
+                self._db.execute('DELETE FROM attributes WHERE fabric=? AND node=? AND endpoint=? AND cluster=?',
+                                 (fabric, nodeId, endpoint, cluster))
+            for (endpoint, cluster), stored in updated.items():
+                self._db.execute('INSERT INTO clusters VALUES (?, ?, ?, ?, ?, ?)',
+                                 (fabric, nodeId, endpoint, cluster, stored.dataVersion, int(stored.complete)))
+                self._db.executemany('INSERT INTO attributes VALUES (?, ?, ?, ?, ?, ?)',
+                                     [(fabric, nodeId, endpoint, cluster, attribute, _encode(value))
+                                      for attribute, value in stored.attributes.items()])
+
+    def RemoveNode(self, fabric: int, nodeId: int):
+        ''' Forgets everything stored for the node, e.g. once it was removed from the fabric. '''
+        with self._lock, self._db:
+            self._db.execute('DELETE FROM clusters WHERE fabric=? AND node=?', (fabric, nodeId))
+            self._db.execute('DELETE FROM attributes WHERE fabric=? AND node=?', (fabric, nodeId))
+
+    @staticmethod
+    def GetDataVersionFilters(stored: NodeClusters, paths: List[AttributePath]) -> List[DataVersionFilter]:
+        ''' Returns DataVersion filters for the stored clusters that hold every attribute the paths request from them. '''
+        filters = []
+        for (endpoint, cluster), storedCluster in stored.items():
+            if not any(_pathMatchesCluster(path, endpoint, cluster) for path in paths):
+                continue
+            required = _requiredAttributes(paths, endpoint, cluster)
+            if storedCluster.complete or (required is not None and required <= storedCluster.attributes.keys()):
+                filters.append(DataVersionFilter(EndpointId=endpoint, ClusterId=cluster, DataVersion=storedCluster.dataVersion))
+        return filters
+
+    @staticmethod
+    def Merge(stored: NodeClusters, tlvAttributes: Dict[int, Dict[int, Dict[int, Any]]], versions: Dict[int, Dict[int, int]],
+              paths: List[AttributePath]) -> Tuple[NodeClusters, Set[Tuple[int, int]]]:
+        ''' Merges the attributes of a read response into the stored clusters of a node.
+
+            Clusters of the response replace the stored ones if their DataVersion changed, or are merged into
+            them otherwise. Clusters with an attribute that could not be read are not stored, so that they are
+            read in full again next time. Clusters and endpoints that are not listed by the Descriptor cluster
+            anymore are removed.
+
+            Returns the updated stored clusters of the node, and the (endpoint, cluster) keys that are gone.
+        '''
+        merged = dict(stored)
+        removed: Set[Tuple[int, int]] = set()
+        for endpoint, endpointAttributes in tlvAttributes.items():
+            for cluster, attributes in endpointAttributes.items():
+                key = (endpoint, cluster)
+                dataVersion = versions.get(endpoint, {}).get(cluster)
+                if dataVersion is None or any(isinstance(v, ValueDecodeFailure) for v in attributes.values()):
+                    if merged.pop(key, None) is not None:
+                        removed.add(key)
+                    continue
+                complete = _requiredAttributes(paths, endpoint, cluster) is None
+                previous = merged.get(key)
+                if previous is not None and previous.dataVersion == dataVersion:
+                    merged[key] = StoredCluster(dataVersion=dataVersion, complete=previous.complete or complete,
+                                                attributes={**previous.attributes, **attributes})
+                else:
+                    merged[key] = StoredCluster(dataVersion=dataVersion, complete=complete, attributes=dict(attributes))
+
+        # Data version filters do not tell apart clusters that did not change from clusters that are gone,
+        # so rely on the Descriptor cluster to drop the ones that are not on the node anymore.
+        partsList = merged.get((_ROOT_ENDPOINT_ID, _DESCRIPTOR_CLUSTER_ID), StoredCluster(0, False)).attributes.get(
+            _PARTS_LIST_ATTRIBUTE_ID)
+        for key in list(merged):
+            endpoint, cluster = key
+            serverList = merged.get((endpoint, _DESCRIPTOR_CLUSTER_ID), StoredCluster(0, False)).attributes.get(
+                _SERVER_LIST_ATTRIBUTE_ID)
+            endpointGone = isinstance(partsList, list) and endpoint != _ROOT_ENDPOINT_ID and endpoint not in partsList
+            clusterGone = isinstance(serverList, list) and cluster not in serverList
+            if endpointGone or clusterGone:
+                del merged[key]
+                removed.add(key)
+        return merged, removed
+
+    @staticmethod
+    def BuildCache(stored: NodeClusters, paths: List[AttributePath], tlvAttributes: Dict[int, Dict[int, Dict[int, Any]]],
+                   versions: Dict[int, Dict[int, int]], returnClusterObject: bool = False) -> AttributeCache:
+        ''' Returns an AttributeCache holding the attributes of a read response, and the stored attributes
+            that the paths request from the clusters that are not in the response.
+        '''
+        cache = AttributeCache(returnClusterObject=returnClusterObject)
+        for (endpoint, cluster), storedCluster in stored.items():
+            if cluster in tlvAttributes.get(endpoint, {}) or not any(_pathMatchesCluster(p, endpoint, cluster) for p in paths):
+                continue
+            required = _requiredAttributes(paths, endpoint, cluster)
+            for attribute, value in storedCluster.attributes.items():
+                if required is None or attribute in required:
+                    cache.UpdateTLV(AttributePath(EndpointId=endpoint, ClusterId=cluster, AttributeId=attribute),
+                                    storedCluster.dataVersion, value)
+        for endpoint, endpointAttributes in tlvAttributes.items():
+            for cluster, attributes in endpointAttributes.items():
+                for attribute, value in attributes.items():
+                    cache.UpdateTLV(AttributePath(EndpointId=endpoint, ClusterId=cluster, AttributeId=attribute),
+                                    versions.get(endpoint, {}).get(cluster), value)
+        return cache
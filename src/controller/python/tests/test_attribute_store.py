@@ -0,0 +1,155 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import asyncio
+import os
+import tempfile
+import unittest
+
+import matter.clusters as Clusters
+from matter.ChipDeviceCtrl import ChipDeviceControllerBase
+from matter.clusters.Attribute import AsyncReadTransaction, AttributeCache, AttributePath, DataVersion, _EnsureIndexesBuilt
+from matter.storage.attribute_store import AttributeStore
+from matter.tlv import float32, uint
+
+FABRIC = 0x1122334455667788
+NODE_ID = 0x12344321
+
+DESCRIPTOR = Clusters.Descriptor.id
+ON_OFF = Clusters.OnOff.id
+LEVEL = Clusters.LevelControl.id
+
+
+class FakeNode:
+    ''' Attributes of a node by endpoint and cluster, with the DataVersion of each cluster. '''
+
+    def __init__(self):
+        self.clusters = {
+            (0, DESCRIPTOR): [1, {1: [uint(DESCRIPTOR)], 3: [uint(1)]}],
+            (1, DESCRIPTOR): [1, {1: [uint(DESCRIPTOR), uint(ON_OFF), uint(LEVEL)]}],
+            (1, ON_OFF): [10, {0: False, 0x4001: uint(0), 0xFFFD: uint(6)}],
+            (1, LEVEL): [20, {0: uint(254), 0x4000: None, 0x10: uint(5), 0xF000: float32(1.5)}],
+        }
+
+    def read(self, paths, filters):
+        versions = {(f.EndpointId, f.ClusterId): f.DataVersion for f in filters}
+        cache = AttributeCache()
+        for (endpoint, cluster), (dataVersion, attributes) in self.clusters.items():
+            if versions.get((endpoint, cluster)) == dataVersion:
+                continue
+            for attribute, value in attributes.items():
+                path = AttributePath(EndpointId=endpoint, ClusterId=cluster, AttributeId=attribute)
+                if any(p.EndpointId in (None, endpoint) and p.ClusterId in (None, cluster) and
+                       p.AttributeId in (None, attribute) for p in paths):
+                    cache.UpdateTLV(path, dataVersion, value)
+        return AsyncReadTransaction.ReadResponse(attributes=cache.GetUpdatedAttributeCache(), events=[],
+                                                 tlvAttributes=cache.attributeTLVCache, dataVersions=cache.versionList)
+
+
+class FakeController(ChipDeviceControllerBase):
+    def __init__(self, node):
+        self._isActive = True
+        self.devCtrl = None
+        self._attributeStore = None
+        self.node = node
+        self.reported = []
+
+    def GetCompressedFabricId(self):
+        return FABRIC
+
+    async def Read(self, nodeId, attributes=None, dataVersionFilters=None, **kwargs):
+        res = self.node.read(attributes, dataVersionFilters or [])
+        self.reported.append(sorted((e, c) for e, clusters in res.tlvAttributes.items() for c in clusters))
+        return res
+
+    def Shutdown(self):
+        self._isActive = False
+
+
+class TestAttributeStore(unittest.TestCase):
+    def test_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'attributes.sqlite')
+            node = FakeNode()
+            with AttributeStore(path) as store:
+                res = node.read([AttributePath()], [])
+                merged, removed = AttributeStore.Merge({}, res.tlvAttributes, res.dataVersions, [AttributePath()])
+                store.UpdateNodeClusters(FABRIC, NODE_ID, merged, removed)
+
+            # A new store on the same file gets the same values, with the same TLV types
+            with AttributeStore(path) as store:
+                stored = store.GetNodeClusters(FABRIC, NODE_ID)
+                self.assertEqual(stored, merged)
+                self.assertIsInstance(stored[(1, LEVEL)].attributes[0xF000], float32)
+                self.assertIsInstance(stored[(1, ON_OFF)].attributes[0xFFFD], uint)
+                self.assertEqual(store.GetNodeClusters(FABRIC, NODE_ID + 1), {})
+
+                store.RemoveNode(FABRIC, NODE_ID)
+                self.assertEqual(store.GetNodeClusters(FABRIC, NODE_ID), {})
+
+    def test_filters_only_cover_stored_attributes(self):
+        node = FakeNode()
+        onOffPath = AttributePath(EndpointId=1, ClusterId=ON_OFF, AttributeId=0)
+        res = node.read([onOffPath], [])
+        stored, _ = AttributeStore.Merge({}, res.tlvAttributes, res.dataVersions, [onOffPath])
+        self.assertFalse(stored[(1, ON_OFF)].complete)
+
+        self.assertEqual(len(AttributeStore.GetDataVersionFilters(stored, [onOffPath])), 1)
+        # Other attributes of the cluster were not read, so the cluster must not be filtered out
+        self.assertEqual(AttributeStore.GetDataVersionFilters(stored, [AttributePath(EndpointId=1, ClusterId=ON_OFF)]), [])
+        self.assertEqual(AttributeStore.GetDataVersionFilters(stored, [AttributePath(EndpointId=1, ClusterId=LEVEL)]), [])
+
+
+class TestIncrementalRead(unittest.TestCase):
+    def setUp(self):
+        # The cluster indexes are normally built when the CHIP stack is initialized
+        _EnsureIndexesBuilt()
+
+    def test_only_changed_clusters_are_reported(self):
+        node = FakeNode()
+        ctrl = FakeController(node)
+
+        async def read(attributes=None):
+            return await ctrl.IncrementalRead(NODE_ID, attributes)
+
+        first = asyncio.run(read())
+        self.assertEqual(len(ctrl.reported[0]), 4)
+
+        node.clusters[(1, ON_OFF)] = [11, {0: True, 0x4001: uint(0), 0xFFFD: uint(6)}]
+        second = asyncio.run(read())
+        self.assertEqual(ctrl.reported[1], [(1, ON_OFF)])
+        self.assertIs(second[1][Clusters.OnOff][Clusters.OnOff.Attributes.OnOff], True)
+        self.assertEqual(second[1][Clusters.OnOff][DataVersion], 11)
+        self.assertEqual(second[1][Clusters.LevelControl], first[1][Clusters.LevelControl])
+
+        # Concrete paths are served from the clusters stored by the wildcard reads
+        third = asyncio.run(read([(1, Clusters.LevelControl.Attributes.CurrentLevel)]))
+        self.assertEqual(ctrl.reported[2], [])
+        self.assertEqual(third[1][Clusters.LevelControl][Clusters.LevelControl.Attributes.CurrentLevel], 254)
+        self.assertNotIn(Clusters.LevelControl.Attributes.OnLevel, third[1][Clusters.LevelControl])
+
+        # Clusters that are not in the server list anymore are dropped
+        node.clusters[(1, DESCRIPTOR)] = [2, {1: [uint(DESCRIPTOR), uint(ON_OFF)]}]
+        del node.clusters[(1, LEVEL)]
+        fourth = asyncio.run(read())
+        self.assertEqual(ctrl.reported[3], [(1, DESCRIPTOR)])
+        self.assertNotIn(Clusters.LevelControl, fourth[1])
+        self.assertNotIn((1, LEVEL), ctrl._attributeStore.GetNodeClusters(FABRIC, NODE_ID))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import asyncio
+import unittest
+
+from matter.ChipDeviceCtrl import ChipDeviceControllerBase
+from matter.clusters.Attribute import SubscriptionTransaction
+from matter.exceptions import ChipStackError
+
+
+class FakeSubscription(SubscriptionTransaction):
+    def __init__(self):
+        self.shutdown = False
+
+    def Shutdown(self):
+        self.shutdown = True
+
+
+class FakeController(ChipDeviceControllerBase):
+    ''' Controller whose Read() completes after a per-node delay, without a CHIP stack. '''
+
+    def __init__(self, delays):
+        self._isActive = True
+        self.devCtrl = None
+        self.delays = delays
+        self.inFlight = 0
+        self.maxInFlight = 0
+        self.reads = []
+        self.subscriptions = []
+
+    async def Read(self, nodeId, attributes=None, events=None, reportInterval=None, **kwargs):
+        self.reads.append((nodeId, kwargs))
+        self.inFlight += 1
+        self.maxInFlight = max(self.maxInFlight, self.inFlight)
+        try:
+            await asyncio.sleep(self.delays[nodeId])
+        finally:
+            self.inFlight -= 1
+        if nodeId == 3:
+            raise ChipStackError(0x32)
+        if reportInterval is not None:
+            subscription = FakeSubscription()
+            self.subscriptions.append(subscription)
+            return subscription
+        return f"response of {nodeId}"
+
+    def Shutdown(self):
+        self._isActive = False
+
+
+class TestReadMany(unittest.TestCase):
+    def test_results_and_errors(self):
+        ctrl = FakeController({1: 0.03, 2: 0.01, 3: 0.0, 4: 0.5})
+
+        async def readAll():
+            return await ctrl.ReadMany([1, 2, 3, 4, 2], attributes=[(0, None)], concurrency=2, perNodeTimeoutSec=0.2,
+                                       fabricFiltered=False)
+        results = asyncio.run(readAll())
+
+        self.assertEqual(sorted(results), [1, 2, 3, 4])
+        self.assertEqual(results[1].result, "response of 1")
+        self.assertTrue(results[2].ok)
+        self.assertIsInstance(results[3].error, ChipStackError)
+        self.assertIsInstance(results[4].error, TimeoutError)
+        self.assertGreaterEqual(results[4].latencySec, 0.2)
+        self.assertLessEqual(ctrl.maxInFlight, 2)
+        # Duplicate node IDs are only read once, and extra arguments are passed to Read()
+        self.assertEqual([nodeId for nodeId, _ in ctrl.reads], [1, 2, 3, 4])
+        self.assertFalse(ctrl.reads[0][1]['fabricFiltered'])
+
+    def test_timed_out_read_keeps_its_slot(self):
+        ctrl = FakeController({1: 0.2, 2: 0.0, 4: 0.0})
+
+        async def readAll():
+            return await ctrl.ReadMany([1, 2, 4], attributes=[(0, None)], concurrency=1, perNodeTimeoutSec=0.05)
+        results = asyncio.run(readAll())
+
+        self.assertIsInstance(results[1].error, TimeoutError)
+        self.assertTrue(results[2].ok)
+        self.assertTrue(results[4].ok)
+        # Node 2 is only read once the read of node 1 is over, even though node 1 timed out before
+        self.assertEqual(ctrl.maxInFlight, 1)
+
+    def test_results_are_streamed(self):
+        ctrl = FakeController({1: 0.05, 2: 0.0, 3: 0.02})
+
+        async def readAll():
+            return [r.nodeId async for r in ctrl.ReadManyAsCompleted([1, 2, 3], attributes=[(0, None)])]
+        self.assertEqual(asyncio.run(readAll()), [2, 3, 1])
+
+    def test_late_subscription_is_shut_down(self):
+        ctrl = FakeController({1: 0.0, 2: 0.1})
+
+        async def subscribeAll():
+            results = await ctrl.SubscribeMany([1, 2], attributes=[(0, None)], perNodeTimeoutSec=0.05)
+            # Let the subscription of node 2 complete after its deadline
+            await asyncio.sleep(0.1)
+            return results
+        results = asyncio.run(subscribeAll())
+
+        self.assertIsInstance(results[1].result, FakeSubscription)
+        self.assertFalse(results[1].result.shutdown)
+        self.assertIsInstance(results[2].error, TimeoutError)
+        self.assertEqual(len(ctrl.subscriptions), 2)
+        self.assertTrue(ctrl.subscriptions[1].shutdown)
+        self.assertTrue(ctrl.reads[0][1]['keepSubscriptions'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import asyncio
+import unittest
+import matter.clusters as Clusters
+from matter.clusters.Attribute import (AttributeCache, AttributePath, MinimalPathSet, SubscriptionMultiplexer, TypedAttributePath,
+                                       _EnsureIndexesBuilt)
+
+ON_OFF = AttributePath.from_attribute(1, Clusters.OnOff.Attributes.OnOff)
+ON_TIME = AttributePath.from_attribute(1, Clusters.OnOff.Attributes.OnTime)
+LEVEL = AttributePath.from_attribute(1, Clusters.LevelControl.Attributes.CurrentLevel)
+
+
+class FakeSubscription:
+    def __init__(self, paths, values):
+        self.paths = paths
+        self.callback = None
+        self.shutdown = False
+        self.cache = AttributeCache()
+        for path, value in values.items():
+            if any(p.EndpointId in (None, path.EndpointId) and p.ClusterId in (None, path.ClusterId) and
+                   p.AttributeId in (None, path.AttributeId) for p in paths):
+                self.cache.UpdateTLV(path, 1, value)
+
+    def GetAttributeTLVCache(self):
+        return self.cache.attributeTLVCache
+
+    def SetAttributeUpdateCallback(self, callback):
+        self.callback = callback
+
+    def Shutdown(self):
+        self.shutdown = True
+
+    def Report(self, path, value):
+        self.cache.UpdateTLV(path, 2, value)
+        self.callback(TypedAttributePath(Path=path), self)
+
+
+class FakeController:
+    def __init__(self):
+        self.values = {ON_OFF: False, ON_TIME: 0, LEVEL: 10}
+        self.subscriptions = []
+
+    async def ReadAttribute(self, nodeId, attributes, reportInterval, fabricFiltered, keepSubscriptions):
+        subscription = FakeSubscription(attributes, self.values)
+        self.subscriptions.append(subscription)
+        return subscription
+
+
+class TestSubscriptionMultiplexer(unittest.TestCase):
+    def setUp(self):
+        # The cluster indexes are normally built when the CHIP stack is initialized
+        _EnsureIndexesBuilt()
+
+    def test_minimal_path_set(self):
+        cluster = AttributePath(EndpointId=1, ClusterId=Clusters.OnOff.id)
+        self.assertEqual(MinimalPathSet([ON_OFF, cluster, ON_TIME, LEVEL, ON_OFF]), [cluster, LEVEL])
+        self.assertEqual(MinimalPathSet([LEVEL, AttributePath()]), [AttributePath()])
+
+    def test_listeners_share_subscriptions(self):
+        ctrl = FakeController()
+        multiplexer = SubscriptionMultiplexer(ctrl, 1)
+        received = {'a': [], 'b': []}
+
+        async def run():
+            a = await multiplexer.AddListener([AttributePath.from_cluster(1, Clusters.OnOff)], lambda p, t: received['a'].append((p.Path, t)))
+            self.assertEqual(len(ctrl.subscriptions), 1)
+            self.assertEqual(sorted(p.AttributeId for p, _ in received['a']), [ON_OFF.AttributeId, ON_TIME.AttributeId])
+
+            # Paths that are already subscribed to do not need another subscription
+            b = await multiplexer.AddListener([ON_OFF], lambda p, t: received['b'].append((p.Path, t)))
+            self.assertEqual(len(ctrl.subscriptions), 1)
+            self.assertEqual([p for p, _ in received['b']], [ON_OFF])
+
+            received['a'].clear()
+            received['b'].clear()
+            ctrl.subscriptions[0].Report(ON_OFF, True)
+            self.assertEqual([p for p, _ in received['a']], [ON_OFF])
+            self.assertEqual([p for p, _ in received['b']], [ON_OFF])
+
+            # New paths re-plan the subscriptions, and listeners get the values that changed during the swap
+            received['a'].clear()
+            ctrl.values[ON_OFF] = True
+            ctrl.values[ON_TIME] = 5
+            c = await multiplexer.AddListener([LEVEL], lambda p, t: None)
+            self.assertEqual(len(ctrl.subscriptions), 2)
+            self.assertTrue(ctrl.subscriptions[0].shutdown)
+            self.assertEqual(multiplexer.subscriptions, [ctrl.subscriptions[1]])
+            self.assertEqual([p for p, _ in received['a']], [ON_TIME])
+
+            # Reports of the replaced subscription that are delivered late are not notified a second time
+            received['a'].clear()
+            ctrl.subscriptions[0].Report(ON_TIME, 5)
+            self.assertEqual(received['a'], [])
+            ctrl.subscriptions[1].Report(ON_TIME, 6)
+            self.assertEqual([p for p, _ in received['a']], [ON_TIME])
+
+            # Removing a listener whose paths are covered by others does not change the subscriptions
+            await multiplexer.RemoveListener(b)
+            self.assertEqual(len(ctrl.subscriptions), 2)
+
+            await multiplexer.RemoveListener(c)
+            self.assertEqual(len(ctrl.subscriptions), 3)
+            self.assertEqual(ctrl.subscriptions[2].paths, [AttributePath(EndpointId=1, ClusterId=Clusters.OnOff.id)])
+            self.assertTrue(ctrl.subscriptions[1].shutdown)
+
+            await multiplexer.RemoveListener(a)
+            self.assertTrue(ctrl.subscriptions[2].shutdown)
+            self.assertEqual(multiplexer.subscriptions, [])
+
+        asyncio.run(run())
+
+    def test_max_paths_per_subscription(self):
+        ctrl = FakeController()
+        multiplexer = SubscriptionMultiplexer(ctrl, 1, maxPathsPerSubscription=1)
+
+        async def run():
+            await multiplexer.AddListener([ON_OFF], lambda p, t: None)
+            await multiplexer.AddListener([LEVEL], lambda p, t: None)
+            self.assertEqual(len(multiplexer.subscriptions), 2)
+            self.assertFalse(any(s.shutdown for s in ctrl.subscriptions))
+            await multiplexer.Shutdown()
+            self.assertTrue(all(s.shutdown for s in ctrl.subscriptions))
+
+        asyncio.run(run())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import math
+import unittest
+
+import matter.clusters as Clusters
+from matter.clusters.Attribute import ValueDecodeFailure
+from matter.MatterTlvJson import convert_dump_to_cache_without_stack
+from matter.tlv import TLVReader, TLVWriter, float32
+from matter.tlv import uint as tlvUint
+
+
+class TestJsonToTlvWithoutStack(unittest.TestCase):
+    def _convert(self, attribute_json):
+        cache = convert_dump_to_cache_without_stack({"1": {"6:STRUCT": attribute_json}})
+        return cache.attributeTLVCache[1][6]
+
+    def _readBack(self, value):
+        writer = TLVWriter()
+        writer.put(None, {0: value})
+        return TLVReader(writer.encoding).get()["Any"][0]
+
+    def test_primitives(self):
+        converted = self._convert({
+            "0:UINT": 7,
+            "1:UINT": "18446744073709551615",
+            "2:INT": -3,
+            "3:INT": "-40000000000",
+            "4:BOOL": True,
+            "5:FLOAT": "-Infinity",
+            "6:DOUBLE": 1.5,
+            "7:BYTES": "VGVzdCBCeXRlcw==",
+            "8:STRING": "example",
+            "9:NULL": None,
+        })
+        self.assertEqual(converted[0], 7)
+        self.assertIsInstance(converted[0], tlvUint)
+        self.assertEqual(converted[1], 0xFFFFFFFFFFFFFFFF)
+        self.assertEqual(converted[2], -3)
+        self.assertEqual(converted[3], -40000000000)
+        self.assertIs(converted[4], True)
+        self.assertIsInstance(converted[5], float32)
+        self.assertTrue(math.isinf(converted[5]) and converted[5] < 0)
+        self.assertEqual(converted[6], 1.5)
+        self.assertEqual(converted[7], b"Test Bytes")
+        self.assertEqual(converted[8], "example")
+        self.assertIsNone(converted[9])
+
+    def test_matches_tlv_reader(self):
+        converted = self._convert({
+            "0:ARRAY-STRUCT": [{"0:UINT": 8, "label:1:STRING": "a", "300:BOOL": False, "4293984426:UINT": 3}],
+            "1:ARRAY-?": [],
+        })
+        value = [{0: tlvUint(8), 1: "a", (None, 300): False, (0xFFF10000, 0xAA): tlvUint(3)}]
+        self.assertEqual(converted[0], value)
+        self.assertEqual(converted[0], self._readBack(value))
+        self.assertEqual(converted[1], [])
+
+    def test_invalid_values(self):
+        converted = self._convert({
+            "0:UINT": -1,
+            "1:ARRAY-?": [1],
+            "2:BYTES": "not base64!",
+            "3:ERROR": "Bad Value",
+        })
+        for attribute_id in range(4):
+            self.assertIsInstance(converted[attribute_id], ValueDecodeFailure)
+
+    def test_attribute_cache(self):
+        cache = convert_dump_to_cache_without_stack({"1": {"6:STRUCT": {"0:BOOL": True, "65533:UINT": 6}}})
+        on_off = cache.GetUpdatedAttributeCache()[1][Clusters.OnOff]
+        self.assertIs(on_off[Clusters.OnOff.Attributes.OnOff], True)
+        self.assertEqual(on_off[Clusters.OnOff.Attributes.ClusterRevision], 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -24,6 +24,7 @@
 #include <algorithm>
 #include <fstream>
 #include <json/json.h>
+#include <sstream>
 
 using namespace chip::Crypto;
 
@@ -41,18 +42,26 @@ CHIP_ERROR BytesToHexStr(const ByteSpan & bytes, std::string & outHexStr)
     return BytesToHex(bytes.data(), bytes.size(), &outHexStr[0], hexLength, flags);
 }
 
+std::string RevocationSetIndexKey(const std::string & issuerNameBase64Str, const std::string & akidHexStr)
+{
+    // Base64 and hex strings never contain a space
+    return issuerNameBase64Str + " " + akidHexStr;
+}
+
 } // anonymous namespace
 
 CHIP_ERROR TestDACRevocationDelegateImpl::SetDeviceAttestationRevocationSetPath(std::string_view path)
 {
     VerifyOrReturnError(path.empty() != true, CHIP_ERROR_INVALID_ARGUMENT);
     mDeviceAttestationRevocationSetPath = path;
+    mIndexedSource                      = RevocationSetSource::kNone;
     return CHIP_NO_ERROR;
 }
 
 CHIP_ERROR TestDACRevocationDelegateImpl::SetDeviceAttestationRevocationData(const std::string & jsonData)
 {
     mRevocationData = jsonData;
+    mIndexedSource  = RevocationSetSource::kNone;
     return CHIP_NO_ERROR;
 }
 
@@ -60,11 +69,13 @@ void TestDACRevocationDelegateImpl::ClearDeviceAttestationRevocationSetPath()
 {
     // clear the string_view
     mDeviceAttestationRevocationSetPath = mDeviceAttestationRevocationSetPath.substr(0, 0);
+    mIndexedSource                      = RevocationSetSource::kNone;
 }
 
 void TestDACRevocationDelegateImpl::ClearDeviceAttestationRevocationData()
 {
     mRevocationData.clear();
+    mIndexedSource = RevocationSetSource::kNone;
 }
 
 // Check if issuer and AKID matches with the crl signer OR crl signer delegator's subject and SKID
@@ -123,25 +134,32 @@ bool TestDACRevocationDelegateImpl::CrossValidateCert(const Json::Value & revoke
 //   }
 // ]
 //
-bool TestDACRevocationDelegateImpl::IsEntryInRevocationSet(const std::string & akidHexStr, const std::string & issuerNameBase64Str,
-                                                           const std::string & serialNumberHexStr)
+bool TestDACRevocationDelegateImpl::UpdateRevocationSetIndex()
 {
     Json::Value jsonData;
+    std::string errs;
 
     // Try direct data first, then fall back to file
     if (!mRevocationData.empty())
     {
-        std::string errs;
-        std::istringstream jsonStream(!mRevocationData.empty() ? mRevocationData : "[]");
+        VerifyOrReturnValue(mIndexedSource != RevocationSetSource::kData, true);
+
+        std::istringstream jsonStream(mRevocationData);
         if (!Json::parseFromStream(Json::CharReaderBuilder(), jsonStream, &jsonData, &errs))
         {
             ChipLogError(NotSpecified, "Failed to parse JSON data: %s", errs.c_str());
             return false;
         }
+        return BuildRevocationSetIndex(jsonData, RevocationSetSource::kData);
     }
-    else if (!mDeviceAttestationRevocationSetPath.empty())
+
+    if (!mDeviceAttestationRevocationSetPath.empty())
     {
-        std::string errs;
+        // The file is only parsed again when it is modified, e.g. when the revocation set is regenerated
+        std::error_code ec;
+        std::filesystem::file_time_type fileTime = std::filesystem::last_write_time(mDeviceAttestationRevocationSetPath, ec);
+        VerifyOrReturnValue(ec || mIndexedSource != RevocationSetSource::kFile || fileTime != mIndexedFileTime, true);
+
         std::ifstream file(mDeviceAttestationRevocationSetPath.c_str());
         if (!file.is_open())
         {
@@ -157,42 +175,73 @@ bool TestDACRevocationDelegateImpl::IsEntryInRevocationSet(const std::string & a
             ChipLogError(NotSpecified, "Failed to parse JSON from file: %s", errs.c_str());
             return false;
         }
+
+        VerifyOrReturnValue(BuildRevocationSetIndex(jsonData, RevocationSetSource::kFile), false);
+        if (ec)
+        {
+            // Without a modification time, the file is parsed again on the next check
+            mIndexedSource = RevocationSetSource::kNone;
+        }
+        mIndexedFileTime = fileTime;
+        return true;
     }
-    else
-    {
-        ChipLogProgress(NotSpecified, "No revocation data available");
-        // No revocation data available
-        return false;
-    }
+
+    ChipLogProgress(NotSpecified, "No revocation data available");
+    // No revocation data available
+    return false;
+}
+
+bool TestDACRevocationDelegateImpl::BuildRevocationSetIndex(const Json::Value & jsonData, RevocationSetSource source)
+{
+    mRevocationSetIndex.clear();
+    mIndexedSource = RevocationSetSource::kNone;
 
     VerifyOrReturnValue(jsonData.isArray(), false, ChipLogError(NotSpecified, "Revocation set is not a valid JSON Array"));
 
-    // 6.2.4.2. Determining Revocation Status of an Entity
     for (const auto & revokedSet : jsonData)
     {
-        VerifyOrReturnValue(revokedSet.isObject(), false,
-                            ChipLogError(NotSpecified, "Revocation set entry is not a valid JSON object"));
-
-        if (revokedSet["issuer_name"].asString() != issuerNameBase64Str)
+        if (!revokedSet.isObject())
         {
-            continue;
+            ChipLogError(NotSpecified, "Revocation set entry is not a valid JSON object");
+            mRevocationSetIndex.clear();
+            return false;
         }
-        if (revokedSet["issuer_subject_key_id"].asString() != akidHexStr)
+
+        RevocationSetEntry entry;
+        entry.revokedSet = revokedSet;
+        for (const auto & revokedSerialNumber : revokedSet["revoked_serial_numbers"])
         {
-            continue;
+            entry.revokedSerialNumbers.insert(revokedSerialNumber.asString());
         }
 
+        std::string key =
+            RevocationSetIndexKey(revokedSet["issuer_name"].asString(), revokedSet["issuer_subject_key_id"].asString());
+        mRevocationSetIndex[key].push_back(std::move(entry));
+    }
+
+    mIndexedSource = source;
+    return true;
+}
+
+bool TestDACRevocationDelegateImpl::IsEntryInRevocationSet(const std::string & akidHexStr, const std::string & issuerNameBase64Str,
+                                                           const std::string & serialNumberHexStr)
+{
+    VerifyOrReturnValue(UpdateRevocationSetIndex(), false);
+
+    // 6.2.4.2. Determining Revocation Status of an Entity
+    auto entries = mRevocationSetIndex.find(RevocationSetIndexKey(issuerNameBase64Str, akidHexStr));
+    VerifyOrReturnValue(entries != mRevocationSetIndex.end(), false);
+
+    for (const auto & entry : entries->second)
+    {
         // 4.a cross validate PAI with crl signer OR crl signer delegator
         // 4.b cross validate DAC with crl signer OR crl signer delegator
-        VerifyOrReturnValue(CrossValidateCert(revokedSet, akidHexStr, issuerNameBase64Str), false);
+        VerifyOrReturnValue(CrossValidateCert(entry.revokedSet, akidHexStr, issuerNameBase64Str), false);
 
         // 4.c check if serial number is revoked
-        for (const auto & revokedSerialNumber : revokedSet["revoked_serial_numbers"])
+        if (entry.revokedSerialNumbers.count(serialNumberHexStr) != 0)
         {
-            if (revokedSerialNumber.asString() == serialNumberHexStr)
-            {
-                return true;
-            }
+            return true;
         }
     }
     return false;
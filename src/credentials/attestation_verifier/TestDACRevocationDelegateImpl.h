@@ -21,7 +21,11 @@
 #include <json/json.h>
 #include <lib/support/Span.h>
 
+#include <filesystem>
 #include <string>
+#include <unordered_map>
+#include <unordered_set>
+#include <vector>
 
 namespace chip {
 namespace Credentials {
@@ -69,6 +73,19 @@ private:
         kSubject = 1,
     };
 
+    enum class RevocationSetSource : uint8_t
+    {
+        kNone = 0,
+        kData = 1,
+        kFile = 2,
+    };
+
+    struct RevocationSetEntry
+    {
+        Json::Value revokedSet;
+        std::unordered_set<std::string> revokedSerialNumbers;
+    };
+
     bool CrossValidateCert(const Json::Value & revokedSet, const std::string & akIdHexStr, const std::string & issuerNameBase64Str);
 
     CHIP_ERROR GetKeyIDHexStr(const ByteSpan & certDer, std::string & outKeyIDHexStr, KeyIdType keyIdType);
@@ -84,10 +101,21 @@ private:
     bool IsEntryInRevocationSet(const std::string & akidHexStr, const std::string & issuerNameBase64Str,
                                 const std::string & serialNumberHexStr);
 
+    // Parse the revocation data, or the revocation set file if it was modified since it was last indexed, into
+    // mRevocationSetIndex. Returns false if there is no revocation data or it is not a valid revocation set.
+    bool UpdateRevocationSetIndex();
+    bool BuildRevocationSetIndex(const Json::Value & jsonData, RevocationSetSource source);
+
     bool IsCertificateRevoked(const ByteSpan & certDer);
 
     std::string mDeviceAttestationRevocationSetPath;
     std::string mRevocationData; // Stores direct JSON data
+
+    // Entries of the revocation set keyed by issuer name and AKID, each with its revoked serial numbers,
+    // so that checking a certificate does not parse the whole revocation set again.
+    std::unordered_map<std::string, std::vector<RevocationSetEntry>> mRevocationSetIndex;
+    RevocationSetSource mIndexedSource = RevocationSetSource::kNone;
+    std::filesystem::file_time_type mIndexedFileTime;
 };
 
 } // namespace Credentials
@@ -188,102 +188,26 @@
 
 import logging
 from dataclasses import dataclass
-from typing import Any, Callable
 
 from test_testing.DeviceConformanceTests import get_supersets
 
 import matter.clusters as Clusters
-import matter.clusters.ClusterObjects
-import matter.tlv
 from matter import ChipUtility
-from matter.clusters.Attribute import ValueDecodeFailure
 from matter.clusters.ClusterObjects import ClusterAttributeDescriptor, ClusterObjectFieldDescriptor
 from matter.clusters.Types import Nullable
 from matter.exceptions import ChipStackError
 from matter.interaction_model import InteractionModelError, Status
 from matter.testing.basic_composition import BasicCompositionTests
-from matter.testing.global_attribute_ids import (AttributeIdType, ClusterIdType, CommandIdType, GlobalAttributeIds,
-                                                 attribute_id_type, cluster_id_type, command_id_type)
+from matter.testing.composition_checks import (IDM_10_1_CHECKS, UnreportedListedAttribute, idm_10_1_endpoint_problems, merge_problems,
+                                               ps_3_1_endpoint_problems, run_per_endpoint, sm_1_2_endpoint_problems)
 from matter.testing.matter_testing import MatterBaseTest, TestStep, async_test_body, default_matter_test_main
-from matter.testing.problem_notices import AttributePathLocation, ClusterPathLocation, CommandPathLocation, UnknownProblemLocation
+from matter.testing.problem_notices import AttributePathLocation, ProblemSeverity, UnknownProblemLocation
 from matter.testing.taglist_and_topology_test import (create_device_type_list_for_root, create_device_type_lists,
                                                       find_tag_list_problems, find_tree_roots, flat_list_ok,
                                                       get_direct_children_of_root, parts_list_problems, separate_endpoint_types)
 from matter.tlv import uint
 
 
-def get_vendor_id(mei: int) -> int:
-    """Get the vendor ID portion (MEI prefix) of an overall MEI."""
-    return (mei >> 16) & 0xffff
-
-
-def check_int_in_range(min_value: int, max_value: int, allow_null: bool = False) -> Callable:
-    """Returns a checker for whether `obj` is an int that fits in a range."""
-    def int_in_range_checker(obj: Any):
-        """Inner checker logic for check_int_in_range
-
-        Checker validates that `obj` must have decoded as an integral value in range [min_value, max_value].
-
-        On failure, a ValueError is raised with a diagnostic message.
-        """
-        if obj is None and allow_null:
-            return
-
-        if not isinstance(obj, int) and not isinstance(obj, matter.tlv.uint):
-            raise ValueError(f"Value {str(obj)} is not an integer or uint (decoded type: {type(obj)})")
-        int_val = int(obj)
-        if (int_val < min_value) or (int_val > max_value):
-            raise ValueError(
-                f"Value {int_val} (0x{int_val:X}) not in range [{min_value}, {max_value}] ([0x{min_value:X}, 0x{max_value:X}])")
-
-    return int_in_range_checker
-
-
-def check_list_of_ints_in_range(min_value: int, max_value: int, min_size: int = 0, max_size: int = 65535, allow_null: bool = False) -> Callable:
-    """Returns a checker for whether `obj` is a list of ints that fit in a range."""
-    def list_of_ints_in_range_checker(obj: Any):
-        """Inner checker for check_list_of_ints_in_range.
-
-        Checker validates that `obj` must have decoded as a list of integral values in range [min_value, max_value].
-        The length of the list must be between [min_size, max_size].
-
-        On failure, a ValueError is raised with a diagnostic message.
-        """
-        if obj is None and allow_null:
-            return
-
-        if not isinstance(obj, list):
-            raise ValueError(f"Value {str(obj)} is not a list, but a list was expected (decoded type: {type(obj)})")
-
-        if len(obj) < min_size or len(obj) > max_size:
-            raise ValueError(
-                f"Value {str(obj)} is a list of size {len(obj)}, but expected a list with size in range [{min_size}, {max_size}]")
-
-        for val_idx, val in enumerate(obj):
-            if not isinstance(val, int) and not isinstance(val, matter.tlv.uint):
-                raise ValueError(
-                    f"At index {val_idx} in {str(obj)}, value {val} is not an int/uint, but an int/uint was expected (decoded type: {type(val)})")
-
-            int_val = int(val)
-            if not ((int_val >= min_value) and (int_val <= max_value)):
-                raise ValueError(
-                    f"At index {val_idx} in {str(obj)}, value {int_val} (0x{int_val:X}) not in range [{min_value}, {max_value}] ([0x{min_value:X}, 0x{max_value:X}])")
-
-    return list_of_ints_in_range_checker
-
-
-def check_non_empty_list_of_ints_in_range(min_value: int, max_value: int, max_size: int = 65535, allow_null: bool = False) -> Callable:
-    """Returns a checker for whether `obj` is a non-empty list of ints that fit in a range."""
-    return check_list_of_ints_in_range(min_value, max_value, min_size=1, max_size=max_size, allow_null=allow_null)
-
-
-def check_no_duplicates(obj: Any) -> None:
-    if not isinstance(obj, list):
-        raise ValueError(f"Value {str(obj)} is not a list, but a list was expected (decoded type: {type(obj)})")
-    if len(set(obj)) != len(obj):
-        raise ValueError(f"Value {str(obj)} contains duplicate values")
-
-
 class TC_DeviceBasicComposition(MatterBaseTest, BasicCompositionTests):
     @async_test_body
     async def setup_class(self):
@@ -390,309 +314,54 @@ class TC_DeviceBasicComposition(MatterBaseTest, BasicCompositionTests):
     async def test_TC_IDM_10_1(self):
         self.print_step(1, "Perform a wildcard read of attributes on all endpoints - already done")
 
-        @dataclass
-        class RequiredMandatoryAttribute:
-            id: int
-            name: str
-            validators: list[Callable]
-
-        ATTRIBUTES_TO_CHECK = [
-            RequiredMandatoryAttribute(id=GlobalAttributeIds.CLUSTER_REVISION_ID, name="ClusterRevision",
-                                       validators=[check_int_in_range(1, 0xFFFF)]),
-            RequiredMandatoryAttribute(id=GlobalAttributeIds.FEATURE_MAP_ID, name="FeatureMap",
-                                       validators=[check_int_in_range(0, 0xFFFF_FFFF)]),
-            RequiredMandatoryAttribute(id=GlobalAttributeIds.ATTRIBUTE_LIST_ID, name="AttributeList",
-                                       validators=[check_non_empty_list_of_ints_in_range(0, 0xFFFF_FFFF), check_no_duplicates]),
-            # TODO: Check for EventList
-            # RequiredMandatoryAttribute(id=0xFFFA, name="EventList", validator=check_list_of_ints_in_range(0, 0xFFFF_FFFF)),
-            RequiredMandatoryAttribute(id=GlobalAttributeIds.ACCEPTED_COMMAND_LIST_ID, name="AcceptedCommandList",
-                                       validators=[check_list_of_ints_in_range(0, 0xFFFF_FFFF), check_no_duplicates]),
-            RequiredMandatoryAttribute(id=GlobalAttributeIds.GENERATED_COMMAND_LIST_ID, name="GeneratedCommandList",
-                                       validators=[check_list_of_ints_in_range(0, 0xFFFF_FFFF), check_no_duplicates]),
-        ]
-
-        self.print_step(2, "Validate all global attributes are present")
-        success = True
-        for endpoint_id, endpoint in self.endpoints_tlv.items():
-            for cluster_id, cluster in endpoint.items():
-                for req_attribute in ATTRIBUTES_TO_CHECK:
-                    attribute_string = self.cluster_mapper.get_attribute_string(cluster_id, req_attribute.id)
-
-                    has_attribute = (req_attribute.id in cluster)
-                    location = AttributePathLocation(endpoint_id, cluster_id, req_attribute.id)
-                    logging.debug(
-                        f"Checking for mandatory global {attribute_string} on {location.as_cluster_string(self.cluster_mapper)}: {'found' if has_attribute else 'not_found'}")
-
-                    # Check attribute is actually present
-                    if not has_attribute:
-                        self.record_error(self.get_test_name(), location=location,
-                                          problem=f"Did not find mandatory global {attribute_string} on {location.as_cluster_string(self.cluster_mapper)}", spec_location="Global Elements")
-                        success = False
-                        continue
-
-        self.print_step(3, "Validate the global attributes are in range and do not contain duplicates")
-        for endpoint_id, endpoint in self.endpoints_tlv.items():
-            for cluster_id, cluster in endpoint.items():
-                for req_attribute in ATTRIBUTES_TO_CHECK:
-                    # Validate attribute value based on the provided validators.
-                    for validator in req_attribute.validators:
-                        try:
-                            validator(cluster[req_attribute.id])
-                        except ValueError as e:
-                            location = AttributePathLocation(endpoint_id, cluster_id, req_attribute.id)
-                            self.record_error(self.get_test_name(), location=location,
-                                              problem=f"Failed validation of value on {location.as_string(self.cluster_mapper)}: {str(e)}", spec_location="Global Elements")
-                            success = False
-                            continue
-                        except KeyError:
-                            # A KeyError here means the attribute does not exist. This problem was already recorded in step 2,
-                            # but we don't assert until the end of the test, so ignore this and don't re-record the error.
-                            continue
-
-        self.print_step(4, "Validate the attribute list exactly matches the set of reported attributes")
-        if success:
-            for endpoint_id, endpoint in self.endpoints_tlv.items():
-                for cluster_id, cluster in endpoint.items():
-                    attribute_list = cluster[GlobalAttributeIds.ATTRIBUTE_LIST_ID]
-                    for attribute_id in attribute_list:
-                        location = AttributePathLocation(endpoint_id, cluster_id, attribute_id)
-                        has_attribute = attribute_id in cluster
-
-                        attribute_string = self.cluster_mapper.get_attribute_string(cluster_id, attribute_id)
-                        logging.debug(
-                            f"Checking presence of claimed supported {attribute_string} on {location.as_cluster_string(self.cluster_mapper)}: {'found' if has_attribute else 'not_found'}")
-
-                        if not has_attribute:
-                            # Check if this is a write-only attribute by trying to read it.
-                            # If it's present and write-only it should return an UNSUPPORTED_READ error. All other errors are a failure.
-                            # Because these can be MEI attributes, we need to build the ClusterAttributeDescriptor manually since it's
-                            # not guaranteed to be generated. Since we expect an error back anyway, the type doesn't matter.
-
-                            write_only_attribute = await self._read_non_standard_attribute_check_unsupported_read(
-                                endpoint_id=endpoint_id, cluster_id=cluster_id, attribute_id=attribute_id)
-
-                            if not write_only_attribute:
-                                self.record_error(self.get_test_name(), location=location,
-                                                  problem=f"Did not find {attribute_string} on {location.as_cluster_string(self.cluster_mapper)} when it was claimed in AttributeList ({attribute_list})", spec_location="AttributeList Attribute")
-                                success = False
-                            continue
-
-                        attribute_value = cluster[attribute_id]
-                        if isinstance(attribute_value, ValueDecodeFailure) and cluster_id != Clusters.Objects.UnitTesting.id:
-                            self.record_error(self.get_test_name(), location=location,
-                                              problem=f"Found a failure to read/decode {attribute_string} on {location.as_cluster_string(self.cluster_mapper)} when it was claimed as supported in AttributeList ({attribute_list}): {str(attribute_value)}", spec_location="AttributeList Attribute")
-                            success = False
-                            continue
-                    for attribute_id in cluster:
-                        if attribute_id not in attribute_list:
-                            attribute_string = self.cluster_mapper.get_attribute_string(cluster_id, attribute_id)
-                            location = AttributePathLocation(endpoint_id, cluster_id, attribute_id)
-                            self.record_error(self.get_test_name(), location=location,
-                                              problem=f'Found attribute {attribute_string} on {location.as_cluster_string(self.cluster_mapper)} not listed in attribute list', spec_location="AttributeList Attribute")
-                            success = False
-
-        self.print_step(
-            5, "Validate that the global attributes do not contain any additional values in the standard or scoped range that are not defined by the cluster specification")
-        # Validate there are attributes in the global range that are not in the required list
-        allowed_globals = [a.id for a in ATTRIBUTES_TO_CHECK]
-        # also allow event list because it's not disallowed
-        event_list_id = 0xFFFA
-        allowed_globals.append(event_list_id)
-        global_range_min = 0x0000_F000
-        attribute_standard_range_max = 0x000_4FFF
-        mei_range_min = 0x0001_0000
-        for endpoint_id, endpoint in self.endpoints_tlv.items():
-            for cluster_id, cluster in endpoint.items():
-                globals = [a for a in cluster[GlobalAttributeIds.ATTRIBUTE_LIST_ID] if a >= global_range_min and a < mei_range_min]
-                unexpected_globals = sorted(set(globals) - set(allowed_globals))
-                for unexpected in unexpected_globals:
-                    location = AttributePathLocation(endpoint_id=endpoint_id, cluster_id=cluster_id, attribute_id=unexpected)
-                    self.record_error(self.get_test_name(), location=location,
-                                      problem=f"Unexpected global attribute {unexpected} in cluster {cluster_id}", spec_location="Global elements")
-                    success = False
-
-        # validate that all the returned attributes in the standard clusters contain only known attribute ids
-        for endpoint_id, endpoint in self.endpoints_tlv.items():
-            for cluster_id, cluster in endpoint.items():
-                if cluster_id not in matter.clusters.ClusterObjects.ALL_ATTRIBUTES:
-                    # Skip clusters that are not part of the standard generated corpus (e.g. MS clusters)
-                    continue
-                standard_attributes = [a for a in cluster[GlobalAttributeIds.ATTRIBUTE_LIST_ID]
-                                       if a <= attribute_standard_range_max]
-                allowed_standard_attributes = matter.clusters.ClusterObjects.ALL_ATTRIBUTES[cluster_id]
-                unexpected_standard_attributes = sorted(set(standard_attributes) - set(allowed_standard_attributes))
-                for unexpected in unexpected_standard_attributes:
-                    location = AttributePathLocation(endpoint_id=endpoint_id, cluster_id=cluster_id, attribute_id=unexpected)
-                    self.record_error(self.get_test_name(), location=location,
-                                      problem=f"Unexpected standard attribute {unexpected} in cluster {cluster_id}", spec_location=f"Cluster {cluster_id}")
-                    success = False
-
-        # validate there are no attributes in the range between standard and global
-        # This is de-facto already covered in the check above, assuming the spec hasn't defined any values in this range, but we should make sure
-        for endpoint_id, endpoint in self.endpoints_tlv.items():
-            for cluster_id, cluster in endpoint.items():
-                bad_range_values = [a for a in cluster[GlobalAttributeIds.ATTRIBUTE_LIST_ID] if a >
-                                    attribute_standard_range_max and a < global_range_min]
-                for bad in bad_range_values:
-                    location = AttributePathLocation(endpoint_id=endpoint_id, cluster_id=cluster_id, attribute_id=bad)
-                    self.record_error(self.get_test_name(), location=location,
-                                      problem=f"Attribute in undefined range {bad} in cluster {cluster_id}", spec_location=f"Cluster {cluster_id}")
-                    success = False
-
-        command_standard_range_max = 0x0000_00FF
-        # Command lists only have a scoped range, so we only need to check for known command ids, no global range check
-        for endpoint_id, endpoint in self.endpoints_tlv.items():
-            for cluster_id, cluster in endpoint.items():
-                if cluster_id not in matter.clusters.ClusterObjects.ALL_CLUSTERS:
-                    continue
-                standard_accepted_commands = [
-                    a for a in cluster[GlobalAttributeIds.ACCEPTED_COMMAND_LIST_ID] if a <= command_standard_range_max]
-                standard_generated_commands = [
-                    a for a in cluster[GlobalAttributeIds.GENERATED_COMMAND_LIST_ID] if a <= command_standard_range_max]
-                if cluster_id in matter.clusters.ClusterObjects.ALL_ACCEPTED_COMMANDS:
-                    allowed_accepted_commands = list(matter.clusters.ClusterObjects.ALL_ACCEPTED_COMMANDS[cluster_id])
-                else:
-                    allowed_accepted_commands = []
-                if cluster_id in matter.clusters.ClusterObjects.ALL_GENERATED_COMMANDS:
-                    allowed_generated_commands = list(matter.clusters.ClusterObjects.ALL_GENERATED_COMMANDS[cluster_id])
-                else:
-                    allowed_generated_commands = []
-
-                # Compare the set of commands in the standard range that the DUT says it accepts vs. the commands we know about.
-                unexpected_accepted_commands = sorted(set(standard_accepted_commands) - set(allowed_accepted_commands))
-                unexpected_generated_commands = sorted(set(standard_generated_commands) - set(allowed_generated_commands))
-
-                for unexpected in unexpected_accepted_commands:
-                    location = CommandPathLocation(endpoint_id=endpoint_id, cluster_id=cluster_id, command_id=unexpected)
-                    self.record_error(self.get_test_name(
-                    ), location=location, problem=f'Unexpected accepted command {unexpected} in cluster {cluster_id} allowed: {allowed_accepted_commands} listed: {standard_accepted_commands}', spec_location=f'Cluster {cluster_id}')
-                    success = False
-
-                for unexpected in unexpected_generated_commands:
-                    location = CommandPathLocation(endpoint_id=endpoint_id, cluster_id=cluster_id, command_id=unexpected)
-                    self.record_error(self.get_test_name(
-                    ), location=location, problem=f'Unexpected generated command {unexpected} in cluster {cluster_id} allowed: {allowed_generated_commands} listed: {standard_generated_commands}', spec_location=f'Cluster {cluster_id}')
-                    success = False
-
-        self.print_step(
-            6, "Validate that none of the global attribute IDs contain values with prefixes outside of the allowed standard or MEI prefix range")
         if self.is_pics_sdk_ci_only:
             # test vendor prefixes are allowed in the CI because we use them internally in examples
             bad_prefix_min = 0xFFF5_0000
         else:
             # test vendor prefixes are not allowed in products
             bad_prefix_min = 0xFFF1_0000
-        for endpoint_id, endpoint in self.endpoints_tlv.items():
-            for cluster_id, cluster in endpoint.items():
-                attr_prefixes = [a & 0xFFFF_0000 for a in cluster[GlobalAttributeIds.ATTRIBUTE_LIST_ID]]
-                cmd_values = cluster[GlobalAttributeIds.ACCEPTED_COMMAND_LIST_ID] + \
-                    cluster[GlobalAttributeIds.GENERATED_COMMAND_LIST_ID]
-                cmd_prefixes = [a & 0xFFFF_0000 for a in cmd_values]
-                bad_attrs = [a for a in attr_prefixes if a >= bad_prefix_min]
-                bad_cmds = [a for a in cmd_prefixes if a >= bad_prefix_min]
-                for bad_attrib_id in bad_attrs:
-                    location = AttributePathLocation(endpoint_id=endpoint_id, cluster_id=cluster_id, attribute_id=bad_attrib_id)
-                    vendor_id = get_vendor_id(bad_attrib_id)
-                    self.record_error(self.get_test_name(
-                    ), location=location, problem=f'Attribute 0x{bad_attrib_id:08x} with bad prefix 0x{vendor_id:04x} in cluster 0x{cluster_id:08x}' + (' (Test Vendor)' if attribute_id_type(bad_attrib_id) == AttributeIdType.kTest else ''), spec_location='Manufacturer Extensible Identifier (MEI)')
-                    success = False
-                for bad_cmd_id in bad_cmds:
-                    location = CommandPathLocation(endpoint_id=endpoint_id, cluster_id=cluster_id, command_id=bad_cmd_id)
-                    vendor_id = get_vendor_id(bad_cmd_id)
-                    self.record_error(self.get_test_name(
-                    ), location=location, problem=f'Command 0x{bad_cmd_id:08x} with bad prefix 0x{vendor_id:04x} in cluster 0x{cluster_id:08x}' + (' (Test Vendor)' if command_id_type(bad_cmd_id) == CommandIdType.kTest else ''), spec_location='Manufacturer Extensible Identifier (MEI)')
-                    success = False
-
-        self.print_step(7, "Validate that none of the MEI global attribute IDs contain values outside of the allowed suffix range")
-        # Validate that any attribute in the manufacturer prefix range is in the standard suffix range.
-        suffix_mask = 0x0000_FFFF
-        for endpoint_id, endpoint in self.endpoints_tlv.items():
-            for cluster_id, cluster in endpoint.items():
-                manufacturer_range_values = [a for a in cluster[GlobalAttributeIds.ATTRIBUTE_LIST_ID] if a > mei_range_min]
-                for manufacturer_value in manufacturer_range_values:
-                    suffix = manufacturer_value & suffix_mask
-                    location = AttributePathLocation(endpoint_id=endpoint_id, cluster_id=cluster_id,
-                                                     attribute_id=manufacturer_value)
-                    if suffix > attribute_standard_range_max and suffix < global_range_min:
-                        self.record_error(
-                            self.get_test_name(), location=location,
-                            problem=f"Manufacturer attribute in undefined range {manufacturer_value} in cluster {cluster_id}",
-                            spec_location=f"Cluster {cluster_id}")
-                        success = False
-                    elif suffix >= global_range_min:
-                        self.record_error(
-                            self.get_test_name(), location=location,
-                            problem=f"Manufacturer attribute in global range {manufacturer_value} in cluster {cluster_id}",
-                            spec_location=f"Cluster {cluster_id}")
-                        success = False
-
-        for endpoint_id, endpoint in self.endpoints_tlv.items():
-            for cluster_id, cluster in endpoint.items():
-                accepted_manufacturer_range_values = [
-                    a for a in cluster[GlobalAttributeIds.ACCEPTED_COMMAND_LIST_ID] if a > mei_range_min]
-                generated_manufacturer_range_values = [
-                    a for a in cluster[GlobalAttributeIds.GENERATED_COMMAND_LIST_ID] if a > mei_range_min]
-                all_command_manufacturer_range_values = accepted_manufacturer_range_values + generated_manufacturer_range_values
-                for manufacturer_value in all_command_manufacturer_range_values:
-                    suffix = manufacturer_value & suffix_mask
-                    location = CommandPathLocation(endpoint_id=endpoint_id, cluster_id=cluster_id, command_id=manufacturer_value)
-                    if suffix > command_standard_range_max:
-                        self.record_error(self.get_test_name(
-                        ), location=location, problem=f'Manufacturer command in the undefined suffix range {manufacturer_value} in cluster {cluster_id}', spec_location='Manufacturer Extensible Identifier (MEI)')
-                        success = False
 
-        self.print_step(8, "Validate that all cluster ID prefixes are in the standard or MEI range")
-        for endpoint_id, endpoint in self.endpoints_tlv.items():
-            cluster_prefixes = [a & 0xFFFF_0000 for a in endpoint]
-            bad_clusters_ids = [a for a in cluster_prefixes if a >= bad_prefix_min]
-            for bad_cluster_id in bad_clusters_ids:
-                location = ClusterPathLocation(endpoint_id=endpoint_id, cluster_id=bad_cluster_id)
-                vendor_id = get_vendor_id(bad_cluster_id)
-                self.record_error(self.get_test_name(), location=location,
-                                  problem=f'Cluster 0x{bad_cluster_id:08x} with bad prefix 0x{vendor_id:04x}' + (' (Test Vendor)' if cluster_id_type(bad_cluster_id) == ClusterIdType.kTest else ''), spec_location='Manufacturer Extensible Identifier (MEI)')
-                success = False
-
-        self.print_step(9, "Validate that all clusters in the standard range have a known cluster ID")
-        for endpoint_id, endpoint in self.endpoints_tlv.items():
-            standard_clusters = [a for a in endpoint if a < mei_range_min]
-            unknown_clusters = sorted(set(standard_clusters) - set(matter.clusters.ClusterObjects.ALL_CLUSTERS))
-            for bad in unknown_clusters:
-                location = ClusterPathLocation(endpoint_id=endpoint_id, cluster_id=bad)
-                self.record_error(self.get_test_name(
-                ), location=location, problem=f'Unknown cluster ID in the standard range {bad}', spec_location='Manufacturer Extensible Identifier (MEI)')
-                success = False
-
-        self.print_step(10, "Validate that all clusters in the MEI range have a suffix in the manufacturer suffix range")
-        for endpoint_id, endpoint in self.endpoints_tlv.items():
-            mei_clusters = [a for a in endpoint if a >= mei_range_min]
-            bad_clusters = [a for a in mei_clusters if ((a & 0x0000_FFFF) < 0xFC00) or ((a & 0x0000_FFFF) > 0xFFFE)]
-            for bad in bad_clusters:
-                location = ClusterPathLocation(endpoint_id=endpoint_id, cluster_id=bad)
-                self.record_error(self.get_test_name(
-                ), location=location, problem=f'MEI cluster with an out of range suffix {bad}', spec_location='Manufacturer Extensible Identifier (MEI)')
+        # The checks of steps 2 to 11 only depend on the endpoint they run on, so run them all at once (possibly in
+        # parallel) and record the problems step by step afterwards, in the order the checks were run serially before.
+        results = run_per_endpoint(idm_10_1_endpoint_problems, self.endpoints_tlv, self.matter_test_config.composition_workers,
+                                   self.get_test_name(), bad_prefix_min)
+
+        step_descriptions = {
+            2: "Validate all global attributes are present",
+            3: "Validate the global attributes are in range and do not contain duplicates",
+            4: "Validate the attribute list exactly matches the set of reported attributes",
+            5: "Validate that the global attributes do not contain any additional values in the standard or scoped range that are not defined by the cluster specification",
+            6: "Validate that none of the global attribute IDs contain values with prefixes outside of the allowed standard or MEI prefix range",
+            7: "Validate that none of the MEI global attribute IDs contain values outside of the allowed suffix range",
+            8: "Validate that all cluster ID prefixes are in the standard or MEI range",
+            9: "Validate that all clusters in the standard range have a known cluster ID",
+            10: "Validate that all clusters in the MEI range have a suffix in the manufacturer suffix range",
+            11: "Validate that standard cluster FeatureMap attributes contains only known feature flags",
+        }
+        success = True
+        current_step = None
+        for step, check_name in IDM_10_1_CHECKS:
+            if step != current_step:
+                self.print_step(step, step_descriptions[step])
+                current_step = step
+            # The attribute list is only checked if all the global attributes are present and valid
+            if check_name == "attribute_list_matches" and not success:
+                continue
+            for problem in merge_problems(results, check_name):
+                if isinstance(problem, UnreportedListedAttribute):
+                    # Check if this is a write-only attribute by trying to read it.
+                    # If it's present and write-only it should return an UNSUPPORTED_READ error. All other errors are a failure.
+                    location = problem.location
+                    write_only_attribute = await self._read_non_standard_attribute_check_unsupported_read(
+                        endpoint_id=location.endpoint_id, cluster_id=location.cluster_id, attribute_id=location.attribute_id)
+                    if write_only_attribute:
+                        continue
+                    self.record_error(self.get_test_name(), location=location, problem=problem.problem,
+                                      spec_location="AttributeList Attribute")
+                else:
+                    self.problems.append(problem)
                 success = False
 
-        self.print_step(11, "Validate that standard cluster FeatureMap attributes contains only known feature flags")
-        for endpoint_id, endpoint in self.endpoints_tlv.items():
-            for cluster_id, cluster in endpoint.items():
-                if cluster_id not in matter.clusters.ClusterObjects.ALL_CLUSTERS:
-                    continue
-                feature_map = cluster[GlobalAttributeIds.FEATURE_MAP_ID]
-                feature_mask = 0
-                try:
-                    feature_map_enum = matter.clusters.ClusterObjects.ALL_CLUSTERS[cluster_id].Bitmaps.Feature
-                    for f in feature_map_enum:
-                        feature_mask = feature_mask | f
-                except AttributeError:
-                    # If there is no feature bitmap, feature mask 0 is correct
-                    pass
-                feature_map_extras = feature_map & ~feature_mask
-                if feature_map_extras != 0:
-                    location = ClusterPathLocation(endpoint_id=endpoint_id, cluster_id=cluster_id)
-                    self.record_error(self.get_test_name(), location=location,
-                                      problem=f'Standard cluster {cluster_id} with unkonwn feature {feature_map_extras:02x}')
-                    success = False
-
         if not success:
             self.fail_current_test(
                 "At least one cluster has failed the range and support checks for its listed attributes, commands or features")
@@ -786,12 +455,12 @@ class TC_DeviceBasicComposition(MatterBaseTest, BasicCompositionTests):
 
         self.print_step(
             3, "For each endpoint on the DUT (including EP 0), verify the PartsList in the Descriptor cluster on that endpoint does not include itself")
-        for endpoint_id, endpoint in self.endpoints.items():
-            if endpoint_id in endpoint[Clusters.Descriptor][Clusters.Descriptor.Attributes.PartsList]:
-                location = AttributePathLocation(endpoint_id=endpoint_id, cluster_id=cluster_id, attribute_id=attribute_id)
-                self.record_error(self.get_test_name(), location=location,
-                                  problem=f"Endpoint {endpoint_id} parts list includes itself", spec_location="PartsList Attribute")
-                self.fail_current_test()
+        results = run_per_endpoint(sm_1_2_endpoint_problems, self.endpoints_tlv, self.matter_test_config.composition_workers,
+                                   self.get_test_name())
+        problems = [problem for endpoint_problems in results.values() for problem in endpoint_problems]
+        if problems:
+            self.problems.extend(problems)
+            self.fail_current_test()
 
         self.print_step(4, "Separate endpoints into flat and tree style")
         flat, tree = separate_endpoint_types(self.endpoints)
@@ -825,77 +494,33 @@ class TC_DeviceBasicComposition(MatterBaseTest, BasicCompositionTests):
         self.print_step(2, "Verify that all endpoints listed in the EndpointList are valid")
         attribute_id = Clusters.PowerSource.Attributes.EndpointList.attribute_id
         cluster_id = Clusters.PowerSource.id
-        attribute_string = self.cluster_mapper.get_attribute_string(cluster_id, attribute_id)
-        for endpoint_id, endpoint in self.endpoints.items():
-            if Clusters.PowerSource not in endpoint:
-                continue
-            location = AttributePathLocation(endpoint_id=endpoint_id, cluster_id=cluster_id, attribute_id=attribute_id)
-            cluster_revision = Clusters.PowerSource.Attributes.ClusterRevision
-            if cluster_revision not in endpoint[Clusters.PowerSource]:
-                location = AttributePathLocation(endpoint_id=endpoint_id, cluster_id=cluster_id,
-                                                 attribute_id=cluster_revision.attribute_id)
-                self.record_error(self.get_test_name(
-                ), location=location, problem=f'Did not find Cluster revision on {location.as_cluster_string(self.cluster_mapper)}', spec_location='Global attributes')
-            if endpoint[Clusters.PowerSource][cluster_revision] < 2:
-                location = AttributePathLocation(endpoint_id=endpoint_id, cluster_id=cluster_id,
-                                                 attribute_id=cluster_revision.attribute_id)
-                self.record_note(self.get_test_name(), location=location,
-                                 problem='Power source ClusterRevision is < 2, skipping remainder of test for this endpoint')
-                continue
-            if Clusters.PowerSource.Attributes.EndpointList not in endpoint[Clusters.PowerSource]:
-                self.record_error(self.get_test_name(), location=location,
-                                  problem=f'Did not find {attribute_string} on {location.as_cluster_string(self.cluster_mapper)}', spec_location="EndpointList Attribute")
-                success = False
-                continue
-
-            endpoint_list = endpoint[Clusters.PowerSource][Clusters.PowerSource.Attributes.EndpointList]
-            non_existent = set(endpoint_list) - set(self.endpoints.keys())
-            if non_existent:
-                location = AttributePathLocation(endpoint_id=endpoint_id, cluster_id=cluster_id, attribute_id=attribute_id)
-                self.record_error(self.get_test_name(), location=location,
-                                  problem=f'{attribute_string} lists a non-existent endpoint', spec_location="EndpointList Attribute")
+        results = run_per_endpoint(ps_3_1_endpoint_problems, self.endpoints_tlv, self.matter_test_config.composition_workers,
+                                   self.get_test_name(), set(self.endpoints_tlv.keys()))
+        power_sources = {endpoint_id: result for endpoint_id, result in results.items() if result is not None}
+        for result in power_sources.values():
+            self.problems.extend(result.endpoint_list_problems)
+            if any(p.severity == ProblemSeverity.ERROR for p in result.endpoint_list_problems):
                 success = False
 
         self.print_step(3, "Verify that all Bridged Node endpoint lists are correct")
         device_types = {}
         parts_list = {}
-        for endpoint_id, endpoint in self.endpoints.items():
-            if Clusters.PowerSource not in endpoint or Clusters.PowerSource.Attributes.EndpointList not in endpoint[Clusters.PowerSource]:
-                continue
-
-            def GetPartValidityProblem(endpoint):
-                if Clusters.Descriptor not in endpoint:
-                    return "Missing cluster descriptor"
-                if Clusters.Descriptor.Attributes.PartsList not in endpoint[Clusters.Descriptor]:
-                    return "Missing PartList in descriptor cluster"
-                if Clusters.Descriptor.Attributes.DeviceTypeList not in endpoint[Clusters.Descriptor]:
-                    return "Missing DeviceTypeList in descriptor cluster"
-                return None
-
-            problem = GetPartValidityProblem(endpoint)
-            if problem:
-                location = AttributePathLocation(endpoint_id=endpoint_id, cluster_id=Clusters.Descriptor.id,
-                                                 attribute_id=Clusters.Descriptor.Attributes.PartsList.id)
-                self.record_error(self.get_test_name(), location=location,
-                                  problem=problem, spec_location="PartsList Attribute")
+        for endpoint_id, result in power_sources.items():
+            if result.descriptor_problems:
+                self.problems.extend(result.descriptor_problems)
                 success = False
-                continue
-
-            device_types[endpoint_id] = [i.deviceType for i in endpoint[Clusters.Descriptor]
-                                         [Clusters.Descriptor.Attributes.DeviceTypeList]]
-            parts_list[endpoint_id] = endpoint[Clusters.Descriptor][Clusters.Descriptor.Attributes.PartsList]
+            elif result.endpoint_list is not None:
+                device_types[endpoint_id] = result.device_types
+                parts_list[endpoint_id] = result.parts_list
 
         bridged_nodes = [id for (id, dev_type) in device_types.items() if BRIDGED_NODE_DEVICE_TYPE_ID in dev_type]
 
         for endpoint_id in bridged_nodes:
-            if Clusters.PowerSource not in self.endpoints[endpoint_id]:
-                continue
             # using a list because we do want to preserve duplicates and error on those.
             desired_endpoint_list = parts_list[endpoint_id].copy()
             desired_endpoint_list.append(endpoint_id)
             desired_endpoint_list.sort()
-            ep_list = self.endpoints[endpoint_id][Clusters.PowerSource][Clusters.PowerSource.Attributes.EndpointList]
-            ep_list.sort()
+            ep_list = sorted(power_sources[endpoint_id].endpoint_list)
             if ep_list != desired_endpoint_list:
                 location = AttributePathLocation(endpoint_id=endpoint_id, cluster_id=cluster_id, attribute_id=attribute_id)
                 self.record_error(self.get_test_name(), location=location,
@@ -909,11 +534,11 @@ class TC_DeviceBasicComposition(MatterBaseTest, BasicCompositionTests):
             children = children + parts_list[endpoint_id]
 
         for endpoint_id in children:
-            if Clusters.PowerSource not in self.endpoints[endpoint_id]:
+            # A missing EndpointList was already reported in step 2
+            if endpoint_id not in power_sources or power_sources[endpoint_id].endpoint_list is None:
                 continue
             desired_endpoint_list = [endpoint_id]
-            ep_list = self.endpoints[endpoint_id][Clusters.PowerSource][Clusters.PowerSource.Attributes.EndpointList]
-            ep_list.sort()
+            ep_list = sorted(power_sources[endpoint_id].endpoint_list)
             if ep_list != desired_endpoint_list:
                 location = AttributePathLocation(endpoint_id=endpoint_id, cluster_id=cluster_id, attribute_id=attribute_id)
                 self.record_error(self.get_test_name(), location=location,
@@ -137,6 +137,13 @@ class PushAvServerProcess(Subprocess):
         """
         self._post_json(endpoint=f"/streams/{stream_id}/trackName", data={"trackName": trackName})
 
+    def get_stream_stats(self, stream_id: str) -> dict:
+        """
+            Retrieve the statistics of the segments and manifests uploaded to stream_id,
+            once all the files uploaded so far are validated.
+        """
+        return self._get_json(f"/streams/{stream_id}/stats?wait=true")
+
 
 class PAVSTIUtils:
     """Utils for Push AV TC's TLS requirements."""
@@ -0,0 +1,222 @@
+#!/usr/bin/env -S python3 -B
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import dataclasses
+import json
+import logging
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import click
+from test_testing.DeviceConformanceTests import DeviceConformanceTests
+
+from matter.testing.basic_composition import JsonToMatterTlv
+from matter.testing.problem_notices import ProblemNotice, ProblemSeverity, UnknownProblemLocation
+from matter.testing.spec_parsing import PrebuiltDataModelDirectory, SpecDataModel, load_spec_data_model
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class CheckOptions:
+    ignore_in_progress: bool
+    allow_provisional: bool
+    fail_on_extra_clusters: bool
+
+
+@dataclass
+class DumpReport:
+    path: str
+    spec_version: Optional[str] = None
+    problems: list[dict[str, Any]] = field(default_factory=list)
+    # Set if the dump could not be checked at all (i.e. it could not be parsed)
+    error: Optional[str] = None
+    seconds: float = 0.0
+
+    @property
+    def error_count(self) -> int:
+        return sum(1 for p in self.problems if p['severity'] == ProblemSeverity.ERROR)
+
+
+class OfflineDeviceConformance(DeviceConformanceTests):
+    ''' Runs the device conformance checks on a wildcard dump, without a DUT or a controller. '''
+
+    def __init__(self, dump_path: str, spec_models: dict[PrebuiltDataModelDirectory, SpecDataModel]):
+        cache = JsonToMatterTlv(dump_path, use_stack=False)
+        self.endpoints = cache.GetUpdatedAttributeCache()
+        self.endpoints_tlv = cache.attributeTLVCache
+        self.problems = []
+
+        self.dm = self._get_dm()
+        if self.dm not in spec_models:
+            spec_models[self.dm] = load_spec_data_model(self.dm)
+        self.xml_clusters = spec_models[self.dm].clusters
+        self.xml_device_types = spec_models[self.dm].device_types
+
+
+# Every check returns the problems it found. The success value returned by some of them is
+# not needed, since it only reflects whether any error was recorded.
+CHECKS: list[tuple[str, Callable[[OfflineDeviceConformance, CheckOptions], list[ProblemNotice]]]] = [
+    ("IDM-10.2", lambda c, o: c.check_conformance(o.ignore_in_progress, False, o.allow_provisional)[1]),
+    ("IDM-10.3", lambda c, o: c.check_revisions(o.ignore_in_progress)[1]),
+    ("IDM-10.5", lambda c, o: c.check_device_type(o.fail_on_extra_clusters, o.allow_provisional)[1]),
+    ("IDM-10.6", lambda c, o: c.check_device_type_revisions()[1]),
+    ("TC-IDM-14.1", lambda c, o: (c.check_root_node_restricted_clusters() + c.check_closure_restricted_clusters() +
+                                  c.check_closure_restricted_sem_tags())),
+    ("TC-DESC-2.3", lambda c, o: c.check_root_endpoint_for_application_device_types() +
+     c.check_all_application_device_types_superset()),
+]
+
+# Spec data models already loaded by this (worker) process
+_spec_models: dict[PrebuiltDataModelDirectory, SpecDataModel] = {}
+
+
+def problem_to_dict(problem: ProblemNotice) -> dict[str, Any]:
+    location = problem.location
+    return {
+        'test_name': problem.test_name,
+        'severity': problem.severity,
+        'location_type': type(location).__name__,
+        'location': dataclasses.asdict(location) if dataclasses.is_dataclass(location) else {},
+        'problem': problem.problem,
+        'spec_location': problem.spec_location,
+    }
+
+
+def check_dump(dump_path: str, options: CheckOptions) -> DumpReport:
+    start = time.monotonic()
+    report = DumpReport(path=dump_path)
+    try:
+        checker = OfflineDeviceConformance(dump_path, _spec_models)
+    except Exception as e:
+        report.error = f'{type(e).__name__}: {e}'
+        report.seconds = time.monotonic() - start
+        return report
+
+    report.spec_version = checker.dm.dirname
+    for test_name, check in CHECKS:
+        try:
+            problems = check(checker, options)
+        except Exception as e:
+            # A check that crashes on a malformed dump should not hide the results of the other checks
+            problems = [ProblemNotice(test_name, UnknownProblemLocation(), ProblemSeverity.ERROR,
+                                      f'Check failed to run: {type(e).__name__}: {e}')]
+        report.problems.extend(problem_to_dict(p) for p in problems)
+
+    report.seconds = time.monotonic() - start
+    return report
+
+
+def find_dumps(paths: tuple[str, ...]) -> list[str]:
+    dumps: list[str] = []
+    for path in paths:
+        if os.path.isdir(path):
+            dumps.extend(sorted(str(p) for p in Path(path).rglob('*.json')))
+        else:
+            dumps.append(path)
+    return dumps
+
+
+def summarize(reports: list[DumpReport]) -> dict[str, Any]:
+    errors_by_test: Counter = Counter()
+    warnings_by_test: Counter = Counter()
+    for report in reports:
+        for p in report.problems:
+            if p['severity'] == ProblemSeverity.ERROR:
+                errors_by_test[p['test_name']] += 1
+            elif p['severity'] == ProblemSeverity.WARNING:
+                warnings_by_test[p['test_name']] += 1
+
+    return {
+        'dumps': len(reports),
+        'unreadable_dumps': sum(1 for r in reports if r.error),
+        'dumps_with_errors': sum(1 for r in reports if r.error_count),
+        'spec_versions': dict(Counter(r.spec_version for r in reports if r.spec_version)),
+        'errors_by_test': dict(errors_by_test),
+        'warnings_by_test': dict(warnings_by_test),
+    }
+
+
+@click.command()
+@click.argument('dumps', nargs=-1, required=True, type=click.Path(exists=True))
+@click.option('--output', '-o', default='conformance_report.json', show_default=True, type=click.Path(dir_okay=False),
+              help='Path of the JSON report with the problems found in every dump')
+@click.option('--jobs', '-j', default=os.cpu_count(), show_default=True, type=click.IntRange(min=1),
+              help='Number of dumps checked in parallel')
+@click.option('--ignore-in-progress', is_flag=True, default=False,
+              help='Ignore attributes and cluster revisions that are known to be in progress in the SDK')
+@click.option('--allow-provisional', is_flag=True, default=False, help='Allow provisional clusters and elements')
+@click.option('--fail-on-extra-clusters/--no-fail-on-extra-clusters', default=True, show_default=True,
+              help='Report clusters that are not allowed by the device types of an endpoint as errors')
+@click.option('--log-level', default='WARNING', type=click.Choice(['DEBUG', 'INFO', 'WARNING', 'ERROR'], case_sensitive=False))
+def main(dumps, output, jobs, ignore_in_progress, allow_provisional, fail_on_extra_clusters, log_level):
+    '''
+        Checks the device composition and conformance of wildcard dumps, as written by the
+        dump_device_composition_path argument of TC_DeviceBasicComposition, without a DUT.
+
+        DUMPS are JSON dump files, or directories that are searched for JSON dump files.
+    '''
+    logging.basicConfig(level=log_level.upper(), format='%(levelname)-7s %(message)s')
+
+    dump_paths = find_dumps(dumps)
+    if not dump_paths:
+        LOGGER.error('No dump files found')
+        sys.exit(2)
+
+    # Parse every spec version once up front. Forked workers inherit them directly, other workers
+    # load them from the on-disk spec data model cache when MATTER_SPEC_CACHE_DIR is set.
+    for dm in PrebuiltDataModelDirectory:
+        load_spec_data_model(dm)
+
+    options = CheckOptions(ignore_in_progress=ignore_in_progress, allow_provisional=allow_provisional,
+                           fail_on_extra_clusters=fail_on_extra_clusters)
+
+    start = time.monotonic()
+    if jobs == 1:
+        reports = [check_dump(path, options) for path in dump_paths]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            reports = list(executor.map(check_dump, dump_paths, [options] * len(dump_paths), chunksize=4))
+    elapsed = time.monotonic() - start
+
+    summary = summarize(reports)
+    with open(output, 'w') as f:
+        json.dump({'summary': summary, 'dumps': [dataclasses.asdict(r) for r in reports]}, f, indent=2)
+
+    print(f'Checked {summary["dumps"]} dumps in {elapsed:0.2f} seconds, report written to {output}')
+    for test_name in sorted(set(summary['errors_by_test']) | set(summary['warnings_by_test'])):
+        print(f'  {test_name:<12} {summary["errors_by_test"].get(test_name, 0):>6} errors '
+              f'{summary["warnings_by_test"].get(test_name, 0):>6} warnings')
+    for report in reports:
+        if report.error:
+            print(f'  UNREADABLE {report.path}: {report.error}')
+        elif report.error_count:
+            print(f'  FAIL       {report.path} ({report.spec_version}): {report.error_count} errors')
+
+    if summary['unreadable_dumps'] or summary['dumps_with_errors']:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
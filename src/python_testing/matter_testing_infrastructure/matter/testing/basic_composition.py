@@ -33,10 +33,10 @@ import matter.clusters as Clusters
 import matter.tlv
 from matter.ChipDeviceCtrl import ChipDeviceController
 from matter.clusters.Attribute import AttributeCache, ValueDecodeFailure
-from matter.MatterTlvJson import TLVJsonConverter
+from matter.MatterTlvJson import TLVJsonConverter, convert_dump_to_cache_without_stack
 from matter.testing.conformance import ConformanceException
 from matter.testing.matter_testing import MatterTestConfig, ProblemNotice
-from matter.testing.spec_parsing import PrebuiltDataModelDirectory, build_xml_clusters, build_xml_device_types, dm_from_spec_version
+from matter.testing.spec_parsing import PrebuiltDataModelDirectory, dm_from_spec_version, load_spec_data_model
 
 LOGGER = logging.getLogger(__name__)
 
@@ -129,11 +129,17 @@ def MatterTlvToJson(tlv_data: dict[int, Any]) -> dict[str, Any]:
     return matter_json_dict
 
 
-def JsonToMatterTlv(json_filename: str) -> AttributeCache:
-    converter = TLVJsonConverter()
+def JsonToMatterTlv(json_filename: str, use_stack: bool = True) -> AttributeCache:
+    """Loads a MatterJsonTlv wildcard dump into an AttributeCache.
+
+       With use_stack=False the dump is converted in python, which does not require an initialized CHIP stack.
+    """
     with open(json_filename, "r") as fin:
         json_tlv = json.load(fin)
-        return converter.convert_dump_to_cache(json_tlv)
+    if not use_stack:
+        return convert_dump_to_cache_without_stack(json_tlv)
+    converter = TLVJsonConverter()
+    return converter.convert_dump_to_cache(json_tlv)
 
 
 class BasicCompositionTests:
@@ -275,6 +281,7 @@ class BasicCompositionTests:
         LOGGER.info("----------------------------------------------------------------------------------")
         LOGGER.info(f"-- Running tests against Specification version {dm.dirname}")
         LOGGER.info("----------------------------------------------------------------------------------")
-        self.xml_clusters, self.problems = build_xml_clusters(dm)
-        self.xml_device_types, problems = build_xml_device_types(dm)
-        self.problems.extend(problems)
+        spec = load_spec_data_model(dm)
+        self.xml_clusters = spec.clusters
+        self.xml_device_types = spec.device_types
+        self.problems = spec.cluster_problems + spec.device_type_problems
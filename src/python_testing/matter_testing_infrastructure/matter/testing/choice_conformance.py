@@ -15,6 +15,9 @@
 #    limitations under the License.
 #
 
+from typing import Optional
+
+from matter.testing.compiled_conformance import ClusterConformanceDecisions
 from matter.testing.conformance import Choice, ConformanceDecisionWithChoice
 from matter.testing.global_attribute_ids import GlobalAttributeIds
 from matter.testing.problem_notices import AttributePathLocation, ProblemNotice, ProblemSeverity
@@ -47,15 +50,18 @@ def _evaluate_choices(location: AttributePathLocation, counts: dict[Choice, int]
     return problems
 
 
-def evaluate_feature_choice_conformance(endpoint_id: int, cluster_id: int, xml_clusters: dict[int, XmlCluster], feature_map: uint, attribute_list: list[uint], all_command_list: list[uint]) -> list[ChoiceConformanceProblemNotice]:
+def evaluate_feature_choice_conformance(endpoint_id: int, cluster_id: int, xml_clusters: dict[int, XmlCluster], feature_map: uint, attribute_list: list[uint], all_command_list: list[uint], decisions: Optional[ClusterConformanceDecisions] = None) -> list[ChoiceConformanceProblemNotice]:
     all_features = [uint(1 << i) for i in range(32)]
     all_features = [f for f in all_features if f in xml_clusters[cluster_id].features]
 
     # Other pieces of the 10.2 test check for unknown features, so just remove them here to check choice conformance
     counts: dict[Choice, int] = {}
     for f in all_features:
-        xml_feature = xml_clusters[cluster_id].features[f]
-        conformance_decision_with_choice = xml_feature.conformance(feature_map, attribute_list, all_command_list)
+        if decisions is not None:
+            conformance_decision_with_choice = decisions.features[f]
+        else:
+            xml_feature = xml_clusters[cluster_id].features[f]
+            conformance_decision_with_choice = xml_feature.conformance(feature_map, attribute_list, all_command_list)
         _add_to_counts_if_required(conformance_decision_with_choice, (feature_map & f) != 0, counts)
 
     location = AttributePathLocation(endpoint_id=endpoint_id, cluster_id=cluster_id,
@@ -63,13 +69,16 @@ def evaluate_feature_choice_conformance(endpoint_id: int, cluster_id: int, xml_c
     return _evaluate_choices(location, counts)
 
 
-def evaluate_attribute_choice_conformance(endpoint_id: int, cluster_id: int, xml_clusters: dict[int, XmlCluster], feature_map: uint, attribute_list: list[uint], all_command_list: list[uint]) -> list[ChoiceConformanceProblemNotice]:
+def evaluate_attribute_choice_conformance(endpoint_id: int, cluster_id: int, xml_clusters: dict[int, XmlCluster], feature_map: uint, attribute_list: list[uint], all_command_list: list[uint], decisions: Optional[ClusterConformanceDecisions] = None) -> list[ChoiceConformanceProblemNotice]:
     all_attributes = xml_clusters[cluster_id].attributes.keys()
 
     counts: dict[Choice, int] = {}
     for attribute_id in all_attributes:
-        conformance_decision_with_choice = xml_clusters[cluster_id].attributes[attribute_id].conformance(
-            feature_map, attribute_list, all_command_list)
+        if decisions is not None:
+            conformance_decision_with_choice = decisions.attributes[attribute_id]
+        else:
+            conformance_decision_with_choice = xml_clusters[cluster_id].attributes[attribute_id].conformance(
+                feature_map, attribute_list, all_command_list)
         _add_to_counts_if_required(conformance_decision_with_choice, attribute_id in attribute_list, counts)
 
     location = AttributePathLocation(endpoint_id=endpoint_id, cluster_id=cluster_id,
@@ -77,13 +86,16 @@ def evaluate_attribute_choice_conformance(endpoint_id: int, cluster_id: int, xml
     return _evaluate_choices(location, counts)
 
 
-def evaluate_command_choice_conformance(endpoint_id: int, cluster_id: int, xml_clusters: dict[int, XmlCluster], feature_map: uint, attribute_list: list[uint], all_command_list: list[uint]) -> list[ChoiceConformanceProblemNotice]:
+def evaluate_command_choice_conformance(endpoint_id: int, cluster_id: int, xml_clusters: dict[int, XmlCluster], feature_map: uint, attribute_list: list[uint], all_command_list: list[uint], decisions: Optional[ClusterConformanceDecisions] = None) -> list[ChoiceConformanceProblemNotice]:
     all_commands = xml_clusters[cluster_id].accepted_commands.keys()
 
     counts: dict[Choice, int] = {}
     for command_id in all_commands:
-        conformance_decision_with_choice = xml_clusters[cluster_id].accepted_commands[command_id].conformance(
-            feature_map, attribute_list, all_command_list)
+        if decisions is not None:
+            conformance_decision_with_choice = decisions.accepted_commands[command_id]
+        else:
+            conformance_decision_with_choice = xml_clusters[cluster_id].accepted_commands[command_id].conformance(
+                feature_map, attribute_list, all_command_list)
         _add_to_counts_if_required(conformance_decision_with_choice, command_id in all_command_list, counts)
 
     location = AttributePathLocation(endpoint_id=endpoint_id, cluster_id=cluster_id,
@@ -0,0 +1,283 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+"""
+Compiled conformance evaluation
+
+The conformance objects built by the spec parser are trees of callables that are walked
+recursively, and that look up attributes and commands in lists, every time an element is
+evaluated. This module compiles each tree once into nested closures that test membership
+in frozensets, and evaluates every element of a cluster at once for a given feature map,
+attribute list and command list, memoizing the result. Devices such as bridges expose the
+same cluster configuration on many endpoints, so most clusters are only evaluated once.
+
+Compiled conformances return the same decisions, and raise the same exceptions, as the
+conformance objects they were compiled from.
+"""
+
+from dataclasses import dataclass
+from typing import Callable
+
+from matter.testing.conformance import (Conformance, ConformanceDecision, ConformanceDecisionWithChoice, ConformanceException,
+                                        and_operation, attribute, command, deprecated, device_feature, disallowed, feature,
+                                        greater_operation, literal, mandatory, mandatory_wrapper, not_operation, optional,
+                                        optional_wrapper, or_operation, otherwise, provisional, zigbee)
+from matter.testing.spec_parsing import XmlCluster
+from matter.tlv import uint
+
+# Compiled conformance: (feature_map, attributes, commands) -> decision
+CompiledConformance = Callable[[int, frozenset, frozenset], ConformanceDecisionWithChoice]
+
+_MANDATORY = ConformanceDecision.MANDATORY
+_OPTIONAL = ConformanceDecision.OPTIONAL
+_NOT_APPLICABLE = ConformanceDecision.NOT_APPLICABLE
+_DISALLOWED = ConformanceDecision.DISALLOWED
+_PROVISIONAL = ConformanceDecision.PROVISIONAL
+
+
+def _constant(decision: ConformanceDecision, choice=None) -> CompiledConformance:
+    def evaluate(feature_map, attributes, commands):
+        return ConformanceDecisionWithChoice(decision, choice)
+    return evaluate
+
+
+def _compile_feature(conformance: feature) -> CompiledConformance:
+    mask = conformance.requiredFeature
+
+    def evaluate(feature_map, attributes, commands):
+        return ConformanceDecisionWithChoice(_MANDATORY if mask & feature_map else _NOT_APPLICABLE)
+    return evaluate
+
+
+def _compile_attribute(conformance: attribute) -> CompiledConformance:
+    attribute_id = conformance.requiredAttribute
+
+    def evaluate(feature_map, attributes, commands):
+        return ConformanceDecisionWithChoice(_MANDATORY if attribute_id in attributes else _NOT_APPLICABLE)
+    return evaluate
+
+
+def _compile_command(conformance: command) -> CompiledConformance:
+    command_id = conformance.requiredCommand
+
+    def evaluate(feature_map, attributes, commands):
+        return ConformanceDecisionWithChoice(_MANDATORY if command_id in commands else _NOT_APPLICABLE)
+    return evaluate
+
+
+def _compile_literal(conformance: literal) -> CompiledConformance:
+    def evaluate(feature_map, attributes, commands):
+        raise ConformanceException('Literal conformance function should not be called - this is simply a value holder')
+    return evaluate
+
+
+def _compile_optional_wrapper(conformance: optional_wrapper) -> CompiledConformance:
+    op = compile_conformance(conformance.op)
+    choice = conformance.choice
+
+    def evaluate(feature_map, attributes, commands):
+        decision_with_choice = op(feature_map, attributes, commands)
+        if decision_with_choice.decision in (_MANDATORY, _OPTIONAL):
+            return ConformanceDecisionWithChoice(_OPTIONAL, choice)
+        if decision_with_choice.decision == _NOT_APPLICABLE:
+            return decision_with_choice
+        raise ConformanceException(f'Optional wrapping invalid op {decision_with_choice}')
+    return evaluate
+
+
+def _compile_not_operation(conformance: not_operation) -> CompiledConformance:
+    op = compile_conformance(conformance.op)
+
+    def evaluate(feature_map, attributes, commands):
+        decision_with_choice = op(feature_map, attributes, commands)
+        decision = decision_with_choice.decision
+        if decision in (_DISALLOWED, _PROVISIONAL):
+            raise ConformanceException('NOT operation on optional or disallowed item')
+        if decision == _OPTIONAL:
+            return decision_with_choice
+        if decision == _NOT_APPLICABLE:
+            return ConformanceDecisionWithChoice(_MANDATORY)
+        if decision == _MANDATORY:
+            return ConformanceDecisionWithChoice(_NOT_APPLICABLE)
+        raise ConformanceException('NOT called on item with non-conformance value')
+    return evaluate
+
+
+def _compile_and_operation(conformance: and_operation) -> CompiledConformance:
+    ops = tuple(compile_conformance(op) for op in conformance.op_list)
+    # Device type features are not exposed by devices, so they degrade to optional in AND terms
+    only_device_features = all(type(op) is device_feature for op in conformance.op_list)
+
+    def evaluate(feature_map, attributes, commands):
+        for op in ops:
+            decision_with_choice = op(feature_map, attributes, commands)
+            decision = decision_with_choice.decision
+            if decision == _MANDATORY:
+                continue
+            if decision == _NOT_APPLICABLE:
+                return decision_with_choice
+            if decision == _OPTIONAL and only_device_features:
+                return decision_with_choice
+            if decision in (_OPTIONAL, _DISALLOWED, _PROVISIONAL):
+                raise ConformanceException('AND operation on optional or disallowed item')
+            raise ConformanceException('Oplist item returned non-conformance value')
+        return ConformanceDecisionWithChoice(_MANDATORY)
+    return evaluate
+
+
+def _compile_or_operation(conformance: or_operation) -> CompiledConformance:
+    ops = tuple(compile_conformance(op) for op in conformance.op_list)
+
+    def evaluate(feature_map, attributes, commands):
+        for op in ops:
+            decision_with_choice = op(feature_map, attributes, commands)
+            decision = decision_with_choice.decision
+            if decision == _NOT_APPLICABLE:
+                continue
+            if decision in (_MANDATORY, _OPTIONAL):
+                return decision_with_choice
+            if decision in (_DISALLOWED, _PROVISIONAL):
+                raise ConformanceException('OR operation on optional or disallowed item')
+            raise ConformanceException('Oplist item returned non-conformance value')
+        return ConformanceDecisionWithChoice(_NOT_APPLICABLE)
+    return evaluate
+
+
+def _compile_otherwise(conformance: otherwise) -> CompiledConformance:
+    ops = tuple(compile_conformance(op) for op in conformance.op_list)
+
+    def evaluate(feature_map, attributes, commands):
+        for op in ops:
+            decision_with_choice = op(feature_map, attributes, commands)
+            if decision_with_choice.decision != _NOT_APPLICABLE:
+                return decision_with_choice
+        return ConformanceDecisionWithChoice(_NOT_APPLICABLE)
+    return evaluate
+
+
+def _compile_fallback(conformance: Callable) -> CompiledConformance:
+    # Conformances this module does not know about are called as they are. They test
+    # membership with `in`, which works on the frozensets as well as on lists.
+    def evaluate(feature_map, attributes, commands):
+        return conformance(feature_map, attributes, commands)
+    return evaluate
+
+
+_CONSTANT_DECISIONS: dict[type, ConformanceDecision] = {
+    zigbee: _NOT_APPLICABLE,
+    mandatory: _MANDATORY,
+    deprecated: _DISALLOWED,
+    disallowed: _DISALLOWED,
+    provisional: _PROVISIONAL,
+    # Greater than terms need attribute values, so they are always optional for now.
+    greater_operation: _OPTIONAL,
+}
+
+_COMPILERS: dict[type, Callable[[Conformance], CompiledConformance]] = {
+    feature: _compile_feature,
+    attribute: _compile_attribute,
+    command: _compile_command,
+    literal: _compile_literal,
+    optional_wrapper: _compile_optional_wrapper,
+    not_operation: _compile_not_operation,
+    and_operation: _compile_and_operation,
+    or_operation: _compile_or_operation,
+    otherwise: _compile_otherwise,
+}
+
+
+def compile_conformance(conformance: Callable) -> CompiledConformance:
+    ''' Compiles a conformance tree into a callable taking the feature map and frozensets of the attribute
+        and command IDs of the cluster.
+    '''
+    conformance_type = type(conformance)
+    if conformance_type in _CONSTANT_DECISIONS:
+        return _constant(_CONSTANT_DECISIONS[conformance_type])
+    if conformance_type is optional:
+        return _constant(_OPTIONAL, conformance.choice)
+    if conformance_type is device_feature:
+        # Device type features do not depend on the cluster, so they always return the same decision
+        decision = conformance().decision
+        return _constant(decision)
+    if conformance_type is mandatory_wrapper:
+        return compile_conformance(conformance.op)
+    if conformance_type in _COMPILERS:
+        return _COMPILERS[conformance_type](conformance)
+    return _compile_fallback(conformance)
+
+
+@dataclass(frozen=True)
+class ClusterConformanceDecisions:
+    ''' Conformance decisions for every feature, attribute and command of a cluster in the spec. '''
+    features: dict[uint, ConformanceDecisionWithChoice]
+    attributes: dict[uint, ConformanceDecisionWithChoice]
+    accepted_commands: dict[uint, ConformanceDecisionWithChoice]
+    generated_commands: dict[uint, ConformanceDecisionWithChoice]
+
+
+class ClusterConformanceEvaluator:
+    ''' Evaluates the conformance of all the elements of the given spec clusters, compiling every
+        conformance on first use and memoizing the decisions for each distinct cluster configuration.
+
+        The evaluator does not watch the spec clusters for changes, so create a new one if the
+        conformances of the given clusters are modified.
+    '''
+
+    def __init__(self, xml_clusters: dict[uint, XmlCluster]):
+        self._xml_clusters = xml_clusters
+        self._compiled: dict[uint, tuple[dict, dict, dict, dict]] = {}
+        self._decisions: dict[tuple[uint, int, frozenset, frozenset], ClusterConformanceDecisions] = {}
+
+    def _compiled_cluster(self, cluster_id: uint) -> tuple[dict, dict, dict, dict]:
+        compiled = self._compiled.get(cluster_id)
+        if compiled is None:
+            cluster = self._xml_clusters[cluster_id]
+            compiled = ({k: compile_conformance(v.conformance) for k, v in cluster.features.items()},
+                        {k: compile_conformance(v.conformance) for k, v in cluster.attributes.items()},
+                        {k: compile_conformance(v.conformance) for k, v in cluster.accepted_commands.items()},
+                        {k: compile_conformance(v.conformance) for k, v in cluster.generated_commands.items()})
+            self._compiled[cluster_id] = compiled
+        return compiled
+
+    def decisions(self, cluster_id: uint, feature_map: uint, attribute_list: list[uint],
+                  all_command_list: list[uint]) -> ClusterConformanceDecisions:
+        ''' Returns the conformance decisions of every element of the cluster.
+
+            feature_map: The feature_map of the cluster on the device
+            attribute_list: The attribute list of the cluster on the device
+            all_command_list: combined list of accepted and generated command IDs of the cluster on the device
+
+            Raises: ConformanceException if any of the conformances of the cluster is invalid
+        '''
+        attributes = frozenset(attribute_list)
+        commands = frozenset(all_command_list)
+        key = (cluster_id, int(feature_map), attributes, commands)
+        decisions = self._decisions.get(key)
+        if decisions is not None:
+            return decisions
+
+        features, cluster_attributes, accepted_commands, generated_commands = self._compiled_cluster(cluster_id)
+
+        def evaluate(compiled: dict[uint, CompiledConformance]) -> dict[uint, ConformanceDecisionWithChoice]:
+            return {k: c(feature_map, attributes, commands) for k, c in compiled.items()}
+
+        decisions = ClusterConformanceDecisions(features=evaluate(features),
+                                                attributes=evaluate(cluster_attributes),
+                                                accepted_commands=evaluate(accepted_commands),
+                                                generated_commands=evaluate(generated_commands))
+        self._decisions[key] = decisions
+        return decisions
@@ -0,0 +1,548 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+"""Per-endpoint checks of the device composition tests, run over the TLV of a wildcard read.
+
+The checks are pure functions of a single endpoint, so that they can be spread over a process
+pool for devices with many endpoints. Each returns the problems it found grouped by check, and
+`merge_problems` orders them as if every check had been run over all the endpoints in turn.
+"""
+
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional, Union
+
+import matter.clusters as Clusters
+import matter.clusters.ClusterObjects
+import matter.tlv
+from matter.clusters.Attribute import ValueDecodeFailure
+from matter.clusters.CHIPClusters import ChipClusters
+from matter.testing.global_attribute_ids import (AttributeIdType, ClusterIdType, CommandIdType, GlobalAttributeIds,
+                                                 attribute_id_type, cluster_id_type, command_id_type)
+from matter.testing.problem_notices import (AttributePathLocation, ClusterMapper, ClusterPathLocation, CommandPathLocation,
+                                            ProblemNotice, ProblemSeverity)
+
+LOGGER = logging.getLogger(__name__)
+
+# Endpoint TLV of a wildcard read: cluster ID -> attribute ID -> value
+EndpointTlv = dict[int, dict[int, Any]]
+
+# The cluster names only come from the generated cluster mapping, so workers do not need a controller for them.
+_CLUSTER_MAPPER = ClusterMapper(ChipClusters)
+
+_GLOBAL_RANGE_MIN = 0x0000_F000
+_ATTRIBUTE_STANDARD_RANGE_MAX = 0x0000_4FFF
+_COMMAND_STANDARD_RANGE_MAX = 0x0000_00FF
+_MEI_RANGE_MIN = 0x0001_0000
+_SUFFIX_MASK = 0x0000_FFFF
+_EVENT_LIST_ID = 0xFFFA
+
+_DESCRIPTOR_ID = Clusters.Descriptor.id
+_PARTS_LIST_ID = Clusters.Descriptor.Attributes.PartsList.attribute_id
+_DEVICE_TYPE_LIST_ID = Clusters.Descriptor.Attributes.DeviceTypeList.attribute_id
+_POWER_SOURCE_ID = Clusters.PowerSource.id
+_ENDPOINT_LIST_ID = Clusters.PowerSource.Attributes.EndpointList.attribute_id
+
+
+def get_vendor_id(mei: int) -> int:
+    """Get the vendor ID portion (MEI prefix) of an overall MEI."""
+    return (mei >> 16) & 0xffff
+
+
+def check_int_in_range(min_value: int, max_value: int, allow_null: bool = False) -> Callable:
+    """Returns a checker for whether `obj` is an int that fits in a range."""
+    def int_in_range_checker(obj: Any):
+        """Inner checker logic for check_int_in_range
+
+        Checker validates that `obj` must have decoded as an integral value in range [min_value, max_value].
+
+        On failure, a ValueError is raised with a diagnostic message.
+        """
+        if obj is None and allow_null:
+            return
+
+        if not isinstance(obj, int) and not isinstance(obj, matter.tlv.uint):
+            raise ValueError(f"Value {str(obj)} is not an integer or uint (decoded type: {type(obj)})")
+        int_val = int(obj)
+        if (int_val < min_value) or (int_val > max_value):
+            raise ValueError(
+                f"Value {int_val} (0x{int_val:X}) not in range [{min_value}, {max_value}] ([0x{min_value:X}, 0x{max_value:X}])")
+
+    return int_in_range_checker
+
+
+def check_list_of_ints_in_range(min_value: int, max_value: int, min_size: int = 0, max_size: int = 65535, allow_null: bool = False) -> Callable:
+    """Returns a checker for whether `obj` is a list of ints that fit in a range."""
+    def list_of_ints_in_range_checker(obj: Any):
+        """Inner checker for check_list_of_ints_in_range.
+
+        Checker validates that `obj` must have decoded as a list of integral values in range [min_value, max_value].
+        The length of the list must be between [min_size, max_size].
+
+        On failure, a ValueError is raised with a diagnostic message.
+        """
+        if obj is None and allow_null:
+            return
+
+        if not isinstance(obj, list):
+            raise ValueError(f"Value {str(obj)} is not a list, but a list was expected (decoded type: {type(obj)})")
+
+        if len(obj) < min_size or len(obj) > max_size:
+            raise ValueError(
+                f"Value {str(obj)} is a list of size {len(obj)}, but expected a list with size in range [{min_size}, {max_size}]")
+
+        for val_idx, val in enumerate(obj):
+            if not isinstance(val, int) and not isinstance(val, matter.tlv.uint):
+                raise ValueError(
+                    f"At index {val_idx} in {str(obj)}, value {val} is not an int/uint, but an int/uint was expected (decoded type: {type(val)})")
+
+            int_val = int(val)
+            if not ((int_val >= min_value) and (int_val <= max_value)):
+                raise ValueError(
+                    f"At index {val_idx} in {str(obj)}, value {int_val} (0x{int_val:X}) not in range [{min_value}, {max_value}] ([0x{min_value:X}, 0x{max_value:X}])")
+
+    return list_of_ints_in_range_checker
+
+
+def check_non_empty_list_of_ints_in_range(min_value: int, max_value: int, max_size: int = 65535, allow_null: bool = False) -> Callable:
+    """Returns a checker for whether `obj` is a non-empty list of ints that fit in a range."""
+    return check_list_of_ints_in_range(min_value, max_value, min_size=1, max_size=max_size, allow_null=allow_null)
+
+
+def check_no_duplicates(obj: Any) -> None:
+    if not isinstance(obj, list):
+        raise ValueError(f"Value {str(obj)} is not a list, but a list was expected (decoded type: {type(obj)})")
+    if len(set(obj)) != len(obj):
+        raise ValueError(f"Value {str(obj)} contains duplicate values")
+
+
+@dataclass
+class RequiredMandatoryAttribute:
+    id: int
+    name: str
+    validators: list[Callable]
+
+
+ATTRIBUTES_TO_CHECK = [
+    RequiredMandatoryAttribute(id=GlobalAttributeIds.CLUSTER_REVISION_ID, name="ClusterRevision",
+                               validators=[check_int_in_range(1, 0xFFFF)]),
+    RequiredMandatoryAttribute(id=GlobalAttributeIds.FEATURE_MAP_ID, name="FeatureMap",
+                               validators=[check_int_in_range(0, 0xFFFF_FFFF)]),
+    RequiredMandatoryAttribute(id=GlobalAttributeIds.ATTRIBUTE_LIST_ID, name="AttributeList",
+                               validators=[check_non_empty_list_of_ints_in_range(0, 0xFFFF_FFFF), check_no_duplicates]),
+    # TODO: Check for EventList
+    # RequiredMandatoryAttribute(id=0xFFFA, name="EventList", validator=check_list_of_ints_in_range(0, 0xFFFF_FFFF)),
+    RequiredMandatoryAttribute(id=GlobalAttributeIds.ACCEPTED_COMMAND_LIST_ID, name="AcceptedCommandList",
+                               validators=[check_list_of_ints_in_range(0, 0xFFFF_FFFF), check_no_duplicates]),
+    RequiredMandatoryAttribute(id=GlobalAttributeIds.GENERATED_COMMAND_LIST_ID, name="GeneratedCommandList",
+                               validators=[check_list_of_ints_in_range(0, 0xFFFF_FFFF), check_no_duplicates]),
+]
+
+
+@dataclass
+class UnreportedListedAttribute:
+    """An attribute listed in the AttributeList of a cluster that is missing from the wildcard read.
+
+    This is only a problem if the attribute is not write-only, which the test has to find out by
+    reading it from the DUT, so the check leaves the decision (and the problem text) to the test.
+    """
+    location: AttributePathLocation
+    problem: str
+
+
+IdmProblem = Union[ProblemNotice, UnreportedListedAttribute]
+
+
+def _error(test_name: str, location, problem: str, spec_location: str = "") -> ProblemNotice:
+    return ProblemNotice(test_name, location, ProblemSeverity.ERROR, problem, spec_location)
+
+
+def _check_global_attributes_present(test_name: str, endpoint_id: int, endpoint: EndpointTlv) -> list[IdmProblem]:
+    problems = []
+    for cluster_id, cluster in endpoint.items():
+        for req_attribute in ATTRIBUTES_TO_CHECK:
+            attribute_string = _CLUSTER_MAPPER.get_attribute_string(cluster_id, req_attribute.id)
+
+            has_attribute = (req_attribute.id in cluster)
+            location = AttributePathLocation(endpoint_id, cluster_id, req_attribute.id)
+            LOGGER.debug(
+                f"Checking for mandatory global {attribute_string} on {location.as_cluster_string(_CLUSTER_MAPPER)}: {'found' if has_attribute else 'not_found'}")
+
+            if not has_attribute:
+                problems.append(_error(test_name, location,
+                                       f"Did not find mandatory global {attribute_string} on {location.as_cluster_string(_CLUSTER_MAPPER)}", "Global Elements"))
+    return problems
+
+
+def _check_global_attribute_values(test_name: str, endpoint_id: int, endpoint: EndpointTlv) -> list[IdmProblem]:
+    problems = []
+    for cluster_id, cluster in endpoint.items():
+        for req_attribute in ATTRIBUTES_TO_CHECK:
+            # A missing attribute was already reported by the presence check.
+            if req_attribute.id not in cluster:
+                continue
+            for validator in req_attribute.validators:
+                try:
+                    validator(cluster[req_attribute.id])
+                except ValueError as e:
+                    location = AttributePathLocation(endpoint_id, cluster_id, req_attribute.id)
+                    problems.append(_error(test_name, location,
+                                           f"Failed validation of value on {location.as_string(_CLUSTER_MAPPER)}: {str(e)}", "Global Elements"))
+    return problems
+
+
+def _check_attribute_list_matches(test_name: str, endpoint_id: int, endpoint: EndpointTlv) -> list[IdmProblem]:
+    problems: list[IdmProblem] = []
+    for cluster_id, cluster in endpoint.items():
+        attribute_list = cluster[GlobalAttributeIds.ATTRIBUTE_LIST_ID]
+        for attribute_id in attribute_list:
+            location = AttributePathLocation(endpoint_id, cluster_id, attribute_id)
+            has_attribute = attribute_id in cluster
+
+            attribute_string = _CLUSTER_MAPPER.get_attribute_string(cluster_id, attribute_id)
+            LOGGER.debug(
+                f"Checking presence of claimed supported {attribute_string} on {location.as_cluster_string(_CLUSTER_MAPPER)}: {'found' if has_attribute else 'not_found'}")
+
+            if not has_attribute:
+                problems.append(UnreportedListedAttribute(
+                    location, f"Did not find {attribute_string} on {location.as_cluster_string(_CLUSTER_MAPPER)} when it was claimed in AttributeList ({attribute_list})"))
+                continue
+
+            attribute_value = cluster[attribute_id]
+            if isinstance(attribute_value, ValueDecodeFailure) and cluster_id != Clusters.Objects.UnitTesting.id:
+                problems.append(_error(test_name, location,
+                                       f"Found a failure to read/decode {attribute_string} on {location.as_cluster_string(_CLUSTER_MAPPER)} when it was claimed as supported in AttributeList ({attribute_list}): {str(attribute_value)}", "AttributeList Attribute"))
+        for attribute_id in cluster:
+            if attribute_id not in attribute_list:
+                attribute_string = _CLUSTER_MAPPER.get_attribute_string(cluster_id, attribute_id)
+                location = AttributePathLocation(endpoint_id, cluster_id, attribute_id)
+                problems.append(_error(test_name, location,
+                                       f'Found attribute {attribute_string} on {location.as_cluster_string(_CLUSTER_MAPPER)} not listed in attribute list', "AttributeList Attribute"))
+    return problems
+
+
+def _check_global_attribute_ids(test_name: str, endpoint_id: int, endpoint: EndpointTlv) -> list[IdmProblem]:
+    # Only the mandatory globals are allowed, and the event list because it's not disallowed
+    allowed_globals = [a.id for a in ATTRIBUTES_TO_CHECK] + [_EVENT_LIST_ID]
+    problems = []
+    for cluster_id, cluster in endpoint.items():
+        globals = [a for a in cluster[GlobalAttributeIds.ATTRIBUTE_LIST_ID] if a >= _GLOBAL_RANGE_MIN and a < _MEI_RANGE_MIN]
+        for unexpected in sorted(set(globals) - set(allowed_globals)):
+            location = AttributePathLocation(endpoint_id=endpoint_id, cluster_id=cluster_id, attribute_id=unexpected)
+            problems.append(_error(test_name, location,
+                                   f"Unexpected global attribute {unexpected} in cluster {cluster_id}", "Global elements"))
+    return problems
+
+
+def _check_standard_attribute_ids(test_name: str, endpoint_id: int, endpoint: EndpointTlv) -> list[IdmProblem]:
+    problems = []
+    for cluster_id, cluster in endpoint.items():
+        if cluster_id not in matter.clusters.ClusterObjects.ALL_ATTRIBUTES:
+            # Skip clusters that are not part of the standard generated corpus (e.g. MS clusters)
+            continue
+        standard_attributes = [a for a in cluster[GlobalAttributeIds.ATTRIBUTE_LIST_ID] if a <= _ATTRIBUTE_STANDARD_RANGE_MAX]
+        allowed_standard_attributes = matter.clusters.ClusterObjects.ALL_ATTRIBUTES[cluster_id]
+        for unexpected in sorted(set(standard_attributes) - set(allowed_standard_attributes)):
+            location = AttributePathLocation(endpoint_id=endpoint_id, cluster_id=cluster_id, attribute_id=unexpected)
+            problems.append(_error(test_name, location,
+                                   f"Unexpected standard attribute {unexpected} in cluster {cluster_id}", f"Cluster {cluster_id}"))
+    return problems
+
+
+def _check_undefined_attribute_range(test_name: str, endpoint_id: int, endpoint: EndpointTlv) -> list[IdmProblem]:
+    # This is de-facto already covered by the standard attribute check, assuming the spec hasn't defined any values
+    # in this range, but we should make sure
+    problems = []
+    for cluster_id, cluster in endpoint.items():
+        bad_range_values = [a for a in cluster[GlobalAttributeIds.ATTRIBUTE_LIST_ID] if a >
+                            _ATTRIBUTE_STANDARD_RANGE_MAX and a < _GLOBAL_RANGE_MIN]
+        for bad in bad_range_values:
+            location = AttributePathLocation(endpoint_id=endpoint_id, cluster_id=cluster_id, attribute_id=bad)
+            problems.append(_error(test_name, location, f"Attribute in undefined range {bad} in cluster {cluster_id}",
+                                   f"Cluster {cluster_id}"))
+    return problems
+
+
+def _check_standard_command_ids(test_name: str, endpoint_id: int, endpoint: EndpointTlv) -> list[IdmProblem]:
+    # Command lists only have a scoped range, so we only need to check for known command ids, no global range check
+    problems = []
+    for cluster_id, cluster in endpoint.items():
+        if cluster_id not in matter.clusters.ClusterObjects.ALL_CLUSTERS:
+            continue
+        standard_accepted_commands = [
+            a for a in cluster[GlobalAttributeIds.ACCEPTED_COMMAND_LIST_ID] if a <= _COMMAND_STANDARD_RANGE_MAX]
+        standard_generated_commands = [
+            a for a in cluster[GlobalAttributeIds.GENERATED_COMMAND_LIST_ID] if a <= _COMMAND_STANDARD_RANGE_MAX]
+        allowed_accepted_commands = list(matter.clusters.ClusterObjects.ALL_ACCEPTED_COMMANDS.get(cluster_id, []))
+        allowed_generated_commands = list(matter.clusters.ClusterObjects.ALL_GENERATED_COMMANDS.get(cluster_id, []))
+
+        # Compare the set of commands in the standard range that the DUT says it accepts vs. the commands we know about.
+        for unexpected in sorted(set(standard_accepted_commands) - set(allowed_accepted_commands)):
+            location = CommandPathLocation(endpoint_id=endpoint_id, cluster_id=cluster_id, command_id=unexpected)
+            problems.append(_error(
+                test_name, location, f'Unexpected accepted command {unexpected} in cluster {cluster_id} allowed: {allowed_accepted_commands} listed: {standard_accepted_commands}', f'Cluster {cluster_id}'))
+
+        for unexpected in sorted(set(standard_generated_commands) - set(allowed_generated_commands)):
+            location = CommandPathLocation(endpoint_id=endpoint_id, cluster_id=cluster_id, command_id=unexpected)
+            problems.append(_error(
+                test_name, location, f'Unexpected generated command {unexpected} in cluster {cluster_id} allowed: {allowed_generated_commands} listed: {standard_generated_commands}', f'Cluster {cluster_id}'))
+    return problems
+
+
+def _check_element_id_prefixes(test_name: str, endpoint_id: int, endpoint: EndpointTlv, bad_prefix_min: int) -> list[IdmProblem]:
+    problems = []
+    for cluster_id, cluster in endpoint.items():
+        attr_prefixes = [a & 0xFFFF_0000 for a in cluster[GlobalAttributeIds.ATTRIBUTE_LIST_ID]]
+        cmd_values = cluster[GlobalAttributeIds.ACCEPTED_COMMAND_LIST_ID] + cluster[GlobalAttributeIds.GENERATED_COMMAND_LIST_ID]
+        cmd_prefixes = [a & 0xFFFF_0000 for a in cmd_values]
+        for bad_attrib_id in [a for a in attr_prefixes if a >= bad_prefix_min]:
+            location = AttributePathLocation(endpoint_id=endpoint_id, cluster_id=cluster_id, attribute_id=bad_attrib_id)
+            vendor_id = get_vendor_id(bad_attrib_id)
+            problems.append(_error(
+                test_name, location, f'Attribute 0x{bad_attrib_id:08x} with bad prefix 0x{vendor_id:04x} in cluster 0x{cluster_id:08x}' + (' (Test Vendor)' if attribute_id_type(bad_attrib_id) == AttributeIdType.kTest else ''), 'Manufacturer Extensible Identifier (MEI)'))
+        for bad_cmd_id in [a for a in cmd_prefixes if a >= bad_prefix_min]:
+            location = CommandPathLocation(endpoint_id=endpoint_id, cluster_id=cluster_id, command_id=bad_cmd_id)
+            vendor_id = get_vendor_id(bad_cmd_id)
+            problems.append(_error(
+                test_name, location, f'Command 0x{bad_cmd_id:08x} with bad prefix 0x{vendor_id:04x} in cluster 0x{cluster_id:08x}' + (' (Test Vendor)' if command_id_type(bad_cmd_id) == CommandIdType.kTest else ''), 'Manufacturer Extensible Identifier (MEI)'))
+    return problems
+
+
+def _check_mei_attribute_suffixes(test_name: str, endpoint_id: int, endpoint: EndpointTlv) -> list[IdmProblem]:
+    # Any attribute in the manufacturer prefix range must be in the standard suffix range.
+    problems = []
+    for cluster_id, cluster in endpoint.items():
+        manufacturer_range_values = [a for a in cluster[GlobalAttributeIds.ATTRIBUTE_LIST_ID] if a > _MEI_RANGE_MIN]
+        for manufacturer_value in manufacturer_range_values:
+            suffix = manufacturer_value & _SUFFIX_MASK
+            location = AttributePathLocation(endpoint_id=endpoint_id, cluster_id=cluster_id, attribute_id=manufacturer_value)
+            if suffix > _ATTRIBUTE_STANDARD_RANGE_MAX and suffix < _GLOBAL_RANGE_MIN:
+                problems.append(_error(test_name, location,
+                                       f"Manufacturer attribute in undefined range {manufacturer_value} in cluster {cluster_id}",
+                                       f"Cluster {cluster_id}"))
+            elif suffix >= _GLOBAL_RANGE_MIN:
+                problems.append(_error(test_name, location,
+                                       f"Manufacturer attribute in global range {manufacturer_value} in cluster {cluster_id}",
+                                       f"Cluster {cluster_id}"))
+    return problems
+
+
+def _check_mei_command_suffixes(test_name: str, endpoint_id: int, endpoint: EndpointTlv) -> list[IdmProblem]:
+    problems = []
+    for cluster_id, cluster in endpoint.items():
+        accepted_manufacturer_range_values = [
+            a for a in cluster[GlobalAttributeIds.ACCEPTED_COMMAND_LIST_ID] if a > _MEI_RANGE_MIN]
+        generated_manufacturer_range_values = [
+            a for a in cluster[GlobalAttributeIds.GENERATED_COMMAND_LIST_ID] if a > _MEI_RANGE_MIN]
+        for manufacturer_value in accepted_manufacturer_range_values + generated_manufacturer_range_values:
+            suffix = manufacturer_value & _SUFFIX_MASK
+            location = CommandPathLocation(endpoint_id=endpoint_id, cluster_id=cluster_id, command_id=manufacturer_value)
+            if suffix > _COMMAND_STANDARD_RANGE_MAX:
+                problems.append(_error(
+                    test_name, location, f'Manufacturer command in the undefined suffix range {manufacturer_value} in cluster {cluster_id}', 'Manufacturer Extensible Identifier (MEI)'))
+    return problems
+
+
+def _check_cluster_id_prefixes(test_name: str, endpoint_id: int, endpoint: EndpointTlv, bad_prefix_min: int) -> list[IdmProblem]:
+    problems = []
+    cluster_prefixes = [a & 0xFFFF_0000 for a in endpoint]
+    for bad_cluster_id in [a for a in cluster_prefixes if a >= bad_prefix_min]:
+        location = ClusterPathLocation(endpoint_id=endpoint_id, cluster_id=bad_cluster_id)
+        vendor_id = get_vendor_id(bad_cluster_id)
+        problems.append(_error(
+            test_name, location, f'Cluster 0x{bad_cluster_id:08x} with bad prefix 0x{vendor_id:04x}' + (' (Test Vendor)' if cluster_id_type(bad_cluster_id) == ClusterIdType.kTest else ''), 'Manufacturer Extensible Identifier (MEI)'))
+    return problems
+
+
+def _check_standard_cluster_ids(test_name: str, endpoint_id: int, endpoint: EndpointTlv) -> list[IdmProblem]:
+    standard_clusters = [a for a in endpoint if a < _MEI_RANGE_MIN]
+    unknown_clusters = sorted(set(standard_clusters) - set(matter.clusters.ClusterObjects.ALL_CLUSTERS))
+    return [_error(test_name, ClusterPathLocation(endpoint_id=endpoint_id, cluster_id=bad),
+                   f'Unknown cluster ID in the standard range {bad}', 'Manufacturer Extensible Identifier (MEI)')
+            for bad in unknown_clusters]
+
+
+def _check_mei_cluster_suffixes(test_name: str, endpoint_id: int, endpoint: EndpointTlv) -> list[IdmProblem]:
+    mei_clusters = [a for a in endpoint if a >= _MEI_RANGE_MIN]
+    bad_clusters = [a for a in mei_clusters if ((a & 0x0000_FFFF) < 0xFC00) or ((a & 0x0000_FFFF) > 0xFFFE)]
+    return [_error(test_name, ClusterPathLocation(endpoint_id=endpoint_id, cluster_id=bad),
+                   f'MEI cluster with an out of range suffix {bad}', 'Manufacturer Extensible Identifier (MEI)')
+            for bad in bad_clusters]
+
+
+def _check_feature_maps(test_name: str, endpoint_id: int, endpoint: EndpointTlv) -> list[IdmProblem]:
+    problems = []
+    for cluster_id, cluster in endpoint.items():
+        if cluster_id not in matter.clusters.ClusterObjects.ALL_CLUSTERS:
+            continue
+        feature_map = cluster[GlobalAttributeIds.FEATURE_MAP_ID]
+        feature_mask = 0
+        try:
+            feature_map_enum = matter.clusters.ClusterObjects.ALL_CLUSTERS[cluster_id].Bitmaps.Feature
+            for f in feature_map_enum:
+                feature_mask = feature_mask | f
+        except AttributeError:
+            # If there is no feature bitmap, feature mask 0 is correct
+            pass
+        feature_map_extras = feature_map & ~feature_mask
+        if feature_map_extras != 0:
+            location = ClusterPathLocation(endpoint_id=endpoint_id, cluster_id=cluster_id)
+            problems.append(_error(test_name, location, f'Standard cluster {cluster_id} with unkonwn feature {feature_map_extras:02x}'))
+    return problems
+
+
+# The checks of TC-IDM-10.1 in the order the test runs them, with the step they belong to.
+IDM_10_1_CHECKS: list[tuple[int, str]] = [
+    (2, "global_attributes_present"),
+    (3, "global_attribute_values"),
+    (4, "attribute_list_matches"),
+    (5, "global_attribute_ids"),
+    (5, "standard_attribute_ids"),
+    (5, "undefined_attribute_range"),
+    (5, "standard_command_ids"),
+    (6, "element_id_prefixes"),
+    (7, "mei_attribute_suffixes"),
+    (7, "mei_command_suffixes"),
+    (8, "cluster_id_prefixes"),
+    (9, "standard_cluster_ids"),
+    (10, "mei_cluster_suffixes"),
+    (11, "feature_maps"),
+]
+
+
+def idm_10_1_endpoint_problems(endpoint_id: int, endpoint: EndpointTlv, test_name: str,
+                               bad_prefix_min: int) -> dict[str, list[IdmProblem]]:
+    """Runs the TC-IDM-10.1 checks on one endpoint and returns the problems found, keyed by check name.
+
+    The attribute list check is only run if the global attributes of the endpoint are all present and valid,
+    since it relies on the AttributeList. The other checks of the global attribute lists skip the clusters
+    that are missing one of them, which is reported by the global_attributes_present check. Attributes
+    listed but not reported are returned as `UnreportedListedAttribute` for the test to confirm.
+    """
+    results: dict[str, list[IdmProblem]] = {
+        "global_attributes_present": _check_global_attributes_present(test_name, endpoint_id, endpoint),
+        "global_attribute_values": _check_global_attribute_values(test_name, endpoint_id, endpoint),
+    }
+    globals_ok = not results["global_attributes_present"] and not results["global_attribute_values"]
+    results["attribute_list_matches"] = _check_attribute_list_matches(test_name, endpoint_id, endpoint) if globals_ok else []
+
+    missing_globals = {problem.location.cluster_id for problem in results["global_attributes_present"]}
+    complete_clusters = {cluster_id: cluster for cluster_id, cluster in endpoint.items() if cluster_id not in missing_globals}
+    results["global_attribute_ids"] = _check_global_attribute_ids(test_name, endpoint_id, complete_clusters)
+    results["standard_attribute_ids"] = _check_standard_attribute_ids(test_name, endpoint_id, complete_clusters)
+    results["undefined_attribute_range"] = _check_undefined_attribute_range(test_name, endpoint_id, complete_clusters)
+    results["standard_command_ids"] = _check_standard_command_ids(test_name, endpoint_id, complete_clusters)
+    results["element_id_prefixes"] = _check_element_id_prefixes(test_name, endpoint_id, complete_clusters, bad_prefix_min)
+    results["mei_attribute_suffixes"] = _check_mei_attribute_suffixes(test_name, endpoint_id, complete_clusters)
+    results["mei_command_suffixes"] = _check_mei_command_suffixes(test_name, endpoint_id, complete_clusters)
+    results["cluster_id_prefixes"] = _check_cluster_id_prefixes(test_name, endpoint_id, endpoint, bad_prefix_min)
+    results["standard_cluster_ids"] = _check_standard_cluster_ids(test_name, endpoint_id, endpoint)
+    results["mei_cluster_suffixes"] = _check_mei_cluster_suffixes(test_name, endpoint_id, endpoint)
+    results["feature_maps"] = _check_feature_maps(test_name, endpoint_id, complete_clusters)
+    return results
+
+
+def sm_1_2_endpoint_problems(endpoint_id: int, endpoint: EndpointTlv, test_name: str) -> list[ProblemNotice]:
+    """Checks that the Descriptor PartsList of the endpoint does not include the endpoint itself (TC-SM-1.2 step 3)."""
+    if endpoint_id in endpoint[_DESCRIPTOR_ID][_PARTS_LIST_ID]:
+        location = AttributePathLocation(endpoint_id=endpoint_id, cluster_id=_DESCRIPTOR_ID, attribute_id=_PARTS_LIST_ID)
+        return [_error(test_name, location, f"Endpoint {endpoint_id} parts list includes itself", "PartsList Attribute")]
+    return []
+
+
+@dataclass
+class PowerSourceEndpoint:
+    """Result of the per-endpoint checks of TC-PS-3.1 on an endpoint with a Power Source cluster."""
+    # Problems with the EndpointList itself (step 2) and with the Descriptor cluster of the endpoint (step 3)
+    endpoint_list_problems: list[ProblemNotice] = field(default_factory=list)
+    descriptor_problems: list[ProblemNotice] = field(default_factory=list)
+    endpoint_list: Optional[list[int]] = None
+    # Only set if the endpoint has an EndpointList and a valid Descriptor cluster
+    device_types: Optional[list[int]] = None
+    parts_list: Optional[list[int]] = None
+
+
+def ps_3_1_endpoint_problems(endpoint_id: int, endpoint: EndpointTlv, test_name: str,
+                             endpoint_ids: set[int]) -> Optional[PowerSourceEndpoint]:
+    """Checks the Power Source EndpointList of the endpoint (TC-PS-3.1 step 2), and collects the Descriptor
+    content needed to check the bridged node endpoint lists.
+
+    Returns None if the endpoint has no Power Source cluster.
+    """
+    if _POWER_SOURCE_ID not in endpoint:
+        return None
+    power_source = endpoint[_POWER_SOURCE_ID]
+    result = PowerSourceEndpoint(endpoint_list=power_source.get(_ENDPOINT_LIST_ID))
+    attribute_string = _CLUSTER_MAPPER.get_attribute_string(_POWER_SOURCE_ID, _ENDPOINT_LIST_ID)
+    location = AttributePathLocation(endpoint_id=endpoint_id, cluster_id=_POWER_SOURCE_ID, attribute_id=_ENDPOINT_LIST_ID)
+    revision_location = AttributePathLocation(endpoint_id=endpoint_id, cluster_id=_POWER_SOURCE_ID,
+                                              attribute_id=GlobalAttributeIds.CLUSTER_REVISION_ID)
+    cluster_revision = power_source.get(GlobalAttributeIds.CLUSTER_REVISION_ID)
+    if cluster_revision is None:
+        result.endpoint_list_problems.append(_error(
+            test_name, revision_location, f'Did not find Cluster revision on {revision_location.as_cluster_string(_CLUSTER_MAPPER)}', 'Global attributes'))
+    elif cluster_revision < 2:
+        result.endpoint_list_problems.append(ProblemNotice(
+            test_name, revision_location, ProblemSeverity.NOTE, 'Power source ClusterRevision is < 2, skipping remainder of test for this endpoint'))
+    elif result.endpoint_list is None:
+        result.endpoint_list_problems.append(_error(
+            test_name, location, f'Did not find {attribute_string} on {location.as_cluster_string(_CLUSTER_MAPPER)}', "EndpointList Attribute"))
+    elif set(result.endpoint_list) - endpoint_ids:
+        result.endpoint_list_problems.append(_error(test_name, location, f'{attribute_string} lists a non-existent endpoint',
+                                                    "EndpointList Attribute"))
+
+    if result.endpoint_list is None:
+        return result
+    descriptor = endpoint.get(_DESCRIPTOR_ID)
+    problem = None
+    if descriptor is None:
+        problem = "Missing cluster descriptor"
+    elif _PARTS_LIST_ID not in descriptor:
+        problem = "Missing PartList in descriptor cluster"
+    elif _DEVICE_TYPE_LIST_ID not in descriptor:
+        problem = "Missing DeviceTypeList in descriptor cluster"
+    if problem:
+        descriptor_location = AttributePathLocation(endpoint_id=endpoint_id, cluster_id=_DESCRIPTOR_ID, attribute_id=_PARTS_LIST_ID)
+        result.descriptor_problems.append(_error(test_name, descriptor_location, problem, "PartsList Attribute"))
+        return result
+    # DeviceTypeList entries are DeviceTypeStruct, whose field 0 is the device type
+    result.device_types = [i[0] for i in descriptor[_DEVICE_TYPE_LIST_ID]]
+    result.parts_list = list(descriptor[_PARTS_LIST_ID])
+    return result
+
+
+def run_per_endpoint(check: Callable[..., Any], endpoints_tlv: dict[int, EndpointTlv], workers: int = 1, *args) -> dict[int, Any]:
+    """Runs `check(endpoint_id, endpoint, *args)` on every endpoint and returns the results keyed by endpoint ID.
+
+    With more than one worker, the endpoints are checked in a process pool. Results are always returned in
+    the order of `endpoints_tlv`, so the problems merged from them do not depend on the number of workers.
+    """
+    endpoint_ids = list(endpoints_tlv)
+    if workers <= 1 or len(endpoint_ids) <= 1:
+        return {endpoint_id: check(endpoint_id, endpoints_tlv[endpoint_id], *args) for endpoint_id in endpoint_ids}
+
+    repeated_args = [[arg] * len(endpoint_ids) for arg in args]
+    chunksize = max(1, len(endpoint_ids) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=min(workers, len(endpoint_ids))) as executor:
+        results = executor.map(check, endpoint_ids, [endpoints_tlv[e] for e in endpoint_ids], *repeated_args, chunksize=chunksize)
+        return dict(zip(endpoint_ids, results))
+
+
+def merge_problems(results: dict[int, dict[str, list]], check_name: str) -> list:
+    """Returns the problems found by one check on all the endpoints, in endpoint order."""
+    return [problem for endpoint_results in results.values() for problem in endpoint_results[check_name]]
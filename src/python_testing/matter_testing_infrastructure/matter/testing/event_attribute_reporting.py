@@ -21,9 +21,14 @@ This module provides classes to manage and validate subscription-based event and
 Classes:
     EventSubscriptionHandler: Handles subscription to events.
     AttributeSubscriptionHandler: Manages subscriptions to specific attributes.
+    AsyncEventSubscriptionHandler: asyncio-native variant of EventSubscriptionHandler.
+    AsyncAttributeSubscriptionHandler: asyncio-native variant of AttributeSubscriptionHandler.
 
 Both classes allow tests to start and manage subscriptions, queue received updates asynchronously and
 block until epected reports are received or fail on timeouts
+
+The asyncio-native variants hand reports over to the event loop instead of a thread queue, so async tests
+can await reports without blocking the event loop (and every other subscription) while they wait.
 """
 
 import asyncio
@@ -32,8 +37,10 @@ import logging
 import queue
 import threading
 import time
+from abc import ABC, abstractmethod
+from collections import defaultdict
 from datetime import datetime, timezone
-from typing import Any, Iterable, Optional
+from typing import Any, Callable, Iterable, Optional
 
 from mobly import asserts
 
@@ -45,34 +52,75 @@ from matter.testing.matter_testing import AttributeMatcher, AttributeValue
 LOGGER = logging.getLogger(__name__)
 
 
-class EventSubscriptionHandler:
-    """
-    Handles subscription-based event reporting. It sets up and manages event subscriptions for a specific cluster or event ID,
-    captures incoming event reports through a callback and stores them for validation and processing.
+def _is_expected_event(event_result: EventReadResult, expected_cluster_id: int, expected_event_id: Optional[int]) -> bool:
+    if event_result.Status != Status.Success:
+        return False
 
-    It supports two usage modes:
-        1. Cluster mode: Pass a 'ClusterObjects.Cluster' to subscribe to all events in a cluster.
-        2. Event ID mode: Pass 'expected_cluster_id' and 'expected_event_id' to subscribe to a specific event.
+    header = event_result.Header
+    if header.ClusterId != expected_cluster_id:
+        return False
 
-    Attributes:
-        _expected_cluster: The cluster object to match.
-        _expected_cluster_id: The cluster ID to match against incoming event headers.
-        _expected_event_id: The specific event ID to match.
-        _q: Internal queue that stores matching EventReadResult objects.
+    return expected_event_id is None or header.EventId == expected_event_id
+
+
+def _is_expected_attribute_report(path: TypedAttributePath, expected_cluster: ClusterObjects.Cluster,
+                                  expected_attribute: Optional[ClusterObjects.ClusterAttributeDescriptor]) -> bool:
+    if expected_attribute:
+        return path.AttributeType == expected_attribute
+    if expected_cluster:
+        return path.ClusterType == expected_cluster
+    return False
+
+
+def _drain_queue(q) -> Optional[Any]:
+    """Empties a thread or asyncio queue, returning the last (newest) item only."""
+    last_item: Optional[Any] = None
+    while True:
+        try:
+            last_item = q.get_nowait()
+        except (queue.Empty, asyncio.QueueEmpty):
+            return last_item
+
+
+def _last_report_value(reports: dict[Any, list[AttributeValue]], expected: AttributeValue) -> Optional[Any]:
+    """Returns the last value reported for the attribute and endpoint of `expected`, or None if there is none."""
+    last_value = None
+    for report in reports.get(expected.attribute, []):
+        if report.endpoint_id == expected.endpoint_id:
+            last_value = report.value
+    return last_value
+
+
+class _EventSubscriptionHandlerBase(ABC):
+    """
+    Subscription and filtering of event reports, shared by EventSubscriptionHandler and AsyncEventSubscriptionHandler.
+
+    Subclasses provide the queue the matching events are put in and the way to wait for them.
     """
 
+    _q: Any
+
     def __init__(self, *, expected_cluster: Optional[ClusterObjects.Cluster] = None, expected_cluster_id: Optional[int] = None, expected_event_id: Optional[int] = None):
         is_cluster_mode = expected_cluster is not None
         is_id_mode = all(x is not None for x in (expected_cluster_id, expected_event_id))
 
         if not (is_cluster_mode ^ is_id_mode):
-            raise ValueError("Failed argument inputs in EventSubscriptionHandler. You should use Cluster or ClusterId and EventId")
+            raise ValueError(
+                f"Failed argument inputs in {type(self).__name__}. You should use Cluster or ClusterId and EventId")
 
         self._expected_cluster = expected_cluster
         self._expected_cluster_id = expected_cluster_id if expected_cluster_id is not None else expected_cluster.id
         self._expected_event_id = expected_event_id
         self._subscription = None
-        self._q: queue.Queue = queue.Queue()
+        self._q = self._new_queue()
+
+    @abstractmethod
+    def _new_queue(self):
+        """Returns the queue the matching events are put in."""
+
+    @abstractmethod
+    def _put(self, event_result: EventReadResult) -> None:
+        """Queues a matching event, called on the CHIP thread."""
 
     def __call__(self, event_result: EventReadResult, transaction: SubscriptionTransaction):
         """
@@ -86,18 +134,11 @@ class EventSubscriptionHandler:
             If an expected_event_id is set, only events with that ID will be accepted.
         """
 
-        if event_result.Status != Status.Success:
-            return
-
-        header = event_result.Header
-        if header.ClusterId != self._expected_cluster_id:
+        if not _is_expected_event(event_result, self._expected_cluster_id, self._expected_event_id):
             return
 
-        if self._expected_event_id is not None and header.EventId != self._expected_event_id:
-            return
-
-        LOGGER.info(f"[EventSubscriptionHandler] Received event: {header}")
-        self._q.put(event_result)
+        LOGGER.info(f"[{type(self).__name__}] Received event: {event_result.Header}")
+        self._put(event_result)
 
     async def start(self, dev_ctrl, node_id: int, endpoint: int, fabric_filtered: bool = False, min_interval_sec: int = 0, max_interval_sec: int = 30) -> Any:
         """This starts a subscription for events on the specified node_id and endpoint. The cluster is specified when the class instance is created."""
@@ -109,6 +150,62 @@ class EventSubscriptionHandler:
         self._subscription.SetEventUpdateCallback(self.__call__)
         return self._subscription
 
+    @staticmethod
+    def _check_event_report(res: EventReadResult, expected_event: ClusterObjects.ClusterEvent) -> Any:
+        asserts.assert_equal(res.Header.ClusterId, expected_event.cluster_id, "Expected cluster ID not found in event report")
+        asserts.assert_equal(res.Header.EventId, expected_event.event_id, "Expected event ID not found in event report")
+        LOGGER.info(f"Successfully waited for {expected_event}")
+        return res.Data
+
+    @staticmethod
+    def _is_event_type(event: EventReadResult, event_type: ClusterObjects.ClusterEvent) -> bool:
+        if event.Header.EventId == event_type.event_id:
+            LOGGER.info(f"Event {event_type.__name__} received: {event}")
+            return True
+        LOGGER.info(f"Received other event: {event.Header.EventId}, ignoring and waiting for {event_type.__name__}.")
+        return False
+
+    def get_last_event(self) -> Optional[Any]:
+        """Flush entire queue, returning last (newest) event only."""
+        return _drain_queue(self._q)
+
+    def flush_events(self) -> None:
+        """Flush entire queue, returning nothing."""
+        _ = self.get_last_event()
+        return
+
+    def reset(self) -> None:
+        """Resets state as if no events had ever been received."""
+        self.flush_events()
+
+    def get_size(self) -> int:
+        return self._q.qsize()
+
+
+class EventSubscriptionHandler(_EventSubscriptionHandlerBase):
+    """
+    Handles subscription-based event reporting. It sets up and manages event subscriptions for a specific cluster or event ID,
+    captures incoming event reports through a callback and stores them for validation and processing.
+
+    It supports two usage modes:
+        1. Cluster mode: Pass a 'ClusterObjects.Cluster' to subscribe to all events in a cluster.
+        2. Event ID mode: Pass 'expected_cluster_id' and 'expected_event_id' to subscribe to a specific event.
+
+    Attributes:
+        _expected_cluster: The cluster object to match.
+        _expected_cluster_id: The cluster ID to match against incoming event headers.
+        _expected_event_id: The specific event ID to match.
+        _q: Internal queue that stores matching EventReadResult objects.
+    """
+
+    _q: queue.Queue
+
+    def _new_queue(self) -> queue.Queue:
+        return queue.Queue()
+
+    def _put(self, event_result: EventReadResult) -> None:
+        self._q.put(event_result)
+
     def wait_for_event_report(self, expected_event: ClusterObjects.ClusterEvent, timeout_sec: float = 10.0) -> Any:
         """This function allows a test script to block waiting for the specific event to be the next event
            to arrive within a timeout (specified in seconds). It returns the event data so that the values can be checked."""
@@ -118,10 +215,7 @@ class EventSubscriptionHandler:
         except queue.Empty:
             asserts.fail("Failed to receive a report for the event {}".format(expected_event))
 
-        asserts.assert_equal(res.Header.ClusterId, expected_event.cluster_id, "Expected cluster ID not found in event report")
-        asserts.assert_equal(res.Header.EventId, expected_event.event_id, "Expected event ID not found in event report")
-        LOGGER.info(f"Successfully waited for {expected_event}")
-        return res.Data
+        return self._check_event_report(res, expected_event)
 
     def wait_for_event_expect_no_report(self, timeout_sec: float = 10.0):
         """This function returns if an event does not arrive within the timeout specified in seconds.
@@ -154,75 +248,56 @@ class EventSubscriptionHandler:
                 event = event_queue.get(block=True, timeout=remaining)
             except queue.Empty:
                 asserts.fail(f"Timeout waiting for event {event_type}.")
-            if event.Header.EventId == event_type.event_id:
-                LOGGER.info(f"Event {event_type.__name__} received: {event}")
+            if self._is_event_type(event, event_type):
                 return event.Data
-            LOGGER.info(f"Received other event: {event.Header.EventId}, ignoring and waiting for {event_type.__name__}.")
-
-    def get_last_event(self) -> Optional[Any]:
-        """Flush entire queue, returning last (newest) event only."""
-        last_event: Optional[Any] = None
-        while True:
-            try:
-                last_event = self._q.get(block=False)
-            except queue.Empty:
-                return last_event
-
-    def flush_events(self) -> None:
-        """Flush entire queue, returning nothing."""
-        _ = self.get_last_event()
-        return
-
-    def reset(self) -> None:
-        """Resets state as if no events had ever been received."""
-        self.flush_events()
 
     @property
     def event_queue(self) -> queue.Queue:
         return self._q
 
-    def get_size(self) -> int:
-        return self._q.qsize()
-
     def get_event_from_queue(self, block: bool, timeout: int):
         return self._q.get(block, timeout)
 
 
-class AttributeSubscriptionHandler:
+class _AttributeSubscriptionHandlerBase(ABC):
     """
-    Callback class to handle attribute subscription reports. This class manages the reception. filtering and queuing of attribute update reports.
+    Subscription, filtering and history of attribute reports, shared by AttributeSubscriptionHandler and
+    AsyncAttributeSubscriptionHandler.
 
-    It provides methods to wait for specific updates, validate expected final values and track changes for verification.
-
-    Attributes;
-        _expected_cluster: The cluster type to subscribe to.
-        _expected_attribute: The attribute within the cluster expected to receive updates.
-        _q: Queue storing AttributeValue instances for received updates.
-        _attribute_reports: Dictionary holding history of all received reports by attribute.
-        _attribute_report_counts: Dictionary counting the number of reports received per attribute.
+    Subclasses provide the queue the reports are put in and the way to wait for them.
     """
 
+    _q: Any
+
     def __init__(self, expected_cluster: ClusterObjects.Cluster = None, expected_attribute: ClusterObjects.ClusterAttributeDescriptor = None):
 
         if expected_cluster is None:
-            raise ValueError("Missing argument. Expected Cluster attribute is missing in AttributeSubscriptionHandler constructor")
+            raise ValueError(f"Missing argument. Expected Cluster attribute is missing in {type(self).__name__} constructor")
 
         self._expected_cluster = expected_cluster
         self._expected_attribute = expected_attribute
         self._subscription = None
-        self._q = queue.Queue()
+        self._q = self._new_queue()
         self._endpoint_id = 0
-        self._attribute_report_counts = None
-        self._attribute_reports = None
+        self._attribute_report_counts: dict[Any, int] = {}
+        self._attribute_reports: dict[Any, list[AttributeValue]] = {}
         self._lock = threading.Lock()
         self.reset()
 
+    @abstractmethod
+    def _new_queue(self):
+        """Returns the queue the reports are put in."""
+
+    @abstractmethod
+    def _on_report(self, report: AttributeValue) -> None:
+        """Queues a report and records it in the history, called on the CHIP thread."""
+
     def reset(self):
         with self._lock:
             self._attribute_report_counts = {}
             attrs = [cls for name, cls in inspect.getmembers(self._expected_cluster.Attributes) if inspect.isclass(
                 cls) and issubclass(cls, ClusterObjects.ClusterAttributeDescriptor)]
-            self._attribute_reports: dict[Any, AttributeValue] = {}
+            self._attribute_reports = {}
             if self._expected_attribute is not None:
                 attrs = [self._expected_attribute]
             for a in attrs:
@@ -268,24 +343,90 @@ class AttributeSubscriptionHandler:
             transaction (SubscriptionTransaction): Provides access to the actual reported value.
         """
 
-        valid_report = False
-        if self._expected_attribute:
-            if path.AttributeType == self._expected_attribute:
-                valid_report = True
-        elif self._expected_cluster:
-            if path.ClusterType == self._expected_cluster:
-                valid_report = True
-
-        if valid_report:
+        if _is_expected_attribute_report(path, self._expected_cluster, self._expected_attribute):
             data = transaction.GetAttribute(path)
             value = AttributeValue(endpoint_id=path.Path.EndpointId, attribute=path.AttributeType,
                                    value=data, timestamp_utc=datetime.now(timezone.utc))
-            LOGGER.info(f"[AttributeSubscriptionHandler] Received attribute report: {path.AttributeType} = {data}")
-            self._q.put(value)
-            if self._lock:
-                with self._lock:
-                    self._attribute_report_counts[path.AttributeType] += 1
-                    self._attribute_reports[path.AttributeType].append(value)
+            LOGGER.info(f"[{type(self).__name__}] Received attribute report: {path.AttributeType} = {data}")
+            self._on_report(value)
+
+    def _record_report(self, report: AttributeValue) -> None:
+        """Adds a report to the history of its attribute."""
+        with self._lock:
+            self._attribute_report_counts[report.attribute] = self._attribute_report_counts.get(report.attribute, 0) + 1
+            self._attribute_reports.setdefault(report.attribute, []).append(report)
+
+    def _check_attribute_report(self, item: AttributeValue) -> Any:
+        LOGGER.info(
+            f"[{type(self).__name__}] Got attribute subscription report. Attribute {item.attribute}. Updated value: {item.value}")
+        asserts.assert_equal(item.attribute, self._expected_attribute,
+                             f"[{type(self).__name__}] Received incorrect report. Expected: {self._expected_attribute}, received: {item.attribute}")
+        return item.value
+
+    def _check_sequence_report(self, item: AttributeValue, attribute: TypedAttributePath, sequence: list[Any], actual_values: list[Any]) -> bool:
+        """
+        Checks that a report of `attribute` on the subscribed endpoint has the next value of `sequence`, recording it
+        in `actual_values`. Reports of other attributes or endpoints are ignored.
+
+        Returns True once the whole sequence was reported.
+        """
+        # Track arrival of all values for the given attribute.
+        if item.endpoint_id != self._endpoint_id or item.attribute != attribute:
+            return False
+
+        actual_values.append(item.value)
+        asserts.assert_equal(item.value, sequence[len(actual_values) - 1],
+                             msg=f"Did not get expected attribute value in correct sequence. Sequence so far: {actual_values}")
+        LOGGER.info(f"Got expected attribute change {len(actual_values)}/{len(sequence)} for attribute {attribute}")
+
+        # We are done waiting when we have accumulated all results.
+        if len(actual_values) == len(sequence):
+            LOGGER.info("Got all attribute changes, done waiting.")
+            return True
+        return False
+
+    @property
+    def attribute_report_counts(self) -> dict[ClusterObjects.ClusterAttributeDescriptor, int]:
+        with self._lock:
+            return self._attribute_report_counts
+
+    @property
+    def attribute_reports(self) -> dict[ClusterObjects.ClusterAttributeDescriptor, list[AttributeValue]]:
+        with self._lock:
+            return self._attribute_reports.copy()
+
+    def get_last_report(self) -> Optional[Any]:
+        """Flush entire queue, returning last (newest) report only."""
+        return _drain_queue(self._q)
+
+    def flush_reports(self) -> None:
+        """Flush entire queue, returning nothing."""
+        _ = self.get_last_report()
+        return
+
+
+class AttributeSubscriptionHandler(_AttributeSubscriptionHandlerBase):
+    """
+    Callback class to handle attribute subscription reports. This class manages the reception. filtering and queuing of attribute update reports.
+
+    It provides methods to wait for specific updates, validate expected final values and track changes for verification.
+
+    Attributes;
+        _expected_cluster: The cluster type to subscribe to.
+        _expected_attribute: The attribute within the cluster expected to receive updates.
+        _q: Queue storing AttributeValue instances for received updates.
+        _attribute_reports: Dictionary holding history of all received reports by attribute.
+        _attribute_report_counts: Dictionary counting the number of reports received per attribute.
+    """
+
+    _q: queue.Queue
+
+    def _new_queue(self) -> queue.Queue:
+        return queue.Queue()
+
+    def _on_report(self, report: AttributeValue) -> None:
+        self._q.put(report)
+        self._record_report(report)
 
     def wait_for_attribute_report(self):
         """
@@ -296,15 +437,11 @@ class AttributeSubscriptionHandler:
 
         try:
             item = self._q.get(block=True, timeout=10)
-            attribute_value = item.value
-            LOGGER.info(
-                f"[AttributeSubscriptionHandler] Got attribute subscription report. Attribute {item.attribute}. Updated value: {attribute_value}. SubscriptionId: {item.value}")
         except queue.Empty:
             asserts.fail(
                 f"[AttributeSubscriptionHandler] Failed to receive a report for the {self._expected_attribute} attribute change")
 
-        asserts.assert_equal(item.attribute, self._expected_attribute,
-                             f"[AttributeSubscriptionHandler] Received incorrect report. Expected: {self._expected_attribute}, received: {item.attribute}")
+        return self._check_attribute_report(item)
 
     def await_all_final_values_reported(self, expected_final_values: Iterable[AttributeValue], timeout_sec: float = 1.0):
         """Expect that every `expected_final_value` report is the last value reported for the given attribute, ignoring timestamps.
@@ -330,11 +467,7 @@ class AttributeSubscriptionHandler:
 
             # Recompute all last-value matches
             for expected_idx, expected_element in enumerate(expected_final_values):
-                last_value = None
-                for report in all_reports.get(expected_element.attribute, []):
-                    if report.endpoint_id == expected_element.endpoint_id:
-                        last_value = report.value
-
+                last_value = _last_report_value(all_reports, expected_element)
                 last_report_matches[expected_idx] = (last_value is not None and last_value == expected_element.value)
 
             # Determine if all were met
@@ -421,31 +554,15 @@ class AttributeSubscriptionHandler:
         elapsed = 0.0
         time_remaining = timeout_sec
 
-        sequence_idx = 0
-        actual_values = []
+        actual_values: list[Any] = []
 
+        LOGGER.info(f"Expecting values {sequence} for attribute {attribute} on endpoint {self._endpoint_id}")
+        LOGGER.info(f"Waiting for {timeout_sec:.1f} seconds for all reports.")
         while time_remaining > 0:
-            expected_value = sequence[sequence_idx]
-            LOGGER.info(f"Expecting value {expected_value} for attribute {attribute} on endpoint {self._endpoint_id}")
-            LOGGER.info(f"Waiting for {timeout_sec:.1f} seconds for all reports.")
             try:
                 item: AttributeValue = self._q.get(block=True, timeout=time_remaining)
-
-                # Track arrival of all values for the given attribute.
-                if item.endpoint_id == self._endpoint_id and item.attribute == attribute:
-                    actual_values.append(item.value)
-
-                    if item.value == expected_value:
-                        LOGGER.info(f"Got expected attribute change {sequence_idx+1}/{len(sequence)} for attribute {attribute}")
-                        sequence_idx += 1
-                    else:
-                        asserts.assert_equal(item.value, expected_value,
-                                             msg=f"Did not get expected attribute value in correct sequence. Sequence so far: {actual_values}")
-
-                    # We are done waiting when we have accumulated all results.
-                    if sequence_idx == len(sequence):
-                        LOGGER.info("Got all attribute changes, done waiting.")
-                        return
+                if self._check_sequence_report(item, attribute, sequence, actual_values):
+                    return
             except queue.Empty:
                 # No error, we update timeouts and keep going
                 pass
@@ -459,26 +576,323 @@ class AttributeSubscriptionHandler:
     def attribute_queue(self) -> queue.Queue:
         return self._q
 
+
+def _deliver_to_loop(loop: Optional[asyncio.AbstractEventLoop], callback: Callable, *args) -> None:
+    """Runs `callback` on the event loop of the handler, from whichever thread the report arrived on."""
+    if loop is None or loop.is_closed():
+        callback(*args)
+        return
+    try:
+        running_loop = asyncio.get_running_loop()
+    except RuntimeError:
+        running_loop = None
+    if running_loop is loop:
+        callback(*args)
+    else:
+        loop.call_soon_threadsafe(callback, *args)
+
+
+class AsyncEventSubscriptionHandler(_EventSubscriptionHandlerBase):
+    """
+    asyncio-native variant of EventSubscriptionHandler.
+
+    Event reports are handed over to the event loop that started the subscription and queued in an
+    `asyncio.Queue`, so the `await_*` methods wait for events without blocking the event loop.
+
+    Attributes:
+        _expected_cluster: The cluster object to match.
+        _expected_cluster_id: The cluster ID to match against incoming event headers.
+        _expected_event_id: The specific event ID to match.
+        _q: asyncio queue that stores matching EventReadResult objects.
+        _loop: Event loop the reports are delivered to, captured when the subscription is started.
+    """
+
+    _q: asyncio.Queue
+
+    def __init__(self, *, expected_cluster: Optional[ClusterObjects.Cluster] = None, expected_cluster_id: Optional[int] = None, expected_event_id: Optional[int] = None):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        super().__init__(expected_cluster=expected_cluster, expected_cluster_id=expected_cluster_id, expected_event_id=expected_event_id)
+
+    def _new_queue(self) -> asyncio.Queue:
+        return asyncio.Queue()
+
+    def _put(self, event_result: EventReadResult) -> None:
+        # Called on the CHIP thread
+        _deliver_to_loop(self._loop, self._q.put_nowait, event_result)
+
+    async def start(self, dev_ctrl, node_id: int, endpoint: int, fabric_filtered: bool = False, min_interval_sec: int = 0, max_interval_sec: int = 30) -> Any:
+        """This starts a subscription for events on the specified node_id and endpoint. The cluster is specified when the class instance is created."""
+        self._loop = asyncio.get_running_loop()
+        return await super().start(dev_ctrl, node_id, endpoint, fabric_filtered, min_interval_sec, max_interval_sec)
+
+    async def _get(self, timeout_sec: float) -> Optional[EventReadResult]:
+        try:
+            return await asyncio.wait_for(self._q.get(), timeout=max(timeout_sec, 0))
+        except asyncio.TimeoutError:
+            return None
+
+    async def await_event_report(self, expected_event: ClusterObjects.ClusterEvent, timeout_sec: float = 10.0) -> Any:
+        """Waits for the specific event to be the next event to arrive within a timeout (specified in seconds).
+           It returns the event data so that the values can be checked."""
+        LOGGER.info(f"Waiting for {expected_event} for {timeout_sec:.1f} seconds")
+        res = await self._get(timeout_sec)
+        if res is None:
+            asserts.fail("Failed to receive a report for the event {}".format(expected_event))
+
+        return self._check_event_report(res, expected_event)
+
+    async def await_event_expect_no_report(self, timeout_sec: float = 10.0):
+        """Returns if an event does not arrive within the timeout specified in seconds.
+           If any event does arrive, an assert failure occurs."""
+        res = await self._get(timeout_sec)
+        if res is None:
+            return
+
+        asserts.fail(f"Event reported when not expected {res}")
+
+    async def await_event_type_report(self, event_type: ClusterObjects.ClusterEvent, timeout_sec: float) -> Optional[Any]:
+        """
+        Waits for a specific event type within the timeout period, ignoring events of other types.
+
+        Returns:
+            The event data (from EventReadResult.Data) when the expected event is received, or fails on timeout.
+        """
+        deadline = time.monotonic() + timeout_sec
+        while True:
+            event = await self._get(deadline - time.monotonic())
+            if event is None:
+                asserts.fail(f"Timeout waiting for event {event_type}.")
+            if self._is_event_type(event, event_type):
+                return event.Data
+
     @property
-    def attribute_report_counts(self) -> dict[ClusterObjects.ClusterAttributeDescriptor, int]:
+    def event_queue(self) -> asyncio.Queue:
+        return self._q
+
+
+# Index key of an attribute report: (endpoint_id, cluster_id, attribute_id). A None endpoint_id matches
+# reports from any endpoint.
+_ReportKey = tuple[Optional[int], int, int]
+
+
+class _ReportWaiter:
+    """
+    A set of conditions awaited by one call of an `await_*` method of AsyncAttributeSubscriptionHandler.
+
+    Each condition is updated with the outcome of the reports it is tested against. Sticky conditions stay
+    met once a report met them (any report matched), others reflect the last report tested (last value).
+    The future completes as soon as all the conditions are met.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, condition_count: int, sticky: bool):
+        self.future: asyncio.Future = loop.create_future()
+        self.met = [False] * condition_count
+        self._sticky = sticky
+        self._check_done()
+
+    def update(self, idx: int, met: bool) -> bool:
+        """Records the outcome of a report for a condition. Returns True if this met the condition for the first time."""
+        if self.future.done() or (self._sticky and self.met[idx]):
+            return False
+        newly_met = met and not self.met[idx]
+        self.met[idx] = met
+        self._check_done()
+        return newly_met
+
+    def _check_done(self):
+        if all(self.met) and not self.future.done():
+            self.future.set_result(None)
+
+
+class AsyncAttributeSubscriptionHandler(_AttributeSubscriptionHandlerBase):
+    """
+    asyncio-native variant of AttributeSubscriptionHandler.
+
+    Attribute reports are handed over to the event loop that started the subscription. There they are recorded
+    in the report history, queued in an `asyncio.Queue` and tested against the matchers of the pending `await_*`
+    calls. Pending matchers are indexed by (endpoint, cluster, attribute), so each report is only tested against
+    the matchers that can match it, and the waiting calls complete as soon as their last condition is met.
+
+    Attributes:
+        _expected_cluster: The cluster type to subscribe to.
+        _expected_attribute: The attribute within the cluster expected to receive updates.
+        _q: asyncio queue storing AttributeValue instances for received updates.
+        _attribute_reports: Dictionary holding history of all received reports by attribute.
+        _attribute_report_counts: Dictionary counting the number of reports received per attribute.
+        _pending: Conditions of the pending `await_*` calls, indexed by report key (None for any report).
+    """
+
+    _q: asyncio.Queue
+
+    def __init__(self, expected_cluster: ClusterObjects.Cluster = None, expected_attribute: ClusterObjects.ClusterAttributeDescriptor = None):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending: dict[Optional[_ReportKey], list[tuple[_ReportWaiter, int, Callable[[AttributeValue], bool]]]] = defaultdict(list)
+        super().__init__(expected_cluster, expected_attribute)
+
+    def _new_queue(self) -> asyncio.Queue:
+        return asyncio.Queue()
+
+    async def start(self, dev_ctrl, node_id: int, endpoint: int, fabric_filtered: bool = False, min_interval_sec: int = 0, max_interval_sec: int = 5, keepSubscriptions: bool = True) -> Any:
+        """This starts a subscription for attributes on the specified node_id and endpoint. The cluster is specified when the class instance is created."""
+        self._loop = asyncio.get_running_loop()
+        return await super().start(dev_ctrl, node_id, endpoint, fabric_filtered, min_interval_sec, max_interval_sec, keepSubscriptions)
+
+    @staticmethod
+    def _report_key(endpoint_id: Optional[int], attribute: ClusterObjects.ClusterAttributeDescriptor) -> _ReportKey:
+        return (endpoint_id, attribute.cluster_id, attribute.attribute_id)
+
+    def _on_report(self, report: AttributeValue) -> None:
+        # Called on the CHIP thread, the value was already read from the transaction
+        _deliver_to_loop(self._loop, self._process_report, report)
+
+    def _process_report(self, report: AttributeValue) -> None:
+        """Processes a report on the event loop: records it, queues it and tests it against the pending conditions."""
+        self._record_report(report)
+        self._q.put_nowait(report)
+        self._test_pending(report)
+
+    def _test_pending(self, report: AttributeValue) -> None:
+        keys = (self._report_key(report.endpoint_id, report.attribute), self._report_key(None, report.attribute), None)
+        for key in keys:
+            for waiter, idx, condition in self._pending.get(key, []):
+                waiter.update(idx, condition(report))
+
+    def _add_pending(self, key: Optional[_ReportKey], waiter: _ReportWaiter, idx: int, condition: Callable[[AttributeValue], bool]):
+        self._pending[key].append((waiter, idx, condition))
+
+    def _remove_pending(self, waiter: _ReportWaiter) -> None:
+        for key in list(self._pending):
+            remaining = [entry for entry in self._pending[key] if entry[0] is not waiter]
+            if remaining:
+                self._pending[key] = remaining
+            else:
+                del self._pending[key]
+
+    async def _wait(self, waiter: _ReportWaiter, timeout_sec: float) -> bool:
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter.future), timeout=timeout_sec)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._remove_pending(waiter)
+
+    async def await_attribute_report(self, timeout_sec: float = 10.0) -> Any:
+        """
+        Waits for a single attribute report to arrive in the queue, validates it and returns its value.
+        """
+        try:
+            item = await asyncio.wait_for(self._q.get(), timeout=timeout_sec)
+        except asyncio.TimeoutError:
+            asserts.fail(
+                f"[AsyncAttributeSubscriptionHandler] Failed to receive a report for the {self._expected_attribute} attribute change")
+
+        return self._check_attribute_report(item)
+
+    async def await_all_final_values_reported(self, expected_final_values: Iterable[AttributeValue], timeout_sec: float = 1.0):
+        """Expect that every `expected_final_value` report is the last value reported for the given attribute, ignoring timestamps.
+
+        Returns as soon as all the last reported values match, or fails after `timeout_sec` seconds.
+        """
+        expected_final_values = list(expected_final_values)
+        for element in expected_final_values:
+            LOGGER.info(
+                f"--> Expecting report for value {element.value} for attribute {element.attribute} on endpoint {element.endpoint_id}")
+        LOGGER.info(f"Waiting for {timeout_sec:.1f} seconds for all reports.")
+
+        loop = asyncio.get_running_loop()
+        waiter = _ReportWaiter(loop, len(expected_final_values), sticky=False)
         with self._lock:
-            return self._attribute_report_counts
+            history = {attribute: list(reports) for attribute, reports in self._attribute_reports.items()}
 
-    @property
-    def attribute_reports(self) -> dict[ClusterObjects.ClusterAttributeDescriptor, AttributeValue]:
+        for idx, expected_element in enumerate(expected_final_values):
+            def condition(report: AttributeValue, expected_value=expected_element.value) -> bool:
+                return report.value == expected_value
+
+            last_value = _last_report_value(history, expected_element)
+            if last_value is not None:
+                waiter.update(idx, last_value == expected_element.value)
+            self._add_pending(self._report_key(expected_element.endpoint_id, expected_element.attribute), waiter, idx, condition)
+
+        if await self._wait(waiter, timeout_sec):
+            LOGGER.info("Found all expected reports were true.")
+            return
+
+        LOGGER.error("Reached time-out without finding all expected report values.")
+        LOGGER.info("Values found:")
+        for expected_idx, expected_element in enumerate(expected_final_values):
+            LOGGER.info(f"  -> {expected_element} found: {waiter.met[expected_idx]}")
+        asserts.fail("Did not find all expected last report values before time-out")
+
+    async def await_all_expected_report_matches(self, expected_matchers: Iterable[AttributeMatcher], timeout_sec: float = 1.0):
+        """Expect that every predicate in `expected_matchers`, when run against all the incoming reports, reaches true by the end, ignoring timestamps.
+
+        Returns as soon as every matcher matched a report since the subscription was established (or reset), or fails
+        after `timeout_sec` seconds. Matchers that declare their attribute are only tested against reports of that attribute.
+        """
+        expected_matchers = list(expected_matchers)
+        for matcher in expected_matchers:
+            LOGGER.info(f"--> Matcher waiting: {matcher.description}")
+        LOGGER.info(f"Waiting for {timeout_sec:.1f} seconds for all reports.")
+
+        loop = asyncio.get_running_loop()
+        waiter = _ReportWaiter(loop, len(expected_matchers), sticky=True)
         with self._lock:
-            return self._attribute_reports.copy()
+            history = [report for reports in self._attribute_reports.values() for report in reports]
+
+        for idx, matcher in enumerate(expected_matchers):
+            attribute = getattr(matcher, "attribute", None)
+            endpoint_id = getattr(matcher, "endpoint_id", None)
+            key = self._report_key(endpoint_id, attribute) if attribute is not None else None
+
+            for report in history:
+                if key is not None and (report.attribute != attribute or endpoint_id not in (None, report.endpoint_id)):
+                    continue
+                if waiter.update(idx, matcher.matches(report)):
+                    LOGGER.info(f"  --> Found a match for: {matcher.description}")
+                    break
+
+            if not waiter.met[idx]:
+                def condition(report: AttributeValue, matcher=matcher) -> bool:
+                    matched = matcher.matches(report)
+                    if matched:
+                        LOGGER.info(f"  --> Found a match for: {matcher.description}")
+                    return matched
+                self._add_pending(key, waiter, idx, condition)
+
+        if await self._wait(waiter, timeout_sec):
+            LOGGER.info("Found all expected matchers did match.")
+            return
 
-    def get_last_report(self) -> Optional[Any]:
-        """Flush entire queue, returning last (newest) report only."""
-        last_report: Optional[Any] = None
-        while True:
+        LOGGER.error("Reached time-out without finding all expected report values.")
+        for expected_idx, expected_matcher in enumerate(expected_matchers):
+            LOGGER.info(f"  -> {expected_matcher.description}: {waiter.met[expected_idx]}")
+        asserts.fail("Did not find all expected reports before time-out")
+
+    async def await_sequence_of_reports(self, attribute: TypedAttributePath, sequence: list[Any], timeout_sec: float) -> None:
+        """Await a given expected sequence of attribute reports in the queue for the endpoint associated.
+
+        *** WARNING: The queue contains every report since the sub was established. Use
+            self.reset() to make it empty. ***
+
+        This will fail current Mobly test with assertion failure if the data is not as expected in order.
+        """
+        deadline = time.monotonic() + timeout_sec
+        actual_values: list[Any] = []
+
+        LOGGER.info(f"Expecting values {sequence} for attribute {attribute} on endpoint {self._endpoint_id}")
+        LOGGER.info(f"Waiting for {timeout_sec:.1f} seconds for all reports.")
+        while (time_remaining := deadline - time.monotonic()) > 0:
             try:
-                last_report = self._q.get(block=False)
-            except queue.Empty:
-                return last_report
+                item: AttributeValue = await asyncio.wait_for(self._q.get(), timeout=time_remaining)
+            except asyncio.TimeoutError:
+                break
 
-    def flush_reports(self) -> None:
-        """Flush entire queue, returning nothing."""
-        _ = self.get_last_report()
-        return
+            if self._check_sequence_report(item, attribute, sequence, actual_values):
+                return
+
+        asserts.fail(f"Did not get full sequence {sequence} in {timeout_sec:.1f} seconds. Got {actual_values} before time-out.")
+
+    @property
+    def attribute_queue(self) -> asyncio.Queue:
+        return self._q
@@ -94,3 +94,6 @@ class MatterTestConfig:
 
     # Restart flag file for rebooting the DUT during test runs
     restart_flag_file: Optional[pathlib.Path] = None
+
+    # Number of worker processes for the per-endpoint checks of the device composition tests
+    composition_workers: int = 1
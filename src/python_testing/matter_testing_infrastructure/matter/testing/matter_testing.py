@@ -103,10 +103,16 @@ class AttributeMatcher:
     This class embodies a predicate for a condition that must be matched by an attribute report.
 
     A match is considered as having occurred when the `matches` method returns True for an `AttributeValue` report.
+
+    Matchers can optionally declare the attribute (and endpoint) of the reports they match. Handlers that index
+    matchers by path, such as `AsyncAttributeSubscriptionHandler`, then only test them against reports for that path.
     """
 
-    def __init__(self, description: str):
+    def __init__(self, description: str, attribute: Optional[ClusterObjects.ClusterAttributeDescriptor] = None,
+                 endpoint_id: Optional[int] = None):
         self._description: str = description
+        self._attribute = attribute
+        self._endpoint_id = endpoint_id
 
     def matches(self, report: AttributeValue) -> bool:
         """Implementers must override this method to return True when an attribute value matches.
@@ -119,18 +125,30 @@ class AttributeMatcher:
     def description(self):
         return self._description
 
+    @property
+    def attribute(self) -> Optional[ClusterObjects.ClusterAttributeDescriptor]:
+        """Attribute of the reports this matcher can match, or None if it may match reports of any attribute."""
+        return self._attribute
+
+    @property
+    def endpoint_id(self) -> Optional[int]:
+        """Endpoint of the reports this matcher can match, or None if it may match reports of any endpoint."""
+        return self._endpoint_id
+
     @staticmethod
-    def from_callable(description: str, matcher: Callable[[AttributeValue], bool]) -> "AttributeMatcher":
+    def from_callable(description: str, matcher: Callable[[AttributeValue], bool],
+                      attribute: Optional[ClusterObjects.ClusterAttributeDescriptor] = None,
+                      endpoint_id: Optional[int] = None) -> "AttributeMatcher":
         """Take a single callable and wrap it into an AttributeMatcher object. Useful to wrap closures."""
         class AttributeMatcherFromCallable(AttributeMatcher):
-            def __init__(self, description, matcher: Callable[[AttributeValue], bool]):
-                super().__init__(description)
+            def __init__(self, description, matcher: Callable[[AttributeValue], bool], attribute, endpoint_id):
+                super().__init__(description, attribute=attribute, endpoint_id=endpoint_id)
                 self._matcher = matcher
 
             def matches(self, report: AttributeValue) -> bool:
                 return self._matcher(report)
 
-        return AttributeMatcherFromCallable(description, matcher)
+        return AttributeMatcherFromCallable(description, matcher, attribute, endpoint_id)
 
 
 @dataclass
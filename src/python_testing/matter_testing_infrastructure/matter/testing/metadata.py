@@ -12,10 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import ast
+import copy
+import hashlib
+import json
 import logging
-from dataclasses import dataclass
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
 from io import StringIO
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 import yaml
 
@@ -45,34 +51,38 @@ class NamedStringIO(StringIO):
 
 def extract_runs_args(py_script_path: str) -> Dict[str, Dict[str, str]]:
     """Extract the run arguments from the CI test arguments blocks."""
+    with open(py_script_path, 'r', encoding='utf8') as py_script:
+        return _extract_runs_args_from_lines(py_script.readlines(), py_script_path)
+
 
+def _extract_runs_args_from_lines(lines: List[str], py_script_path: str) -> Dict[str, Dict[str, str]]:
     found_ci_args_section = False
     runs_arg_lines: Dict[str, Dict[str, str]] = {}
 
     ci_args_section_lines = []
-    with open(py_script_path, 'r', encoding='utf8') as py_script:
-        for line_idx, line in enumerate(py_script.readlines()):
-            line = line.strip()
+    for line in lines:
+        line = line.strip()
 
-            # Append empty line to the line capture, so during YAML parsing
-            # line numbers will match the original file.
-            ci_args_section_lines.append("")
+        # Append empty line to the line capture, so during YAML parsing
+        # line numbers will match the original file.
+        ci_args_section_lines.append("")
 
-            # Detect the single CI args section, to skip the lines otherwise.
-            if line.startswith("# === BEGIN CI TEST ARGUMENTS ==="):
-                found_ci_args_section = True
-                continue
-            if line.startswith("# === END CI TEST ARGUMENTS ==="):
-                break
+        # Detect the single CI args section, to skip the lines otherwise.
+        if line.startswith("# === BEGIN CI TEST ARGUMENTS ==="):
+            found_ci_args_section = True
+            continue
+        if line.startswith("# === END CI TEST ARGUMENTS ==="):
+            break
 
-            if found_ci_args_section:
-                # Update the last line in the line capture.
-                ci_args_section_lines[-1] = " " + line.lstrip("#")
+        if found_ci_args_section:
+            # Update the last line in the line capture.
+            ci_args_section_lines[-1] = " " + line.lstrip("#")
 
     if not runs_arg_lines:
         try:
             runs = yaml.safe_load(NamedStringIO("\n".join(ci_args_section_lines), py_script_path))
-            for run, args in runs.get("test-runner-runs", {}).items():
+            # Scripts without a CI test arguments block have no runs
+            for run, args in (runs or {}).get("test-runner-runs", {}).items():
                 runs_arg_lines[run] = {}
                 runs_arg_lines[run]['run'] = run
                 runs_arg_lines[run].update(args)
@@ -122,7 +132,7 @@ class MetadataReader:
                 arg_val = arg_val.replace(f'${{{name}}}', value)
             metadata_dict[arg] = arg_val.strip()
 
-    def parse_script(self, py_script_path: str) -> List[Metadata]:
+    def parse_script(self, py_script_path: str, runs_args: Optional[Dict[str, Dict[str, str]]] = None) -> List[Metadata]:
         """
         Parses a script and returns a list of metadata object where
         each element of that list representing run arguments associated
@@ -133,6 +143,10 @@ class MetadataReader:
         py_script_path:
          path to the python test script
 
+        runs_args:
+         run arguments of the script already extracted from it (e.g. from
+         a MetadataIndex), in which case the script is not read again
+
         Return:
 
         List[Metadata]
@@ -141,7 +155,10 @@ class MetadataReader:
          the script file.
         """
         runs_metadata: List[Metadata] = []
-        runs_args = extract_runs_args(py_script_path)
+        if runs_args is None:
+            runs_args = extract_runs_args(py_script_path)
+        # The arguments are resolved in place, so keep the given ones untouched
+        runs_args = copy.deepcopy(runs_args)
 
         for run, attr in runs_args.items():
             self.__resolve_env_vals__(attr)
@@ -158,3 +175,194 @@ class MetadataReader:
             ))
 
         return runs_metadata
+
+
+class _NotStatic(Exception):
+    pass
+
+
+def _static_value(node: ast.AST) -> Any:
+    """
+    Evaluates an expression made only of literals and TestStep(...) calls with
+    literal arguments, which TestStep calls being returned as dictionaries.
+    Raises _NotStatic for anything else.
+    """
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == 'TestStep':
+        step = {'test_plan_number': None, 'description': None, 'expectation': '', 'is_commissioning': False}
+        step.update(zip(step, [_static_value(arg) for arg in node.args]))
+        for keyword in node.keywords:
+            if keyword.arg is None:
+                raise _NotStatic()
+            step[keyword.arg] = _static_value(keyword.value)
+        return step
+    if isinstance(node, (ast.List, ast.Tuple)):
+        return [_static_value(element) for element in node.elts]
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+        return _static_value(node.left) + _static_value(node.right)
+    try:
+        return ast.literal_eval(node)
+    except ValueError:
+        raise _NotStatic()
+
+
+def _static_return_value(function: ast.FunctionDef) -> Any:
+    """Returns the value of a method that only returns a static expression, see _static_value()."""
+    body = function.body
+    # Skip the docstring
+    if body and isinstance(body[0], ast.Expr) and isinstance(body[0].value, ast.Constant):
+        body = body[1:]
+    if len(body) != 1 or not isinstance(body[0], ast.Return) or body[0].value is None:
+        raise _NotStatic()
+    return _static_value(body[0].value)
+
+
+@dataclass
+class StaticTestInfo:
+    """
+    Information on a test_* method of a test script, extracted without importing it.
+
+    Fields are None if the script defines the matching steps_*, pics_* or desc_*
+    method, but the value it returns can only be known by running it. Tests without
+    these methods get the defaults of MatterBaseTest.
+    """
+    function: str
+    desc: Optional[str] = None
+    steps: Optional[List[Dict[str, Any]]] = None
+    pics: Optional[List[str]] = None
+
+
+@dataclass
+class ScriptInfo:
+    """The run arguments and tests of a test script, as stored in a MetadataIndex."""
+    sha256: str
+    runs: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    tests: List[StaticTestInfo] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, value: Dict[str, Any]) -> 'ScriptInfo':
+        return cls(sha256=value['sha256'], runs=value['runs'], tests=[StaticTestInfo(**t) for t in value['tests']])
+
+
+# Steps of a test without a steps_* method, see MatterBaseTest.get_test_steps()
+_DEFAULT_STEPS = [{'test_plan_number': 1, 'description': 'Run entire test', 'expectation': '', 'is_commissioning': False}]
+
+
+def extract_script_info(py_script_path: str) -> ScriptInfo:
+    """
+    Extracts the run arguments and the test_*, steps_*, pics_* and desc_* methods of
+    a test script by parsing it, without importing it.
+    """
+    with open(py_script_path, 'rb') as py_script:
+        content = py_script.read()
+    text = content.decode('utf8')
+    info = ScriptInfo(sha256=hashlib.sha256(content).hexdigest(),
+                      runs=_extract_runs_args_from_lines(text.splitlines(), py_script_path))
+
+    try:
+        tree = ast.parse(text, filename=py_script_path)
+    except SyntaxError as e:
+        LOGGER.warning(f"Failed to parse {py_script_path}, its tests are not indexed: {e}")
+        return info
+
+    for class_node in [node for node in tree.body if isinstance(node, ast.ClassDef)]:
+        methods = {node.name: node for node in class_node.body if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))}
+        for name in [name for name in methods if name.startswith('test_')]:
+            test = StaticTestInfo(function=name)
+            suffix = name.removeprefix('test_')
+            for prefix, default in (('desc', name), ('steps', _DEFAULT_STEPS), ('pics', [])):
+                method = methods.get(f'{prefix}_{suffix}')
+                try:
+                    value = default if method is None else _static_return_value(method)
+                except _NotStatic:
+                    value = None
+                setattr(test, prefix, value)
+            info.tests.append(test)
+
+    return info
+
+
+def _file_sha256(path: str) -> str:
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+class MetadataIndex:
+    """
+    A cache of the ScriptInfo of test scripts, stored as a JSON file.
+
+    Entries are keyed by the SHA-256 of the script content, so an entry is only
+    extracted again once the script changes, and listing or filtering tests only
+    requires hashing the scripts instead of parsing or importing them.
+    """
+
+    _VERSION = 1
+
+    def __init__(self, index_path: Optional[str] = None):
+        """
+        Loads the index from index_path, if it exists. Without an index_path, nothing
+        is persisted.
+        """
+        self.index_path = index_path
+        self._entries: Dict[str, ScriptInfo] = {}
+        self._scripts: Dict[str, ScriptInfo] = {}
+        if index_path and os.path.exists(index_path):
+            try:
+                with open(index_path, 'r', encoding='utf8') as f:
+                    data = json.load(f)
+                if data.get('version') == self._VERSION:
+                    self._entries = {sha256: ScriptInfo.from_dict(value) for sha256, value in data['scripts'].items()}
+            except (ValueError, KeyError, TypeError) as e:
+                LOGGER.warning(f"Ignoring invalid metadata index {index_path}: {e}")
+
+    def update(self, py_script_paths: List[str], jobs: Optional[int] = None, prune: bool = False) -> Dict[str, ScriptInfo]:
+        """
+        Returns the ScriptInfo of the given scripts, keyed by path. Scripts that changed
+        since the index was written are extracted in parallel by up to `jobs` processes
+        (by default, one per CPU), and added to the index file.
+
+        With prune, py_script_paths is the full listing of the indexed scripts: the
+        entries of scripts that changed or are gone are dropped from the index file.
+        """
+        hashes = {path: _file_sha256(path) for path in py_script_paths}
+        stale = [path for path, sha256 in hashes.items() if sha256 not in self._entries]
+        if stale:
+            LOGGER.info(f"Extracting metadata of {len(stale)} test scripts")
+            if jobs == 1 or len(stale) == 1:
+                infos = [extract_script_info(path) for path in stale]
+            else:
+                with ProcessPoolExecutor(max_workers=jobs) as executor:
+                    infos = list(executor.map(extract_script_info, stale, chunksize=8))
+            for path, info in zip(stale, infos):
+                # The script may have changed since it was hashed, key it by the content that was parsed
+                hashes[path] = info.sha256
+                self._entries[info.sha256] = info
+
+        scripts = {path: self._entries[sha256] for path, sha256 in hashes.items()}
+        self._scripts.update(scripts)
+        pruned = False
+        if prune:
+            entries_count = len(self._entries)
+            self._entries = {info.sha256: info for info in scripts.values()}
+            pruned = len(self._entries) != entries_count
+        if (stale or pruned) and self.index_path:
+            self._write()
+        return scripts
+
+    def _write(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.index_path)), exist_ok=True)
+        tmp_path = f'{self.index_path}.tmp'
+        with open(tmp_path, 'w', encoding='utf8') as f:
+            json.dump({'version': self._VERSION,
+                       'scripts': {sha256: asdict(info) for sha256, info in self._entries.items()}}, f, indent=1)
+        os.replace(tmp_path, self.index_path)
+
+    def get(self, py_script_path: str) -> ScriptInfo:
+        """Returns the ScriptInfo of a script, updating the index for it if it was not part of an update() yet."""
+        info = self._scripts.get(py_script_path)
+        if info is None:
+            info = self.update([py_script_path], jobs=1)[py_script_path]
+        return info
+
+    def runs_args(self, py_script_path: str) -> Dict[str, Dict[str, Any]]:
+        """Same as extract_runs_args(), served from the index."""
+        return self.get(py_script_path).runs
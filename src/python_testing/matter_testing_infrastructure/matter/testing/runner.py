@@ -348,6 +348,15 @@ def default_matter_test_main():
 
 
 def get_test_info(test_class, matter_test_config) -> list[TestInfo]:
+    """
+    Returns the steps, description and PICS of the tests of test_class, by calling its
+    steps_*, desc_* and pics_* methods.
+
+    The test class is already imported by then, and its methods can build these values at
+    runtime, so this does not use the static MetadataIndex. To list tests without importing
+    their script, use MetadataIndex.get(), whose StaticTestInfo leaves the values it cannot
+    extract statically as None.
+    """
     test_config = generate_mobly_test_config(matter_test_config)
     base = test_class(test_config)
 
@@ -792,6 +801,7 @@ def convert_args_to_matter_config(args: argparse.Namespace):
     config.timeout = args.timeout  # This can be none, we pull the default from the test if it's unspecified
     config.endpoint = args.endpoint  # This can be None, the get_endpoint function allows the tests to supply a default
     config.restart_flag_file = args.restart_flag_file
+    config.composition_workers = args.composition_workers
 
     # Map CLI arg to the current config field name used by tests
     config.pipe_name = args.app_pipe
@@ -852,6 +862,8 @@ def parse_matter_test_args(argv: Optional[List[str]] = None):
     basic_group.add_argument('--restart-flag-file', type=str, default=None,
                              help="The full path of the file to use to signal a restart to the app")
     basic_group.add_argument('--timeout', type=int, help="Test timeout in seconds")
+    basic_group.add_argument('--composition-workers', type=int, default=1, metavar='N',
+                             help="Number of processes running the per-endpoint checks of the device composition tests")
     basic_group.add_argument("--PICS", help="PICS file path", type=str)
 
     basic_group.add_argument("--use-legacy-test-event-triggers", action="store_true", default=False,
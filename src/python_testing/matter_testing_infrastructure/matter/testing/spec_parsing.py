@@ -15,11 +15,14 @@
 #    limitations under the License.
 #
 
+import hashlib
 import importlib
 import importlib.resources as pkg_resources
 import logging
 import os
+import pickle
 import re
+import tempfile
 import typing
 import xml.etree.ElementTree as ElementTree
 import zipfile
@@ -31,6 +34,9 @@ from typing import Callable, Optional, Union
 
 import matter.clusters as Clusters
 import matter.testing.conformance as conformance_support
+import matter.testing.global_attribute_ids as global_attribute_ids
+import matter.testing.problem_notices as problem_notices
+import matter.tlv as tlv
 from matter.testing.conformance import (OPTIONAL_CONFORM, TOP_LEVEL_CONFORMANCE_TAGS, ConformanceException,
                                         ConformanceParseParameters, feature, is_disallowed, mandatory, optional, or_operation,
                                         parse_callable_from_xml)
@@ -945,16 +951,20 @@ def get_data_model_directory(data_model_directory: Union[PrebuiltDataModelDirect
         return data_model_directory
 
     # If it's a prebuilt directory, build the path based on the version and data model level
+    # Avoid returning a zipfile.Path backed by a closed file handle. Build Path from the filesystem path
+    # so the ZipFile lifecycle is managed by zipfile.Path itself.
+    zip_root = zipfile.Path(_get_prebuilt_zip_path(data_model_directory))
+    return zip_root / data_model_level.dirname
+
+
+def _get_prebuilt_zip_path(data_model_directory: PrebuiltDataModelDirectory) -> str:
+    """Filesystem path of the zip file holding all the XML files of a prebuilt data model."""
     zip_file_traversable = pkg_resources.files(importlib.import_module('matter.testing')).joinpath(
         'data_model').joinpath(data_model_directory.dirname).joinpath('allfiles.zip')
 
-    # Avoid returning a zipfile.Path backed by a closed file handle. Build Path from the filesystem path
-    # so the ZipFile lifecycle is managed by zipfile.Path itself.
     # mypy: Traversable does not declare __fspath__, but runtime object from importlib.resources
     # is a FileSystem resource that implements it. Safe to coerce for zipfile.Path usage.
-    zip_path = os.fspath(zip_file_traversable)  # type: ignore[call-overload]
-    zip_root = zipfile.Path(zip_path)
-    return zip_root / data_model_level.dirname
+    return os.fspath(zip_file_traversable)  # type: ignore[call-overload]
 
 
 def build_xml_clusters(data_model_directory: Union[PrebuiltDataModelDirectory, Traversable]) -> typing.Tuple[dict[uint, XmlCluster], list[ProblemNotice]]:
@@ -1466,11 +1476,12 @@ def build_xml_device_types(data_model_directory: typing.Union[PrebuiltDataModelD
     device_types: dict[int, XmlDeviceType] = {}
     problems: list[ProblemNotice] = []
     if not cluster_definition_xml:
-        cluster_dir = data_model_directory
-        if not isinstance(data_model_directory, PrebuiltDataModelDirectory):
+        if isinstance(data_model_directory, PrebuiltDataModelDirectory):
+            # Prebuilt clusters are parsed once and then served from the spec data model cache
+            cluster_definition_xml = load_spec_data_model(data_model_directory).clusters
+        else:
             # Transform this into the cluster directory
-            cluster_dir = data_model_directory.joinpath('..', 'clusters')
-        cluster_definition_xml, _ = build_xml_clusters(cluster_dir)
+            cluster_definition_xml, _ = build_xml_clusters(data_model_directory.joinpath('..', 'clusters'))
 
     found_xmls = 0
 
@@ -1606,6 +1617,158 @@ def build_xml_global_data_types(data_model_directory: Union[PrebuiltDataModelDir
     return global_data_types, problems
 
 
+# Environment variable naming the directory where parsed spec data models are cached on disk.
+# The on-disk cache is only used when this is set (or a cache directory is given explicitly).
+SPEC_CACHE_DIR_ENV = 'MATTER_SPEC_CACHE_DIR'
+
+# Modules defining the classes and enums stored in a parsed data model. A change to any of them can
+# change what unpickling a snapshot produces, so their sources are part of the cache key.
+_SPEC_CACHE_SOURCE_MODULES = (conformance_support, global_attribute_ids, problem_notices, tlv, Clusters.Objects)
+
+# Bump when the layout of the cached data changes in a way the parser sources do not capture.
+_SPEC_CACHE_FORMAT = 1
+
+# Pickled SpecDataModel by (data model directory, content hash), shared by all callers in this process.
+_spec_data_model_cache: dict[tuple[str, str], bytes] = {}
+
+# Hash of the parser sources, computed once per process.
+_spec_sources_hash: Optional[str] = None
+
+
+@dataclass
+class SpecDataModel:
+    clusters: dict[uint, XmlCluster]
+    cluster_problems: list[ProblemNotice]
+    device_types: dict[int, XmlDeviceType]
+    device_type_problems: list[ProblemNotice]
+    namespaces: dict[int, XmlNamespace]
+    namespace_problems: list[ProblemNotice]
+
+
+def _default_spec_cache_dir() -> Optional[str]:
+    return os.environ.get(SPEC_CACHE_DIR_ENV) or None
+
+
+def _get_spec_sources_hash() -> str:
+    """Hash of the sources of the parser and of every module the parsed data model is made of."""
+    global _spec_sources_hash
+    if _spec_sources_hash is None:
+        digest = hashlib.sha256(str(_SPEC_CACHE_FORMAT).encode())
+        for source in [__file__] + [module.__file__ for module in _SPEC_CACHE_SOURCE_MODULES]:
+            with open(source, 'rb') as f:
+                digest.update(f.read())
+        _spec_sources_hash = digest.hexdigest()
+    return _spec_sources_hash
+
+
+def _spec_data_model_hash(data_model_directory: Union[PrebuiltDataModelDirectory, Traversable]) -> str:
+    """
+    Hash of everything the parsed data model depends on: the XML files, the sources of the parser and of
+    the modules defining the parsed objects, so that a changed parser never loads a snapshot produced by
+    an older version.
+    """
+    digest = hashlib.sha256(_get_spec_sources_hash().encode())
+
+    if isinstance(data_model_directory, PrebuiltDataModelDirectory):
+        with open(_get_prebuilt_zip_path(data_model_directory), 'rb') as f:
+            digest.update(f.read())
+        return digest.hexdigest()
+
+    for level in (DataModelLevel.kCluster, DataModelLevel.kDeviceType, DataModelLevel.kNamespace):
+        top = data_model_directory.joinpath(level.dirname)
+        for xml in sorted((f for f in top.iterdir() if f.name.endswith('.xml')), key=lambda f: f.name):
+            digest.update(f'{level.dirname}/{xml.name}'.encode())
+            digest.update(xml.read_bytes())
+    return digest.hexdigest()
+
+
+def _build_spec_data_model(data_model_directory: Union[PrebuiltDataModelDirectory, Traversable]) -> SpecDataModel:
+    if isinstance(data_model_directory, PrebuiltDataModelDirectory):
+        cluster_dir = device_type_dir = namespace_dir = data_model_directory
+    else:
+        cluster_dir = data_model_directory.joinpath(DataModelLevel.kCluster.dirname)
+        device_type_dir = data_model_directory.joinpath(DataModelLevel.kDeviceType.dirname)
+        namespace_dir = data_model_directory.joinpath(DataModelLevel.kNamespace.dirname)
+
+    clusters, cluster_problems = build_xml_clusters(cluster_dir)
+    device_types, device_type_problems = build_xml_device_types(device_type_dir, clusters)
+    namespaces, namespace_problems = build_xml_namespaces(namespace_dir)
+    return SpecDataModel(clusters, cluster_problems, device_types, device_type_problems, namespaces, namespace_problems)
+
+
+def _read_spec_cache_file(path: str) -> Optional[bytes]:
+    try:
+        with open(path, 'rb') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        LOGGER.warning("Unable to read spec data model cache %s: %s", path, e)
+        return None
+
+
+def _write_spec_cache_file(path: str, data: bytes):
+    # Write to a temporary file first so concurrent test processes never read a partially written snapshot
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        LOGGER.warning("Unable to write spec data model cache %s: %s", path, e)
+
+
+def load_spec_data_model(data_model_directory: Union[PrebuiltDataModelDirectory, Traversable],
+                         cache_dir: Optional[str] = None) -> SpecDataModel:
+    """
+    Load the clusters, device types and namespaces of a data model, parsing the XML files only once.
+
+    Parsed data models are kept in memory for the whole process. When `cache_dir` is given, or the
+    MATTER_SPEC_CACHE_DIR environment variable is set, they are also pickled in that directory, keyed
+    by a hash of the XML files and of the parser sources, so later test processes skip parsing entirely.
+    Without either, nothing is written to disk.
+
+    `data_model_directory` given as a path MUST be of type Traversable and contain the `clusters`,
+    `device_types` and `namespaces` directories.
+
+    Every call returns a new copy of the data, so callers are free to modify it.
+    """
+    if isinstance(data_model_directory, PrebuiltDataModelDirectory):
+        name = data_model_directory.dirname
+    else:
+        name = str(data_model_directory)
+    content_hash = _spec_data_model_hash(data_model_directory)
+    key = (name, content_hash)
+
+    data = _spec_data_model_cache.get(key)
+    if data is not None:
+        return pickle.loads(data)
+
+    if cache_dir is None:
+        cache_dir = _default_spec_cache_dir()
+    cache_path = os.path.join(cache_dir, f'{content_hash}.pickle') if cache_dir else None
+
+    if cache_path:
+        data = _read_spec_cache_file(cache_path)
+        if data is not None:
+            try:
+                model = pickle.loads(data)
+                LOGGER.info("Loaded spec data model %s from cache %s", name, cache_path)
+                _spec_data_model_cache[key] = data
+                return model
+            except Exception as e:
+                # A corrupted or incompatible cache file: parse the XML files again and overwrite it.
+                LOGGER.warning("Ignoring unusable spec data model cache %s: %s", cache_path, e)
+
+    model = _build_spec_data_model(data_model_directory)
+    data = pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL)
+    if cache_path:
+        _write_spec_cache_file(cache_path, data)
+    _spec_data_model_cache[key] = data
+    return model
+
+
 def dm_from_spec_version(specification_version: uint) -> PrebuiltDataModelDirectory:
     ''' Returns the data model directory for a given specification revision.
 
@@ -0,0 +1,124 @@
+"""Unit tests for composition_checks module."""
+
+import unittest
+
+import matter.clusters as Clusters
+from matter.testing import composition_checks
+from matter.testing.global_attribute_ids import GlobalAttributeIds
+from matter.testing.problem_notices import ProblemSeverity
+from matter.tlv import uint
+
+
+def _cluster(attribute_list: list[int], accepted: tuple[int, ...] = (), generated: tuple[int, ...] = (), feature_map: int = 0) -> dict:
+    cluster = {attribute_id: uint(0) for attribute_id in attribute_list}
+    cluster.update({
+        GlobalAttributeIds.CLUSTER_REVISION_ID: uint(1),
+        GlobalAttributeIds.FEATURE_MAP_ID: uint(feature_map),
+        GlobalAttributeIds.ATTRIBUTE_LIST_ID: [uint(a) for a in attribute_list],
+        GlobalAttributeIds.ACCEPTED_COMMAND_LIST_ID: [uint(c) for c in accepted],
+        GlobalAttributeIds.GENERATED_COMMAND_LIST_ID: [uint(c) for c in generated],
+    })
+    return cluster
+
+
+_GLOBALS = [a.id for a in composition_checks.ATTRIBUTES_TO_CHECK]
+
+
+def _endpoints() -> dict:
+    on_off = _cluster([0x0000] + _GLOBALS)
+    # Claims attributes that are not reported, and lists an unknown standard attribute, an attribute in the undefined range and an unknown command
+    bad_on_off = _cluster([0x0000, 0x0F00, 0x5001] + _GLOBALS, accepted=[0x00, 0xF0])
+    del bad_on_off[0x0F00]
+    del bad_on_off[0x5001]
+    # Missing its ClusterRevision, which skips the attribute list check on this endpoint only
+    missing_global = _cluster([0x0000] + _GLOBALS)
+    del missing_global[GlobalAttributeIds.CLUSTER_REVISION_ID]
+    return {
+        0: {Clusters.OnOff.id: on_off},
+        1: {Clusters.OnOff.id: bad_on_off, 0xFFF1_FC00: _cluster(_GLOBALS)},
+        2: {Clusters.OnOff.id: missing_global},
+    }
+
+
+class TestCompositionChecks(unittest.TestCase):
+    """Unit tests for the per-endpoint composition checks."""
+
+    def test_idm_10_1_checks(self):
+        results = composition_checks.run_per_endpoint(
+            composition_checks.idm_10_1_endpoint_problems, _endpoints(), 1, "TC_IDM_10_1", 0xFFF1_0000)
+        self.assertEqual(list(results), [0, 1, 2])
+        self.assertFalse(any(problems for problems in results[0].values()))
+
+        self.assertEqual(len(composition_checks.merge_problems(results, "global_attributes_present")), 1)
+        self.assertEqual(composition_checks.merge_problems(results, "global_attributes_present")[0].location.endpoint_id, 2)
+
+        unreported = [p for p in results[1]["attribute_list_matches"] if isinstance(p, composition_checks.UnreportedListedAttribute)]
+        self.assertEqual([p.location.attribute_id for p in unreported], [0x0F00, 0x5001])
+        self.assertEqual(results[2]["attribute_list_matches"], [])
+
+        self.assertEqual([p.location.attribute_id for p in results[1]["standard_attribute_ids"]], [0x0F00])
+        self.assertEqual([p.location.attribute_id for p in results[1]["undefined_attribute_range"]], [0x5001])
+        self.assertEqual([p.location.command_id for p in results[1]["standard_command_ids"]], [0xF0])
+        self.assertEqual([p.location.cluster_id for p in results[1]["cluster_id_prefixes"]], [0xFFF1_0000])
+        for problem in composition_checks.merge_problems(results, "standard_attribute_ids"):
+            self.assertEqual(problem.severity, ProblemSeverity.ERROR)
+            self.assertEqual(problem.test_name, "TC_IDM_10_1")
+
+    def test_missing_attribute_list(self):
+        no_attribute_list = _cluster([0x0000, 0x0F00] + _GLOBALS)
+        del no_attribute_list[GlobalAttributeIds.ATTRIBUTE_LIST_ID]
+        endpoints = {0: {Clusters.OnOff.id: no_attribute_list,
+                         Clusters.LevelControl.id: _cluster([0x0F00] + _GLOBALS), 0xFFF1_FC00: _cluster(_GLOBALS)}}
+
+        results = composition_checks.run_per_endpoint(
+            composition_checks.idm_10_1_endpoint_problems, endpoints, 1, "TC_IDM_10_1", 0xFFF1_0000)
+
+        missing = results[0]["global_attributes_present"]
+        self.assertEqual([(p.location.cluster_id, p.location.attribute_id) for p in missing],
+                         [(Clusters.OnOff.id, GlobalAttributeIds.ATTRIBUTE_LIST_ID)])
+        self.assertIn("Did not find mandatory global", missing[0].problem)
+        self.assertEqual(results[0]["attribute_list_matches"], [])
+        # The other clusters of the endpoint are still checked
+        self.assertEqual([p.location.cluster_id for p in results[0]["standard_attribute_ids"]], [Clusters.LevelControl.id])
+        self.assertEqual([p.location.cluster_id for p in results[0]["cluster_id_prefixes"]], [0xFFF1_0000])
+
+    def test_process_pool_matches_serial(self):
+        endpoints = _endpoints()
+        serial = composition_checks.run_per_endpoint(
+            composition_checks.idm_10_1_endpoint_problems, endpoints, 1, "TC_IDM_10_1", 0xFFF1_0000)
+        parallel = composition_checks.run_per_endpoint(
+            composition_checks.idm_10_1_endpoint_problems, endpoints, 3, "TC_IDM_10_1", 0xFFF1_0000)
+        self.assertEqual(list(parallel), list(serial))
+        for _, check_name in composition_checks.IDM_10_1_CHECKS:
+            self.assertEqual(composition_checks.merge_problems(parallel, check_name),
+                             composition_checks.merge_problems(serial, check_name))
+
+    def test_ps_3_1_checks(self):
+        descriptor = {
+            Clusters.Descriptor.Attributes.DeviceTypeList.attribute_id: [{0: uint(0x13), 1: uint(1)}],
+            Clusters.Descriptor.Attributes.PartsList.attribute_id: [uint(2)],
+        }
+        power_source = {
+            GlobalAttributeIds.CLUSTER_REVISION_ID: uint(2),
+            Clusters.PowerSource.Attributes.EndpointList.attribute_id: [uint(1), uint(2), uint(5)],
+        }
+        endpoint = {Clusters.Descriptor.id: descriptor, Clusters.PowerSource.id: power_source}
+
+        self.assertIsNone(composition_checks.ps_3_1_endpoint_problems(1, {Clusters.Descriptor.id: descriptor}, "TC_PS_3_1", {1, 2}))
+
+        result = composition_checks.ps_3_1_endpoint_problems(1, endpoint, "TC_PS_3_1", {1, 2})
+        self.assertEqual(len(result.endpoint_list_problems), 1)
+        self.assertIn("non-existent endpoint", result.endpoint_list_problems[0].problem)
+        self.assertEqual(result.device_types, [0x13])
+        self.assertEqual(result.parts_list, [2])
+
+        power_source[GlobalAttributeIds.CLUSTER_REVISION_ID] = uint(1)
+        del endpoint[Clusters.Descriptor.id]
+        result = composition_checks.ps_3_1_endpoint_problems(1, endpoint, "TC_PS_3_1", {1, 2})
+        self.assertEqual([p.severity for p in result.endpoint_list_problems], [ProblemSeverity.NOTE])
+        self.assertEqual([p.problem for p in result.descriptor_problems], ["Missing cluster descriptor"])
+        self.assertIsNone(result.device_types)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -12,11 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
 import os
 import tempfile
 import unittest
 
-from metadata import Metadata, MetadataReader
+from metadata import Metadata, MetadataIndex, MetadataReader, StaticTestInfo
 
 
 class TestMetadataReader(unittest.TestCase):
@@ -72,5 +73,78 @@ class TestMetadataReader(unittest.TestCase):
             self.assertEqual(self.expected_metadata, reader.parse_script(test_file)[0])
 
 
+class TestMetadataIndex(unittest.TestCase):
+
+    test_file_content = TestMetadataReader.test_file_content + '''
+class TC_TEST(MatterBaseTest):
+    def desc_TC_TEST_1_1(self) -> str:
+        return "[TC-TEST-1.1] " + "Test"
+
+    def pics_TC_TEST_1_1(self) -> list[str]:
+        return ["TEST.S"]
+
+    def steps_TC_TEST_1_1(self) -> list[TestStep]:
+        """Steps of the test"""
+        return [TestStep(1, "Commissioning", is_commissioning=True),
+                TestStep("2a", "Read", "Value is read")]
+
+    def test_TC_TEST_1_1(self):
+        pass
+
+    def steps_TC_TEST_1_2(self) -> list[TestStep]:
+        steps = [TestStep(1, "Step")]
+        return steps
+
+    async def test_TC_TEST_1_2(self):
+        pass
+'''
+
+    def test_static_test_info(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            test_file = os.path.join(temp_dir, "TC_TEST.py")
+            with open(test_file, "w") as f:
+                f.write(self.test_file_content)
+            index_path = os.path.join(temp_dir, "index.json")
+
+            info = MetadataIndex(index_path).update([test_file])[test_file]
+            self.assertEqual(list(info.runs), ["run1"])
+            self.assertEqual(info.tests, [
+                StaticTestInfo(function="test_TC_TEST_1_1", desc="[TC-TEST-1.1] Test", pics=["TEST.S"], steps=[
+                    {"test_plan_number": 1, "description": "Commissioning", "expectation": "", "is_commissioning": True},
+                    {"test_plan_number": "2a", "description": "Read", "expectation": "Value is read", "is_commissioning": False},
+                ]),
+                # The steps can only be known by running the steps_ method
+                StaticTestInfo(function="test_TC_TEST_1_2", desc="test_TC_TEST_1_2", pics=[], steps=None),
+            ])
+
+            # The index is reused as long as the script does not change
+            self.assertEqual(MetadataIndex(index_path).get(test_file), info)
+            with open(test_file, "a") as f:
+                f.write("\n    def desc_TC_TEST_1_2(self) -> str:\n        return 'Changed'\n")
+            self.assertEqual(MetadataIndex(index_path).get(test_file).tests[1].desc, "Changed")
+
+            # Other scripts stay in the index, until they are left out of a full listing
+            other_file = os.path.join(temp_dir, "TC_OTHER.py")
+            with open(other_file, "w") as f:
+                f.write(self.test_file_content)
+            with open(other_file, "a") as f:
+                f.write("\n# Other\n")
+            other_info = MetadataIndex(index_path).get(other_file)
+            index = MetadataIndex(index_path)
+            self.assertEqual(index.update([test_file, other_file], jobs=1), {test_file: index.get(test_file), other_file: other_info})
+            with open(index_path) as f:
+                self.assertEqual(len(json.load(f)["scripts"]), 3)
+            MetadataIndex(index_path).update([other_file], jobs=1, prune=True)
+            with open(index_path) as f:
+                self.assertEqual(list(json.load(f)["scripts"]), [other_info.sha256])
+
+            # Run arguments from the index resolve like the ones read from the script
+            env_file = os.path.join(temp_dir, "env.yaml")
+            with open(env_file, "w") as f:
+                f.write(TestMetadataReader.env_file_content)
+            reader = MetadataReader(env_file)
+            self.assertEqual(reader.parse_script(test_file, info.runs), reader.parse_script(test_file))
+
+
 if __name__ == "__main__":
     unittest.main()
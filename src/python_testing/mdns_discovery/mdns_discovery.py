@@ -19,18 +19,20 @@ import json
 import logging
 import time
 from asyncio import Event, Semaphore, TimeoutError, create_task, gather, sleep, wait_for
-from typing import Dict, List, Optional
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional
 
 from mdns_discovery.data_classes.aaaa_record import AaaaRecord
 from mdns_discovery.data_classes.mdns_service_info import MdnsServiceInfo
 from mdns_discovery.data_classes.ptr_record import PtrRecord
 from mdns_discovery.enums.mdns_service_type import MdnsServiceType
 from mdns_discovery.mdns_async_service_info import AddressResolverIPv6, MdnsAsyncServiceInfo
+from mdns_discovery.mdns_record_cache import MdnsRecordCache
 from mdns_discovery.service_listeners.mdns_service_listener import MdnsServiceListener
 from mdns_discovery.utils.network import get_host_ipv6_addresses
 from zeroconf import IPVersion, ServiceStateChange, Zeroconf
 from zeroconf.asyncio import AsyncServiceBrowser, AsyncZeroconf, AsyncZeroconfServiceTypes
-from zeroconf.const import _TYPE_A, _TYPE_AAAA, _TYPE_SRV, _TYPE_TXT, _TYPES
+from zeroconf.const import _TYPE_A, _TYPE_AAAA, _TYPE_PTR, _TYPE_SRV, _TYPE_TXT, _TYPES
 
 logger = logging.getLogger(__name__)
 
@@ -66,10 +68,19 @@ class MdnsDiscovery:
             - `get_commissionable_subtypes()`: Discover supported subtypes for commissionable nodes.
             - `discover()`: The mDNS discovery engine powering the discovery methods.
 
+        Session mode:
+            By default every method opens its own Zeroconf instance and always queries the network.
+            Between `start_session()` and `stop_session()` (or inside `async with MdnsDiscovery() as mdns:`)
+            a single Zeroconf instance is shared by all the calls, and PTR, SRV, TXT and AAAA results
+            are cached until their TTL expires, so repeated queries are answered without network traffic.
+            Use `clear_cache()` when a fresh answer is required, e.g. after the DUT changed its advertisements.
+
         Attributes:
             interfaces (list[str]): IPv6 interfaces used for discovery.
             _discovered_services (dict): Stores results of service discovery.
             _event (asyncio.Event): Event used to synchronize async discovery.
+            _session_azc (AsyncZeroconf): Zeroconf instance shared by all calls in session mode.
+            _record_cache (MdnsRecordCache): Query results cached in session mode.
         """
         # List of IPv6 addresses to use for mDNS discovery.
         self.interfaces = get_host_ipv6_addresses()
@@ -80,6 +91,53 @@ class MdnsDiscovery:
         # An asyncio Event to signal when a service has been discovered
         self._event = Event()
 
+        # Service instance (full or instance name) that ends the current browse as soon as it is discovered
+        self._wait_for_instance: Optional[str] = None
+
+        # Session mode state
+        self._session_azc: Optional[AsyncZeroconf] = None
+        self._record_cache = MdnsRecordCache()
+
+    async def __aenter__(self) -> "MdnsDiscovery":
+        await self.start_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.stop_session()
+
+    # Session methods
+    async def start_session(self) -> None:
+        """
+        Starts session mode: a single Zeroconf instance is kept alive and shared by all
+        subsequent calls, and query results are cached until their TTL expires.
+
+        Typically called from a test class setup, with `stop_session()` called from its teardown.
+        """
+        if self._session_azc is not None:
+            return
+
+        self._session_azc = AsyncZeroconf(interfaces=self.interfaces)
+        await self._session_azc.zeroconf.async_wait_for_start()
+        logger.info("mDNS discovery session started")
+
+    async def stop_session(self) -> None:
+        """
+        Stops session mode, closing the shared Zeroconf instance and dropping the cached results.
+        """
+        if self._session_azc is None:
+            return
+
+        azc, self._session_azc = self._session_azc, None
+        self._record_cache.clear()
+        await azc.async_close()
+        logger.info("mDNS discovery session stopped")
+
+    def clear_cache(self) -> None:
+        """
+        Drops all the query results cached in session mode, so that the next queries go to the network.
+        """
+        self._record_cache.clear()
+
     # Public methods
     async def get_commissioner_services(self, log_output: bool = False,
                                         discovery_timeout_sec: float = DISCOVERY_TIMEOUT_SEC
@@ -298,7 +356,15 @@ class MdnsDiscovery:
         """
         logger.info(f"Service record information lookup (AAAA) for '{hostname}' in progress...")
 
-        async with AsyncZeroconf(interfaces=self.interfaces) as azc:
+        cached_records = self._cached(_TYPE_AAAA, hostname)
+        if cached_records is not None:
+            logger.info(f"Service record information (AAAA) for '{hostname}' answered from the session cache.")
+            self._discovered_services = {hostname: list(cached_records)}
+            if log_output:
+                self._log_output()
+            return list(cached_records)
+
+        async with self._zeroconf() as azc:
             # Perform AAAA query
             addr_resolver = AddressResolverIPv6(hostname)
 
@@ -316,6 +382,10 @@ class MdnsDiscovery:
                 if ipv6_addresses:
                     quada_records = [AaaaRecord(ipv6) for ipv6 in ipv6_addresses]
 
+                if self._session_azc is not None and quada_records:
+                    ttl_sec = MdnsRecordCache.remaining_ttl(azc.zeroconf, _TYPE_AAAA, hostname)
+                    self._record_cache.put(_TYPE_AAAA, hostname, list(quada_records), ttl_sec)
+
                 # Adds service to discovered services
                 self._discovered_services = {hostname: list(quada_records)}
 
@@ -331,6 +401,7 @@ class MdnsDiscovery:
                               service_types: list[str],
                               discovery_timeout_sec: float = DISCOVERY_TIMEOUT_SEC,
                               log_output: bool = False,
+                              wait_for_instance: Optional[str] = None,
                               ) -> list[PtrRecord]:
         """
         Asynchronously discovers mDNS PTR records for the given service types.
@@ -341,6 +412,8 @@ class MdnsDiscovery:
                 Defaults to DISCOVERY_TIMEOUT_SEC (15 sec).
             log_output (bool, optional): If True, logs the discovered records to the console.
                 Defaults to False.
+            wait_for_instance (Optional[str]): If set, the browse ends as soon as the service with this
+                instance name (or full service name) is discovered, instead of after a period of silence.
 
         Returns:
             list[PtrRecord]: A list of discovered PtrRecord objects.
@@ -349,7 +422,8 @@ class MdnsDiscovery:
         await self.discover(
             discovery_timeout_sec=discovery_timeout_sec,
             log_output=log_output,
-            service_types=service_types
+            service_types=service_types,
+            wait_for_instance=wait_for_instance
         )
 
         if self._discovered_services:
@@ -382,7 +456,7 @@ class MdnsDiscovery:
                     the discovery process.
         """
         logger.info("Discovering all available mDNS service types...")
-        async with AsyncZeroconf(interfaces=self.interfaces) as azc:
+        async with self._zeroconf() as azc:
             try:
                 service_types = list(set(await wait_for(AsyncZeroconfServiceTypes.async_find(aiozc=azc, interfaces=self.interfaces), timeout=discovery_timeout_sec)))
             except TimeoutError:
@@ -433,7 +507,8 @@ class MdnsDiscovery:
                        query_service: bool = False,
                        query_timeout_sec=QUERY_TIMEOUT_SEC,
                        append_results: bool = False,
-                       log_output: bool = False
+                       log_output: bool = False,
+                       wait_for_instance: Optional[str] = None
                        ) -> None:
         """
         Asynchronously discovers network services using multicast DNS (mDNS).
@@ -453,6 +528,9 @@ class MdnsDiscovery:
                 storing new results. Only applies when `query_service` is True. Defaults to False.
             log_output (bool, optional): If True, logs the discovered services to the
                 console. Defaults to False.
+            wait_for_instance (Optional[str]): If set, the browse ends as soon as the service with this
+                instance name (or full service name) is discovered, instead of waiting for a period of
+                silence or for `discovery_timeout_sec`. Defaults to None.
 
         Raises:
             ValueError: If both `all_services` and `service_types` are provided.
@@ -489,26 +567,13 @@ class MdnsDiscovery:
         self._event.clear()
         self._discovered_services = {}
         self._last_discovery_time = time.time()
+        self._wait_for_instance = wait_for_instance
 
-        async with AsyncZeroconf(interfaces=self.interfaces) as azc:
-            aiobrowser = AsyncServiceBrowser(
-                zeroconf=azc.zeroconf, type_=types, handlers=[self._on_service_state_change]
-            )
-
-            # Background monitor to end discovery early after
-            # a period of silence (inactivity, no new services)
-            create_task(self._monitor_discovery_silence(silence_threshold=DISCOVERY_SILENCE_THRESHOLD_SEC))
-
-            try:
-                # Wait for either the silence timeout (triggered by the background monitor)
-                # or the full discovery timeout to elapse, whichever comes first
-                await wait_for(self._event.wait(), timeout=discovery_timeout_sec)
-            except TimeoutError:
-                logger.info("mDNS browse finished after %d seconds", discovery_timeout_sec)
-            finally:
-                logger.info("Stopping mDNS browse and cleaning up")
-                self._event.set()
-                await aiobrowser.async_cancel()
+        async with self._zeroconf() as azc:
+            if self._discovered_services_from_cache(types, wait_for_instance):
+                logger.info("mDNS service(s) of type %s answered from the session cache", types)
+            else:
+                await self._browse(azc, types, discovery_timeout_sec)
 
             # Log discovered services stats found during the browse
             services_count = sum(len(ptr_list) for ptr_list in self._discovered_services.values())
@@ -569,6 +634,12 @@ class MdnsDiscovery:
         Returns:
             None: This method does not return any value.
         """
+        # Drop cached results of services that went away
+        if state_change == ServiceStateChange.Removed:
+            self._record_cache.invalidate(service_type)
+            self._record_cache.invalidate(name)
+            return
+
         # Exit if status isn't 'Added'
         if state_change != ServiceStateChange.Added:
             return
@@ -582,7 +653,13 @@ class MdnsDiscovery:
         self._discovered_services.setdefault(service_type, [])
         existing_names = {r.service_name for r in self._discovered_services[service_type]}
         if name not in existing_names:
-            self._discovered_services[service_type].append(PtrRecord(service_type=service_type, service_name=name))
+            ptr_record = PtrRecord(service_type=service_type, service_name=name)
+            self._discovered_services[service_type].append(ptr_record)
+
+            # End the browse right away once the awaited service instance shows up
+            if self._wait_for_instance in (ptr_record.instance_name, ptr_record.service_name):
+                logger.info(f"Awaited mDNS service instance '{self._wait_for_instance}' discovered, stopping browse")
+                self._event.set()
 
     async def _query_service_info(self,
                                   service_type: str,
@@ -609,14 +686,22 @@ class MdnsDiscovery:
         """
         rec_types = "(" + ", ".join(_TYPES.get(t, str(t)).upper() for t in query_record_types) + ")"
 
-        async with AsyncZeroconf(interfaces=self.interfaces) as azc:
+        cached_info = self._cached_service_info(service_name, query_record_types)
+        if cached_info is not None:
+            logger.info(f"Service record information {rec_types} for '{service_name}' answered from the session cache.")
+            self._add_discovered_service(service_type, cached_info, append_results)
+            return cached_info
+
+        async with self._zeroconf() as azc:
 
             # Adds service listener
             service_listener = MdnsServiceListener()
             await azc.async_add_service_listener(service_type, service_listener)
 
-            # Wait for the add/update service event or timeout
-            await service_listener.wait_for_service_update(service_name, rec_types, SERVICE_LISTENER_TIMEOUT_SEC)
+            # Wait for the add/update service event or timeout, unless the service
+            # instance was already seen by a browse earlier in this session
+            if not self._is_known_instance(service_type, service_name):
+                await service_listener.wait_for_service_update(service_name, rec_types, SERVICE_LISTENER_TIMEOUT_SEC)
 
             # Prepare and perform query
             service_info = MdnsAsyncServiceInfo(name=service_name, type_=service_type)
@@ -634,22 +719,131 @@ class MdnsDiscovery:
                 # Convert discovered service info into MdnsServiceInfo object
                 mdns_service_info = MdnsServiceInfo(service_info)
 
-                # - If not appending service info results to the discovered services list,
-                #   empty the list on every call so it holds only a single result (as used
-                #   by the `get_srv_record` and `get_txt_record` methods).
-                # - Otherwise append service info results to the discovered services
-                #   list (as used by the `discover` method)
-                if not append_results:
-                    self._discovered_services = {}
+                if self._session_azc is not None:
+                    self._cache_service_info(azc.zeroconf, service_info, query_record_types, mdns_service_info)
 
-                # Add service to discovered services
-                self._discovered_services.setdefault(service_type, []).append(mdns_service_info)
+                self._add_discovered_service(service_type, mdns_service_info, append_results)
 
                 return mdns_service_info
 
             logger.error(f"Service record information {rec_types} for '{service_name}' not found.")
             return None
 
+    def _add_discovered_service(self, service_type: str, mdns_service_info: MdnsServiceInfo, append_results: bool) -> None:
+        """
+        Stores a queried service in `self._discovered_services`.
+
+        - If not appending service info results to the discovered services list,
+          empty the list on every call so it holds only a single result (as used
+          by the `get_srv_record` and `get_txt_record` methods).
+        - Otherwise append service info results to the discovered services
+          list (as used by the `discover` method)
+        """
+        if not append_results:
+            self._discovered_services = {}
+
+        self._discovered_services.setdefault(service_type, []).append(mdns_service_info)
+
+    @asynccontextmanager
+    async def _zeroconf(self) -> AsyncIterator[AsyncZeroconf]:
+        """
+        Yields the shared Zeroconf instance in session mode, or a new one that is closed on exit otherwise.
+        """
+        if self._session_azc is not None:
+            yield self._session_azc
+            return
+
+        async with AsyncZeroconf(interfaces=self.interfaces) as azc:
+            yield azc
+
+    def _cached(self, record_type: int, name: str):
+        """
+        Returns a result cached in session mode, or None outside session mode or when nothing valid is cached.
+        """
+        if self._session_azc is None:
+            return None
+        return self._record_cache.get(record_type, name)
+
+    def _cached_service_info(self, service_name: str, query_record_types: set[int]) -> Optional[MdnsServiceInfo]:
+        """
+        Returns the cached service info of a service instance if a single earlier query answered all the
+        requested record types, e.g. a full service query answers a later SRV only query.
+        """
+        cached = {id(info): info for info in (self._cached(t, service_name) for t in query_record_types)}
+        if len(cached) != 1:
+            return None
+        return next(iter(cached.values()))
+
+    def _cache_service_info(self, zc: Zeroconf, service_info: MdnsAsyncServiceInfo,
+                            query_record_types: set[int], mdns_service_info: MdnsServiceInfo) -> None:
+        """
+        Caches a service query result under each of its queried record types, until the shortest TTL of
+        the records it was built from expires. Address records belong to the SRV target host.
+        """
+        names = {_TYPE_SRV: service_info.name, _TYPE_TXT: service_info.name,
+                 _TYPE_A: service_info.server, _TYPE_AAAA: service_info.server}
+        ttls = [MdnsRecordCache.remaining_ttl(zc, t, names[t]) for t in query_record_types if names.get(t)]
+        if not ttls:
+            return
+
+        ttl_sec = min(ttls)
+        for record_type in query_record_types:
+            self._record_cache.put(record_type, service_info.name, mdns_service_info, ttl_sec)
+
+    def _is_known_instance(self, service_type: str, service_name: str) -> bool:
+        """
+        Returns True if a browse earlier in this session discovered the given service instance.
+        """
+        ptr_records = self._cached(_TYPE_PTR, service_type) or []
+        return any(ptr.service_name == service_name for ptr in ptr_records)
+
+    def _discovered_services_from_cache(self, types: List[str], wait_for_instance: Optional[str]) -> bool:
+        """
+        Fills `self._discovered_services` with the PTR records cached for all the given service types.
+        Returns False, leaving it empty, if any of the types (or the awaited instance) is not cached.
+        """
+        cached = {service_type: self._cached(_TYPE_PTR, service_type) for service_type in types}
+        if any(ptr_records is None for ptr_records in cached.values()):
+            return False
+
+        if wait_for_instance and not any(wait_for_instance in (ptr.instance_name, ptr.service_name)
+                                         for ptr_records in cached.values() for ptr in ptr_records):
+            return False
+
+        self._discovered_services = {service_type: list(ptr_records) for service_type, ptr_records in cached.items()}
+        return True
+
+    async def _browse(self, azc: AsyncZeroconf, types: List[str], discovery_timeout_sec: float) -> None:
+        """
+        Browses for PTR records of the given service types until a period of silence, the awaited
+        service instance or the discovery timeout, and caches the results in session mode.
+        """
+        aiobrowser = AsyncServiceBrowser(
+            zeroconf=azc.zeroconf, type_=types, handlers=[self._on_service_state_change]
+        )
+
+        # Background monitor to end discovery early after
+        # a period of silence (inactivity, no new services)
+        create_task(self._monitor_discovery_silence(silence_threshold=DISCOVERY_SILENCE_THRESHOLD_SEC))
+
+        try:
+            # Wait for either the silence timeout (triggered by the background monitor),
+            # the awaited service instance or the full discovery timeout, whichever comes first
+            await wait_for(self._event.wait(), timeout=discovery_timeout_sec)
+        except TimeoutError:
+            logger.info("mDNS browse finished after %d seconds", discovery_timeout_sec)
+        finally:
+            logger.info("Stopping mDNS browse and cleaning up")
+            self._event.set()
+            await aiobrowser.async_cancel()
+
+        # A browse that ended on the awaited instance may have missed other
+        # services of the same types, so its results are not cached
+        if self._session_azc is not None and not self._wait_for_instance:
+            for service_type, ptr_records in self._discovered_services.items():
+                ttl_sec = MdnsRecordCache.remaining_ttl(azc.zeroconf, _TYPE_PTR, service_type)
+                self._record_cache.put(_TYPE_PTR, service_type, list(ptr_records), ttl_sec)
+
     async def _monitor_discovery_silence(self, silence_threshold: float) -> None:
         """
         Monitor service discovery and end it after a period of inactivity (silence).
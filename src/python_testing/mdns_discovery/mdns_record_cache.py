@@ -0,0 +1,99 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from zeroconf import Zeroconf, current_time_millis
+from zeroconf.const import _CLASS_IN, _DNS_HOST_TTL, _DNS_OTHER_TTL, _TYPE_A, _TYPE_AAAA, _TYPE_SRV
+
+# Fallback TTLs (seconds) used when the answered records are no longer in the Zeroconf
+# cache, matching the TTLs Zeroconf itself assigns to host and other records.
+_FALLBACK_TTL_SEC = {
+    _TYPE_A: _DNS_HOST_TTL,
+    _TYPE_AAAA: _DNS_HOST_TTL,
+    _TYPE_SRV: _DNS_HOST_TTL,
+}
+
+
+@dataclass
+class _CacheEntry:
+    value: Any
+    expires_at: float
+
+
+class MdnsRecordCache:
+    """
+    A TTL-aware cache of mDNS query results, used by `MdnsDiscovery` in session mode.
+
+    Results are keyed by DNS record type and name: the service type for PTR records,
+    the service instance name for SRV and TXT records and the hostname for A and AAAA
+    records. Each result expires when the shortest TTL of the records it was built
+    from runs out.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._entries: dict[tuple[int, str], _CacheEntry] = {}
+
+    def get(self, record_type: int, name: str) -> Optional[Any]:
+        """
+        Returns the cached result for the record type and name, or None if it is missing or expired.
+        """
+        entry = self._entries.get((record_type, name.lower()))
+        if entry is None:
+            return None
+        if self._clock() >= entry.expires_at:
+            del self._entries[(record_type, name.lower())]
+            return None
+        return entry.value
+
+    def put(self, record_type: int, name: str, value: Any, ttl_sec: float) -> None:
+        """
+        Caches a result for the record type and name for `ttl_sec` seconds.
+        Results with a TTL of zero (goodbye packets) are not cached.
+        """
+        if ttl_sec <= 0:
+            self._entries.pop((record_type, name.lower()), None)
+            return
+        self._entries[(record_type, name.lower())] = _CacheEntry(value, self._clock() + ttl_sec)
+
+    def invalidate(self, name: str) -> None:
+        """
+        Removes all the cached results for the given name, whatever their record type.
+        """
+        name = name.lower()
+        for key in [key for key in self._entries if key[1] == name]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    @staticmethod
+    def remaining_ttl(zc: Zeroconf, record_type: int, name: str) -> float:
+        """
+        Returns the shortest remaining TTL, in seconds, of the records of the given type
+        and name in the Zeroconf cache, or the default TTL of that record type if there
+        are none (e.g. when the Zeroconf cache was cleared by a concurrent query).
+        """
+        now = current_time_millis()
+        records = zc.cache.async_all_by_details(name, record_type, _CLASS_IN)
+        ttls = [record.get_remaining_ttl(now) for record in records]
+        if ttls:
+            return min(ttls)
+        return _FALLBACK_TTL_SEC.get(record_type, _DNS_OTHER_TTL)
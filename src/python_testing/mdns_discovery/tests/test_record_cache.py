@@ -0,0 +1,128 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import unittest
+
+from mdns_discovery.data_classes.ptr_record import PtrRecord
+from mdns_discovery.mdns_discovery import MdnsDiscovery
+from mdns_discovery.mdns_record_cache import MdnsRecordCache
+from zeroconf import ServiceStateChange
+from zeroconf.const import _TYPE_PTR, _TYPE_SRV, _TYPE_TXT
+
+SERVICE_TYPE = "_matterc._udp.local."
+SERVICE_NAME = f"974B15BD2CC5278E.{SERVICE_TYPE}"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestMdnsRecordCache(unittest.TestCase):
+
+    def test_entries_expire_after_ttl(self):
+        clock = FakeClock()
+        cache = MdnsRecordCache(clock=clock)
+
+        cache.put(_TYPE_SRV, SERVICE_NAME, "srv", ttl_sec=120)
+        clock.now += 119
+        self.assertEqual(cache.get(_TYPE_SRV, SERVICE_NAME), "srv")
+        # Names are case insensitive
+        self.assertEqual(cache.get(_TYPE_SRV, SERVICE_NAME.lower()), "srv")
+        self.assertIsNone(cache.get(_TYPE_TXT, SERVICE_NAME))
+
+        clock.now += 1
+        self.assertIsNone(cache.get(_TYPE_SRV, SERVICE_NAME))
+
+    def test_goodbye_and_invalidate(self):
+        cache = MdnsRecordCache(clock=FakeClock())
+
+        cache.put(_TYPE_SRV, SERVICE_NAME, "srv", ttl_sec=120)
+        cache.put(_TYPE_TXT, SERVICE_NAME, "txt", ttl_sec=4500)
+        cache.put(_TYPE_PTR, SERVICE_TYPE, ["ptr"], ttl_sec=4500)
+
+        # A zero TTL drops the entry
+        cache.put(_TYPE_SRV, SERVICE_NAME, "srv", ttl_sec=0)
+        self.assertIsNone(cache.get(_TYPE_SRV, SERVICE_NAME))
+
+        cache.invalidate(SERVICE_NAME)
+        self.assertIsNone(cache.get(_TYPE_TXT, SERVICE_NAME))
+        self.assertEqual(cache.get(_TYPE_PTR, SERVICE_TYPE), ["ptr"])
+
+        cache.clear()
+        self.assertIsNone(cache.get(_TYPE_PTR, SERVICE_TYPE))
+
+
+class TestMdnsDiscoverySessionCache(unittest.TestCase):
+
+    def setUp(self):
+        self.mdns = MdnsDiscovery()
+        # Results are only served from the cache in session mode
+        self.mdns._session_azc = object()
+
+    def test_ptr_records_from_cache(self):
+        ptr = PtrRecord(service_type=SERVICE_TYPE, service_name=SERVICE_NAME)
+        self.assertFalse(self.mdns._discovered_services_from_cache([SERVICE_TYPE], None))
+
+        self.mdns._record_cache.put(_TYPE_PTR, SERVICE_TYPE, [ptr], ttl_sec=4500)
+        self.assertTrue(self.mdns._discovered_services_from_cache([SERVICE_TYPE], None))
+        self.assertEqual(self.mdns._discovered_services, {SERVICE_TYPE: [ptr]})
+        self.assertTrue(self.mdns._discovered_services_from_cache([SERVICE_TYPE], ptr.instance_name))
+        self.assertTrue(self.mdns._is_known_instance(SERVICE_TYPE, SERVICE_NAME))
+
+        # An awaited instance that is not cached requires a browse
+        self.assertFalse(self.mdns._discovered_services_from_cache([SERVICE_TYPE], "0000000000000000"))
+
+        # Outside session mode the cache is not used
+        self.mdns._session_azc = None
+        self.assertFalse(self.mdns._discovered_services_from_cache([SERVICE_TYPE], None))
+
+    def test_service_info_from_cache(self):
+        info = object()
+        self.mdns._record_cache.put(_TYPE_SRV, SERVICE_NAME, info, ttl_sec=120)
+        self.assertIs(self.mdns._cached_service_info(SERVICE_NAME, {_TYPE_SRV}), info)
+        self.assertIsNone(self.mdns._cached_service_info(SERVICE_NAME, {_TYPE_SRV, _TYPE_TXT}))
+
+        self.mdns._record_cache.put(_TYPE_TXT, SERVICE_NAME, info, ttl_sec=4500)
+        self.assertIs(self.mdns._cached_service_info(SERVICE_NAME, {_TYPE_SRV, _TYPE_TXT}), info)
+
+    def test_wait_for_instance_ends_browse(self):
+        self.mdns._event.clear()
+        self.mdns._discovered_services = {}
+        self.mdns._wait_for_instance = "974B15BD2CC5278E"
+
+        self.mdns._on_service_state_change(None, SERVICE_TYPE, f"0000000000000001.{SERVICE_TYPE}", ServiceStateChange.Added)
+        self.assertFalse(self.mdns._event.is_set())
+
+        self.mdns._on_service_state_change(None, SERVICE_TYPE, SERVICE_NAME, ServiceStateChange.Added)
+        self.assertTrue(self.mdns._event.is_set())
+        self.assertEqual(len(self.mdns._discovered_services[SERVICE_TYPE]), 2)
+
+    def test_removed_service_is_invalidated(self):
+        self.mdns._record_cache.put(_TYPE_SRV, SERVICE_NAME, object(), ttl_sec=120)
+        self.mdns._record_cache.put(_TYPE_PTR, SERVICE_TYPE, [], ttl_sec=4500)
+
+        self.mdns._on_service_state_change(None, SERVICE_TYPE, SERVICE_NAME, ServiceStateChange.Removed)
+        self.assertIsNone(self.mdns._record_cache.get(_TYPE_SRV, SERVICE_NAME))
+        self.assertIsNone(self.mdns._record_cache.get(_TYPE_PTR, SERVICE_TYPE))
+
+
+if __name__ == "__main__":
+    unittest.main()
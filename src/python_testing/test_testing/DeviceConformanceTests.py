@@ -22,13 +22,14 @@ import matter.clusters as Clusters
 from matter.testing.basic_composition import BasicCompositionTests
 from matter.testing.choice_conformance import (evaluate_attribute_choice_conformance, evaluate_command_choice_conformance,
                                                evaluate_feature_choice_conformance)
+from matter.testing.compiled_conformance import ClusterConformanceEvaluator
 from matter.testing.conformance import conformance_allowed
 from matter.testing.global_attribute_ids import (ClusterIdType, DeviceTypeIdType, GlobalAttributeIds, cluster_id_type,
                                                  device_type_id_type, is_valid_device_type_id)
 from matter.testing.problem_notices import (AttributePathLocation, ClusterPathLocation, CommandPathLocation, DeviceTypePathLocation,
                                             ProblemNotice, ProblemSeverity)
 from matter.testing.spec_parsing import (CommandType, PrebuiltDataModelDirectory, XmlDeviceType, XmlDeviceTypeClusterRequirements,
-                                         build_xml_device_types, build_xml_namespaces)
+                                         load_spec_data_model)
 from matter.tlv import uint
 
 
@@ -140,6 +141,10 @@ class DeviceConformanceTests(BasicCompositionTests):
         # They're not marked provisional, but are present in the ToT spec under an ifdef.
         provisional_cluster_ids.extend([])
 
+        # Bridges and composed devices repeat the same cluster configuration on many endpoints, so
+        # decisions are evaluated once per distinct configuration.
+        evaluator = ClusterConformanceEvaluator(self.xml_clusters)
+
         for endpoint_id, endpoint in self.endpoints_tlv.items():
             for cluster_id, cluster in endpoint.items():
                 cluster_location = ClusterPathLocation(endpoint_id=endpoint_id, cluster_id=cluster_id)
@@ -161,6 +166,7 @@ class DeviceConformanceTests(BasicCompositionTests):
                 attribute_list = cluster[GlobalAttributeIds.ATTRIBUTE_LIST_ID]
                 all_command_list = cluster[GlobalAttributeIds.ACCEPTED_COMMAND_LIST_ID] + \
                     cluster[GlobalAttributeIds.GENERATED_COMMAND_LIST_ID]
+                decisions = evaluator.decisions(cluster_id, feature_map, attribute_list, all_command_list)
 
                 # Feature conformance checking
                 location = AttributePathLocation(endpoint_id=endpoint_id, cluster_id=cluster_id,
@@ -178,13 +184,12 @@ class DeviceConformanceTests(BasicCompositionTests):
                         record_error(location=location,
                                      problem=f'Unknown feature with mask 0x{f:02x} (feature bit {f.bit_length() - 1})')
                         continue
-                    xml_feature = self.xml_clusters[cluster_id].features[f]
-                    conformance_decision_with_choice = xml_feature.conformance(feature_map, attribute_list, all_command_list)
+                    conformance_decision_with_choice = decisions.features[f]
                     if not conformance_allowed(conformance_decision_with_choice, allow_provisional):
                         record_error(location=location,
                                      problem=f'Disallowed feature with mask 0x{f:02x} (feature bit {f.bit_length() - 1})')
                 for feature_mask, xml_feature in self.xml_clusters[cluster_id].features.items():
-                    conformance_decision_with_choice = xml_feature.conformance(feature_map, attribute_list, all_command_list)
+                    conformance_decision_with_choice = decisions.features[feature_mask]
                     if conformance_decision_with_choice.is_mandatory() and feature_mask not in feature_masks:
                         record_error(
                             location=location, problem=f'Required feature with mask 0x{feature_mask:02x} (feature bit {feature_mask.bit_length() - 1}) is not present in feature map. {conformance_str(xml_feature.conformance, feature_map, self.xml_clusters[cluster_id].features)}')
@@ -200,7 +205,7 @@ class DeviceConformanceTests(BasicCompositionTests):
                             record_error(location=location, problem='Standard attribute found on device, but not in spec')
                         continue
                     xml_attribute = self.xml_clusters[cluster_id].attributes[attribute_id]
-                    conformance_decision_with_choice = xml_attribute.conformance(feature_map, attribute_list, all_command_list)
+                    conformance_decision_with_choice = decisions.attributes[attribute_id]
                     if not conformance_allowed(conformance_decision_with_choice, allow_provisional):
                         location = AttributePathLocation(endpoint_id=endpoint_id, cluster_id=cluster_id, attribute_id=attribute_id)
                         record_error(
@@ -208,7 +213,7 @@ class DeviceConformanceTests(BasicCompositionTests):
                 for attribute_id, xml_attribute in self.xml_clusters[cluster_id].attributes.items():
                     if cluster_id in ignore_attributes and attribute_id in ignore_attributes[cluster_id]:
                         continue
-                    conformance_decision_with_choice = xml_attribute.conformance(feature_map, attribute_list, all_command_list)
+                    conformance_decision_with_choice = decisions.attributes[attribute_id]
                     if conformance_decision_with_choice.is_mandatory() and attribute_id not in cluster:
                         location = AttributePathLocation(endpoint_id=endpoint_id, cluster_id=cluster_id, attribute_id=attribute_id)
                         record_error(
@@ -217,6 +222,7 @@ class DeviceConformanceTests(BasicCompositionTests):
                 def check_spec_conformance_for_commands(command_type: CommandType):
                     global_attribute_id = GlobalAttributeIds.ACCEPTED_COMMAND_LIST_ID if command_type == CommandType.ACCEPTED else GlobalAttributeIds.GENERATED_COMMAND_LIST_ID
                     xml_commands_dict = self.xml_clusters[cluster_id].accepted_commands if command_type == CommandType.ACCEPTED else self.xml_clusters[cluster_id].generated_commands
+                    command_decisions = decisions.accepted_commands if command_type == CommandType.ACCEPTED else decisions.generated_commands
                     command_list = cluster[global_attribute_id]
                     for command_id in command_list:
                         location = CommandPathLocation(endpoint_id=endpoint_id, cluster_id=cluster_id, command_id=command_id)
@@ -226,12 +232,12 @@ class DeviceConformanceTests(BasicCompositionTests):
                                 record_error(location=location, problem='Standard command found on device, but not in spec')
                             continue
                         xml_command = xml_commands_dict[command_id]
-                        conformance_decision_with_choice = xml_command.conformance(feature_map, attribute_list, all_command_list)
+                        conformance_decision_with_choice = command_decisions[command_id]
                         if not conformance_allowed(conformance_decision_with_choice, allow_provisional):
                             record_error(
                                 location=location, problem=f'Command 0x{command_id:02x} is included, but disallowed by conformance. {conformance_str(xml_command.conformance, feature_map, self.xml_clusters[cluster_id].features)}')
                     for command_id, xml_command in xml_commands_dict.items():
-                        conformance_decision_with_choice = xml_command.conformance(feature_map, attribute_list, all_command_list)
+                        conformance_decision_with_choice = command_decisions[command_id]
                         if conformance_decision_with_choice.is_mandatory() and command_id not in command_list:
                             location = CommandPathLocation(endpoint_id=endpoint_id, cluster_id=cluster_id, command_id=command_id)
                             record_error(
@@ -242,11 +248,11 @@ class DeviceConformanceTests(BasicCompositionTests):
                 check_spec_conformance_for_commands(CommandType.GENERATED)
 
                 feature_choice_problems = evaluate_feature_choice_conformance(
-                    endpoint_id, cluster_id, self.xml_clusters, feature_map, attribute_list, all_command_list)
+                    endpoint_id, cluster_id, self.xml_clusters, feature_map, attribute_list, all_command_list, decisions)
                 attribute_choice_problems = evaluate_attribute_choice_conformance(
-                    endpoint_id, cluster_id, self.xml_clusters, feature_map, attribute_list, all_command_list)
+                    endpoint_id, cluster_id, self.xml_clusters, feature_map, attribute_list, all_command_list, decisions)
                 command_choice_problem = evaluate_command_choice_conformance(
-                    endpoint_id, cluster_id, self.xml_clusters, feature_map, attribute_list, all_command_list)
+                    endpoint_id, cluster_id, self.xml_clusters, feature_map, attribute_list, all_command_list, decisions)
 
                 if feature_choice_problems or attribute_choice_problems or command_choice_problem:
                     success = False
@@ -501,7 +507,7 @@ class DeviceConformanceTests(BasicCompositionTests):
     def check_closure_restricted_clusters(self) -> list[ProblemNotice]:
         # This is a test that is SPECIFIC to the 1.5 spec, and thus we need the 1.5 spec information specifically
         # to assess the revisions.
-        one_five_device_types, _ = build_xml_device_types(PrebuiltDataModelDirectory.k1_5)
+        one_five_device_types = load_spec_data_model(PrebuiltDataModelDirectory.k1_5).device_types
         # TODO: change this once https://github.com/project-chip/matter-test-scripts/issues/689 is implemented
 
         window_covering_id = self._get_device_type_id('Window Covering', one_five_device_types)
@@ -526,8 +532,9 @@ class DeviceConformanceTests(BasicCompositionTests):
     def check_closure_restricted_sem_tags(self) -> list[ProblemNotice]:
         # This is a test that is SPECIFIC to the 1.5 spec, and thus we need the 1.5 spec information specifically
         # to assess the revisions.
-        one_five_device_types, _ = build_xml_device_types(PrebuiltDataModelDirectory.k1_5)
-        one_five_namespaces, _ = build_xml_namespaces(PrebuiltDataModelDirectory.k1_5)
+        one_five = load_spec_data_model(PrebuiltDataModelDirectory.k1_5)
+        one_five_device_types = one_five.device_types
+        one_five_namespaces = one_five.namespaces
         # TODO: change this once https://github.com/project-chip/matter-test-scripts/issues/689 is implemented
 
         def get_namespace_id(name: str) -> uint:
@@ -0,0 +1,150 @@
+#
+#    Copyright (c) 2026 Project CHIP Authors
+#    All rights reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+
+import json
+import os
+import sys
+import tempfile
+
+from click.testing import CliRunner
+from mobly import asserts
+
+import matter.clusters as Clusters
+from matter.testing.matter_testing import MatterBaseTest, default_matter_test_main
+from matter.testing.problem_notices import ProblemSeverity
+
+try:
+    import batch_conformance_checker
+except ImportError:
+    sys.path.append(os.path.abspath(
+        os.path.join(os.path.dirname(__file__), '..')))
+    import batch_conformance_checker
+
+GLOBAL_ATTRIBUTES = {
+    'GeneratedCommandList': 0xFFF8,
+    'AcceptedCommandList': 0xFFF9,
+    'AttributeList': 0xFFFB,
+    'FeatureMap': 0xFFFC,
+    'ClusterRevision': 0xFFFD,
+}
+
+
+def cluster_dump(cluster_revision: int, attributes: dict[str, object]) -> dict[str, object]:
+    ''' MatterJsonTlv dump of a cluster with no commands and no features. '''
+    attribute_ids = sorted([int(name.split(':')[0]) for name in attributes] + list(GLOBAL_ATTRIBUTES.values()))
+    dump = dict(attributes)
+    dump[f'{GLOBAL_ATTRIBUTES["GeneratedCommandList"]}:ARRAY-?'] = []
+    dump[f'{GLOBAL_ATTRIBUTES["AcceptedCommandList"]}:ARRAY-?'] = []
+    dump[f'{GLOBAL_ATTRIBUTES["AttributeList"]}:ARRAY-UINT'] = attribute_ids
+    dump[f'{GLOBAL_ATTRIBUTES["FeatureMap"]}:UINT'] = 0
+    dump[f'{GLOBAL_ATTRIBUTES["ClusterRevision"]}:UINT'] = cluster_revision
+    return dump
+
+
+def root_node_dump() -> dict[str, object]:
+    ''' Wildcard dump of a 1.4 root node that only has the descriptor and basic information clusters. '''
+    desc = Clusters.Descriptor
+    basic = Clusters.BasicInformation
+    return {
+        '0': {
+            f'{desc.id}:STRUCT': cluster_dump(3, {
+                f'{desc.Attributes.DeviceTypeList.attribute_id}:ARRAY-STRUCT': [{'0:UINT': 0x0016, '1:UINT': 3}],
+                f'{desc.Attributes.ServerList.attribute_id}:ARRAY-UINT': [desc.id, basic.id],
+                f'{desc.Attributes.ClientList.attribute_id}:ARRAY-?': [],
+                f'{desc.Attributes.PartsList.attribute_id}:ARRAY-?': [],
+            }),
+            f'{basic.id}:STRUCT': cluster_dump(4, {
+                f'{basic.Attributes.SpecificationVersion.attribute_id}:UINT': 0x01040000,
+            }),
+        },
+    }
+
+
+class TestBatchConformanceChecker(MatterBaseTest):
+    def setup_class(self):
+        super().setup_class()
+        self.options = batch_conformance_checker.CheckOptions(ignore_in_progress=False, allow_provisional=False,
+                                                              fail_on_extra_clusters=True)
+
+    def test_find_dumps(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            os.makedirs(os.path.join(tmp, 'nested'))
+            for name in ('b.json', 'a.json', os.path.join('nested', 'c.json'), 'notes.txt'):
+                with open(os.path.join(tmp, name), 'w') as f:
+                    f.write('{}')
+            single = os.path.join(tmp, 'notes.txt')
+
+            dumps = batch_conformance_checker.find_dumps((tmp, single))
+            asserts.assert_equal(dumps, [os.path.join(tmp, 'a.json'), os.path.join(tmp, 'b.json'),
+                                         os.path.join(tmp, 'nested', 'c.json'), single],
+                                 "Directories are not searched recursively for JSON dumps")
+
+    def test_unreadable_dump(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'broken.json')
+            with open(path, 'w') as f:
+                f.write('{"0": ')
+
+            report = batch_conformance_checker.check_dump(path, self.options)
+            asserts.assert_is_not_none(report.error, "Unreadable dump was not reported")
+            asserts.assert_equal(report.problems, [], "Problems were reported for an unreadable dump")
+            asserts.assert_is_none(report.spec_version, "Spec version was reported for an unreadable dump")
+
+    def test_check_dump(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'root_node.json')
+            with open(path, 'w') as f:
+                json.dump(root_node_dump(), f)
+
+            report = batch_conformance_checker.check_dump(path, self.options)
+            asserts.assert_is_none(report.error, f"Dump could not be checked: {report.error}")
+            asserts.assert_equal(report.spec_version, '1.4', "Spec version was not read from the dump")
+
+            # The root node lacks all its other mandatory clusters
+            errors = [p for p in report.problems if p['severity'] == ProblemSeverity.ERROR]
+            asserts.assert_true(any(p['test_name'] == 'IDM-10.5' for p in errors),
+                                "Missing root node clusters were not reported")
+            asserts.assert_false(any(p['problem'].startswith('Check failed to run') for p in report.problems),
+                                 "A check failed to run on a valid dump")
+
+    def test_report(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            dumps = os.path.join(tmp, 'dumps')
+            os.makedirs(dumps)
+            with open(os.path.join(dumps, 'root_node.json'), 'w') as f:
+                json.dump(root_node_dump(), f)
+            with open(os.path.join(dumps, 'broken.json'), 'w') as f:
+                f.write('not json')
+            output = os.path.join(tmp, 'report.json')
+
+            result = CliRunner().invoke(batch_conformance_checker.main, [dumps, '--output', output, '--jobs', '1'])
+            asserts.assert_equal(result.exit_code, 1, f"Dumps with errors did not fail the run: {result.output}")
+
+            with open(output) as f:
+                report = json.load(f)
+            summary = report['summary']
+            asserts.assert_equal(summary['dumps'], 2, "Wrong number of checked dumps")
+            asserts.assert_equal(summary['unreadable_dumps'], 1, "Wrong number of unreadable dumps")
+            asserts.assert_equal(summary['dumps_with_errors'], 1, "Wrong number of dumps with errors")
+            asserts.assert_equal(summary['spec_versions'], {'1.4': 1}, "Wrong spec versions")
+            asserts.assert_equal(sum(summary['errors_by_test'].values()),
+                                 sum(1 for d in report['dumps'] for p in d['problems'] if p['severity'] == ProblemSeverity.ERROR),
+                                 "Summary does not match the problems of the dumps")
+
+
+if __name__ == "__main__":
+    default_matter_test_main()
@@ -20,10 +20,12 @@ from typing import Callable
 
 from mobly import asserts
 
+from matter.testing.compiled_conformance import compile_conformance
 from matter.testing.conformance import (Choice, Conformance, ConformanceDecision, ConformanceException, ConformanceParseParameters,
                                         deprecated, disallowed, mandatory, optional, parse_basic_callable_from_xml,
                                         parse_callable_from_xml, provisional, zigbee)
 from matter.testing.matter_testing import MatterBaseTest, default_matter_test_main
+from matter.testing.spec_parsing import PrebuiltDataModelDirectory, load_spec_data_model
 from matter.tlv import uint
 
 
@@ -950,6 +952,29 @@ class TestConformanceSupport(MatterBaseTest):
             xml = (f'<deprecateConform {xml_attrs}/>')
             check_bad_choice(xml)
 
+    def test_compiled_conformance(self):
+        def evaluate(conformance: Callable, feature_map: uint, attribute_list, command_list):
+            try:
+                decision_with_choice = conformance(feature_map, attribute_list, command_list)
+                return decision_with_choice.decision, decision_with_choice.choice
+            except ConformanceException as e:
+                return str(e)
+
+        # Every conformance in the spec must give the same decision once compiled, for every set of the elements it depends on.
+        xml_clusters = load_spec_data_model(PrebuiltDataModelDirectory.k1_5).clusters
+        for cluster in xml_clusters.values():
+            elements = list(cluster.features.values()) + list(cluster.attributes.values()) + \
+                list(cluster.accepted_commands.values()) + list(cluster.generated_commands.values())
+            element_lists = [[], list(cluster.attributes.keys()) + list(cluster.accepted_commands.keys()) +
+                             list(cluster.generated_commands.keys())]
+            for element in elements:
+                compiled = compile_conformance(element.conformance)
+                for feature_map in [0x00, 0x01, 0x02, 0x05, 0xFF]:
+                    for element_list in element_lists:
+                        asserts.assert_equal(evaluate(compiled, uint(feature_map), frozenset(element_list), frozenset(element_list)),
+                                             evaluate(element.conformance, uint(feature_map), element_list, element_list),
+                                             f"Compiled conformance {element.conformance} does not match for feature map {feature_map:02x}")
+
 
 if __name__ == "__main__":
     default_matter_test_main()
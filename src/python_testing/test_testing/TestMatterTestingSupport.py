@@ -15,7 +15,9 @@
 #    limitations under the License.
 #
 
+import asyncio
 import os
+import threading
 import time
 import typing
 from datetime import datetime, timedelta, timezone
@@ -23,8 +25,11 @@ from datetime import datetime, timedelta, timezone
 from mobly import asserts, signals
 
 import matter.clusters as Clusters
+from matter.clusters.Attribute import AttributePath, EventHeader, EventReadResult, TypedAttributePath
 from matter.clusters.Types import Nullable, NullValue
-from matter.testing.matter_testing import (MatterBaseTest, async_test_body, default_matter_test_main, matchers,
+from matter.interaction_model import Status
+from matter.testing.event_attribute_reporting import AsyncAttributeSubscriptionHandler, AsyncEventSubscriptionHandler
+from matter.testing.matter_testing import (AttributeMatcher, MatterBaseTest, async_test_body, default_matter_test_main, matchers,
                                            parse_matter_test_args)
 from matter.testing.pics import parse_pics, parse_pics_xml
 from matter.testing.taglist_and_topology_test import (TagProblem, create_device_type_list_for_root, create_device_type_lists,
@@ -727,6 +732,103 @@ class TestMatterTestingSupport(MatterBaseTest):
         asserts.assert_equal(parsed.global_test_params.get("PIXIT.TEST.STR.MULTI.2"), "bar")
         asserts.assert_equal(parsed.global_test_params.get("PIXIT.TEST.JSON"), {"key": "value"})
 
+    @async_test_body
+    async def test_async_attribute_subscription_handler(self):
+        on_off = Clusters.OnOff.Attributes.OnOff
+        on_time = Clusters.OnOff.Attributes.OnTime
+        handler = AsyncAttributeSubscriptionHandler(expected_cluster=Clusters.OnOff)
+        handler._loop = asyncio.get_running_loop()
+        handler._endpoint_id = 1
+
+        class FakeTransaction:
+            def __init__(self, value):
+                self.value = value
+
+            def GetAttribute(self, path):
+                return self.value
+
+        def report(endpoint_id, attribute, value):
+            path = TypedAttributePath(ClusterType=Clusters.OnOff, AttributeType=attribute)
+            path.Path = AttributePath.from_attribute(endpoint_id, attribute)
+            handler(path, FakeTransaction(value))
+
+        def report_from_thread(*reports):
+            # Reports are delivered on the CHIP thread, not on the event loop
+            thread = threading.Thread(target=lambda: [report(*r) for r in reports])
+            thread.start()
+            thread.join()
+
+        report_from_thread((1, on_off, False), (1, on_time, 5), (2, on_off, True))
+        # Let the event loop process the reports handed over by the thread
+        await asyncio.sleep(0)
+        asserts.assert_equal(handler.attribute_queue.qsize(), 3)
+
+        # Matchers with a path are only tested against reports of their attribute and endpoint
+        ep2_on = AttributeMatcher.from_callable("OnOff is true on EP2", lambda report: report.value is True,
+                                                attribute=on_off, endpoint_id=2)
+        any_on_time = AttributeMatcher.from_callable("OnTime is 5", lambda report: report.value == 5, attribute=on_time)
+        await handler.await_all_expected_report_matches([ep2_on, any_on_time], timeout_sec=0.1)
+
+        # Wait for reports that arrive while awaiting
+        ep1_on = AttributeMatcher.from_callable("OnOff is true on EP1", lambda report: report.value is True,
+                                                attribute=on_off, endpoint_id=1)
+        asyncio.get_running_loop().call_later(0.05, report_from_thread, (1, on_off, True))
+        await handler.await_all_expected_report_matches([ep1_on], timeout_sec=1.0)
+        asserts.assert_equal(handler.attribute_report_counts[on_off], 3)
+
+        with asserts.assert_raises(signals.TestFailure):
+            await handler.await_all_expected_report_matches([AttributeMatcher.from_callable(
+                "OnTime is 6", lambda report: report.value == 6, attribute=on_time)], timeout_sec=0.1)
+
+        handler.reset()
+        asyncio.get_running_loop().call_later(0.05, report_from_thread, (1, on_off, False), (1, on_off, True))
+        await handler.await_sequence_of_reports(attribute=on_off, sequence=[False, True], timeout_sec=1.0)
+
+    @async_test_body
+    async def test_async_event_subscription_handler(self):
+        start_up = Clusters.BasicInformation.Events.StartUp
+        shut_down = Clusters.BasicInformation.Events.ShutDown
+        handler = AsyncEventSubscriptionHandler(expected_cluster=Clusters.BasicInformation)
+        handler._loop = asyncio.get_running_loop()
+
+        def report(event, data, status=Status.Success):
+            header = EventHeader(EndpointId=0, ClusterId=event.cluster_id, EventId=event.event_id)
+            handler(EventReadResult(Header=header, Status=status, Data=data), None)
+
+        def report_from_thread(*reports):
+            # Reports are delivered on the CHIP thread, not on the event loop
+            thread = threading.Thread(target=lambda: [report(*r) for r in reports])
+            thread.start()
+            thread.join()
+
+        # Events of other clusters and failed reports are not queued
+        report_from_thread((start_up, start_up(softwareVersion=1)), (Clusters.AccessControl.Events.AccessControlEntryChanged, None),
+                           (start_up, None, Status.Failure))
+        await asyncio.sleep(0)
+        asserts.assert_equal(handler.get_size(), 1)
+        data = await handler.await_event_report(start_up, timeout_sec=0.1)
+        asserts.assert_equal(data.softwareVersion, 1)
+        await handler.await_event_expect_no_report(timeout_sec=0.1)
+
+        # Wait for events that arrive while awaiting, ignoring the other event types
+        asyncio.get_running_loop().call_later(0.05, report_from_thread, (shut_down, shut_down()),
+                                              (start_up, start_up(softwareVersion=2)))
+        data = await handler.await_event_type_report(start_up, timeout_sec=1.0)
+        asserts.assert_equal(data.softwareVersion, 2)
+
+        with asserts.assert_raises(signals.TestFailure):
+            await handler.await_event_report(start_up, timeout_sec=0.1)
+
+        report_from_thread((shut_down, shut_down()))
+        await asyncio.sleep(0)
+        with asserts.assert_raises(signals.TestFailure):
+            await handler.await_event_expect_no_report(timeout_sec=0.1)
+
+        report_from_thread((shut_down, shut_down()), (start_up, start_up(softwareVersion=3)))
+        await asyncio.sleep(0)
+        handler.reset()
+        asserts.assert_equal(handler.event_queue.qsize(), 0)
+
 
 if __name__ == "__main__":
     default_matter_test_main()
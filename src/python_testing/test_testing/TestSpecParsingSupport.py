@@ -15,18 +15,22 @@
 #    limitations under the License.
 #
 
+import os
+import tempfile
 import xml.etree.ElementTree as ElementTree
 
 import jinja2
 from mobly import asserts
 
 import matter.clusters as Clusters
+import matter.testing.spec_parsing as spec_parsing
 from matter.testing.global_attribute_ids import GlobalAttributeIds
 from matter.testing.matter_testing import MatterBaseTest, default_matter_test_main
 from matter.testing.problem_notices import ProblemNotice
 from matter.testing.spec_parsing import (ClusterParser, DataModelLevel, PrebuiltDataModelDirectory, XmlCluster,
-                                         add_cluster_data_from_xml, build_xml_clusters, check_clusters_for_unknown_commands,
-                                         combine_derived_clusters_with_base, get_data_model_directory)
+                                         add_cluster_data_from_xml, build_xml_clusters, build_xml_device_types,
+                                         check_clusters_for_unknown_commands, combine_derived_clusters_with_base,
+                                         get_data_model_directory, load_spec_data_model)
 
 # TODO: improve the test coverage here
 # https://github.com/project-chip/connectedhomeip/issues/30958
@@ -549,6 +553,23 @@ class TestSpecParsingSupport(MatterBaseTest):
         asserts.assert_not_in(response_id, one_three_clusters[Clusters.Thermostat.id].generated_commands.keys(),
                               "Atomic request found in thermostat generated command list for 1.3")
 
+    def test_spec_data_model_cache(self):
+        clusters, _ = build_xml_clusters(PrebuiltDataModelDirectory.k1_4)
+        device_types, _ = build_xml_device_types(PrebuiltDataModelDirectory.k1_4, clusters)
+
+        # Start from an empty in-process cache so the data model is written to the cache directory
+        spec_parsing._spec_data_model_cache.clear()
+        with tempfile.TemporaryDirectory() as cache_dir:
+            spec = load_spec_data_model(PrebuiltDataModelDirectory.k1_4, cache_dir=cache_dir)
+            asserts.assert_equal(spec.clusters, clusters, "Cached clusters do not match the parsed clusters")
+            asserts.assert_equal(spec.device_types, device_types, "Cached device types do not match the parsed device types")
+            asserts.assert_equal(len(os.listdir(cache_dir)), 1, "Parsed data model was not written to the cache directory")
+
+            # Every load returns its own copy, so tests can modify the data without affecting each other
+            spec.clusters.clear()
+            spec = load_spec_data_model(PrebuiltDataModelDirectory.k1_4, cache_dir=cache_dir)
+            asserts.assert_equal(spec.clusters, clusters, "Modifying a loaded data model changed the cached data")
+
 
 if __name__ == "__main__":
     default_matter_test_main()
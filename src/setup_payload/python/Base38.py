@@ -27,27 +27,33 @@ MAX_BYTES_IN_CHUNK = 3
 MAX_ENCODED_BYTES_IN_CHUNK = 5
 
 
+# Base38 digits of all the values of two characters, least significant digit first
+_CHAR_PAIRS = [CODES[i % RADIX] + CODES[i // RADIX] for i in range(RADIX * RADIX)]
+_CODE_VALUES = {c: i for i, c in enumerate(CODES)}
+
+
+def encode_chunk(value, chars_needed):
+    """ Encodes the integer value of a chunk of up to 3 bytes, least significant byte first. """
+    pair1 = _CHAR_PAIRS[value % (RADIX * RADIX)]
+    if chars_needed == 2:
+        return pair1
+    value //= RADIX * RADIX
+    pair2 = _CHAR_PAIRS[value % (RADIX * RADIX)]
+    if chars_needed == 4:
+        return pair1 + pair2
+    return pair1 + pair2 + CODES[value // (RADIX * RADIX)]
+
+
 def encode(bytes):
     total_bytes = len(bytes)
-    qrcode = ''
+    chunks = []
 
     for i in range(0, total_bytes, MAX_BYTES_IN_CHUNK):
-        if (i + MAX_BYTES_IN_CHUNK) > total_bytes:
-            bytes_in_chunk = total_bytes - i
-        else:
-            bytes_in_chunk = MAX_BYTES_IN_CHUNK
-
-        value = 0
-        for j in range(i, i + bytes_in_chunk):
-            value = value + (bytes[j] << (8 * (j - i)))
-
-        base38_chars_needed = BASE38_CHARS_NEEDED_IN_CHUNK[bytes_in_chunk - 1]
-        while base38_chars_needed > 0:
-            qrcode += CODES[int(value % RADIX)]
-            value = int(value / RADIX)
-            base38_chars_needed -= 1
+        bytes_in_chunk = min(MAX_BYTES_IN_CHUNK, total_bytes - i)
+        value = int.from_bytes(bytes[i:i + bytes_in_chunk], byteorder='little')
+        chunks.append(encode_chunk(value, BASE38_CHARS_NEEDED_IN_CHUNK[bytes_in_chunk - 1]))
 
-    return qrcode
+    return ''.join(chunks)
 
 
 def decode(qrcode):
@@ -55,18 +61,16 @@ def decode(qrcode):
     decoded_bytes = bytearray()
 
     for i in range(0, total_chars, MAX_ENCODED_BYTES_IN_CHUNK):
-        if (i + MAX_ENCODED_BYTES_IN_CHUNK) > total_chars:
-            chars_in_chunk = total_chars - i
-        else:
-            chars_in_chunk = MAX_ENCODED_BYTES_IN_CHUNK
+        chars_in_chunk = min(MAX_ENCODED_BYTES_IN_CHUNK, total_chars - i)
 
         value = 0
         for j in range(i + chars_in_chunk - 1, i - 1, -1):
-            value = value * RADIX + CODES.index(qrcode[j])
+            code = _CODE_VALUES.get(qrcode[j])
+            if code is None:
+                raise ValueError('invalid Base38 character: {!r}'.format(qrcode[j]))
+            value = value * RADIX + code
 
         bytes_in_chunk = BASE38_CHARS_NEEDED_IN_CHUNK.index(chars_in_chunk) + 1
-        for k in range(0, bytes_in_chunk):
-            decoded_bytes.append(value & 0xFF)
-            value = value >> 8
+        decoded_bytes += (value & ((1 << (8 * bytes_in_chunk)) - 1)).to_bytes(bytes_in_chunk, byteorder='little')
 
     return decoded_bytes
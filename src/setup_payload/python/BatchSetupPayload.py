@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+#
+# Copyright (c) 2026 Project CHIP Authors
+# All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Generates the onboarding codes of many devices at once. The codes are the same as the ones
+# of SetupPayload.py, but the payloads are packed with integer operations instead of construct
+# and bitarray, and batches of rows are encoded across a pool of processes.
+
+import contextlib
+import csv
+import multiprocessing
+import os
+
+import Base38
+import click
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+COLUMNS = ['discriminator', 'passcode', 'vid', 'pid', 'discovery', 'flow']
+OUTPUT_COLUMNS = COLUMNS + ['qrcode', 'manualcode']
+
+# Valid range of each column, as accepted by `SetupPayload.py generate`
+RANGES = {
+    'discriminator': (0, 0xFFF),
+    'passcode': (1, 0x5F5E0FE),
+    'vid': (0, 0xFFFF),
+    'pid': (0, 0xFFFF),
+    'discovery': (0, 7),
+    'flow': (0, 2),
+}
+
+ARROW_EXTENSIONS = ('.arrow', '.feather', '.parquet')
+
+# (bit offset, Base38 characters) of the chunks of the 11 bytes QR code payload
+QRCODE_CHUNKS = [(0, 5), (24, 5), (48, 5), (72, 4)]
+
+# Verhoeff check digit tables, see stdnum.verhoeff
+VERHOEFF_MULTIPLICATION = [
+    [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+    [1, 2, 3, 4, 0, 6, 7, 8, 9, 5],
+    [2, 3, 4, 0, 1, 7, 8, 9, 5, 6],
+    [3, 4, 0, 1, 2, 8, 9, 5, 6, 7],
+    [4, 0, 1, 2, 3, 9, 5, 6, 7, 8],
+    [5, 9, 8, 7, 6, 0, 4, 3, 2, 1],
+    [6, 5, 9, 8, 7, 1, 0, 4, 3, 2],
+    [7, 6, 5, 9, 8, 2, 1, 0, 4, 3],
+    [8, 7, 6, 5, 9, 3, 2, 1, 0, 4],
+    [9, 8, 7, 6, 5, 4, 3, 2, 1, 0],
+]
+VERHOEFF_PERMUTATION = [
+    [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+    [1, 5, 7, 6, 2, 8, 3, 0, 9, 4],
+    [5, 8, 0, 3, 7, 9, 6, 1, 4, 2],
+    [8, 9, 1, 6, 0, 4, 3, 5, 2, 7],
+    [9, 4, 5, 3, 1, 2, 6, 8, 7, 0],
+    [4, 2, 8, 6, 5, 7, 3, 9, 0, 1],
+    [2, 7, 9, 3, 8, 0, 6, 4, 1, 5],
+    [7, 0, 4, 6, 9, 1, 3, 2, 5, 8],
+]
+VERHOEFF_INVERSE = '0432156789'
+
+
+def verhoeff_check_digit(digits):
+    check = 0
+    for i, digit in enumerate(reversed(digits)):
+        check = VERHOEFF_MULTIPLICATION[check][VERHOEFF_PERMUTATION[(i + 1) % 8][ord(digit) - 48]]
+    return VERHOEFF_INVERSE[check]
+
+
+def generate_qrcode(discriminator, passcode, vid=0, pid=0, discovery=4, flow=0):
+    # Version 0, fields packed from the least significant bit, as in qrcode_format of SetupPayload.py
+    payload = (vid << 3) | (pid << 19) | (flow << 35) | (discovery << 37) | (discriminator << 45) | (passcode << 57)
+    return 'MT:' + ''.join(Base38.encode_chunk((payload >> shift) & 0xFFFFFF, chars) for shift, chars in QRCODE_CHUNKS)
+
+
+def generate_manualcode(discriminator, passcode, vid=0, pid=0, flow=0):
+    short_discriminator = discriminator >> 8
+    vid_pid_present = 1 if flow else 0
+    payload = '{}{:05}{:04}'.format((vid_pid_present << 2) | (short_discriminator >> 2),
+                                    ((short_discriminator & 0x3) << 14) | (passcode & 0x3FFF),
+                                    passcode >> 14)
+    if vid_pid_present:
+        payload += '{:05}{:05}'.format(vid, pid)
+    return payload + verhoeff_check_digit(payload)
+
+
+def encode_batch(batch):
+    """
+    Returns the QR codes and the manual codes of a batch of rows, given as a dict of
+    columns of the same length (see COLUMNS).
+    """
+    for column, (min_value, max_value) in RANGES.items():
+        for row, value in enumerate(batch[column]):
+            if not min_value <= value <= max_value:
+                raise ValueError('row {}: {} {} out of range [{}, {}]'.format(row, column, value, min_value, max_value))
+
+    rows = list(zip(*(batch[column] for column in COLUMNS)))
+    qrcodes = [generate_qrcode(d, p, v, i, dm, f) for d, p, v, i, dm, f in rows]
+    manualcodes = [generate_manualcode(d, p, v, i, f) for d, p, v, i, _, f in rows]
+    return qrcodes, manualcodes
+
+
+def _encode_batch_with_columns(batch):
+    batch['qrcode'], batch['manualcode'] = encode_batch(batch)
+    return batch
+
+
+def generate_batches(batches, jobs=None):
+    """
+    Encodes the batches across `jobs` processes (all the CPUs by default) and yields them in
+    order, with the `qrcode` and `manualcode` columns added.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1:
+        yield from map(_encode_batch_with_columns, batches)
+        return
+
+    with multiprocessing.Pool(jobs) as pool:
+        # The pool holds at most jobs * 2 batches at once
+        pending = []
+        for batch in batches:
+            pending.append(pool.apply_async(_encode_batch_with_columns, (batch,)))
+            if len(pending) >= jobs * 2:
+                yield pending.pop(0).get()
+        for result in pending:
+            yield result.get()
+
+
+def _parse_int(value):
+    value = value.strip()
+    return int(value, 16) if value.lower().startswith('0x') else int(value, 10)
+
+
+def _fill_defaults(batch, defaults, size):
+    for column in COLUMNS:
+        if column not in batch:
+            if defaults.get(column) is None:
+                raise ValueError('missing column: {}'.format(column))
+            batch[column] = [defaults[column]] * size
+    return batch
+
+
+def read_csv_batches(path, batch_size, defaults):
+    """ Yields batches of the rows of a CSV file. Columns that are not in the file are set to their default value. """
+    with open(path, newline='') as f:
+        reader = csv.DictReader(f)
+        columns = [column for column in COLUMNS if column in (reader.fieldnames or [])]
+        batch = {column: [] for column in columns}
+        size = 0
+        for row in reader:
+            for column in columns:
+                batch[column].append(_parse_int(row[column]))
+            size += 1
+            if size == batch_size:
+                yield _fill_defaults(batch, defaults, size)
+                batch = {column: [] for column in columns}
+                size = 0
+        if size:
+            yield _fill_defaults(batch, defaults, size)
+
+
+def read_arrow_batches(path, batch_size, defaults):
+    """ Yields batches of the rows of an Arrow IPC (.arrow or .feather) or Parquet file. """
+    if path.endswith('.parquet'):
+        record_batches = pyarrow.parquet.ParquetFile(path).iter_batches(batch_size=batch_size)
+    else:
+        reader = pyarrow.ipc.open_file(path)
+        record_batches = (reader.get_batch(i) for i in range(reader.num_record_batches))
+
+    for record_batch in record_batches:
+        for offset in range(0, record_batch.num_rows, batch_size):
+            chunk = record_batch.slice(offset, batch_size)
+            columns = {name: chunk.column(name).to_pylist() for name in chunk.schema.names if name in COLUMNS}
+            yield _fill_defaults(columns, defaults, chunk.num_rows)
+
+
+class CsvWriter:
+    """ Writes batches to a CSV file opened by the caller, with newline=''. """
+
+    def __init__(self, file):
+        self._writer = csv.writer(file)
+        self._writer.writerow(OUTPUT_COLUMNS)
+
+    def write(self, batch):
+        self._writer.writerows(zip(*(batch[column] for column in OUTPUT_COLUMNS)))
+
+
+class ArrowWriter:
+    def __init__(self, path):
+        int_type = pyarrow.uint32()
+        self._schema = pyarrow.schema([(column, int_type) for column in COLUMNS] +
+                                      [('qrcode', pyarrow.string()), ('manualcode', pyarrow.string())])
+        if path.endswith('.parquet'):
+            self._writer = pyarrow.parquet.ParquetWriter(path, self._schema)
+        else:
+            self._writer = pyarrow.ipc.new_file(path, self._schema)
+
+    def write(self, batch):
+        self._writer.write_batch(pyarrow.record_batch([batch[column] for column in OUTPUT_COLUMNS], schema=self._schema))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self._writer.close()
+
+
+@click.command()
+@click.option('--input', '-i', 'input_path', required=True, type=click.Path(exists=True, dir_okay=False),
+              help='CSV, Arrow (.arrow, .feather) or Parquet file with discriminator, passcode, vid, pid, discovery and flow columns')
+@click.option('--output', '-o', 'output_path', required=True, type=click.Path(dir_okay=False),
+              help='Output CSV, Arrow (.arrow, .feather) or Parquet file, with qrcode and manualcode columns added')
+@click.option('--vendor-id', '-vid', type=click.IntRange(0, 0xFFFF), default=0, help='Vendor ID of the rows without a vid column')
+@click.option('--product-id', '-pid', type=click.IntRange(0, 0xFFFF), default=0, help='Product ID of the rows without a pid column')
+@click.option('--discovery-cap-bitmask', '-dm', type=click.IntRange(0, 7), default=4, help='Discovery capability bitmask of the rows without a discovery column. Default: OnNetwork')
+@click.option('--commissioning-flow', '-cf', type=click.IntRange(0, 2), default=0, help='Commissioning flow of the rows without a flow column')
+@click.option('--jobs', '-j', type=click.IntRange(1), default=None, help='Number of worker processes. Default: number of CPUs')
+@click.option('--batch-size', type=click.IntRange(1), default=10000, help='Number of rows encoded at once by a worker')
+def generate(input_path, output_path, vendor_id, product_id, discovery_cap_bitmask, commissioning_flow, jobs, batch_size):
+    """ Generates the QR codes and manual codes of all the rows of the input file. """
+    if pyarrow is None and (input_path.endswith(ARROW_EXTENSIONS) or output_path.endswith(ARROW_EXTENSIONS)):
+        raise click.ClickException('pyarrow is required to read and write Arrow and Parquet files')
+
+    defaults = {'vid': vendor_id, 'pid': product_id, 'discovery': discovery_cap_bitmask, 'flow': commissioning_flow}
+    if input_path.endswith(ARROW_EXTENSIONS):
+        batches = read_arrow_batches(input_path, batch_size, defaults)
+    else:
+        batches = read_csv_batches(input_path, batch_size, defaults)
+
+    count = 0
+    with contextlib.ExitStack() as stack:
+        if output_path.endswith(ARROW_EXTENSIONS):
+            writer = stack.enter_context(ArrowWriter(output_path))
+        else:
+            writer = CsvWriter(stack.enter_context(open(output_path, 'w', newline='')))
+        try:
+            for batch in generate_batches(batches, jobs):
+                writer.write(batch)
+                count += len(batch['qrcode'])
+        except ValueError as e:
+            # Rows of the batch that failed are numbered from its first row
+            raise click.ClickException('batch starting at row {}: {}'.format(count, e))
+    click.echo('Generated onboarding codes of {} devices: {}'.format(count, output_path))
+
+
+if __name__ == '__main__':
+    generate()
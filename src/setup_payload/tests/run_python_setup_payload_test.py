@@ -15,12 +15,14 @@
 # limitations under the License.
 
 import os
+import random
 import re
 import subprocess
 import sys
 
 CHIP_TOPDIR = os.path.dirname(os.path.realpath(__file__))[:-len(os.path.join('src', 'setup_payload', 'tests'))]
 sys.path.insert(0, os.path.join(CHIP_TOPDIR, 'src', 'setup_payload', 'python'))
+import BatchSetupPayload  # noqa: E402
 from SetupPayload import CommissioningFlow, SetupPayload  # noqa: E402
 
 
@@ -201,11 +203,32 @@ def test_onboardingcode_parsing():
         assert payload.pid == test_payload['res']['ProductID']
 
 
+def test_batch_code_generation():
+    # Seeded, for a failure to be reproducible
+    rng = random.Random(1000)
+    batch = {column: [] for column in BatchSetupPayload.COLUMNS}
+    for _ in range(1000):
+        batch['discriminator'].append(rng.randint(0, 0xFFF))
+        batch['passcode'].append(rng.randint(1, 0x5F5E0FE))
+        batch['vid'].append(rng.randint(0, 0xFFFF))
+        batch['pid'].append(rng.randint(0, 0xFFFF))
+        batch['discovery'].append(rng.randint(0, 7))
+        batch['flow'].append(rng.randint(0, 2))
+
+    qrcodes, manualcodes = BatchSetupPayload.encode_batch(batch)
+    for i, (qrcode, manualcode) in enumerate(zip(qrcodes, manualcodes)):
+        payload = SetupPayload(batch['discriminator'][i], batch['passcode'][i], batch['discovery'][i],
+                               CommissioningFlow(batch['flow'][i]), batch['vid'][i], batch['pid'][i])
+        assert qrcode == payload.generate_qrcode()
+        assert manualcode == payload.generate_manualcode()
+
+
 def main():
     if len(sys.argv) == 2:
         chip_tool = sys.argv[1]
         test_code_generation(chip_tool)
         test_onboardingcode_parsing()
+        test_batch_code_generation()
 
 
 if __name__ == '__main__':
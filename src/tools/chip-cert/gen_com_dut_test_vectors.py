@@ -1,16 +1,24 @@
 #!/usr/bin/env python
 
 import argparse
+import base64
+import concurrent.futures
+import datetime
 import glob
 import json
 import os
 import os.path
+import secrets
 import subprocess
 import sys
 from binascii import hexlify
 from enum import Enum
 
 import cryptography.x509
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import AuthorityInformationAccessOID, ExtendedKeyUsageOID, ExtensionOID, NameOID
 
 VID_NOT_PRESENT = 0xFFFF
 PID_NOT_PRESENT = 0x0000
@@ -19,6 +27,86 @@ VALID_IN_PAST = "2020-06-28 14:23:43"
 VALID_NOW = "2022-09-28 14:23:43"
 VALID_IN_FUTURE = "2031-06-28 14:23:43"
 
+CERT_VALID_DAYS_NO_WELL_DEFINED_EXPIRATION = 4294967295
+X509_NO_WELL_DEFINED_EXPIRATION = datetime.datetime(9999, 12, 31, 23, 59, 59, tzinfo=datetime.timezone.utc)
+
+OID_MATTER_VID = x509.ObjectIdentifier('1.3.6.1.4.1.37244.2.1')
+OID_MATTER_PID = x509.ObjectIdentifier('1.3.6.1.4.1.37244.2.2')
+
+# Error flags of `chip-cert gen-att-cert` reproduced by the in-process backend. The 'cert-version' and 'sig-algo'
+# certificates are always generated with chip-cert: cryptography neither builds v2 certificates nor signs with SHA-1.
+IN_PROCESS_ATT_CERT_ERRORS = {
+    'no-error', 'subject-vid-mismatch', 'subject-pid-mismatch', 'sig-curve',
+    'ext-basic-missing', 'ext-basic-critical-missing', 'ext-basic-critical-wrong', 'ext-basic-ca-missing', 'ext-basic-ca-wrong',
+    'ext-basic-pathlen-presence-wrong', 'ext-basic-pathlen0', 'ext-basic-pathlen1', 'ext-basic-pathlen2',
+    'ext-key-usage-missing', 'ext-key-usage-critical-missing', 'ext-key-usage-critical-wrong', 'ext-key-usage-dig-sig',
+    'ext-key-usage-key-cert-sign', 'ext-key-usage-crl-sign', 'ext-akid-missing', 'ext-skid-missing',
+    'ext-extended-key-usage', 'ext-authority-info-access', 'ext-subject-alt-name',
+}
+ATT_CERT_PATH_LEN_ERRORS = {'ext-basic-pathlen0': 0, 'ext-basic-pathlen1': 1, 'ext-basic-pathlen2': 2}
+
+# Certification Elements of all the generated CDs
+CD_DEVICE_TYPE_ID = 0x1234
+CD_CERTIFICATE_ID = 'ZIG20141ZB330001-24'
+CD_SECURITY_LEVEL = 0
+CD_SECURITY_INFO = 0
+CD_VERSION_NUMBER = 0x9876
+CD_CERTIFICATION_TYPE = 0
+
+CD_PID_ARRAY_COUNTS = {
+    'pid-array-count0': 0,
+    'pid-array-count01-valid': 1,
+    'pid-array-count01-mismatch': 1,
+    'pid-array-count10-valid': 10,
+    'pid-array-count10-mismatch': 10,
+    'pid-array-count100-valid': 100,
+    'pid-array-count100-mismatch': 100,
+}
+CD_PID_ARRAY_MISMATCH_ERRORS = {'pid-array-count01-mismatch', 'pid-array-count10-mismatch', 'pid-array-count100-mismatch'}
+CD_DAC_ORIGIN_VID_PRESENT_ERRORS = {'dac-origin-vid-present', 'dac-origin-vid-pid-present', 'dac-origin-vid-mismatch',
+                                    'dac-origin-pid-mismatch', 'different-origin'}
+CD_DAC_ORIGIN_PID_PRESENT_ERRORS = {'dac-origin-pid-present', 'dac-origin-vid-pid-present', 'dac-origin-vid-mismatch',
+                                    'dac-origin-pid-mismatch', 'different-origin'}
+# (number of entries, whether the valid PAA is listed)
+CD_AUTHORIZED_PAA_LIST_ERRORS = {
+    'authorized-paa-list-count0': (0, True),
+    'authorized-paa-list-count1-valid': (1, True),
+    'authorized-paa-list-count2-valid': (2, True),
+    'authorized-paa-list-count3-invalid': (3, False),
+    'authorized-paa-list-count10-valid': (10, True),
+    'authorized-paa-list-count10-invalid': (10, False),
+}
+CD_WRONG_AUTHORIZED_PAA_KID = bytes.fromhex('F444CABBC5016577AA8B44FFB90FCCA140FE6620')
+
+DER_BOOLEAN = 0x01
+DER_INTEGER = 0x02
+DER_OCTET_STRING = 0x04
+DER_OBJECT_IDENTIFIER = 0x06
+DER_SEQUENCE = 0x30
+DER_SET = 0x31
+DER_CONTEXT_0 = 0x80
+DER_CONSTRUCTED_CONTEXT_0 = 0xA0
+DER_CONSTRUCTED_CONTEXT_3 = 0xA3
+
+# Value of the subjectKeyIdentifier OBJECT IDENTIFIER (2.5.29.14)
+OID_SUBJECT_KEY_IDENTIFIER = bytes.fromhex('551D0E')
+
+# DER encoded OBJECT IDENTIFIERs
+OID_PKCS7_DATA = bytes.fromhex('06092A864886F70D010701')
+OID_PKCS7_SIGNED_DATA = bytes.fromhex('06092A864886F70D010702')
+OID_SHA256 = bytes.fromhex('0609608648016503040201')
+OID_SHA1 = bytes.fromhex('06052B0E03021A')
+OID_ECDSA_WITH_SHA256 = bytes.fromhex('06082A8648CE3D040302')
+OID_ECDSA_WITH_SHA1 = bytes.fromhex('06072A8648CE3D0401')
+# chip-cert encodes the whole Microsoft Authenticode OID element as the value of the OID
+OID_MSAC = bytes.fromhex('060C060A2B060104018237020104')
+
+TLV_TAG_ANONYMOUS = 0x00
+TLV_TAG_CONTEXT = 0x20
+TLV_TYPE_STRUCTURE = 0x15
+TLV_TYPE_ARRAY = 0x16
+TLV_END_OF_CONTAINER = 0x18
+
 
 class CertType(Enum):
     PAA = 1
@@ -700,9 +788,170 @@ class Names:
         self.key_der = prefix + 'Key.der'
 
 
+def der_encode(tag: int, content: bytes) -> bytes:
+    """Encodes a DER element, `tag` being the identifier octet"""
+    if len(content) < 0x80:
+        length = bytes([len(content)])
+    else:
+        length_bytes = len(content).to_bytes((len(content).bit_length() + 7) // 8, byteorder='big')
+        length = bytes([0x80 | len(length_bytes)]) + length_bytes
+    return bytes([tag]) + length + content
+
+
+def der_elements(data: bytes):
+    """Yields the (tag, content) of the DER elements of data"""
+    offset = 0
+    while offset < len(data):
+        tag = data[offset]
+        length = data[offset + 1]
+        offset += 2
+        if length & 0x80:
+            length_size = length & 0x7F
+            length = int.from_bytes(data[offset:offset + length_size], byteorder='big')
+            offset += length_size
+        yield tag, data[offset:offset + length]
+        offset += length
+
+
+def get_cert_skid(cert) -> bytes:
+    """
+    Returns the subject key identifier of a certificate. The extensions are walked by hand, since
+    cryptography rejects some of the extensions of the error test cases.
+    """
+    _, cert_content = next(der_elements(cert.public_bytes(serialization.Encoding.DER)))
+    _, tbs = next(der_elements(cert_content))
+    for tag, content in der_elements(tbs):
+        if tag == DER_CONSTRUCTED_CONTEXT_3:
+            _, extensions = next(der_elements(content))
+            for _, extension in der_elements(extensions):
+                fields = list(der_elements(extension))
+                if fields[0] == (DER_OBJECT_IDENTIFIER, OID_SUBJECT_KEY_IDENTIFIER):
+                    _, key_id = next(der_elements(fields[-1][1]))
+                    return key_id
+    raise Exception('Subject key identifier not found in %s' % cert.subject.rfc4514_string())
+
+
+def pem_to_der(pem_filename: str, der_filename: str):
+    """Writes the DER form of a PEM certificate or key, as `openssl x509|ec -outform DER` would"""
+    with open(pem_filename, 'rb') as infile:
+        pem_lines = infile.read().splitlines()
+    body = b''.join(line for line in pem_lines if line and not line.startswith(b'-----'))
+    with open(der_filename, 'wb') as outfile:
+        outfile.write(base64.b64decode(body))
+
+
+def basic_constraints_path_len(cert_type: CertType, error_type: str):
+    """Returns the pathLenConstraint chip-cert puts in the basic constraints extension, None when absent"""
+    if error_type in ATT_CERT_PATH_LEN_ERRORS:
+        return ATT_CERT_PATH_LEN_ERRORS[error_type]
+    if error_type == 'ext-basic-pathlen-presence-wrong':
+        return 0 if cert_type == CertType.DAC else None
+    if cert_type == CertType.DAC:
+        return 0 if error_type == 'ext-basic-ca-missing' else None
+    return 0 if cert_type == CertType.PAI else 1
+
+
+def make_att_cert(cert_type: CertType, error_type: str, subject_cn: str, vid: int, pid: int, ca_cert, ca_key,
+                  valid_from: datetime.datetime, valid_days: int):
+    """
+    Generates an attestation certificate and its key in-process, with the same structure as
+    `chip-cert gen-att-cert -I -E <error_type>` (see MakeAttCert() in CertUtils.cpp).
+    The PAA is self-signed, ca_cert and ca_key are ignored.
+    """
+    is_ca = cert_type != CertType.DAC
+    key = ec.generate_private_key(ec.SECP256K1() if error_type == 'sig-curve' else ec.SECP256R1())
+
+    subject = [x509.NameAttribute(NameOID.COMMON_NAME, subject_cn)]
+    if vid != VID_NOT_PRESENT:
+        subject_vid = (vid + 1) & 0xFFFF if error_type == 'subject-vid-mismatch' else vid
+        subject.append(x509.NameAttribute(OID_MATTER_VID, '{:04X}'.format(subject_vid)))
+    if pid != PID_NOT_PRESENT:
+        subject_pid = (pid + 1) & 0xFFFF if error_type == 'subject-pid-mismatch' else pid
+        subject.append(x509.NameAttribute(OID_MATTER_PID, '{:04X}'.format(subject_pid)))
+    subject = x509.Name(subject)
+
+    if cert_type == CertType.PAA:
+        ca_key = key
+        issuer = subject
+    else:
+        issuer = ca_cert.subject
+
+    if valid_days == CERT_VALID_DAYS_NO_WELL_DEFINED_EXPIRATION:
+        valid_to = X509_NO_WELL_DEFINED_EXPIRATION
+    else:
+        valid_to = valid_from + datetime.timedelta(days=valid_days, seconds=-1)
+
+    builder = x509.CertificateBuilder(issuer_name=issuer, subject_name=subject, public_key=key.public_key(),
+                                      serial_number=secrets.randbelow((1 << 63) - 1) + 1,
+                                      not_valid_before=valid_from, not_valid_after=valid_to)
+
+    if error_type != 'ext-basic-missing':
+        # Encoded by hand, the error cases are not all valid x509.BasicConstraints
+        constraints = b''
+        if error_type != 'ext-basic-ca-missing' and is_ca != (error_type == 'ext-basic-ca-wrong'):
+            constraints += der_encode(DER_BOOLEAN, b'\xff')
+        path_len = basic_constraints_path_len(cert_type, error_type)
+        if path_len is not None:
+            constraints += der_encode(DER_INTEGER, bytes([path_len]))
+        builder = builder.add_extension(
+            x509.UnrecognizedExtension(ExtensionOID.BASIC_CONSTRAINTS, der_encode(DER_SEQUENCE, constraints)),
+            critical=error_type not in ('ext-basic-critical-missing', 'ext-basic-critical-wrong'))
+
+    if error_type != 'ext-key-usage-missing':
+        digital_signature = (not is_ca) != (error_type == 'ext-key-usage-dig-sig')
+        key_cert_sign = is_ca != (error_type == 'ext-key-usage-key-cert-sign')
+        crl_sign = is_ca != (error_type == 'ext-key-usage-crl-sign')
+        # chip-cert adds keyEncipherment rather than leaving the key usage empty
+        key_encipherment = not (digital_signature or key_cert_sign or crl_sign)
+        builder = builder.add_extension(
+            x509.KeyUsage(digital_signature=digital_signature, content_commitment=False, key_encipherment=key_encipherment,
+                          data_encipherment=False, key_agreement=False, key_cert_sign=key_cert_sign, crl_sign=crl_sign,
+                          encipher_only=False, decipher_only=False),
+            critical=error_type not in ('ext-key-usage-critical-missing', 'ext-key-usage-critical-wrong'))
+
+    if error_type != 'ext-skid-missing':
+        builder = builder.add_extension(x509.SubjectKeyIdentifier.from_public_key(key.public_key()), critical=False)
+
+    if error_type != 'ext-akid-missing':
+        if cert_type == CertType.PAA:
+            authority_key_id = x509.SubjectKeyIdentifier.from_public_key(key.public_key()).digest
+        else:
+            authority_key_id = get_cert_skid(ca_cert)
+        builder = builder.add_extension(x509.AuthorityKeyIdentifier(authority_key_id, None, None), critical=False)
+
+    if error_type == 'ext-extended-key-usage':
+        builder = builder.add_extension(
+            x509.ExtendedKeyUsage([ExtendedKeyUsageOID.CLIENT_AUTH, ExtendedKeyUsageOID.SERVER_AUTH]), critical=True)
+
+    if error_type == 'ext-authority-info-access':
+        builder = builder.add_extension(x509.AuthorityInformationAccess([x509.AccessDescription(
+            AuthorityInformationAccessOID.OCSP, x509.UniformResourceIdentifier('http://ocsp.example.com/'))]), critical=False)
+
+    if error_type == 'ext-subject-alt-name':
+        builder = builder.add_extension(x509.SubjectAlternativeName([x509.DNSName('test.com')]), critical=False)
+
+    return builder.sign(ca_key, hashes.SHA256()), key
+
+
+def write_cert_and_key(cert, key, names: Names):
+    with open(names.cert_pem, 'wb') as outfile:
+        outfile.write(cert.public_bytes(serialization.Encoding.PEM))
+    with open(names.key_pem, 'wb') as outfile:
+        outfile.write(key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.TraditionalOpenSSL,
+                                        serialization.NoEncryption()))
+
+
+def parse_valid_from(valid_from: str) -> datetime.datetime:
+    if len(valid_from) == 0:
+        # Same default as chip-cert: today, at midnight UTC
+        return datetime.datetime.combine(datetime.datetime.now(datetime.timezone.utc).date(), datetime.time(),
+                                         tzinfo=datetime.timezone.utc)
+    return datetime.datetime.strptime(valid_from, '%Y-%m-%d %H:%M:%S').replace(tzinfo=datetime.timezone.utc)
+
+
 class DevCertBuilder:
     def __init__(self, cert_type: CertType, error_type: str, paa_path: str, test_case_out_dir: str, chip_cert: str, vid: int,
-                 pid: int, custom_cn_attribute: str, valid_from: str):
+                 pid: int, custom_cn_attribute: str, valid_from: str, backend: str = 'chip-cert'):
         self.vid = vid
         self.pid = pid
         self.cert_type = cert_type
@@ -710,8 +959,9 @@ class DevCertBuilder:
         self.chipcert = chip_cert
         self.custom_cn_attribute = custom_cn_attribute
         self.valid_from = valid_from
+        self.in_process = backend == 'python' and error_type in IN_PROCESS_ATT_CERT_ERRORS
 
-        if not os.path.exists(self.chipcert):
+        if not self.in_process and not os.path.exists(self.chipcert):
             raise Exception('Path not found: %s' % self.chipcert)
 
         if not os.path.exists(test_case_out_dir):
@@ -729,14 +979,11 @@ class DevCertBuilder:
 
     def make_certs_and_keys(self) -> None:
         """Creates the PEM and DER certs and keyfiles"""
-        error_type_flag = ' -I -E ' + self.error_type
         subject_name = self.custom_cn_attribute
-        vid_flag = ' -V 0x{:X}'.format(self.vid)
-        pid_flag = ' -P 0x{:X}'.format(self.pid)
         if (len(self.valid_from) == 0):
-            validity_flags = ' -l 4294967295 '
+            valid_days = CERT_VALID_DAYS_NO_WELL_DEFINED_EXPIRATION
         else:
-            validity_flags = ' -f "' + self.valid_from + '" -l 730 '
+            valid_days = 730
 
         if self.cert_type == CertType.PAI:
             if (len(subject_name) == 0):
@@ -749,16 +996,200 @@ class DevCertBuilder:
         else:
             return
 
-        cmd = self.chipcert + ' gen-att-cert ' + type_flag + error_type_flag + ' -c "' + subject_name + '" -C ' + \
-            self.signer.cert_pem + ' -K ' + self.signer.key_pem + vid_flag + pid_flag + \
-            validity_flags + ' -o ' + self.own.cert_pem + ' -O ' + self.own.key_pem
-        subprocess.run(cmd, shell=True)
-        cmd = 'openssl x509 -inform pem -in ' + self.own.cert_pem + \
-            ' -out ' + self.own.cert_der + ' -outform DER'
-        subprocess.run(cmd, shell=True)
-        cmd = 'openssl ec -inform pem -in ' + self.own.key_pem + \
-            ' -out ' + self.own.key_der + ' -outform DER'
-        subprocess.run(cmd, shell=True)
+        if self.in_process:
+            with open(self.signer.cert_pem, 'rb') as infile:
+                ca_cert = x509.load_pem_x509_certificate(infile.read())
+            with open(self.signer.key_pem, 'rb') as infile:
+                ca_key = serialization.load_pem_private_key(infile.read(), None)
+            cert, key = make_att_cert(self.cert_type, self.error_type, subject_name, self.vid, self.pid, ca_cert, ca_key,
+                                      parse_valid_from(self.valid_from), valid_days)
+            write_cert_and_key(cert, key, self.own)
+        else:
+            error_type_flag = ' -I -E ' + self.error_type
+            vid_flag = ' -V 0x{:X}'.format(self.vid)
+            pid_flag = ' -P 0x{:X}'.format(self.pid)
+            if (len(self.valid_from) == 0):
+                validity_flags = ' -l {} '.format(valid_days)
+            else:
+                validity_flags = ' -f "' + self.valid_from + '" -l {} '.format(valid_days)
+
+            cmd = self.chipcert + ' gen-att-cert ' + type_flag + error_type_flag + ' -c "' + subject_name + '" -C ' + \
+                self.signer.cert_pem + ' -K ' + self.signer.key_pem + vid_flag + pid_flag + \
+                validity_flags + ' -o ' + self.own.cert_pem + ' -O ' + self.own.key_pem
+            subprocess.run(cmd, shell=True)
+
+        pem_to_der(self.own.cert_pem, self.own.cert_der)
+        pem_to_der(self.own.key_pem, self.own.key_der)
+
+
+def tlv_element(control: int, tag, value: bytes = b'') -> bytes:
+    if tag is None:
+        return bytes([TLV_TAG_ANONYMOUS | control]) + value
+    return bytes([TLV_TAG_CONTEXT | control, tag]) + value
+
+
+def tlv_uint(tag, value: int) -> bytes:
+    """Encodes an unsigned integer on the fewest bytes, as the Matter TLVWriter does"""
+    for element_type, size in ((0x04, 1), (0x05, 2), (0x06, 4), (0x07, 8)):
+        if value < (1 << (8 * size)):
+            return tlv_element(element_type, tag, value.to_bytes(size, byteorder='little'))
+    raise ValueError('Value too large for TLV: %d' % value)
+
+
+def tlv_string(tag, value: bytes, utf8: bool) -> bytes:
+    return tlv_element(0x0C if utf8 else 0x10, tag, bytes([len(value)]) + value)
+
+
+def tlv_container(tag, element_type: int, elements) -> bytes:
+    return tlv_element(element_type, tag, b''.join(elements)) + bytes([TLV_END_OF_CONTAINER])
+
+
+def encode_cd_content(vid: int, pid: int, error_flag: str = 'no-error', origin_vid: int = None, origin_pid: int = None,
+                      authorized_paa_skids=()) -> bytes:
+    """
+    Returns the TLV Certification Elements of a CD, as encoded by `chip-cert gen-cd -I -E <error_flag>`
+    (see EncodeCertificationElements_Ignore_Error() in Cmd_GenCD.cpp). As with chip-cert, the DAC origin
+    fields and the authorized PAA list are only encoded when error_flag asks for them.
+    """
+    elements = []
+    if error_flag != 'format-version-missing':
+        elements.append(tlv_uint(0, 2 if error_flag == 'format-version-wrong' else 1))
+    if error_flag != 'vid-missing':
+        elements.append(tlv_uint(1, vid ^ 0xFFFF if error_flag == 'vid-mismatch' else vid))
+    if error_flag != 'pid-array-missing':
+        first_pid = (pid + 1) & 0xFFFF if error_flag in CD_PID_ARRAY_MISMATCH_ERRORS else pid
+        pid_count = CD_PID_ARRAY_COUNTS.get(error_flag, 1)
+        elements.append(tlv_container(2, TLV_TYPE_ARRAY,
+                                      [tlv_uint(None, (first_pid + i) & 0xFFFF) for i in range(pid_count)]))
+    if error_flag != 'device-type-id-missing':
+        device_type_id = CD_DEVICE_TYPE_ID
+        elements.append(tlv_uint(3, device_type_id ^ 0xFFFFFFFF if error_flag == 'device-type-id-mismatch' else device_type_id))
+    if error_flag != 'cert-id-missing':
+        if error_flag == 'cert-id-mismatch':
+            certificate_id = 'INV20141ZB330001-24'
+        elif error_flag == 'cert-id-len-wrong':
+            certificate_id = CD_CERTIFICATE_ID + '1234'
+        else:
+            certificate_id = CD_CERTIFICATE_ID
+        elements.append(tlv_string(4, certificate_id.encode('utf-8'), utf8=True))
+    if error_flag != 'security-level-missing':
+        elements.append(tlv_uint(5, CD_SECURITY_LEVEL ^ 0xFF if error_flag == 'security-level-wrong' else CD_SECURITY_LEVEL))
+    if error_flag != 'security-info-missing':
+        elements.append(tlv_uint(6, CD_SECURITY_INFO ^ 0xFFFF if error_flag == 'security-info-wrong' else CD_SECURITY_INFO))
+    if error_flag != 'version-number-missing':
+        elements.append(tlv_uint(7, CD_VERSION_NUMBER ^ 0xFFFF if error_flag == 'version-number-wrong' else CD_VERSION_NUMBER))
+    if error_flag != 'cert-type-missing':
+        elements.append(tlv_uint(8, CD_CERTIFICATION_TYPE ^ 0xFF if error_flag == 'cert-type-wrong' else CD_CERTIFICATION_TYPE))
+
+    origin_present = origin_vid is not None or origin_pid is not None
+    if error_flag in CD_DAC_ORIGIN_VID_PRESENT_ERRORS:
+        if error_flag != 'dac-origin-vid-mismatch' and origin_present:
+            elements.append(tlv_uint(9, origin_vid or 0))
+        else:
+            elements.append(tlv_uint(9, 0x8008))
+    if error_flag in CD_DAC_ORIGIN_PID_PRESENT_ERRORS:
+        if error_flag != 'dac-origin-pid-mismatch' and origin_present:
+            elements.append(tlv_uint(10, origin_pid or 0))
+        else:
+            elements.append(tlv_uint(10, 0xFF00))
+
+    if error_flag in CD_AUTHORIZED_PAA_LIST_ERRORS:
+        paa_count, paa_list_correct = CD_AUTHORIZED_PAA_LIST_ERRORS[error_flag]
+        wrong_kid = bytearray(CD_WRONG_AUTHORIZED_PAA_KID)
+        paa_list = []
+        for i in range(paa_count):
+            if paa_list_correct and i < len(authorized_paa_skids):
+                paa_list.append(tlv_string(None, authorized_paa_skids[i], utf8=False))
+            else:
+                wrong_kid[i % len(wrong_kid)] ^= 0xFF
+                paa_list.append(tlv_string(None, bytes(wrong_kid), utf8=False))
+        elements.append(tlv_container(11, TLV_TYPE_ARRAY, paa_list))
+
+    return tlv_container(None, TLV_TYPE_STRUCTURE, elements)
+
+
+def sign_cd(cd_content: bytes, signer_key, signer_key_id: bytes, error_flag: str = 'no-error') -> bytes:
+    """
+    Returns the CMS signed message of a CD, as encoded by `chip-cert gen-cd -I -E <error_flag>`
+    (see CMS_Sign_Ignore_Error() in Cmd_GenCD.cpp).
+    """
+    signature = bytearray(signer_key.sign(cd_content, ec.ECDSA(hashes.SHA256())))
+    if error_flag == 'cms-sig':
+        signature[10] ^= 0xFF
+
+    if error_flag == 'signer-info-skid':
+        signer_key_id = bytearray(signer_key_id)
+        signer_key_id[7] ^= 0xFF
+
+    signer_info = der_encode(DER_SET, der_encode(DER_SEQUENCE, b''.join([
+        der_encode(DER_INTEGER, b'\x02' if error_flag == 'signer-info-v2' else b'\x03'),
+        der_encode(DER_CONTEXT_0, bytes(signer_key_id)),
+        der_encode(DER_SEQUENCE, OID_SHA1 if error_flag == 'signer-info-digest-algo' else OID_SHA256),
+        der_encode(DER_SEQUENCE, OID_ECDSA_WITH_SHA1 if error_flag == 'cms-sig-algo' else OID_ECDSA_WITH_SHA256),
+        der_encode(DER_OCTET_STRING, bytes(signature)),
+    ])))
+
+    encapsulated_content = der_encode(DER_SEQUENCE, b''.join([
+        OID_MSAC if error_flag == 'cms-econtent-type' else OID_PKCS7_DATA,
+        der_encode(DER_CONSTRUCTED_CONTEXT_0, der_encode(DER_OCTET_STRING, cd_content)),
+    ]))
+
+    signed_data = der_encode(DER_SEQUENCE, b''.join([
+        der_encode(DER_INTEGER, b'\x02' if error_flag == 'cms-v2' else b'\x03'),
+        der_encode(DER_SET, der_encode(DER_SEQUENCE, OID_SHA1 if error_flag == 'cms-digest-algo' else OID_SHA256)),
+        encapsulated_content,
+        signer_info,
+    ]))
+
+    return der_encode(DER_SEQUENCE, OID_PKCS7_SIGNED_DATA + der_encode(DER_CONSTRUCTED_CONTEXT_0, signed_data))
+
+
+def get_skid(cert_filename: str) -> bytes:
+    with open(cert_filename, 'rb') as infile:
+        return get_cert_skid(x509.load_pem_x509_certificate(infile.read()))
+
+
+def generate_cd(args, out_filename: str, vid: int, pid: int, error_flag: str = None, origin_vid: int = None,
+                origin_pid: int = None, authorized_paa_cert: str = None):
+    """Generates a CD signed by the CD signing key, error_flag None meaning `chip-cert gen-cd` without -I"""
+    if args.backend == 'python':
+        with open(args.cd_key, 'rb') as infile:
+            signer_key = serialization.load_pem_private_key(infile.read(), None)
+        authorized_paa_skids = [get_skid(authorized_paa_cert)] if authorized_paa_cert else []
+        cd_content = encode_cd_content(vid, pid, error_flag or 'no-error', origin_vid, origin_pid, authorized_paa_skids)
+        with open(out_filename, 'wb') as outfile:
+            outfile.write(sign_cd(cd_content, signer_key, get_skid(args.cd_cert), error_flag or 'no-error'))
+        return
+
+    cmd = args.chipcert + ' gen-cd'
+    if error_flag is not None:
+        cmd += ' -I -E ' + error_flag
+    cmd += ' -K ' + args.cd_key + ' -C ' + args.cd_cert + ' -O ' + out_filename + \
+        ' -f 1 -V 0x{:X} -p 0x{:X}'.format(vid, pid)
+    if origin_vid:
+        cmd += ' -o 0x{:X}'.format(origin_vid)
+    if origin_pid:
+        cmd += ' -r 0x{:X}'.format(origin_pid)
+    if authorized_paa_cert:
+        cmd += ' -a ' + authorized_paa_cert
+    cmd += ' -d 0x{:X} -c "{}" -l {:X} -i {:X} -n {:X} -t {}'.format(
+        CD_DEVICE_TYPE_ID, CD_CERTIFICATE_ID, CD_SECURITY_LEVEL, CD_SECURITY_INFO, CD_VERSION_NUMBER, CD_CERTIFICATION_TYPE)
+    subprocess.run(cmd, shell=True)
+
+
+def verify_test_case(args, test_case_out_dir: str, paa_cert: str, check_chain: bool, check_cd: bool):
+    """Checks the generated vectors with chip-cert, which is used as the reference implementation"""
+    commands = []
+    if check_chain:
+        commands.append([args.chipcert, 'validate-att-cert', '-d', test_case_out_dir + '/dac-Cert.der',
+                         '-i', test_case_out_dir + '/pai-Cert.der', '-a', paa_cert])
+    if check_cd:
+        commands.append([args.chipcert, 'print-cd', test_case_out_dir + '/cd.der'])
+    for cmd in commands:
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        if result.returncode != 0:
+            raise Exception('Verification of %s failed: %s\n%s' % (test_case_out_dir, ' '.join(cmd),
+                                                                   result.stderr.decode('utf-8', errors='replace')))
 
 
 def add_raw_ec_keypair_to_dict_from_der(der_key_filename: str, json_dict: dict):
@@ -827,205 +1258,158 @@ def generate_test_case_vector_json(test_case_out_dir: str, test_cert: str, test_
         outfile.write('\n')
 
 
-def main():
-    argparser = argparse.ArgumentParser()
-    argparser.add_argument('-o', '--out_dir', dest='outdir',
-                           default='credentials/development/commissioner_dut',
-                           help='output directory for all generated test vectors')
-    argparser.add_argument('-p', '--paa', dest='paapath',
-                           default='credentials/test/attestation/Chip-Test-PAA-FFF1-', help='PAA to use')
-    argparser.add_argument('--paa_different_origin', dest='paapath_different_origin',
-                           default='credentials/test/attestation/Chip-Test-PAA-NoVID-',
-                           help='PAA to use when signing the PAI for the origin VID/PID test case (VID=0xFFF2)')
-    argparser.add_argument('-d', '--cd', dest='cdpath',
-                           default='credentials/test/certification-declaration/Chip-Test-CD-Signing-',
-                           help='CD Signing Key/Cert to use')
-    argparser.add_argument('-c', '--chip-cert-dir', dest='chipcertdir',
-                           default='out/debug/linux_x64_clang/', help='Directory where chip-cert tool is located')
+def generate_cert_struct_test_case(args, test_cert: str, test_case: dict):
+    test_case_out_dir = args.outdir + '/struct_' + test_cert + '_' + test_case["test_folder"]
 
-    args = argparser.parse_args()
+    if test_case["test_folder"] == 'valid_in_past':
+        if test_cert == 'dac':
+            dac_valid_from = VALID_IN_PAST
+            pai_valid_from = VALID_NOW
+        else:
+            dac_valid_from = VALID_NOW
+            pai_valid_from = VALID_IN_PAST
+    elif test_case["test_folder"] == 'valid_in_future':
+        if test_cert == 'dac':
+            dac_valid_from = VALID_IN_FUTURE
+            pai_valid_from = VALID_NOW
+        else:
+            dac_valid_from = VALID_NOW
+            pai_valid_from = VALID_IN_FUTURE
+    else:
+        dac_valid_from = ''
+        pai_valid_from = ''
+
+    if test_cert == 'dac':
+        error_type_dac = test_case["error_flag"]
+        error_type_pai = 'no-error'
+    else:
+        if test_case["error_flag"] == 'ext-skid-missing':
+            error_type_dac = 'ext-akid-missing'
+        else:
+            error_type_dac = 'no-error'
+        error_type_pai = test_case["error_flag"]
 
-    if not os.path.exists(args.outdir):
-        os.mkdir(args.outdir)
+    vid = 0xFFF1
+    pid = 0x8000
 
-    chipcert = args.chipcertdir + 'chip-cert'
+    # Generate PAI Cert/Key
+    pai_builder = DevCertBuilder(CertType.PAI, error_type_pai, args.paapath, test_case_out_dir,
+                                 args.chipcert, vid, PID_NOT_PRESENT, '', pai_valid_from, args.backend)
+    pai_builder.make_certs_and_keys()
+
+    if test_cert == 'pai':
+        if test_case["error_flag"] == 'subject-vid-mismatch':
+            vid += 1
+        if test_case["error_flag"] == 'subject-pid-mismatch':
+            pid += 1
+
+    # Generate DAC Cert/Key. cryptography cannot load the PAIs that only chip-cert generates (e.g. v2 certificates),
+    # so their DAC is generated by chip-cert as well.
+    dac_backend = args.backend if pai_builder.in_process else 'chip-cert'
+    builder = DevCertBuilder(CertType.DAC, error_type_dac, args.paapath, test_case_out_dir,
+                             args.chipcert, vid, pid, '', dac_valid_from, dac_backend)
+    builder.make_certs_and_keys()
 
-    if not os.path.exists(chipcert):
-        raise Exception('Path not found: %s' % chipcert)
+    # Generate Certification Declaration (CD)
+    generate_cd(args, test_case_out_dir + '/cd.der', vid, pid)
 
-    cd_cert = args.cdpath + 'Cert.pem'
-    cd_key = args.cdpath + 'Key.pem'
+    # Generate Test Case Data Container in JSON Format
+    generate_test_case_vector_json(test_case_out_dir, test_cert, test_case, basic_info_pid=0x8000)
+
+    if args.verify:
+        is_valid_chain = error_type_pai == 'no-error' and error_type_dac == 'no-error' and not dac_valid_from
+        verify_test_case(args, test_case_out_dir, args.paapath + 'Cert.pem', check_chain=is_valid_chain, check_cd=True)
+
+
+def generate_vidpid_fallback_encoding_test_case(args, test_cert: str, test_case: dict):
+    test_case_out_dir = args.outdir + '/struct_' + test_cert + '_' + test_case["test_folder"]
+    fallback_vid = test_case.get('fallback_vid', 0x0FFF1)
+    fallback_pid = test_case.get('fallback_pid', 0x00B1)
+    if test_cert == 'dac':
+        common_name_dac = test_case["common_name"]
+        common_name_pai = ''
+        vid_dac = test_case.get("vid", VID_NOT_PRESENT)
+        pid_dac = test_case.get("pid", PID_NOT_PRESENT)
+        vid_pai = fallback_vid
+        pid_pai = fallback_pid
+    else:
+        common_name_dac = ''
+        common_name_pai = test_case["common_name"]
+        common_name_pai = common_name_pai.replace('DAC', 'PAI')
+        vid_dac = fallback_vid
+        pid_dac = fallback_pid
+        vid_pai = test_case.get("vid", VID_NOT_PRESENT)
+        pid_pai = test_case.get("pid", PID_NOT_PRESENT)
 
-    for test_cert in ['dac', 'pai']:
-        for test_case in CERT_STRUCT_TEST_CASES:
-            test_case_out_dir = args.outdir + '/struct_' + test_cert + '_' + test_case["test_folder"]
-
-            if test_case["test_folder"] == 'valid_in_past':
-                if test_cert == 'dac':
-                    dac_valid_from = VALID_IN_PAST
-                    pai_valid_from = VALID_NOW
-                else:
-                    dac_valid_from = VALID_NOW
-                    pai_valid_from = VALID_IN_PAST
-            elif test_case["test_folder"] == 'valid_in_future':
-                if test_cert == 'dac':
-                    dac_valid_from = VALID_IN_FUTURE
-                    pai_valid_from = VALID_NOW
-                else:
-                    dac_valid_from = VALID_NOW
-                    pai_valid_from = VALID_IN_FUTURE
-            else:
-                dac_valid_from = ''
-                pai_valid_from = ''
+    # Generate PAI Cert/Key
+    builder = DevCertBuilder(CertType.PAI, 'no-error', args.paapath, test_case_out_dir,
+                             args.chipcert, vid_pai, pid_pai, common_name_pai, '', args.backend)
+    builder.make_certs_and_keys()
 
-            if test_cert == 'dac':
-                error_type_dac = test_case["error_flag"]
-                error_type_pai = 'no-error'
-            else:
-                if test_case["error_flag"] == 'ext-skid-missing':
-                    error_type_dac = 'ext-akid-missing'
-                else:
-                    error_type_dac = 'no-error'
-                error_type_pai = test_case["error_flag"]
-
-            vid = 0xFFF1
-            pid = 0x8000
-
-            # Generate PAI Cert/Key
-            builder = DevCertBuilder(CertType.PAI, error_type_pai, args.paapath, test_case_out_dir,
-                                     chipcert, vid, PID_NOT_PRESENT, '', pai_valid_from)
-            builder.make_certs_and_keys()
-
-            if test_cert == 'pai':
-                if test_case["error_flag"] == 'subject-vid-mismatch':
-                    vid += 1
-                if test_case["error_flag"] == 'subject-pid-mismatch':
-                    pid += 1
-
-            # Generate DAC Cert/Key
-            builder = DevCertBuilder(CertType.DAC, error_type_dac, args.paapath, test_case_out_dir,
-                                     chipcert, vid, pid, '', dac_valid_from)
-            builder.make_certs_and_keys()
-
-            # Generate Certification Declaration (CD)
-            vid_flag = ' -V 0x{:X}'.format(vid)
-            pid_flag = ' -p 0x{:X}'.format(pid)
-            cmd = chipcert + ' gen-cd -K ' + cd_key + ' -C ' + cd_cert + ' -O ' + test_case_out_dir + '/cd.der' + \
-                ' -f 1 ' + vid_flag + pid_flag + ' -d 0x1234 -c "ZIG20141ZB330001-24" -l 0 -i 0 -n 9876 -t 0'
-            subprocess.run(cmd, shell=True)
+    # Generate DAC Cert/Key
+    builder = DevCertBuilder(CertType.DAC, 'no-error', args.paapath, test_case_out_dir,
+                             args.chipcert, vid_dac, pid_dac, common_name_dac, '', args.backend)
+    builder.make_certs_and_keys()
 
-            # Generate Test Case Data Container in JSON Format
-            generate_test_case_vector_json(test_case_out_dir, test_cert, test_case, basic_info_pid=0x8000)
+    # Generate Certification Declaration (CD)
+    generate_cd(args, test_case_out_dir + '/cd.der', fallback_vid, fallback_pid)
 
-    for test_cert in ['dac', 'pai']:
-        for test_case in VIDPID_FALLBACK_ENCODING_TEST_CASES:
-            test_case_out_dir = args.outdir + '/struct_' + test_cert + '_' + test_case["test_folder"]
-            fallback_vid = test_case.get('fallback_vid', 0x0FFF1)
-            fallback_pid = test_case.get('fallback_pid', 0x00B1)
-            if test_cert == 'dac':
-                common_name_dac = test_case["common_name"]
-                common_name_pai = ''
-                if "vid" in test_case:
-                    vid_dac = test_case["vid"]
-                else:
-                    vid_dac = VID_NOT_PRESENT
-                if "pid" in test_case:
-                    pid_dac = test_case["pid"]
-                else:
-                    pid_dac = PID_NOT_PRESENT
-                vid_pai = fallback_vid
-                pid_pai = fallback_pid
-            else:
-                common_name_dac = ''
-                common_name_pai = test_case["common_name"]
-                common_name_pai = common_name_pai.replace('DAC', 'PAI')
-                vid_dac = fallback_vid
-                pid_dac = fallback_pid
-                if "vid" in test_case:
-                    vid_pai = test_case["vid"]
-                else:
-                    vid_pai = VID_NOT_PRESENT
-                if "pid" in test_case:
-                    pid_pai = test_case["pid"]
-                else:
-                    pid_pai = PID_NOT_PRESENT
-
-            # Generate PAI Cert/Key
-            builder = DevCertBuilder(CertType.PAI, 'no-error', args.paapath, test_case_out_dir,
-                                     chipcert, vid_pai, pid_pai, common_name_pai, '')
-            builder.make_certs_and_keys()
-
-            # Generate DAC Cert/Key
-            builder = DevCertBuilder(CertType.DAC, 'no-error', args.paapath, test_case_out_dir,
-                                     chipcert, vid_dac, pid_dac, common_name_dac, '')
-            builder.make_certs_and_keys()
-
-            # Generate Certification Declaration (CD)
-            cmd = f'{chipcert} gen-cd -K {cd_key} -C {cd_cert} -O {test_case_out_dir}/cd.der -f 1 -V 0x{fallback_vid:04X} -p 0x{fallback_pid:04X} -d 0x1234 -c "ZIG20141ZB330001-24" -l 0 -i 0 -n 9876 -t 0'
-            subprocess.run(cmd, shell=True)
+    # Generate Test Case Data Container in JSON Format
+    generate_test_case_vector_json(test_case_out_dir, test_cert, test_case, basic_info_pid=fallback_pid)
 
-            # Generate Test Case Data Container in JSON Format
-            generate_test_case_vector_json(test_case_out_dir, test_cert, test_case, basic_info_pid=fallback_pid)
+    if args.verify:
+        verify_test_case(args, test_case_out_dir, args.paapath + 'Cert.pem', check_chain=False, check_cd=True)
 
-    for test_case in CD_STRUCT_TEST_CASES:
-        test_case_out_dir = args.outdir + '/struct_cd_' + test_case["test_folder"]
-        vid = 0xFFF1
-        pid = 0x8000
-        origin_vid = None
-        origin_pid = None
-        paapath = args.paapath
-        if test_case["error_flag"] == 'different-origin':
-            # This test case mimics a device that uses a PID/VID provided by another vendor
-            # The PID/VID in the CD is set to 0xFFF1/0x8000 as in all other test cases
-            # so testers can use the same comand line invocation to start the test programs
-            # In this case, the DAC VID and PID are different.
-            origin_vid = 0xFFF2
-            origin_pid = 0x8001
-            paapath = args.paapath_different_origin
-        if test_case["error_flag"] == 'dac-origin-vid-present' or test_case["error_flag"] == 'dac-origin-vid-pid-present':
-            origin_vid = vid
-        if test_case["error_flag"] == 'dac-origin-pid-present' or test_case["error_flag"] == 'dac-origin-vid-pid-present':
-            origin_pid = pid
-
-        # Generate PAI Cert/Key
-        dac_vid = origin_vid if origin_vid else vid
-        dac_pid = origin_pid if origin_pid else pid
-        builder = DevCertBuilder(CertType.PAI, 'no-error', paapath, test_case_out_dir,
-                                 chipcert, dac_vid, dac_pid, '', '')
-        builder.make_certs_and_keys()
-
-        # Generate DAC Cert/Key
-        builder = DevCertBuilder(CertType.DAC, 'no-error', paapath, test_case_out_dir,
-                                 chipcert, dac_vid, dac_pid, '', '')
-        builder.make_certs_and_keys()
-
-        # Generate Certification Declaration (CD)
-        vid_flag = ' -V 0x{:X}'.format(vid)
-        pid_flag = ' -p 0x{:X}'.format(pid)
-
-        dac_origin_flag = ' '
-        if origin_vid:
-            dac_origin_flag += ' -o 0x{:X}'.format(origin_vid)
-        if origin_pid:
-            dac_origin_flag += ' -r 0x{:X}'.format(origin_pid)
-
-        if test_case["error_flag"] == 'authorized-paa-list-count0' or test_case["error_flag"] == 'authorized-paa-list-count1-valid'\
-                or test_case["error_flag"] == 'authorized-paa-list-count2-valid'\
-                or test_case["error_flag"] == 'authorized-paa-list-count3-invalid'\
-                or test_case["error_flag"] == 'authorized-paa-list-count10-valid'\
-                or test_case["error_flag"] == 'authorized-paa-list-count10-invalid':
-            authorized_paa_flag = ' -a ' + args.paapath + 'Cert.pem'
-        else:
-            authorized_paa_flag = ''
 
-        cmd = chipcert + ' gen-cd -I -E ' + test_case["error_flag"] + ' -K ' + cd_key + ' -C ' + cd_cert + ' -O ' + \
-            test_case_out_dir + '/cd.der' + ' -f 1 ' + vid_flag + pid_flag + dac_origin_flag + authorized_paa_flag + \
-            ' -d 0x1234 -c "ZIG20141ZB330001-24" -l 0 -i 0 -n 9876 -t 0'
-        subprocess.run(cmd, shell=True)
+def generate_cd_struct_test_case(args, test_case: dict):
+    test_case_out_dir = args.outdir + '/struct_cd_' + test_case["test_folder"]
+    vid = 0xFFF1
+    pid = 0x8000
+    origin_vid = None
+    origin_pid = None
+    paapath = args.paapath
+    if test_case["error_flag"] == 'different-origin':
+        # This test case mimics a device that uses a PID/VID provided by another vendor
+        # The PID/VID in the CD is set to 0xFFF1/0x8000 as in all other test cases
+        # so testers can use the same comand line invocation to start the test programs
+        # In this case, the DAC VID and PID are different.
+        origin_vid = 0xFFF2
+        origin_pid = 0x8001
+        paapath = args.paapath_different_origin
+    if test_case["error_flag"] == 'dac-origin-vid-present' or test_case["error_flag"] == 'dac-origin-vid-pid-present':
+        origin_vid = vid
+    if test_case["error_flag"] == 'dac-origin-pid-present' or test_case["error_flag"] == 'dac-origin-vid-pid-present':
+        origin_pid = pid
+
+    # Generate PAI Cert/Key
+    dac_vid = origin_vid if origin_vid else vid
+    dac_pid = origin_pid if origin_pid else pid
+    builder = DevCertBuilder(CertType.PAI, 'no-error', paapath, test_case_out_dir,
+                             args.chipcert, dac_vid, dac_pid, '', '', args.backend)
+    builder.make_certs_and_keys()
 
-        # Generate Test Case Data Container in JSON Format
-        generate_test_case_vector_json(test_case_out_dir, 'cd', test_case, basic_info_pid=0x8000)
+    # Generate DAC Cert/Key
+    builder = DevCertBuilder(CertType.DAC, 'no-error', paapath, test_case_out_dir,
+                             args.chipcert, dac_vid, dac_pid, '', '', args.backend)
+    builder.make_certs_and_keys()
 
+    # Generate Certification Declaration (CD)
+    if test_case["error_flag"] in CD_AUTHORIZED_PAA_LIST_ERRORS:
+        authorized_paa_cert = args.paapath + 'Cert.pem'
+    else:
+        authorized_paa_cert = None
+    generate_cd(args, test_case_out_dir + '/cd.der', vid, pid, test_case["error_flag"], origin_vid, origin_pid,
+                authorized_paa_cert)
+
+    # Generate Test Case Data Container in JSON Format
+    generate_test_case_vector_json(test_case_out_dir, 'cd', test_case, basic_info_pid=0x8000)
+
+    if args.verify:
+        verify_test_case(args, test_case_out_dir, paapath + 'Cert.pem', check_chain=True,
+                         check_cd=test_case["error_flag"] == 'no-error')
+
+
+def generate_invalid_paa_test_case(args):
     # Test case: Generate {DAC, PAI, PAA} chain with random (invalid) PAA
     test_case = {
         "description": 'Use Invalid PAA (Not Registered in the DCL).',
@@ -1040,33 +1424,101 @@ def main():
         os.mkdir(test_case_out_dir)
 
     # Generate PAA Cert/Key
-    cmd = chipcert + ' gen-att-cert -t a -c "Invalid (Not Registered in the DCL) Matter PAA" -f "' + VALID_IN_PAST + \
-        '" -l 4294967295 -o ' + paapath + 'Cert.pem -O ' + paapath + 'Key.pem'
-    subprocess.run(cmd, shell=True)
+    paa_subject_name = 'Invalid (Not Registered in the DCL) Matter PAA'
+    if args.backend == 'python':
+        cert, key = make_att_cert(CertType.PAA, 'no-error', paa_subject_name, VID_NOT_PRESENT, PID_NOT_PRESENT, None, None,
+                                  parse_valid_from(VALID_IN_PAST), CERT_VALID_DAYS_NO_WELL_DEFINED_EXPIRATION)
+        write_cert_and_key(cert, key, Names(CertType.PAA, paapath, test_case_out_dir))
+    else:
+        cmd = args.chipcert + ' gen-att-cert -t a -c "' + paa_subject_name + '" -f "' + VALID_IN_PAST + \
+            '" -l 4294967295 -o ' + paapath + 'Cert.pem -O ' + paapath + 'Key.pem'
+        subprocess.run(cmd, shell=True)
 
     vid = 0xFFF1
     pid = 0x8000
 
     # Generate PAI Cert/Key
     builder = DevCertBuilder(CertType.PAI, test_case["error_flag"], paapath, test_case_out_dir,
-                             chipcert, vid, PID_NOT_PRESENT, '', VALID_IN_PAST)
+                             args.chipcert, vid, PID_NOT_PRESENT, '', VALID_IN_PAST, args.backend)
     builder.make_certs_and_keys()
 
     # Generate DAC Cert/Key
     builder = DevCertBuilder(CertType.DAC, test_case["error_flag"], paapath, test_case_out_dir,
-                             chipcert, vid, pid, '', VALID_IN_PAST)
+                             args.chipcert, vid, pid, '', VALID_IN_PAST, args.backend)
     builder.make_certs_and_keys()
 
     # Generate Certification Declaration (CD)
-    vid_flag = ' -V 0x{:X}'.format(vid)
-    pid_flag = ' -p 0x{:X}'.format(pid)
-    cmd = chipcert + ' gen-cd -K ' + cd_key + ' -C ' + cd_cert + ' -O ' + test_case_out_dir + '/cd.der' + \
-        ' -f 1 ' + vid_flag + pid_flag + ' -d 0x1234 -c "ZIG20141ZB330001-24" -l 0 -i 0 -n 9876 -t 0'
-    subprocess.run(cmd, shell=True)
+    generate_cd(args, test_case_out_dir + '/cd.der', vid, pid)
 
     # Generate Test Case Data Container in JSON Format
     generate_test_case_vector_json(test_case_out_dir, 'paa', test_case, basic_info_pid=0x8000)
 
+    if args.verify:
+        verify_test_case(args, test_case_out_dir, paapath + 'Cert.pem', check_chain=False, check_cd=True)
+
+
+def main():
+    argparser = argparse.ArgumentParser()
+    argparser.add_argument('-o', '--out_dir', dest='outdir',
+                           default='credentials/development/commissioner_dut',
+                           help='output directory for all generated test vectors')
+    argparser.add_argument('-p', '--paa', dest='paapath',
+                           default='credentials/test/attestation/Chip-Test-PAA-FFF1-', help='PAA to use')
+    argparser.add_argument('--paa_different_origin', dest='paapath_different_origin',
+                           default='credentials/test/attestation/Chip-Test-PAA-NoVID-',
+                           help='PAA to use when signing the PAI for the origin VID/PID test case (VID=0xFFF2)')
+    argparser.add_argument('-d', '--cd', dest='cdpath',
+                           default='credentials/test/certification-declaration/Chip-Test-CD-Signing-',
+                           help='CD Signing Key/Cert to use')
+    argparser.add_argument('-c', '--chip-cert-dir', dest='chipcertdir',
+                           default='out/debug/linux_x64_clang/', help='Directory where chip-cert tool is located')
+    argparser.add_argument('-b', '--backend', choices=['python', 'chip-cert'], default='python',
+                           help='generate the certificates and CDs in-process (python) or with chip-cert. The python '
+                                'backend still uses chip-cert for the cert-version and sig-algo test cases, and the DACs they sign')
+    argparser.add_argument('-j', '--jobs', type=int, default=os.cpu_count(),
+                           help='number of test cases generated in parallel (default: number of CPUs)')
+    argparser.add_argument('--verify', action='store_true',
+                           help='check the generated certificate chains and CDs with chip-cert')
+
+    args = argparser.parse_args()
+
+    args.chipcert = args.chipcertdir + 'chip-cert'
+
+    # Even the python backend uses chip-cert for some test cases, check for it before any of them is written
+    if not os.path.exists(args.chipcert):
+        raise Exception('Path not found: %s' % args.chipcert)
+
+    if not os.path.exists(args.outdir):
+        os.mkdir(args.outdir)
+
+    args.cd_cert = args.cdpath + 'Cert.pem'
+    args.cd_key = args.cdpath + 'Key.pem'
+
+    # Every test case is written to its own directory, so they are generated independently
+    test_cases = []
+    for test_cert in ['dac', 'pai']:
+        for test_case in CERT_STRUCT_TEST_CASES:
+            test_cases.append((generate_cert_struct_test_case, args, test_cert, test_case))
+
+    for test_cert in ['dac', 'pai']:
+        for test_case in VIDPID_FALLBACK_ENCODING_TEST_CASES:
+            test_cases.append((generate_vidpid_fallback_encoding_test_case, args, test_cert, test_case))
+
+    for test_case in CD_STRUCT_TEST_CASES:
+        test_cases.append((generate_cd_struct_test_case, args, test_case))
+
+    test_cases.append((generate_invalid_paa_test_case, args))
+
+    if args.jobs <= 1:
+        for generate, *generate_args in test_cases:
+            generate(*generate_args)
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        futures = [executor.submit(*test_case) for test_case in test_cases]
+        for future in futures:
+            future.result()
+
 
 if __name__ == '__main__':
     sys.exit(main())
@@ -525,36 +525,35 @@ class OpCertBuilder:
 
     def make_certs_and_keys(self) -> None:
         """Creates the PEM and DER certs and keyfiles"""
-        error_type_flag = ' -I -E ' + self.error_type
-        validity_flags = ' -V "2020-10-15 14:23:43" -l 7305 '
+        error_type_flags = ['-I', '-E', self.error_type]
+        validity_flags = ['-V', '2020-10-15 14:23:43', '-l', '7305']
 
         if self.cert_type == CertType.NOC:
-            type_flag = ' -t n '
-            suject_id_flags = ' -i DEDEDEDE00010001 -f FAB000000000001D '
-            signer_key_and_cert = ' -K ' + self.signer_key + ' -C ' + self.signer_cert
+            type_flags = ['-t', 'n']
+            subject_id_flags = ['-i', 'DEDEDEDE00010001', '-f', 'FAB000000000001D']
+            signer_key_and_cert = ['-K', self.signer_key, '-C', self.signer_cert]
         elif self.cert_type == CertType.ICAC:
-            type_flag = ' -t c '
-            suject_id_flags = ' -i CACACACA00000003 -f FAB000000000001D '
-            signer_key_and_cert = ' -K ' + self.signer_key + ' -C ' + self.signer_cert
+            type_flags = ['-t', 'c']
+            subject_id_flags = ['-i', 'CACACACA00000003', '-f', 'FAB000000000001D']
+            signer_key_and_cert = ['-K', self.signer_key, '-C', self.signer_cert]
         else:
-            type_flag = ' -t r '
-            suject_id_flags = ' -i CACACACA00000001 '
+            type_flags = ['-t', 'r']
+            subject_id_flags = ['-i', 'CACACACA00000001']
             if self.error_type == 'subject-fabric-id-invalid' or self.error_type == 'subject-fabric-id-twice':
-                suject_id_flags = ' -f FAB000000000001D '
-            signer_key_and_cert = ' '
+                subject_id_flags = ['-f', 'FAB000000000001D']
+            signer_key_and_cert = []
 
         if self.cert_form == CertFormat.DER:
-            format_flag = ' -F x509-der '
+            format_flags = ['-F', 'x509-der']
         else:
-            format_flag = ' -F chip '
+            format_flags = ['-F', 'chip']
 
-        cmd = 'echo ' + self.own.cert_file_name
-        subprocess.run(cmd, shell=True)
+        print(self.own.cert_file_name)
 
         # Generate privatkey/certificate in DER or CHIP TLV format
-        cmd = self.chipcert + ' gen-cert ' + type_flag + error_type_flag + suject_id_flags + signer_key_and_cert \
-            + validity_flags + format_flag + ' -o ' + self.own.cert_file_name + ' -O ' + self.own.key_file_name
-        subprocess.run(cmd, shell=True)
+        cmd = [self.chipcert, 'gen-cert'] + type_flags + error_type_flags + subject_id_flags + signer_key_and_cert \
+            + validity_flags + format_flags + ['-o', self.own.cert_file_name, '-O', self.own.key_file_name]
+        subprocess.run(cmd)
 
     def full_arrays(self) -> tuple[str, str]:
         """Returns DER and CHIP TLV certificate byte arrays and declarations"""
@@ -0,0 +1,184 @@
+"""
+Simulates cameras pushing CMAF segments to a push AV server, each uploader creating its own
+stream and uploading its segments on its own connection, and reports the upload latencies.
+
+By default a server is started in a subprocess on a free port, in a temporary working directory.
+Use --port and --working-directory to target a server already running on this machine instead.
+"""
+
+import argparse
+import concurrent.futures
+import http.client
+import json
+import logging
+import os
+import socket
+import ssl
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Optional
+
+module_dir_path = os.path.dirname(os.path.realpath(__file__))
+
+UPLOAD_CHUNK_SIZE = 16 * 1024
+
+
+class Uploader:
+    """ A camera uploading the segments of a single stream over its own connection. """
+
+    def __init__(self, host: str, port: int, ssl_context: ssl.SSLContext, track_name: str):
+        self.connection = http.client.HTTPSConnection(host, port, context=ssl_context)
+        self.track_name = track_name
+        self.latencies = []
+        self.errors = 0
+
+    def request(self, method: str, path: str, body=None, headers: Optional[dict] = None) -> tuple[int, bytes]:
+        self.connection.request(method, path, body=body, headers=headers or {},
+                                encode_chunked=body is not None and not isinstance(body, (bytes, str)))
+        response = self.connection.getresponse()
+        return response.status, response.read()
+
+    def upload(self, path: str, data: bytes):
+        # Sent by chunks, as a camera streaming a segment while it is being encoded
+        chunks = (data[i:i + UPLOAD_CHUNK_SIZE] for i in range(0, len(data), UPLOAD_CHUNK_SIZE))
+        start = time.monotonic()
+        status, _ = self.request("PUT", path, body=chunks)
+        self.latencies.append(time.monotonic() - start)
+        if status != 202:
+            logging.error("Upload of %s failed with status %d", path, status)
+            self.errors += 1
+
+    def run(self, segments: int, segment_size: int, interval: float) -> int:
+        status, body = self.request("POST", "/streams")
+        if status != 201:
+            raise RuntimeError(f"Failed to create a stream: {status} {body}")
+        stream_id = json.loads(body)["stream_id"]
+        self.request("POST", f"/streams/{stream_id}/trackName", json.dumps({"trackName": self.track_name}),
+                     {"Content-Type": "application/json"})
+
+        session = f"/streams/{stream_id}/session_1/{self.track_name}"
+        self.upload(f"{session}/segment_0.init", os.urandom(1024))
+        for segment in range(1, segments + 1):
+            deadline = time.monotonic() + interval
+            self.upload(f"{session}/segment_{segment}.m4s", os.urandom(segment_size))
+            time.sleep(max(0, deadline - time.monotonic()))
+
+        self.connection.close()
+        return stream_id
+
+
+def client_ssl_context(working_directory: str, host: str, port: int) -> ssl.SSLContext:
+    """ Create a device identity on the server and a TLS context using it. """
+    ssl_context = ssl.create_default_context(cafile=os.path.join(working_directory, "certs", "server", "root.pem"))
+    connection = http.client.HTTPSConnection(host, port, context=ssl_context)
+    connection.request("POST", "/certs/load-test/keypair")
+    if connection.getresponse().status != 200:
+        raise RuntimeError("Failed to create the load-test device keypair")
+    connection.close()
+
+    ssl_context.load_cert_chain(os.path.join(working_directory, "certs", "device", "load-test.pem"),
+                                os.path.join(working_directory, "certs", "device", "load-test.key"))
+    return ssl_context
+
+
+def start_local_server(working_directory: str, port: int, server_args: list[str]) -> subprocess.Popen:
+    server = subprocess.Popen([sys.executable, os.path.join(module_dir_path, "server.py"), "--host", "127.0.0.1",
+                               "--port", str(port), "--working-directory", working_directory, "--strict-mode"]
+                              + server_args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    # Wait for the server to accept connections
+    deadline = time.monotonic() + 30
+    while True:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            return server
+        except OSError:
+            if server.poll() is not None or time.monotonic() > deadline:
+                server.kill()
+                raise RuntimeError("The push AV server did not start")
+            time.sleep(0.1)
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def percentile(values: list[float], p: float) -> float:
+    return statistics.quantiles(values, n=100, method="inclusive")[p - 1] if len(values) > 1 else values[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test of the push AV server with concurrent segment uploaders")
+    parser.add_argument("--uploaders", "-n", type=int, default=8, help="Number of cameras uploading at the same time")
+    parser.add_argument("--segments", type=int, default=20, help="Number of media segments uploaded by each camera")
+    parser.add_argument("--segment-size", type=int, default=512 * 1024, help="Size in bytes of each media segment")
+    parser.add_argument("--interval", type=float, default=0,
+                        help="Seconds between the start of two segments of a camera, as the segment duration "
+                        "of a live stream. Default to uploading as fast as possible.")
+    parser.add_argument("--port", type=int, help="Port of a server already running. Default to starting a local one.")
+    parser.add_argument("--working-directory",
+                        help="Working directory of the server. Required with --port, default to a temporary directory.")
+    parser.add_argument("server_args", nargs="*", help="Arguments of the local server, after --, "
+                        "e.g. -- --fsync-interval 1")
+    args = parser.parse_args()
+
+    logging.basicConfig(format="%(asctime)s|%(levelname)-5s|%(message)s", level=logging.INFO, datefmt="%H:%M:%S")
+
+    if args.port and not args.working_directory:
+        parser.error("--working-directory of the server is required with --port")
+
+    # The server certificate is issued to localhost
+    host = "localhost"
+    server = None
+    tmp = None
+    if args.port:
+        port, working_directory = args.port, args.working_directory
+    else:
+        port = free_port()
+        if args.working_directory:
+            working_directory = args.working_directory
+        else:
+            tmp = tempfile.TemporaryDirectory(prefix="push_av_load_test")
+            working_directory = tmp.name
+        server = start_local_server(working_directory, port, args.server_args)
+
+    try:
+        ssl_context = client_ssl_context(working_directory, host, port)
+        uploaders = [Uploader(host, port, ssl_context, f"track{i}") for i in range(args.uploaders)]
+
+        start = time.monotonic()
+        with concurrent.futures.ThreadPoolExecutor(len(uploaders)) as executor:
+            futures = [executor.submit(uploader.run, args.segments, args.segment_size, args.interval)
+                       for uploader in uploaders]
+            stream_ids = [future.result() for future in futures]
+        elapsed = time.monotonic() - start
+
+        connection = http.client.HTTPSConnection(host, port, context=ssl_context)
+        connection.request("GET", "/streams")
+        streams = {stream["id"]: stream for stream in json.loads(connection.getresponse().read())["streams"]}
+        connection.close()
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+        if tmp:
+            tmp.cleanup()
+
+    latencies = [latency for uploader in uploaders for latency in uploader.latencies]
+    uploaded = args.uploaders * args.segments * args.segment_size
+    missing = sum(args.segments + 1 - len(streams.get(stream_id, {}).get("valid_files", [])) for stream_id in stream_ids)
+
+    print(f"{len(latencies)} uploads by {args.uploaders} uploaders in {elapsed:.2f}s: "
+          f"{len(latencies) / elapsed:.1f} uploads/s, {uploaded / elapsed / 1e6:.1f} MB/s")
+    print(f"Latency: p50 {percentile(latencies, 50) * 1000:.1f}ms, p95 {percentile(latencies, 95) * 1000:.1f}ms, "
+          f"max {max(latencies) * 1000:.1f}ms")
+    print(f"Errors: {sum(uploader.errors for uploader in uploaders)}, files missing from /streams: {missing}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,512 @@
+"""
+Incremental validation of the media uploaded to the push AV server.
+
+Segments are parsed as they arrive, in a pool of worker threads, by walking their ISO-BMFF box
+headers: only the moof, sidx and initialization boxes are read, the media data is skipped. The
+timing of each segment is kept per track, from which running statistics of the stream (segment
+durations, bitrate, gaps in the segment numbers and timeline, track consistency) are computed
+without running ffprobe on every file.
+"""
+
+import concurrent.futures
+import logging
+import os
+import re
+import struct
+import threading
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional
+
+# Boxes whose children are read when parsing a segment or an initialization segment
+CONTAINER_BOXES = {b"moov", b"trak", b"mdia", b"mvex", b"moof", b"traf"}
+# Boxes that are read in full, all the other ones are skipped
+LEAF_BOXES = {b"mvhd", b"tkhd", b"mdhd", b"hdlr", b"trex", b"mfhd", b"tfhd", b"tfdt", b"trun", b"sidx"}
+
+# Number of the segment in the segment_<SegmentNumber> name of the uploads
+SEGMENT_NUMBER_PATTERN = re.compile(r"segment_(?P<number>\d+)$")
+
+# Header lines of HLS playlists
+HLS_ATTRIBUTE_PATTERN = re.compile(r"^#(?P<tag>EXT[A-Z0-9-]*)(?::(?P<value>.*))?$")
+
+
+class MediaValidationError(Exception):
+    pass
+
+
+def iter_boxes(f: BinaryIO, end: int) -> Iterator[tuple[bytes, int, int]]:
+    """
+    Yield the (type, payload offset, payload size) of the boxes of 'f' until offset 'end',
+    leaving the file positioned at the start of the payload of each box.
+    """
+    offset = f.tell()
+    while offset < end:
+        f.seek(offset)
+        header = f.read(8)
+        if len(header) < 8:
+            raise MediaValidationError(f"Truncated box header at offset {offset}")
+        size, box_type = struct.unpack(">I4s", header)
+        header_size = 8
+        if size == 1:
+            large_size = f.read(8)
+            if len(large_size) < 8:
+                raise MediaValidationError(f"Truncated box header at offset {offset}")
+            size = struct.unpack(">Q", large_size)[0]
+            header_size = 16
+        elif size == 0:
+            # The box extends to the end of the file
+            size = end - offset
+        if size < header_size or offset + size > end:
+            raise MediaValidationError(f"Box {box_type!r} at offset {offset} of size {size} exceeds its parent")
+
+        yield box_type, offset + header_size, size - header_size
+        offset += size
+
+
+def read_boxes(f: BinaryIO, end: int, path: tuple[bytes, ...] = ()) -> Iterator[tuple[tuple[bytes, ...], bytes]]:
+    """ Yield the path and payload of the leaf boxes of interest, descending into the containers. """
+    for box_type, offset, size in iter_boxes(f, end):
+        if box_type in CONTAINER_BOXES:
+            f.seek(offset)
+            yield from read_boxes(f, offset + size, path + (box_type,))
+        elif box_type in LEAF_BOXES:
+            yield path + (box_type,), f.read(size)
+        elif not path:
+            # Top-level boxes are reported so that their presence can be checked
+            yield (box_type,), b""
+
+
+def _full_box(payload: bytes) -> tuple[int, int]:
+    """ Return the version and flags of a full box. """
+    if len(payload) < 4:
+        raise MediaValidationError("Truncated full box")
+    return payload[0], int.from_bytes(payload[1:4], "big")
+
+
+@dataclass
+class TrackHeader:
+    """ Description of a track in an initialization segment. """
+    track_id: int
+    timescale: Optional[int] = None
+    handler: Optional[str] = None
+    default_sample_duration: int = 0
+
+
+@dataclass
+class FragmentTiming:
+    """ Timing of the samples of a track in a media segment, in the timescale of the track. """
+    base_media_decode_time: Optional[int] = None
+    duration: int = 0
+    samples: int = 0
+
+
+@dataclass
+class SegmentInfo:
+    path: Path
+    number: Optional[int]
+    size: int
+    fragments: int = 0
+    tracks: dict[int, FragmentTiming] = field(default_factory=dict)
+    # (timescale, duration) of the segment according to its sidx box, if any
+    sidx_duration: Optional[tuple[int, int]] = None
+    sequence_numbers: list[int] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+
+
+def parse_init_segment(p: Path) -> dict[int, TrackHeader]:
+    """ Return the tracks described by the moov box of an initialization segment. """
+    tracks: dict[int, TrackHeader] = {}
+    defaults: dict[int, int] = {}
+    track: Optional[TrackHeader] = None
+
+    with open(p, "rb") as f:
+        for path, payload in read_boxes(f, os.fstat(f.fileno()).st_size):
+            box_type = path[-1]
+            if box_type == b"tkhd":
+                version, _ = _full_box(payload)
+                track_id_offset = 4 + (16 if version == 1 else 8)
+                track_id = struct.unpack_from(">I", payload, track_id_offset)[0]
+                track = tracks.setdefault(track_id, TrackHeader(track_id))
+            elif box_type == b"mdhd" and track:
+                version, _ = _full_box(payload)
+                track.timescale = struct.unpack_from(">I", payload, 4 + (16 if version == 1 else 8))[0]
+            elif box_type == b"hdlr" and track and b"mdia" in path:
+                track.handler = payload[8:12].decode("ascii", errors="replace")
+            elif box_type == b"trex":
+                track_id, _, default_sample_duration = struct.unpack_from(">III", payload, 4)
+                defaults[track_id] = default_sample_duration
+
+    if not tracks:
+        raise MediaValidationError("No track in the initialization segment")
+
+    for track_id, default_sample_duration in defaults.items():
+        if track_id in tracks:
+            tracks[track_id].default_sample_duration = default_sample_duration
+
+    return tracks
+
+
+def _parse_sidx(payload: bytes) -> tuple[int, int]:
+    version, _ = _full_box(payload)
+    timescale = struct.unpack_from(">I", payload, 8)[0]
+    offset = 12 + (16 if version == 1 else 8)
+    reference_count = struct.unpack_from(">H", payload, offset + 2)[0]
+    offset += 4
+    duration = 0
+    for i in range(reference_count):
+        duration += struct.unpack_from(">I", payload, offset + i * 12 + 4)[0]
+    return timescale, duration
+
+
+def _parse_trun(payload: bytes, default_sample_duration: int) -> tuple[int, int]:
+    """ Return the number of samples and their total duration. """
+    _, flags = _full_box(payload)
+    sample_count = struct.unpack_from(">I", payload, 4)[0]
+    if not flags & 0x100:
+        return sample_count, sample_count * default_sample_duration
+
+    offset = 8 + (4 if flags & 0x1 else 0) + (4 if flags & 0x4 else 0)
+    sample_size = 4 * bin(flags & 0xF00).count("1")
+    if offset + sample_count * sample_size > len(payload):
+        raise MediaValidationError("Truncated trun box")
+    duration = sum(struct.unpack_from(">I", payload, offset + i * sample_size)[0] for i in range(sample_count))
+    return sample_count, duration
+
+
+def parse_segment(p: Path, number: Optional[int], init_tracks: Optional[dict[int, TrackHeader]]) -> SegmentInfo:
+    """
+    Return the timing of the tracks of a media segment, made of one or more moof and mdat boxes.
+    Sample durations are read from the trun boxes, defaulting to the ones of the tfhd boxes, then
+    to the ones of the initialization segment.
+    """
+    segment = SegmentInfo(p, number, p.stat().st_size)
+    init_tracks = init_tracks or {}
+    moof = mdat = 0
+    track_id = None
+    default_sample_duration = 0
+
+    with open(p, "rb") as f:
+        for path, payload in read_boxes(f, segment.size):
+            box_type = path[-1]
+            if path == (b"mdat",):
+                mdat += 1
+            elif box_type == b"sidx":
+                timescale, duration = _parse_sidx(payload)
+                previous = segment.sidx_duration[1] if segment.sidx_duration else 0
+                segment.sidx_duration = (timescale, previous + duration)
+            elif box_type == b"mfhd":
+                moof += 1
+                segment.sequence_numbers.append(struct.unpack_from(">I", payload, 4)[0])
+            elif box_type == b"tfhd":
+                _, flags = _full_box(payload)
+                track_id = struct.unpack_from(">I", payload, 4)[0]
+                offset = 8 + (8 if flags & 0x1 else 0) + (4 if flags & 0x2 else 0)
+                if flags & 0x8:
+                    default_sample_duration = struct.unpack_from(">I", payload, offset)[0]
+                elif track_id in init_tracks:
+                    default_sample_duration = init_tracks[track_id].default_sample_duration
+                else:
+                    default_sample_duration = 0
+                segment.tracks.setdefault(track_id, FragmentTiming())
+            elif box_type == b"tfdt" and track_id is not None:
+                version, _ = _full_box(payload)
+                base_media_decode_time = struct.unpack_from(">Q" if version == 1 else ">I", payload, 4)[0]
+                timing = segment.tracks[track_id]
+                if timing.base_media_decode_time is None:
+                    timing.base_media_decode_time = base_media_decode_time
+            elif box_type == b"trun" and track_id is not None:
+                samples, duration = _parse_trun(payload, default_sample_duration)
+                segment.tracks[track_id].samples += samples
+                segment.tracks[track_id].duration += duration
+
+    segment.fragments = moof
+    if not moof:
+        segment.errors.append("No moof box")
+    if moof != mdat:
+        segment.errors.append(f"{moof} moof boxes for {mdat} mdat boxes")
+    if any(b <= a for a, b in zip(segment.sequence_numbers, segment.sequence_numbers[1:])):
+        segment.errors.append("Fragment sequence numbers are not increasing")
+
+    return segment
+
+
+def parse_dash_manifest(p: Path) -> dict:
+    """ Return a summary of a DASH MPD and the errors found in it. """
+    summary = {"type": "dash", "errors": []}
+    try:
+        root = ET.parse(p).getroot()
+    except ET.ParseError as e:
+        summary["errors"].append(f"Invalid XML: {e}")
+        return summary
+
+    def local_name(element):
+        return element.tag.rsplit("}", 1)[-1]
+
+    if local_name(root) != "MPD":
+        summary["errors"].append(f"Root element is {local_name(root)}, not MPD")
+        return summary
+
+    summary["profile"] = root.get("profiles")
+    summary["dynamic"] = root.get("type") == "dynamic"
+    representations = []
+    periods = 0
+    for element in root.iter():
+        name = local_name(element)
+        if name == "Period":
+            periods += 1
+        elif name == "Representation":
+            representation = {"id": element.get("id"), "bandwidth": element.get("bandwidth")}
+            if representation["id"] is None or representation["bandwidth"] is None:
+                summary["errors"].append(f"Representation {representation['id']} without id or bandwidth")
+            representations.append(representation)
+
+    if not periods:
+        summary["errors"].append("No Period")
+    if not representations:
+        summary["errors"].append("No Representation")
+    summary["periods"] = periods
+    summary["representations"] = representations
+    return summary
+
+
+def parse_hls_playlist(p: Path) -> dict:
+    """ Return a summary of an HLS playlist and the errors found in it. """
+    summary = {"type": "hls", "errors": []}
+    lines = [line.strip() for line in p.read_text(errors="replace").splitlines() if line.strip()]
+    if not lines or lines[0] != "#EXTM3U":
+        summary["errors"].append("Playlist does not start with #EXTM3U")
+        return summary
+
+    target_duration = None
+    durations = []
+    variants = 0
+    for line in lines[1:]:
+        match = HLS_ATTRIBUTE_PATTERN.match(line)
+        if not match:
+            continue
+        tag, value = match.group("tag"), match.group("value")
+        try:
+            if tag == "EXT-X-TARGETDURATION":
+                target_duration = int(value)
+            elif tag == "EXTINF":
+                durations.append(float(value.split(",", 1)[0]))
+            elif tag == "EXT-X-STREAM-INF":
+                variants += 1
+        except (TypeError, ValueError):
+            summary["errors"].append(f"Invalid {tag}: {value}")
+
+    if variants:
+        summary["variants"] = variants
+        return summary
+
+    summary["target_duration"] = target_duration
+    summary["segments"] = len(durations)
+    if target_duration is None:
+        summary["errors"].append("Media playlist without EXT-X-TARGETDURATION")
+    else:
+        # RFC 8216 4.3.3.1, the EXTINF durations rounded to the nearest integer must not exceed the target duration
+        longer = [duration for duration in durations if round(duration) > target_duration]
+        if longer:
+            summary["errors"].append(f"{len(longer)} segments longer than the target duration: {longer[:5]}")
+    return summary
+
+
+class TrackStats:
+    """ The segments received for one track of a stream, that is one directory of uploads. """
+
+    def __init__(self):
+        self.init_path: Optional[str] = None
+        self.init_tracks: Optional[dict[int, TrackHeader]] = None
+        # Segments by (0, segment number), or (1, order of arrival) for the ones without a number
+        self.segments: dict[tuple[int, int], SegmentInfo] = {}
+        self.errors: list[str] = []
+        self.unnumbered = 0
+
+    def _segment_duration(self, segment: SegmentInfo) -> Optional[float]:
+        durations = [timing.duration / self.init_tracks[track_id].timescale
+                     for track_id, timing in segment.tracks.items()
+                     if self.init_tracks and track_id in self.init_tracks and self.init_tracks[track_id].timescale]
+        if durations:
+            return max(durations)
+        if segment.sidx_duration and segment.sidx_duration[0]:
+            return segment.sidx_duration[1] / segment.sidx_duration[0]
+        return None
+
+    def to_dict(self) -> dict:
+        segments = [self.segments[number] for number in sorted(self.segments)]
+        timed = [(segment.size, duration) for segment, duration in zip(segments, map(self._segment_duration, segments))
+                 if duration is not None]
+        durations = [duration for _, duration in timed]
+        total_duration = sum(durations)
+        # Only the segments whose duration is known count in the bitrate
+        timed_size = sum(size for size, _ in timed)
+
+        # Gaps in the segment numbers, as [first, last] ranges so a jump in the numbering costs a single
+        # entry, and in the timeline of each track
+        missing_segments = []
+        missing_count = 0
+        discontinuities = []
+        for previous, segment in zip(segments, segments[1:]):
+            if previous.number is not None and segment.number is not None and segment.number > previous.number + 1:
+                missing_segments.append([previous.number + 1, segment.number - 1])
+                missing_count += segment.number - previous.number - 1
+            for track_id, timing in segment.tracks.items():
+                previous_timing = previous.tracks.get(track_id)
+                if (previous_timing is None or previous_timing.base_media_decode_time is None or
+                        timing.base_media_decode_time is None):
+                    continue
+                expected = previous_timing.base_media_decode_time + previous_timing.duration
+                if timing.base_media_decode_time != expected:
+                    discontinuities.append({"segment": segment.number, "track_id": track_id,
+                                            "expected": expected, "actual": timing.base_media_decode_time})
+
+        errors = list(self.errors)
+        if segments and self.init_tracks is None:
+            errors.append("No initialization segment")
+        track_sets = {tuple(sorted(segment.tracks)) for segment in segments if segment.tracks}
+        if len(track_sets) > 1:
+            errors.append(f"Segments have different tracks: {sorted(track_sets)}")
+        if self.init_tracks:
+            unknown = sorted(set().union(*track_sets) - set(self.init_tracks))
+            if unknown:
+                errors.append(f"Tracks {unknown} are not in the initialization segment")
+        errors.extend(f"segment {segment.number}: {error}" for segment in segments for error in segment.errors)
+
+        return {
+            "init": self.init_path,
+            "tracks": [{"track_id": t.track_id, "handler": t.handler, "timescale": t.timescale}
+                       for t in (self.init_tracks or {}).values()],
+            "segments": len(segments),
+            "first_segment": segments[0].number if segments else None,
+            "last_segment": segments[-1].number if segments else None,
+            "bytes": sum(segment.size for segment in segments),
+            "duration": total_duration,
+            "min_segment_duration": min(durations, default=None),
+            "max_segment_duration": max(durations, default=None),
+            "avg_segment_duration": total_duration / len(durations) if durations else None,
+            "bitrate": timed_size * 8 / total_duration if total_duration else None,
+            "missing_segments": missing_segments,
+            "missing_segment_count": missing_count,
+            "discontinuities": discontinuities,
+            "errors": errors,
+        }
+
+
+class StreamStats:
+    def __init__(self):
+        self.tracks: dict[str, TrackStats] = {}
+        self.manifests: dict[str, dict] = {}
+
+    def track(self, directory: str) -> TrackStats:
+        return self.tracks.setdefault(directory, TrackStats())
+
+    def to_dict(self) -> dict:
+        return {
+            "tracks": {directory: track.to_dict() for directory, track in sorted(self.tracks.items())},
+            "manifests": dict(sorted(self.manifests.items())),
+        }
+
+
+class StreamValidator:
+    """
+    Validate the uploaded segments and manifests in a pool of worker threads, keeping the
+    statistics of each stream up to date as the uploads arrive.
+    """
+
+    def __init__(self, max_workers: int = 2):
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers, thread_name_prefix="stream_validator")
+        self.lock = threading.Lock()
+        self.streams: dict[int, StreamStats] = {}
+        self.pending: dict[int, set[concurrent.futures.Future]] = {}
+
+    def submit(self, stream_id: int, file_path: str, p: Path) -> Optional[concurrent.futures.Future]:
+        """ Queue the validation of the file uploaded at 'file_path' of a stream, stored at 'p'. """
+        ext = file_path.rsplit(".", 1)[-1]
+        if ext not in ("init", "m4s", "mpd", "m3u8"):
+            return None
+
+        with self.lock:
+            self.streams.setdefault(stream_id, StreamStats())
+            pending = self.pending.setdefault(stream_id, set())
+            future = self.executor.submit(self._validate, stream_id, file_path, ext, p)
+            pending.add(future)
+        future.add_done_callback(lambda f: self._done(stream_id, f))
+        return future
+
+    def _done(self, stream_id: int, future: concurrent.futures.Future):
+        with self.lock:
+            self.pending[stream_id].discard(future)
+        if future.exception():
+            logging.error("Validation failed: %s", future.exception())
+
+    def _validate(self, stream_id: int, file_path: str, ext: str, p: Path):
+        directory, _, name = file_path.rpartition("/")
+        stats = self.streams[stream_id]
+
+        if ext in ("mpd", "m3u8"):
+            summary = parse_dash_manifest(p) if ext == "mpd" else parse_hls_playlist(p)
+            with self.lock:
+                updates = stats.manifests.get(file_path, {}).get("updates", 0)
+                stats.manifests[file_path] = dict(summary, updates=updates + 1)
+            return
+
+        if ext == "init":
+            try:
+                init_tracks = parse_init_segment(p)
+            except (MediaValidationError, struct.error, OSError) as e:
+                with self.lock:
+                    stats.track(directory).errors.append(f"{name}: {e}")
+                return
+            with self.lock:
+                track = stats.track(directory)
+                track.init_path, track.init_tracks = file_path, init_tracks
+                segments = list(track.segments.items())
+            # Segments parsed before their initialization segment may use the sample durations it defaults to
+            for key, segment in segments:
+                if any(timing.duration == 0 for timing in segment.tracks.values()):
+                    self._validate_segment(track, segment.path, segment.number, key)
+            return
+
+        match = SEGMENT_NUMBER_PATTERN.search(name.rsplit(".", 1)[0])
+        number = int(match.group("number")) if match else None
+        with self.lock:
+            track = stats.track(directory)
+            if number is None:
+                # Segments without a segment number are ordered by arrival, after the numbered ones
+                track.unnumbered += 1
+                key = (1, track.unnumbered)
+            else:
+                key = (0, number)
+        self._validate_segment(track, p, number, key)
+
+    def _validate_segment(self, track: TrackStats, p: Path, number: Optional[int], key: tuple[int, int]):
+        while True:
+            with self.lock:
+                init_tracks = track.init_tracks
+            try:
+                segment = parse_segment(p, number, init_tracks)
+            except (MediaValidationError, struct.error, OSError) as e:
+                segment = SegmentInfo(p, number, p.stat().st_size if p.exists() else 0, errors=[str(e)])
+
+            with self.lock:
+                # Parse again if the initialization segment arrived in the meantime
+                if track.init_tracks is init_tracks:
+                    track.segments[key] = segment
+                    return
+
+    def stats(self, stream_id: int) -> dict:
+        with self.lock:
+            stats = self.streams.get(stream_id, StreamStats())
+            result = stats.to_dict()
+            result["pending"] = len(self.pending.get(stream_id, ()))
+        return result
+
+    def wait(self, stream_id: int, timeout: Optional[float] = None):
+        """ Wait for the validation of the files already uploaded to a stream. """
+        with self.lock:
+            pending = list(self.pending.get(stream_id, ()))
+        concurrent.futures.wait(pending, timeout)
+
+    def close(self):
+        self.executor.shutdown()
@@ -1,5 +1,6 @@
 import argparse
 import asyncio
+import concurrent.futures
 import datetime
 import ipaddress
 import json
@@ -15,9 +16,10 @@ import string
 import subprocess
 import sys
 import tempfile
+import threading
 from enum import Enum
 from pathlib import Path
-from typing import Awaitable, Callable, Literal, Optional
+from typing import AsyncIterable, Awaitable, Callable, Literal, Optional
 
 from cryptography import x509
 from cryptography.hazmat.primitives import hashes, serialization
@@ -31,6 +33,13 @@ from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel
 from zeroconf import ServiceInfo, Zeroconf
 
+try:
+    from media_validation import StreamValidator
+except ImportError:
+    # media_validation.py is next to this script, which is not on the path when it is imported as a module
+    sys.path.append(os.path.dirname(os.path.realpath(__file__)))
+    from media_validation import StreamValidator
+
 module_dir_path = os.path.dirname(os.path.realpath(__file__))
 templates_path = os.path.join(module_dir_path, "templates")
 static_path = os.path.join(module_dir_path, "static")
@@ -40,6 +49,13 @@ https://dashif.org/Ingest/#interface-2-naming
 '''
 VALID_EXTENSIONS = ["mpd", "m3u8", "m4s", "init"]
 
+# CMAF extended path of the segments: session_<SessionNumber>/<TrackName>/segment_<SegmentNumber>
+# https://github.com/CHIP-Specifications/connectedhomeip-spec/blob/master/src/app_clusters/PushAVStreamTransport.adoc#12-operation
+SEGMENT_PATH_PATTERN = re.compile(r"^session_\d+/(?P<trackName>[^/]+)/segment_\d+$")
+
+# Uploads are written to disk by chunks of at least this size
+DEFAULT_UPLOAD_BUFFER_SIZE = 256 * 1024
+
 
 class WorkingDirectory:
     """
@@ -399,6 +415,86 @@ class CAHierarchy:
         return (key_path, cert_bundle_path, False)
 
 
+class UploadWriter:
+    """
+    Write uploaded files to disk from a pool of threads, so that the event loop serving
+    the uploads of all the streams never blocks on the disk.
+
+    The body of an upload is buffered up to `buffer_size` bytes before being written, and the
+    next chunks are only read once that write is done, bounding the memory used per upload.
+    If `fsync_interval` is set, the files written are synced to disk together, at most once
+    per interval, instead of after each upload.
+    """
+
+    def __init__(self, buffer_size: int = DEFAULT_UPLOAD_BUFFER_SIZE, fsync_interval: Optional[float] = None,
+                 max_workers: int = 4):
+        self.buffer_size = buffer_size
+        self.fsync_interval = fsync_interval
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers, thread_name_prefix="upload_writer")
+        self.pending_fsync: set[Path] = set()
+        self.fsync_task: Optional[asyncio.Task] = None
+
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+
+    async def write_bytes(self, dst: Path, data: bytes):
+        await self._run(dst.write_bytes, data)
+        self._schedule_fsync(dst)
+
+    async def write_stream(self, dst: Path, chunks: AsyncIterable[bytes]) -> int:
+        """ Write all the chunks to 'dst', returning the number of bytes written. """
+        size = 0
+        buffer = bytearray()
+        f = await self._run(open, dst, "wb")
+        try:
+            async for chunk in chunks:
+                buffer += chunk
+                if len(buffer) >= self.buffer_size:
+                    size += await self._run(f.write, bytes(buffer))
+                    buffer.clear()
+            if buffer:
+                size += await self._run(f.write, bytes(buffer))
+        finally:
+            await self._run(f.close)
+
+        self._schedule_fsync(dst)
+        return size
+
+    def _schedule_fsync(self, path: Path):
+        if self.fsync_interval is None:
+            return
+        self.pending_fsync.add(path)
+        if self.fsync_task is None or self.fsync_task.done():
+            self.fsync_task = asyncio.get_running_loop().create_task(self._fsync_after_interval())
+
+    async def _fsync_after_interval(self):
+        await asyncio.sleep(self.fsync_interval)
+        await self.flush()
+
+    @staticmethod
+    def _fsync(paths: list[Path]):
+        # Directories are synced too, for the new files to be found after a crash
+        for path in paths + list({path.parent for path in paths}):
+            try:
+                fd = os.open(path, os.O_RDONLY)
+            except FileNotFoundError:
+                continue
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+    async def flush(self):
+        """ Sync to disk all the files written since the last flush. """
+        paths = list(self.pending_fsync)
+        self.pending_fsync.clear()
+        if paths:
+            await self._run(self._fsync, paths)
+
+    def close(self):
+        self.executor.shutdown()
+
+
 class SignClientCertificate(BaseModel):
     """Request model to sign a client certificate"""
     csr: str
@@ -419,14 +515,23 @@ class PushAvServer:
 
     templates = Jinja2Templates(directory=templates_path)
 
-    def __init__(self, wd: WorkingDirectory, device_hierarchy: CAHierarchy, strict_mode: bool):
+    def __init__(self, wd: WorkingDirectory, device_hierarchy: CAHierarchy, strict_mode: bool,
+                 upload_writer: Optional[UploadWriter] = None, validator: Optional[StreamValidator] = None):
         self.wd = wd
         self.device_hierarchy = device_hierarchy
         self.strict_mode = strict_mode
+        self.upload_writer = upload_writer or UploadWriter()
+        self.validator = validator or StreamValidator()
         self.router = APIRouter()
 
         # In-memory map to track stream files: {stream_id: {"valid_files": [], "invalid_files": []}}
         self.stream_files_map = {}
+        # Paths in each list of stream_files_map, to find duplicates without going through the lists
+        self.stream_files_index = {}
+
+        # In-memory copy of the details.json of each stream: {stream_id: details}
+        self.stream_details = {}
+        self.create_stream_lock = threading.Lock()
 
         # UI
         self.router.add_api_route("/", self.index, methods=["GET"], response_class=RedirectResponse)
@@ -443,6 +548,7 @@ class PushAvServer:
 
         self.router.add_api_route("/streams/{stream_id}/{file_path:path}.{ext}", self.handle_upload, methods=["PUT"])
 
+        self.router.add_api_route("/streams/{stream_id}/stats", self.stream_stats, methods=["GET"])
         self.router.add_api_route("/streams/{stream_id}/{file_path:path}", self.segment_download, methods=["GET"])
         self.router.add_api_route("/streams/{stream_id}/trackName", self.update_track_name, methods=["POST"], status_code=202)
         self.router.add_api_route("/certs", self.list_certs, methods=["GET"], status_code=200)
@@ -453,16 +559,30 @@ class PushAvServer:
     # Utilities
 
     def _read_stream_details(self, stream_id: int):
+        if stream_id in self.stream_details:
+            return self.stream_details[stream_id]
+
         p = self.wd.path("streams", str(stream_id), "details.json")
 
         try:
             with open(p, 'r') as file:
-                return json.load(file)
+                details = json.load(file)
         except FileNotFoundError:
             raise HTTPException(404, detail="Stream doesn't exists")
         except Exception as e:
             raise HTTPException(500, f"An unexpected error occurred: {e}")
 
+        self.stream_details[stream_id] = details
+        return details
+
+    def _write_stream_details(self, stream_id: int, details: dict):
+        p = self.wd.path("streams", str(stream_id), "details.json")
+
+        with open(p, 'w', encoding='utf-8') as f:
+            json.dump(details, f, ensure_ascii=False, indent=4)
+
+        self.stream_details[stream_id] = details
+
     # UI website
 
     def index(self):
@@ -509,19 +629,20 @@ class PushAvServer:
     # APIs
 
     def create_stream(self, interface: Optional[SupportedIngestInterface] = None):
-        # Find the last registered stream
-        dirs = [d for d in pathlib.Path(self.wd.path("streams")).iterdir() if d.is_dir()]
-        last_stream = int(dirs[-1].name) if len(dirs) > 0 else 0
-        stream_id = last_stream + 1
+        # Streams may be created concurrently, each must get its own directory
+        with self.create_stream_lock:
+            # Find the last registered stream
+            ids = [int(d.name) for d in pathlib.Path(self.wd.path("streams")).iterdir() if d.is_dir() and d.name.isdigit()]
+            stream_id = max(ids, default=0) + 1
 
-        # TODO Add option to specify Interface-1, Interface-2 DASH, or I2-HLS to improve the strict mode
-        p = self.wd.mkdir("streams", str(stream_id))
-        stream = {"stream_id": stream_id, "strict_mode": self.strict_mode, "interface": interface}
+            # TODO Add option to specify Interface-1, Interface-2 DASH, or I2-HLS to improve the strict mode
+            self.wd.mkdir("streams", str(stream_id))
 
-        with open(p / "details.json", 'w', encoding='utf-8') as f:
-            json.dump(stream, f, ensure_ascii=False, indent=4)
+        stream = {"stream_id": stream_id, "strict_mode": self.strict_mode, "interface": interface}
+        self._write_stream_details(stream_id, stream)
 
         # Initialize entry in stream files map
+        self.stream_files_index[str(stream_id)] = {"valid_files": set(), "invalid_files": set()}
         self.stream_files_map[str(stream_id)] = {"valid_files": [], "invalid_files": []}
 
         return stream
@@ -549,12 +670,8 @@ class PushAvServer:
 
         cert_details = req.scope["extensions"]["ssl"]["client_certificate"]
 
-        with open(dst.with_suffix(dst.suffix + ".crt"), "w") as f:
-            f.write(json.dumps(cert_details))
-
-        with open(dst, "wb") as f:
-            async for chunk in req.stream():
-                f.write(chunk)
+        await self.upload_writer.write_bytes(dst.with_suffix(dst.suffix + ".crt"), json.dumps(cert_details).encode())
+        await self.upload_writer.write_stream(dst, req.stream())
 
         return Response(status_code=202)
 
@@ -579,9 +696,7 @@ class PushAvServer:
                     validation_error_reason = "Unsupported manifest object extension"
             elif ext == "m4s":
                 # Checks if CMAF extended path matches the pattern session_<SessionNumber>/<TrackName>/segment_<SegmentNumber>
-                # https://github.com/CHIP-Specifications/connectedhomeip-spec/blob/master/src/app_clusters/PushAVStreamTransport.adoc#12-operation
-                segment_pattern = re.compile(r"^session_\d+/(?P<trackName>[^/]+)/segment_\d+$")
-                match = segment_pattern.match(file_path)
+                match = SEGMENT_PATH_PATTERN.match(file_path)
                 if not match:
                     is_valid = False
                     validation_error_reason = "Path does not adhere to Matter's extended path format: session_<SessionNumber>/<TrackName>/segment_<SegmentNumber>"
@@ -603,17 +718,23 @@ class PushAvServer:
         logging.debug(f"Upload received: {extended_path}")
         stream_id_str = str(stream_id)
         if stream_id_str in self.stream_files_map:
-            if is_valid and extended_path not in self.stream_files_map[stream_id_str]["valid_files"]:
-                self.stream_files_map[stream_id_str]["valid_files"].append(extended_path)
+            stream_files = self.stream_files_map[stream_id_str]
+            stream_files_index = self.stream_files_index[stream_id_str]
+            if is_valid and extended_path not in stream_files_index["valid_files"]:
+                stream_files_index["valid_files"].add(extended_path)
+                stream_files["valid_files"].append(extended_path)
             if not is_valid:
                 logging.error(f"{extended_path}: {validation_error_reason}")
-                if extended_path not in self.stream_files_map[stream_id_str]["invalid_files"]:
-                    self.stream_files_map[stream_id_str]["invalid_files"].append({
+                if extended_path not in stream_files_index["invalid_files"]:
+                    stream_files_index["invalid_files"].add(extended_path)
+                    stream_files["invalid_files"].append({
                         "file_path": extended_path,
                         "validation_error_reason": validation_error_reason
                     })
 
-        return await self._handle_upload(dst, req)
+        response = await self._handle_upload(dst, req)
+        self.validator.submit(stream_id, extended_path, dst)
+        return response
 
     def ffprobe_check(self, stream_id: int, file_path: str):
 
@@ -633,6 +754,18 @@ class PushAvServer:
 
         return json.loads(proc.stdout)
 
+    async def stream_stats(self, stream_id: int, wait: bool = False):
+        """
+        Statistics of the segments and manifests uploaded to a stream, as validated so far.
+        With 'wait', the validation of all the files already uploaded is waited for.
+        """
+        self._read_stream_details(stream_id)
+
+        if wait:
+            await asyncio.to_thread(self.validator.wait, stream_id)
+
+        return dict(self.validator.stats(stream_id), stream_id=stream_id)
+
     async def segment_download(self, file_path: str, stream_id: int):
         return FileResponse(self.wd.path("streams", str(stream_id), file_path))
 
@@ -686,14 +819,12 @@ class PushAvServer:
         """
         Updates the trackName for a given stream_id.
         """
-        stream_details = self._read_stream_details(stream_id)
+        stream_details = dict(self._read_stream_details(stream_id))
 
         stream_details["trackName"] = track_request.trackName
 
-        details_path = self.wd.path("streams", str(stream_id), "details.json")
         try:
-            with open(details_path, 'w', encoding='utf-8') as f:
-                json.dump(stream_details, f, ensure_ascii=False, indent=4)
+            await asyncio.to_thread(self._write_stream_details, stream_id, stream_details)
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Failed to write stream details: {e}")
 
@@ -708,7 +839,9 @@ class PushAvServer:
 class PushAvContext:
     """Hold the context for a full Push AV Server including temporary disk, CA hierarchies and web server"""
 
-    def __init__(self, host: Optional[str], port: Optional[int], working_directory: Optional[str], dns: Optional[str], server_ip: Optional[str], strict_mode: bool):
+    def __init__(self, host: Optional[str], port: Optional[int], working_directory: Optional[str], dns: Optional[str], server_ip: Optional[str], strict_mode: bool,
+                 upload_buffer_size: int = DEFAULT_UPLOAD_BUFFER_SIZE, fsync_interval: Optional[float] = None,
+                 validation_workers: int = 2):
         self.directory = WorkingDirectory(working_directory)
         self.host = host
         self.port = port
@@ -738,7 +871,9 @@ class PushAvContext:
         logger = logging.getLogger("hypercorn.error")
         self.app = FastAPI()
         self.app.mount("/static", StaticFiles(directory=static_path), name="static")
-        pas = PushAvServer(self.directory, self.device_hierarchy, strict_mode)
+        self.upload_writer = UploadWriter(upload_buffer_size, fsync_interval)
+        self.validator = StreamValidator(validation_workers)
+        pas = PushAvServer(self.directory, self.device_hierarchy, strict_mode, self.upload_writer, self.validator)
         self.app.include_router(pas.router)
 
         @self.app.exception_handler(HTTPException)
@@ -784,10 +919,13 @@ class PushAvContext:
             await serve(self.app, config, shutdown_trigger=shutdown_trigger)
 
         finally:
+            await self.upload_writer.flush()
             if self.svc_info:
                 self.zeroconf.unregister_service(self.svc_info)
 
     def cleanup(self):
+        self.upload_writer.close()
+        self.validator.close()
         self.directory.cleanup()
 
 
@@ -817,10 +955,18 @@ if __name__ == "__main__":
     parser.add_argument("--server-ip", help="The IP address of the server to include in the SSL certificate.")
     parser.add_argument("--strict-mode", action='store_true',
                         help="When enabled, upload must happen on the path described by the Matter specification")
+    parser.add_argument("--upload-buffer-size", type=int, default=DEFAULT_UPLOAD_BUFFER_SIZE,
+                        help="Size in bytes of the chunks in which uploads are written to disk")
+    parser.add_argument("--fsync-interval", type=float,
+                        help="When set, uploaded files are synced to disk together every FSYNC_INTERVAL seconds. "
+                        "Default to leaving it to the OS.")
+    parser.add_argument("--validation-workers", type=int, default=2,
+                        help="Number of threads parsing the uploaded segments and manifests for /streams/{id}/stats")
 
     args = parser.parse_args()
 
-    with PushAvContext(args.host, args.port, args.working_directory, args.dns, args.server_ip, args.strict_mode) as ctx:
+    with PushAvContext(args.host, args.port, args.working_directory, args.dns, args.server_ip, args.strict_mode,
+                       args.upload_buffer_size, args.fsync_interval, args.validation_workers) as ctx:
 
         shutdown_event = asyncio.Event()
 
@@ -0,0 +1,238 @@
+"""
+Tests of the validation of the media uploaded to the push AV server, over small hand-built
+fragmented MP4 segments, DASH MPDs and HLS playlists.
+
+Run with: python3 src/tools/push_av_server/test_media_validation.py
+"""
+
+import struct
+import tempfile
+import unittest
+from pathlib import Path
+
+from media_validation import (MediaValidationError, StreamValidator, iter_boxes, parse_dash_manifest, parse_hls_playlist,
+                              parse_init_segment, parse_segment)
+
+TIMESCALE = 90000
+SAMPLE_DURATION = 3000
+
+
+def box(box_type: bytes, payload: bytes = b"") -> bytes:
+    return struct.pack(">I4s", 8 + len(payload), box_type) + payload
+
+
+def full_box(box_type: bytes, version: int, flags: int, payload: bytes) -> bytes:
+    return box(box_type, bytes([version]) + flags.to_bytes(3, "big") + payload)
+
+
+def init_segment(track_id: int = 1, timescale: int = TIMESCALE, default_sample_duration: int = SAMPLE_DURATION) -> bytes:
+    tkhd = full_box(b"tkhd", 0, 7, struct.pack(">III", 0, 0, track_id) + bytes(68))
+    mdhd = full_box(b"mdhd", 0, 0, struct.pack(">III", 0, 0, timescale) + bytes(8))
+    hdlr = full_box(b"hdlr", 0, 0, struct.pack(">I4s", 0, b"vide") + bytes(12) + b"video\0")
+    trak = box(b"trak", tkhd + box(b"mdia", mdhd + hdlr + box(b"minf")))
+    trex = full_box(b"trex", 0, 0, struct.pack(">IIIII", track_id, 1, default_sample_duration, 0, 0))
+    return box(b"ftyp", b"cmf2" + bytes(4)) + box(b"moov", full_box(b"mvhd", 0, 0, bytes(96)) + trak + box(b"mvex", trex))
+
+
+def fragment(sequence_number: int, base_media_decode_time: int, samples: int = 60, track_id: int = 1,
+             sample_durations: bool = True, mdat: bool = True) -> bytes:
+    """ A moof box with a single track fragment, and its mdat box. """
+    tfhd = full_box(b"tfhd", 0, 0x20000, struct.pack(">I", track_id))
+    tfdt = full_box(b"tfdt", 1, 0, struct.pack(">Q", base_media_decode_time))
+    if sample_durations:
+        trun = full_box(b"trun", 0, 0x301, struct.pack(">Ii", samples, 0) +
+                        b"".join(struct.pack(">II", SAMPLE_DURATION, 10) for _ in range(samples)))
+    else:
+        trun = full_box(b"trun", 0, 0x1, struct.pack(">Ii", samples, 0))
+    moof = box(b"moof", full_box(b"mfhd", 0, 0, struct.pack(">I", sequence_number)) + box(b"traf", tfhd + tfdt + trun))
+    return moof + (box(b"mdat", bytes(samples * 10)) if mdat else b"")
+
+
+class MediaValidationTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def write(self, name: str, content: bytes) -> Path:
+        p = Path(self.tmp.name) / name
+        p.write_bytes(content)
+        return p
+
+
+class TestBoxes(MediaValidationTestCase):
+
+    def boxes(self, content: bytes) -> list:
+        with open(self.write("boxes", content), "rb") as f:
+            return [(box_type, offset, size) for box_type, offset, size in iter_boxes(f, len(content))]
+
+    def test_box_sizes(self):
+        large = struct.pack(">I4sQ", 1, b"free", 20) + bytes(4)
+        self.assertEqual(self.boxes(box(b"ftyp", bytes(8)) + large + struct.pack(">I4s", 0, b"mdat") + bytes(5)),
+                         [(b"ftyp", 8, 8), (b"free", 32, 4), (b"mdat", 44, 5)])
+
+    def test_truncated_box_header(self):
+        with self.assertRaisesRegex(MediaValidationError, "Truncated box header"):
+            self.boxes(box(b"ftyp") + b"\0\0\0")
+        with self.assertRaisesRegex(MediaValidationError, "Truncated box header"):
+            self.boxes(struct.pack(">I4s", 1, b"free") + bytes(4))
+
+    def test_box_exceeding_its_parent(self):
+        with self.assertRaisesRegex(MediaValidationError, "exceeds its parent"):
+            self.boxes(struct.pack(">I4s", 32, b"moof") + bytes(8))
+        with self.assertRaisesRegex(MediaValidationError, "exceeds its parent"):
+            self.boxes(struct.pack(">I4s", 4, b"moof"))
+
+
+class TestSegments(MediaValidationTestCase):
+
+    def test_init_segment(self):
+        tracks = parse_init_segment(self.write("segment_0.init", init_segment(track_id=2)))
+        self.assertEqual(list(tracks), [2])
+        self.assertEqual((tracks[2].timescale, tracks[2].handler, tracks[2].default_sample_duration),
+                         (TIMESCALE, "vide", SAMPLE_DURATION))
+
+    def test_init_segment_without_track(self):
+        with self.assertRaisesRegex(MediaValidationError, "No track"):
+            parse_init_segment(self.write("segment_0.init", box(b"ftyp", bytes(8)) + box(b"moov")))
+
+    def test_segment(self):
+        p = self.write("segment_1.m4s", fragment(1, 180000) + fragment(2, 360000))
+        segment = parse_segment(p, 1, None)
+        self.assertEqual(segment.errors, [])
+        self.assertEqual(segment.fragments, 2)
+        self.assertEqual(segment.sequence_numbers, [1, 2])
+        self.assertEqual(segment.tracks[1].base_media_decode_time, 180000)
+        self.assertEqual((segment.tracks[1].samples, segment.tracks[1].duration), (120, 120 * SAMPLE_DURATION))
+
+    def test_default_sample_durations(self):
+        p = self.write("segment_1.m4s", fragment(1, 0, sample_durations=False))
+        self.assertEqual(parse_segment(p, 1, None).tracks[1].duration, 0)
+        init_tracks = parse_init_segment(self.write("segment_0.init", init_segment()))
+        self.assertEqual(parse_segment(p, 1, init_tracks).tracks[1].duration, 60 * SAMPLE_DURATION)
+
+    def test_sidx_duration(self):
+        # A single reference, of 2 seconds
+        reference = struct.pack(">III", 1000, 2 * TIMESCALE, 0x90000000)
+        sidx = full_box(b"sidx", 0, 0, struct.pack(">IIIIHH", 1, TIMESCALE, 0, 0, 0, 1) + reference)
+        segment = parse_segment(self.write("segment_1.m4s", sidx + fragment(1, 0)), 1, None)
+        self.assertEqual(segment.sidx_duration, (TIMESCALE, 2 * TIMESCALE))
+
+    def test_malformed_segments(self):
+        self.assertEqual(parse_segment(self.write("empty.m4s", box(b"styp", bytes(8))), None, None).errors, ["No moof box"])
+        self.assertEqual(parse_segment(self.write("no_mdat.m4s", fragment(1, 0, mdat=False)), None, None).errors,
+                         ["1 moof boxes for 0 mdat boxes"])
+        self.assertEqual(parse_segment(self.write("sequence.m4s", fragment(2, 0) + fragment(1, 0)), None, None).errors,
+                         ["Fragment sequence numbers are not increasing"])
+
+    def test_truncated_segments(self):
+        content = fragment(1, 0)
+        with self.assertRaisesRegex(MediaValidationError, "exceeds its parent"):
+            parse_segment(self.write("truncated.m4s", content[:len(content) - 1]), None, None)
+
+        # A trun box announcing more samples than it holds
+        trun = full_box(b"trun", 0, 0x301, struct.pack(">Ii", 10, 0) + struct.pack(">II", SAMPLE_DURATION, 10))
+        traf = box(b"traf", full_box(b"tfhd", 0, 0x20000, struct.pack(">I", 1)) + trun)
+        moof = box(b"moof", full_box(b"mfhd", 0, 0, struct.pack(">I", 1)) + traf)
+        with self.assertRaisesRegex(MediaValidationError, "Truncated trun box"):
+            parse_segment(self.write("trun.m4s", moof + box(b"mdat")), None, None)
+
+
+class TestManifests(MediaValidationTestCase):
+
+    def test_dash_manifest(self):
+        summary = parse_dash_manifest(self.write("index.mpd", b'<MPD xmlns="urn:mpeg:dash:schema:mpd:2011" type="dynamic" '
+                                                 b'profiles="urn:mpeg:dash:profile:isoff-live:2011"><Period><AdaptationSet>'
+                                                 b'<Representation id="v" bandwidth="1000"/></AdaptationSet></Period></MPD>'))
+        self.assertEqual(summary, {"type": "dash", "errors": [], "profile": "urn:mpeg:dash:profile:isoff-live:2011",
+                                   "dynamic": True, "periods": 1, "representations": [{"id": "v", "bandwidth": "1000"}]})
+
+    def test_malformed_dash_manifests(self):
+        self.assertRegex(parse_dash_manifest(self.write("truncated.mpd", b"<MPD><Period>"))["errors"][0], "^Invalid XML")
+        self.assertEqual(parse_dash_manifest(self.write("root.mpd", b"<Playlist/>"))["errors"],
+                         ["Root element is Playlist, not MPD"])
+        self.assertEqual(parse_dash_manifest(self.write("empty.mpd", b"<MPD/>"))["errors"], ["No Period", "No Representation"])
+        self.assertEqual(parse_dash_manifest(self.write("bandwidth.mpd", b'<MPD><Period><Representation id="v"/></Period></MPD>'))
+                         ["errors"], ["Representation v without id or bandwidth"])
+
+    def test_hls_playlists(self):
+        media = parse_hls_playlist(self.write("index.m3u8", b"#EXTM3U\n#EXT-X-TARGETDURATION:2\n#EXTINF:2.0,\na.m4s\n"
+                                              b"#EXTINF:2.4,\nb.m4s\n"))
+        self.assertEqual(media, {"type": "hls", "errors": [], "target_duration": 2, "segments": 2})
+        master = parse_hls_playlist(self.write("master.m3u8", b"#EXTM3U\n#EXT-X-STREAM-INF:BANDWIDTH=1000\nvideo.m3u8\n"))
+        self.assertEqual(master, {"type": "hls", "errors": [], "variants": 1})
+
+    def test_malformed_hls_playlists(self):
+        self.assertEqual(parse_hls_playlist(self.write("empty.m3u8", b""))["errors"], ["Playlist does not start with #EXTM3U"])
+        self.assertEqual(parse_hls_playlist(self.write("target.m3u8", b"#EXTM3U\n#EXTINF:2.0,\na.m4s\n"))["errors"],
+                         ["Media playlist without EXT-X-TARGETDURATION"])
+        self.assertEqual(parse_hls_playlist(self.write("long.m3u8", b"#EXTM3U\n#EXT-X-TARGETDURATION:2\n#EXTINF:3.1,\na.m4s\n"))
+                         ["errors"], ["1 segments longer than the target duration: [3.1]"])
+        self.assertEqual(parse_hls_playlist(self.write("invalid.m3u8", b"#EXTM3U\n#EXT-X-TARGETDURATION:2\n#EXTINF:two,\n"
+                                                       b"a.m4s\n"))["errors"], ["Invalid EXTINF: two,"])
+
+
+class TestStreamValidator(MediaValidationTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.validator = StreamValidator()
+        self.addCleanup(self.validator.close)
+
+    def upload(self, file_path: str, content: bytes):
+        self.validator.submit(1, file_path, self.write(file_path.replace("/", "_"), content)).result()
+
+    def test_stream_stats(self):
+        segment_duration = 60 * SAMPLE_DURATION
+        # Segments received before the initialization segment are parsed again once it arrives
+        self.upload("video/segment_1.m4s", fragment(1, segment_duration, sample_durations=False))
+        self.upload("video/segment_0.init", init_segment())
+        self.upload("video/segment_2.m4s", fragment(2, 2 * segment_duration))
+        # Segment 3 is missing, and segment 4 does not start where segment 2 ends
+        self.upload("video/segment_4.m4s", fragment(4, 5 * segment_duration))
+        self.upload("video/segment_5.m4s", fragment(5, 6 * segment_duration, track_id=2))
+        self.upload("video/segment_6.m4s", fragment(6, 0)[:20])
+        self.upload("index.m3u8", b"#EXTM3U\n#EXT-X-TARGETDURATION:2\n#EXTINF:2.0,\nvideo/segment_1.m4s\n")
+        self.validator.wait(1)
+
+        stats = self.validator.stats(1)
+        self.assertEqual(stats["pending"], 0)
+        self.assertEqual(stats["manifests"], {"index.m3u8": {"type": "hls", "errors": [], "target_duration": 2,
+                                                             "segments": 1, "updates": 1}})
+        video = stats["tracks"]["video"]
+        self.assertEqual(video["init"], "video/segment_0.init")
+        self.assertEqual(video["tracks"], [{"track_id": 1, "handler": "vide", "timescale": TIMESCALE}])
+        self.assertEqual((video["segments"], video["first_segment"], video["last_segment"]), (5, 1, 6))
+        self.assertEqual((video["min_segment_duration"], video["max_segment_duration"]), (2.0, 2.0))
+        self.assertEqual((video["missing_segments"], video["missing_segment_count"]), ([[3, 3]], 1))
+        self.assertEqual(video["discontinuities"], [{"segment": 4, "track_id": 1, "expected": 3 * segment_duration,
+                                                     "actual": 5 * segment_duration}])
+        self.assertEqual(len(video["errors"]), 3)
+        self.assertEqual(video["errors"][:2], ["Segments have different tracks: [(1,), (2,)]",
+                                               "Tracks [2] are not in the initialization segment"])
+        self.assertRegex(video["errors"][2], "^segment 6: Box b'moof' at offset 0 of size .* exceeds its parent$")
+
+    def test_missing_segment_ranges(self):
+        self.upload("video/segment_0.init", init_segment())
+        for number in (1, 4, 5, 1000000000):
+            self.upload(f"video/segment_{number}.m4s", fragment(number, 0))
+        video = self.validator.stats(1)["tracks"]["video"]
+        self.assertEqual(video["missing_segments"], [[2, 3], [6, 999999999]])
+        self.assertEqual(video["missing_segment_count"], 2 + 999999994)
+
+    def test_invalid_init_segment(self):
+        self.upload("video/segment_0.init", init_segment()[:30])
+        self.upload("video/segment_1.m4s", fragment(1, 0))
+        video = self.validator.stats(1)["tracks"]["video"]
+        self.assertEqual(video["init"], None)
+        self.assertEqual(len(video["errors"]), 2)
+        self.assertRegex(video["errors"][0], "^segment_0.init: Box b'moov' .* exceeds its parent$")
+        self.assertEqual(video["errors"][1], "No initialization segment")
+
+    def test_ignored_uploads(self):
+        self.assertIsNone(self.validator.submit(1, "video/thumbnail.jpg", self.write("thumbnail.jpg", b"")))
+        self.assertEqual(self.validator.stats(1), {"tracks": {}, "manifests": {}, "pending": 0})
+
+
+if __name__ == "__main__":
+    unittest.main()